@@ -0,0 +1,103 @@
+"""Move task message history into an append-only task_messages table.
+
+Revision ID: 20261018_0001
+Revises: 20260119_0001
+Create Date: 2026-10-18 09:00:00.000000
+
+Task history used to live in the tasks.history JSONB array. Every append
+rewrote (and re-TOASTed) the whole array, so long conversations paid O(n^2)
+over their lifetime. Messages are now rows of task_messages ordered by a
+global identity column, and reading the last N messages is an index scan on
+(task_id, seq).
+
+The upgrade creates the table and backfills it from tasks.history in every
+schema that has a tasks table (the public schema and the per-DID schemas),
+then empties tasks.history. The downgrade folds the rows back into
+tasks.history.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0001"
+down_revision: Union[str, None] = "20260119_0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _schemas_with_table(table_name: str) -> list[str]:
+    """Return every schema containing the given Bindu table."""
+    result = op.get_bind().execute(
+        sa.text(
+            "SELECT table_schema FROM information_schema.tables "
+            "WHERE table_name = :table_name AND table_type = 'BASE TABLE'"
+        ),
+        {"table_name": table_name},
+    )
+    return [row[0] for row in result]
+
+
+def _quote(schema_name: str) -> str:
+    return op.get_bind().dialect.identifier_preparer.quote_schema(schema_name)
+
+
+def upgrade() -> None:
+    """Create task_messages and backfill it from tasks.history."""
+    for schema_name in _schemas_with_table("tasks"):
+        schema = _quote(schema_name)
+
+        op.execute(f"""
+            CREATE TABLE IF NOT EXISTS {schema}.task_messages (
+                seq BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+                task_id UUID NOT NULL,
+                message JSONB NOT NULL,
+                created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+                CONSTRAINT fk_task_messages_task FOREIGN KEY (task_id)
+                    REFERENCES {schema}.tasks(id) ON DELETE CASCADE
+            )
+        """)
+        op.execute(f"""
+            CREATE INDEX IF NOT EXISTS idx_task_messages_task_id_seq
+            ON {schema}.task_messages (task_id, seq)
+        """)
+        op.execute(f"""
+            COMMENT ON TABLE {schema}.task_messages
+            IS 'Append-only A2A message history of tasks'
+        """)
+
+        # Backfill in conversation order; tasks already migrated have an
+        # empty history and are skipped, so the upgrade can be re-run.
+        op.execute(f"""
+            INSERT INTO {schema}.task_messages (task_id, message, created_at)
+            SELECT t.id, m.message, t.created_at
+            FROM {schema}.tasks AS t
+            CROSS JOIN LATERAL jsonb_array_elements(t.history)
+                WITH ORDINALITY AS m(message, ord)
+            WHERE jsonb_array_length(t.history) > 0
+            ORDER BY t.created_at, t.id, m.ord
+        """)
+        op.execute(f"""
+            UPDATE {schema}.tasks SET history = '[]'::jsonb
+            WHERE jsonb_array_length(history) > 0
+        """)
+
+
+def downgrade() -> None:
+    """Fold task_messages back into tasks.history and drop the table."""
+    for schema_name in _schemas_with_table("task_messages"):
+        schema = _quote(schema_name)
+
+        op.execute(f"""
+            UPDATE {schema}.tasks AS t
+            SET history = h.history
+            FROM (
+                SELECT task_id, jsonb_agg(message ORDER BY seq) AS history
+                FROM {schema}.task_messages
+                GROUP BY task_id
+            ) AS h
+            WHERE h.task_id = t.id
+        """)
+        op.execute(f"DROP TABLE {schema}.task_messages")
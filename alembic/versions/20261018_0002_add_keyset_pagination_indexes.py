@@ -0,0 +1,65 @@
+"""Index tasks and contexts on (created_at, id) for keyset pagination.
+
+Revision ID: 20261018_0002
+Revises: 20261018_0001
+Create Date: 2026-10-18 12:00:00.000000
+
+tasks/list and contexts/list page newest first with a cursor on
+(created_at, id). The composite indexes serve those pages directly and also
+cover every query the single-column created_at indexes served, so those are
+replaced. Applied to every schema holding the tables (the public schema and
+the per-DID schemas).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0002"
+down_revision: Union[str, None] = "20261018_0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ("tasks", "contexts")
+
+
+def _schemas_with_table(table_name: str) -> list[str]:
+    """Return every schema containing the given Bindu table."""
+    result = op.get_bind().execute(
+        sa.text(
+            "SELECT table_schema FROM information_schema.tables "
+            "WHERE table_name = :table_name AND table_type = 'BASE TABLE'"
+        ),
+        {"table_name": table_name},
+    )
+    return [row[0] for row in result]
+
+
+def _quote(schema_name: str) -> str:
+    return op.get_bind().dialect.identifier_preparer.quote_schema(schema_name)
+
+
+def upgrade() -> None:
+    """Replace created_at indexes with (created_at, id) indexes."""
+    for table in _TABLES:
+        for schema_name in _schemas_with_table(table):
+            schema = _quote(schema_name)
+            op.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_{table}_created_at_id
+                ON {schema}.{table} (created_at, id)
+            """)
+            op.execute(f"DROP INDEX IF EXISTS {schema}.idx_{table}_created_at")
+
+
+def downgrade() -> None:
+    """Restore the single-column created_at indexes."""
+    for table in _TABLES:
+        for schema_name in _schemas_with_table(table):
+            schema = _quote(schema_name)
+            op.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_{table}_created_at
+                ON {schema}.{table} (created_at DESC)
+            """)
+            op.execute(f"DROP INDEX IF EXISTS {schema}.idx_{table}_created_at_id")
@@ -0,0 +1,71 @@
+"""Add webhook_outbox table for durable push notification delivery.
+
+Revision ID: 20261018_0003
+Revises: 20261018_0002
+Create Date: 2026-10-18 15:00:00.000000
+
+Push notification events are written to webhook_outbox before they are
+queued for background delivery and removed once delivered, so events still
+pending at shutdown or after a crash are redelivered on the next start.
+Created in every schema holding a tasks table (the public schema and the
+per-DID schemas).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0003"
+down_revision: Union[str, None] = "20261018_0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _schemas_with_table(table_name: str) -> list[str]:
+    """Return every schema containing the given Bindu table."""
+    result = op.get_bind().execute(
+        sa.text(
+            "SELECT table_schema FROM information_schema.tables "
+            "WHERE table_name = :table_name AND table_type = 'BASE TABLE'"
+        ),
+        {"table_name": table_name},
+    )
+    return [row[0] for row in result]
+
+
+def _quote(schema_name: str) -> str:
+    return op.get_bind().dialect.identifier_preparer.quote_schema(schema_name)
+
+
+def upgrade() -> None:
+    """Create the webhook_outbox table."""
+    for schema_name in _schemas_with_table("tasks"):
+        schema = _quote(schema_name)
+
+        op.execute(f"""
+            CREATE TABLE IF NOT EXISTS {schema}.webhook_outbox (
+                event_id UUID PRIMARY KEY NOT NULL,
+                task_id UUID NOT NULL,
+                config JSONB NOT NULL,
+                event JSONB NOT NULL,
+                created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+                CONSTRAINT fk_webhook_outbox_task FOREIGN KEY (task_id)
+                    REFERENCES {schema}.tasks(id) ON DELETE CASCADE
+            )
+        """)
+        op.execute(f"""
+            CREATE INDEX IF NOT EXISTS idx_webhook_outbox_created_at
+            ON {schema}.webhook_outbox (created_at)
+        """)
+        op.execute(f"""
+            COMMENT ON TABLE {schema}.webhook_outbox
+            IS 'Push notification events not yet delivered to their webhook'
+        """)
+
+
+def downgrade() -> None:
+    """Drop the webhook_outbox table."""
+    for schema_name in _schemas_with_table("webhook_outbox"):
+        op.execute(f"DROP TABLE {_quote(schema_name)}.webhook_outbox")
@@ -0,0 +1,117 @@
+"""Maintain per-state task counters in task_state_counts.
+
+Revision ID: 20261018_0004
+Revises: 20261018_0003
+Create Date: 2026-10-18 18:00:00.000000
+
+Statement-level triggers on tasks keep task_state_counts up to date, so
+the /metrics scrape reads a handful of counter rows instead of counting the
+tasks table. Counters are spread over 16 shards per state to avoid a hot
+row under concurrent transitions, and are backfilled from the existing
+tasks. Created in every schema holding a tasks table (the public schema and
+the per-DID schemas).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0004"
+down_revision: Union[str, None] = "20261018_0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_SHARDS = 16
+_TRIGGERS = {
+    "insert": "NEW TABLE AS new_rows",
+    "update": "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "delete": "OLD TABLE AS old_rows",
+}
+
+
+def _schemas_with_table(table_name: str) -> list[str]:
+    """Return every schema containing the given Bindu table."""
+    result = op.get_bind().execute(
+        sa.text(
+            "SELECT table_schema FROM information_schema.tables "
+            "WHERE table_name = :table_name AND table_type = 'BASE TABLE'"
+        ),
+        {"table_name": table_name},
+    )
+    return [row[0] for row in result]
+
+
+def _quote(schema_name: str) -> str:
+    return op.get_bind().dialect.identifier_preparer.quote_schema(schema_name)
+
+
+def _upsert(delta: str) -> str:
+    return f"""
+        INSERT INTO task_state_counts (state, shard, task_count)
+        SELECT state, target_shard, sum(change) FROM ({delta}) AS delta
+        GROUP BY state HAVING sum(change) <> 0 ORDER BY state
+        ON CONFLICT (state, shard)
+        DO UPDATE SET task_count = task_state_counts.task_count + EXCLUDED.task_count;"""
+
+
+def upgrade() -> None:
+    """Create task_state_counts, its triggers, and backfill the counters."""
+    for schema_name in _schemas_with_table("tasks"):
+        schema = _quote(schema_name)
+
+        op.execute(f"""
+            CREATE TABLE IF NOT EXISTS {schema}.task_state_counts (
+                state VARCHAR(50) NOT NULL,
+                shard INTEGER NOT NULL,
+                task_count BIGINT NOT NULL DEFAULT 0,
+                PRIMARY KEY (state, shard)
+            )
+        """)
+        op.execute(f"""
+            COMMENT ON TABLE {schema}.task_state_counts
+            IS 'Number of tasks per state, maintained by triggers on tasks'
+        """)
+        op.execute(f"""
+            CREATE OR REPLACE FUNCTION {schema}.count_task_states() RETURNS trigger
+            LANGUAGE plpgsql SET search_path = {schema} AS $$
+            DECLARE
+                target_shard integer := floor(random() * {_SHARDS})::integer;
+            BEGIN
+                IF TG_OP = 'INSERT' THEN{_upsert("SELECT state, 1 AS change FROM new_rows")}
+                ELSIF TG_OP = 'DELETE' THEN{_upsert("SELECT state, -1 AS change FROM old_rows")}
+                ELSE{_upsert("SELECT state, -1 AS change FROM old_rows UNION ALL SELECT state, 1 FROM new_rows")}
+                END IF;
+                RETURN NULL;
+            END
+            $$
+        """)
+
+        # Block task writes while the triggers are added and the counters
+        # seeded, so no transition is missed or counted twice.
+        op.execute(f"LOCK TABLE {schema}.tasks IN SHARE ROW EXCLUSIVE MODE")
+        for operation, rows in _TRIGGERS.items():
+            op.execute(f"""
+                CREATE TRIGGER trg_tasks_state_counts_{operation}
+                AFTER {operation.upper()} ON {schema}.tasks REFERENCING {rows}
+                FOR EACH STATEMENT EXECUTE FUNCTION {schema}.count_task_states()
+            """)
+        op.execute(f"DELETE FROM {schema}.task_state_counts")
+        op.execute(f"""
+            INSERT INTO {schema}.task_state_counts (state, shard, task_count)
+            SELECT state, 0, count(*) FROM {schema}.tasks GROUP BY state
+        """)
+
+
+def downgrade() -> None:
+    """Drop the triggers, their function and task_state_counts."""
+    for schema_name in _schemas_with_table("task_state_counts"):
+        schema = _quote(schema_name)
+        for operation in _TRIGGERS:
+            op.execute(
+                f"DROP TRIGGER IF EXISTS trg_tasks_state_counts_{operation} "
+                f"ON {schema}.tasks"
+            )
+        op.execute(f"DROP FUNCTION IF EXISTS {schema}.count_task_states()")
+        op.execute(f"DROP TABLE {schema}.task_state_counts")
@@ -0,0 +1,68 @@
+"""Add delivery leases to webhook_outbox.
+
+Revision ID: 20261018_0005
+Revises: 20261018_0004
+Create Date: 2026-10-18 21:00:00.000000
+
+Replicas claim outbox events with SELECT ... FOR UPDATE SKIP LOCKED and
+hold them with a lease: owner names the replica delivering an event and
+visible_at is when other replicas may claim it unless the lease is renewed.
+Existing rows are claimable at once. Added in every schema holding a
+webhook_outbox table (the public schema and the per-DID schemas).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0005"
+down_revision: Union[str, None] = "20261018_0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _schemas_with_table(table_name: str) -> list[str]:
+    """Return every schema containing the given Bindu table."""
+    result = op.get_bind().execute(
+        sa.text(
+            "SELECT table_schema FROM information_schema.tables "
+            "WHERE table_name = :table_name AND table_type = 'BASE TABLE'"
+        ),
+        {"table_name": table_name},
+    )
+    return [row[0] for row in result]
+
+
+def _quote(schema_name: str) -> str:
+    return op.get_bind().dialect.identifier_preparer.quote_schema(schema_name)
+
+
+def upgrade() -> None:
+    """Add the owner and visible_at lease columns."""
+    for schema_name in _schemas_with_table("webhook_outbox"):
+        schema = _quote(schema_name)
+
+        op.execute(f"""
+            ALTER TABLE {schema}.webhook_outbox
+                ADD COLUMN IF NOT EXISTS owner VARCHAR(255),
+                ADD COLUMN IF NOT EXISTS visible_at TIMESTAMP WITH TIME ZONE
+                    NOT NULL DEFAULT NOW()
+        """)
+        op.execute(f"""
+            CREATE INDEX IF NOT EXISTS idx_webhook_outbox_visible_at
+            ON {schema}.webhook_outbox (visible_at)
+        """)
+
+
+def downgrade() -> None:
+    """Drop the lease columns."""
+    for schema_name in _schemas_with_table("webhook_outbox"):
+        schema = _quote(schema_name)
+        op.execute(f"DROP INDEX IF EXISTS {schema}.idx_webhook_outbox_visible_at")
+        op.execute(f"""
+            ALTER TABLE {schema}.webhook_outbox
+                DROP COLUMN IF EXISTS visible_at,
+                DROP COLUMN IF EXISTS owner
+        """)
@@ -9,6 +9,7 @@ use bindufy() directly in their Python scripts.
 """
 
 import argparse
+import asyncio
 import signal
 import sys
 
@@ -32,28 +33,33 @@ def _handle_serve(args: argparse.Namespace) -> None:
         print("Usage: bindu serve --grpc [--grpc-port 3774]")
         sys.exit(1)
 
+    grpc_port = args.grpc_port
+    logger.info(f"Starting Bindu core with gRPC on port {grpc_port}")
+
+    asyncio.run(_serve_grpc(grpc_port))
+    sys.exit(0)
+
+
+async def _serve_grpc(grpc_port: int) -> None:
+    """Serve BinduService on this loop until SIGINT or SIGTERM."""
     # Import here to avoid loading heavy dependencies on --help
     from bindu.grpc.registry import AgentRegistry
     from bindu.grpc.server import start_grpc_server
 
-    grpc_port = args.grpc_port
     registry = AgentRegistry()
-
-    logger.info(f"Starting Bindu core with gRPC on port {grpc_port}")
-
-    server = start_grpc_server(registry=registry, port=grpc_port)
+    server = await start_grpc_server(registry=registry, port=grpc_port)
 
     # Handle graceful shutdown
-    def _shutdown(signum: int, frame: object) -> None:
-        logger.info("Shutting down gRPC server...")
-        server.stop(grace=5)
-        sys.exit(0)
-
-    signal.signal(signal.SIGINT, _shutdown)
-    signal.signal(signal.SIGTERM, _shutdown)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
 
     # Block until terminated
-    server.wait_for_termination()
+    await stop.wait()
+    logger.info("Shutting down gRPC server...")
+    await server.stop(grace=5)
+    registry.close()
 
 
 def main() -> None:
@@ -75,6 +75,11 @@ class SchedulerConfig:
     max_connections: int = 10
     retry_on_timeout: bool = True
     poll_timeout: int = 1
+    queue_mode: Literal["list", "stream"] = "list"
+    consumer_group: str = "bindu-workers"
+    visibility_timeout: float = 60.0
+    max_deliveries: int = 5
+    batch_size: int = 10
 
 
 @dataclass(frozen=True)
@@ -212,6 +217,10 @@ class AgentManifest:
     # Negotiation
     negotiation: dict[str, Any] | None = None
 
+    # Handler execution (mode, max_workers, timeout_seconds)
+    execution: dict[str, Any] | None = None
+    """How sync handlers are executed; defaults come from app_settings.worker."""
+
     # Runtime Execution (injected by framework)
     run: Callable[..., Any] | None = field(default=None, init=False)
 
@@ -573,6 +573,9 @@ class TaskSendParams(TypedDict):
     payment_context: NotRequired[dict[str, Any]]
     """Payment context for X402 extension (optional)."""
 
+    redelivered: NotRequired[bool]
+    """Set by the scheduler when a previous delivery of this operation was not acknowledged."""
+
 
 @pydantic.with_config(ConfigDict(alias_generator=to_camel))
 class TaskIdParams(TypedDict):
@@ -595,15 +598,51 @@ class TaskQueryParams(TaskIdParams):
 
 @pydantic.with_config(ConfigDict(alias_generator=to_camel))
 class ListTasksParams(TypedDict):
-    """Defines parameters for listing tasks. <NotPartOfA2A>."""
+    """Defines parameters for listing tasks. <NotPartOfA2A>.
+
+    Tasks are listed newest first. To page through them, pass the id of the
+    last task of the previous page as ``cursor``.
+    """
 
     history_length: NotRequired[int]
     """The length of the history."""
 
+    length: NotRequired[int]
+    """The maximum number of tasks to return."""
+
+    cursor: NotRequired[UUID]
+    """The ID of the last task of the previous page."""
+
+    summary: NotRequired[bool]
+    """Return TaskSummary projections instead of full tasks."""
+
     metadata: NotRequired[dict[str, Any]]
     """Additional metadata."""
 
 
+@pydantic.with_config(ConfigDict(alias_generator=to_camel))
+class TaskSummary(TypedDict):
+    """Lightweight projection of a task, without history or artifacts. <NotPartOfA2A>."""
+
+    id: Required[UUID]
+    """The ID of the task."""
+
+    context_id: Required[UUID]
+    """The context the task belongs to."""
+
+    kind: Required[Literal["task"]]
+    """Event type."""
+
+    status: Required[TaskStatus]
+    """Current status of the task."""
+
+    created_at: Required[str]
+    """ISO datetime when the task was created."""
+
+    updated_at: Required[str]
+    """ISO datetime when the task was last updated."""
+
+
 @pydantic.with_config(ConfigDict(alias_generator=to_camel))
 class TaskFeedbackParams(TypedDict):
     """Defines parameters for providing feedback on a task. <NotPartOfA2A>."""
@@ -793,15 +832,42 @@ class ContextQueryParams(ContextIdParams):
 
 @pydantic.with_config(ConfigDict(alias_generator=to_camel))
 class ListContextsParams(TypedDict):
-    """Parameters for listing contexts."""
+    """Parameters for listing contexts.
+
+    Contexts are listed newest first. To page through them, pass the id of the
+    last context of the previous page as ``cursor``.
+    """
 
     history_length: NotRequired[int]
     """The length of the list."""
 
+    length: NotRequired[int]
+    """The maximum number of contexts to return."""
+
+    cursor: NotRequired[UUID]
+    """The ID of the last context of the previous page."""
+
+    summary: NotRequired[bool]
+    """Return ContextSummary projections without task ids."""
+
     metadata: NotRequired[dict[str, Any]]
     """Additional metadata."""
 
 
+@pydantic.with_config(ConfigDict(alias_generator=to_camel))
+class ContextSummary(TypedDict):
+    """Lightweight projection of a context for listings."""
+
+    context_id: Required[UUID]
+    """The ID of the context."""
+
+    task_count: Required[int]
+    """Number of tasks in the context."""
+
+    created_at: Required[str]
+    """ISO datetime when the context was created."""
+
+
 # -----------------------------------------------------------------------------
 # Agent-to-Agent Negotiation Models <NotPartOfA2A>
 # -----------------------------------------------------------------------------
@@ -1500,7 +1566,8 @@ CancelTaskResponse = JSONRPCResponse[
 
 ListTasksRequest = JSONRPCRequest[Literal["tasks/list"], ListTasksParams]
 ListTasksResponse = JSONRPCResponse[
-    List[Task], Union[TaskNotFoundError, TaskNotCancelableError]
+    Union[List[Task], List[TaskSummary]],
+    Union[TaskNotFoundError, TaskNotCancelableError],
 ]
 
 TaskFeedbackRequest = JSONRPCRequest[Literal["tasks/feedback"], TaskFeedbackParams]
@@ -1508,7 +1575,8 @@ TaskFeedbackResponse = JSONRPCResponse[Dict[str, str], TaskNotFoundError]
 
 ListContextsRequest = JSONRPCRequest[Literal["contexts/list"], ListContextsParams]
 ListContextsResponse = JSONRPCResponse[
-    List[Context], Union[ContextNotFoundError, ContextNotCancelableError]
+    Union[List[Context], List[ContextSummary]],
+    Union[ContextNotFoundError, ContextNotCancelableError],
 ]
 
 ClearContextsRequest = JSONRPCRequest[Literal["contexts/clear"], ContextIdParams]
@@ -1,37 +1,148 @@
 """gRPC client for calling remote agent handlers.
 
 GrpcAgentClient is a callable class that replaces manifest.run for agents
-registered via gRPC. When ManifestWorker calls manifest.run(messages) at
-line 171 of manifest_worker.py, this client makes a gRPC call to the SDK's
-AgentHandler endpoint and returns the result in the same format that
+registered via gRPC. When ManifestWorker invokes manifest.run(messages), this
+client makes a ``grpc.aio`` call to the SDK's AgentHandler endpoint on the
+worker's event loop and returns the result in the same format that
 ResultProcessor and ResponseDetector expect.
 
 Supports both unary and streaming responses:
-    - Unary (HandleMessages): Returns str or dict directly.
-    - Streaming (HandleMessagesStream): Returns a generator that yields
-      chunks. ResultProcessor.collect_results() drains it automatically.
+    - Unary (HandleMessages): Resolves to str or dict.
+    - Streaming (HandleMessagesStream): Resolves to an async generator that
+      yields chunks as the SDK sends them, so they reach message/stream
+      clients without waiting for the whole response.
+
+Calls never block the event loop, so a remote agent runs as many tasks at
+once as the worker allows. Clients of the same callback address share a
+small pool of channels on each event loop (see ``GrpcSettings``). Each call's
+deadline is the client timeout, shortened to whatever is left of the
+caller's deadline (the task timeout enforced by ManifestWorker), and
+cancelling the calling task (e.g. tasks/cancel) cancels the RPC.
 
 Key contract:
     - Input:  list[dict[str, str]] — chat messages [{"role": "user", "content": "..."}]
     - Output: str (normal completion), dict with "state" key (state transition),
-      or generator of str/dict (streaming — collected by ResultProcessor).
+      or async generator of str/dict (streaming — last chunk is the final result).
 
-This means ManifestWorker, ResultProcessor, and ResponseDetector require
-zero changes — they cannot tell the difference between a local Python handler
-and a remote gRPC handler.
+This means ManifestWorker, ResultProcessor, and ResponseDetector handle a
+remote gRPC handler exactly like a local async Python handler.
 """
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from typing import Any
 
+import anyio
 import grpc
 
 from bindu.grpc.generated import agent_handler_pb2, agent_handler_pb2_grpc
+from bindu.settings import app_settings
 from bindu.utils.logging import get_logger
 
 logger = get_logger("bindu.grpc.client")
 
+# Timeout for HealthCheck and GetCapabilities calls (seconds)
+PROBE_TIMEOUT_SECONDS = 5.0
+
+
+def _channel_options() -> list[tuple[str, Any]]:
+    """Build the options of channels to SDK callback addresses."""
+    settings = app_settings.grpc
+    return [
+        ("grpc.max_receive_message_length", settings.max_message_length),
+        ("grpc.max_send_message_length", settings.max_message_length),
+        ("grpc.keepalive_time_ms", settings.keepalive_time_ms),
+        ("grpc.keepalive_timeout_ms", settings.keepalive_timeout_ms),
+        ("grpc.keepalive_permit_without_calls", 0),
+        # One connection per pooled channel instead of a shared subchannel
+        ("grpc.use_local_subchannel_pool", 1),
+    ]
+
+
+@dataclass
+class _PooledChannels:
+    """Channels to one callback address, bound to one event loop."""
+
+    loop: asyncio.AbstractEventLoop
+    channels: list[grpc.aio.Channel]
+    stubs: list[agent_handler_pb2_grpc.AgentHandlerStub]
+    users: int = 0
+    next_index: int = 0
+
+    def next_stub(self) -> agent_handler_pb2_grpc.AgentHandlerStub:
+        """Return the next stub in round-robin order."""
+        stub = self.stubs[self.next_index % len(self.stubs)]
+        self.next_index += 1
+        return stub
+
+    def close(self) -> None:
+        """Close the channels on the event loop that owns them."""
+        if self.loop.is_closed():
+            return
+
+        async def close_channels() -> None:
+            for channel in self.channels:
+                await channel.close()
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            task = self.loop.create_task(close_channels())
+            _closing.add(task)
+            task.add_done_callback(_closing.discard)
+        elif self.loop.is_running():
+            asyncio.run_coroutine_threadsafe(close_channels(), self.loop)
+
+
+# Shared channels per (callback address, event loop); aio channels cannot be
+# used from a loop other than the one they were created on.
+_pool: dict[tuple[str, asyncio.AbstractEventLoop], _PooledChannels] = {}
+_pool_lock = threading.Lock()
+_closing: set[asyncio.Task[None]] = set()
+
+
+def _acquire_channels(address: str, loop: asyncio.AbstractEventLoop) -> _PooledChannels:
+    """Take a reference to the pooled channels of ``address`` on ``loop``."""
+    with _pool_lock:
+        pooled = _pool.get((address, loop))
+        if pooled is None:
+            options = _channel_options()
+            channels = [
+                grpc.aio.insecure_channel(address, options=options)
+                for _ in range(app_settings.grpc.client_pool_size)
+            ]
+            pooled = _PooledChannels(
+                loop=loop,
+                channels=channels,
+                stubs=[agent_handler_pb2_grpc.AgentHandlerStub(c) for c in channels],
+            )
+            _pool[(address, loop)] = pooled
+            logger.debug(
+                f"Opened {len(channels)} channel(s) to agent handler at {address}"
+            )
+        pooled.users += 1
+        return pooled
+
+
+def _release_channels(address: str, loop: asyncio.AbstractEventLoop) -> None:
+    """Drop a reference, closing the channels once no client uses them."""
+    with _pool_lock:
+        pooled = _pool.get((address, loop))
+        if pooled is None:
+            return
+        pooled.users -= 1
+        if pooled.users > 0:
+            return
+        del _pool[(address, loop)]
+    pooled.close()
+    logger.debug(f"Closed channels to agent handler at {address}")
+
 
 class GrpcAgentClient:
     """Callable gRPC client that acts as manifest.run for remote agents.
@@ -41,19 +152,18 @@ class GrpcAgentClient:
     This client is set as manifest.run, so ManifestWorker calls it transparently.
 
     Supports both unary and streaming modes:
-        - Unary: Calls HandleMessages, returns str or dict.
-        - Streaming: Calls HandleMessagesStream, returns a generator.
-          ResultProcessor.collect_results() handles generators via __next__.
+        - Unary: Calls HandleMessages, resolves to str or dict.
+        - Streaming: Calls HandleMessagesStream, resolves to an async generator.
+          Used when the agent registers with capabilities.streaming.
 
     The __call__ signature uses 'messages' as the parameter name to pass
     validate_agent_function() inspection.
 
     Attributes:
         _address: The SDK's AgentHandler gRPC address (e.g., "localhost:50052").
-        _timeout: Timeout in seconds for HandleMessages calls.
+        _timeout: Upper bound in seconds for HandleMessages calls.
         _use_streaming: Whether to use HandleMessagesStream instead of HandleMessages.
-        _channel: Lazy-initialized gRPC channel.
-        _stub: Lazy-initialized AgentHandler stub.
+        _pooled: Pooled channels acquired lazily, per event loop.
     """
 
     def __init__(
@@ -67,29 +177,31 @@ class GrpcAgentClient:
         Args:
             callback_address: The SDK's AgentHandler gRPC server address
                 (e.g., "localhost:50052").
-            timeout: Timeout in seconds for HandleMessages calls.
+            timeout: Upper bound in seconds for HandleMessages calls.
             use_streaming: If True, use HandleMessagesStream (server-side streaming)
-                instead of HandleMessages (unary). The streaming RPC returns a
-                generator that ResultProcessor.collect_results() will drain.
+                instead of HandleMessages (unary). The streaming RPC resolves to
+                an async generator that ResultProcessor.collect_results() drains.
         """
         self._address = callback_address
         self._timeout = timeout
         self._use_streaming = use_streaming
-        self._channel: grpc.Channel | None = None
-        self._stub: agent_handler_pb2_grpc.AgentHandlerStub | None = None
-
-    def _ensure_connected(self) -> None:
-        """Lazily create the gRPC channel and stub on first use."""
-        if self._channel is None:
-            self._channel = grpc.insecure_channel(
-                self._address,
-                options=[
-                    ("grpc.max_receive_message_length", 4 * 1024 * 1024),
-                    ("grpc.max_send_message_length", 4 * 1024 * 1024),
-                ],
-            )
-            self._stub = agent_handler_pb2_grpc.AgentHandlerStub(self._channel)
-            logger.debug(f"Connected to agent handler at {self._address}")
+        self._pooled: dict[asyncio.AbstractEventLoop, _PooledChannels] = {}
+        self._lock = threading.Lock()
+
+    def _stub(self) -> agent_handler_pb2_grpc.AgentHandlerStub:
+        """Return a pooled stub for the running event loop, connecting on first use."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pooled = self._pooled.get(loop)
+            if pooled is None:
+                pooled = _acquire_channels(self._address, loop)
+                self._pooled[loop] = pooled
+        return pooled.next_stub()
+
+    def _call_timeout(self) -> float:
+        """Seconds a call may take: the client timeout, capped by the caller's deadline."""
+        remaining = anyio.current_effective_deadline() - anyio.current_time()
+        return max(0.0, min(self._timeout, remaining))
 
     def _build_request(
         self, messages: list[dict[str, str]]
@@ -112,16 +224,13 @@ class GrpcAgentClient:
         ]
         return agent_handler_pb2.HandleRequest(messages=proto_messages)
 
-    def __call__(self, messages: list[dict[str, str]], **kwargs: Any) -> Any:
+    async def __call__(self, messages: list[dict[str, str]], **kwargs: Any) -> Any:
         """Execute the remote handler with conversation history.
 
-        Called by ManifestWorker at line 171:
-            raw_results = self.manifest.run(message_history or [])
-
         Supports two modes:
             - Unary (default): Calls HandleMessages, returns str or dict.
-            - Streaming: Calls HandleMessagesStream, returns a generator.
-              ResultProcessor.collect_results() drains generators via __next__.
+            - Streaming: Calls HandleMessagesStream, returns an async generator.
+              ResultProcessor.collect_results() drains it via __anext__.
 
         Args:
             messages: Conversation history as list of dicts.
@@ -133,65 +242,55 @@ class GrpcAgentClient:
                 str: Plain text response (maps to "completed" task state).
                 dict: Structured response with "state" key for state transitions.
             Streaming mode:
-                Generator[str | dict]: Yields chunks. ResultProcessor.collect_results()
+                AsyncGenerator[str | dict]: Yields chunks. ResultProcessor.collect_results()
                 uses the last yielded value as the final result.
 
         Raises:
-            grpc.RpcError: If the gRPC call fails (caught by ManifestWorker's
+            grpc.aio.AioRpcError: If the gRPC call fails (caught by ManifestWorker's
                 try/except which calls _handle_task_failure).
         """
-        self._ensure_connected()
-        assert self._stub is not None
-
+        stub = self._stub()
         request = self._build_request(messages)
+        timeout = self._call_timeout()
 
         if self._use_streaming:
             logger.debug(
                 f"Calling HandleMessagesStream on {self._address} "
                 f"with {len(request.messages)} messages"
             )
-            return self._handle_streaming(request)
-        else:
-            logger.debug(
-                f"Calling HandleMessages on {self._address} "
-                f"with {len(request.messages)} messages"
-            )
-            return self._handle_unary(request)
-
-    def _handle_unary(
-        self, request: agent_handler_pb2.HandleRequest
-    ) -> str | dict[str, Any]:
-        """Make a unary HandleMessages call.
-
-        Args:
-            request: Proto HandleRequest.
+            return self._handle_streaming(stub, request, timeout)
 
-        Returns:
-            str or dict from _response_to_result().
-        """
-        assert self._stub is not None
-        response = self._stub.HandleMessages(request, timeout=self._timeout)
+        logger.debug(
+            f"Calling HandleMessages on {self._address} "
+            f"with {len(request.messages)} messages"
+        )
+        # Cancelling the awaiting task cancels the RPC
+        response = await stub.HandleMessages(request, timeout=timeout)
         return self._response_to_result(response)
 
-    def _handle_streaming(self, request: agent_handler_pb2.HandleRequest) -> Any:
+    async def _handle_streaming(
+        self,
+        stub: agent_handler_pb2_grpc.AgentHandlerStub,
+        request: agent_handler_pb2.HandleRequest,
+        timeout: float,
+    ) -> AsyncIterator[str | dict[str, Any]]:
         """Make a streaming HandleMessagesStream call.
 
-        Returns a generator that yields results from the stream.
-        ResultProcessor.collect_results() detects this via __next__
-        and drains it, using the last yielded value as the final result.
-
         Args:
+            stub: Pooled AgentHandler stub.
             request: Proto HandleRequest.
+            timeout: Deadline of the whole stream in seconds.
 
         Yields:
             str or dict from _response_to_result() for each stream chunk.
         """
-        assert self._stub is not None
-        response_stream = self._stub.HandleMessagesStream(
-            request, timeout=self._timeout
-        )
-        for response in response_stream:
-            yield self._response_to_result(response)
+        call = stub.HandleMessagesStream(request, timeout=timeout)
+        try:
+            async for response in call:
+                yield self._response_to_result(response)
+        finally:
+            # Stops the SDK's handler if the consumer gave up or was cancelled
+            call.cancel()
 
     @staticmethod
     def _response_to_result(
@@ -225,25 +324,23 @@ class GrpcAgentClient:
             # Plain string response — maps to "completed" task state
             return response.content
 
-    def health_check(self) -> bool:
+    async def health_check(self) -> bool:
         """Check if the remote SDK agent is healthy.
 
         Returns:
             True if the agent responds and reports healthy, False otherwise.
         """
-        self._ensure_connected()
-        assert self._stub is not None
         try:
-            response = self._stub.HealthCheck(
+            response = await self._stub().HealthCheck(
                 agent_handler_pb2.HealthCheckRequest(),
-                timeout=5.0,
+                timeout=PROBE_TIMEOUT_SECONDS,
             )
             return response.healthy
         except grpc.RpcError as e:
             logger.warning(f"Health check failed for {self._address}: {e}")
             return False
 
-    def get_capabilities(
+    async def get_capabilities(
         self,
     ) -> agent_handler_pb2.GetCapabilitiesResponse | None:
         """Query the remote SDK agent's capabilities.
@@ -251,24 +348,25 @@ class GrpcAgentClient:
         Returns:
             GetCapabilitiesResponse if successful, None on failure.
         """
-        self._ensure_connected()
-        assert self._stub is not None
         try:
-            return self._stub.GetCapabilities(
+            return await self._stub().GetCapabilities(
                 agent_handler_pb2.GetCapabilitiesRequest(),
-                timeout=5.0,
+                timeout=PROBE_TIMEOUT_SECONDS,
             )
         except grpc.RpcError as e:
             logger.warning(f"GetCapabilities failed for {self._address}: {e}")
             return None
 
     def close(self) -> None:
-        """Close the gRPC channel and release resources."""
-        if self._channel is not None:
-            self._channel.close()
-            self._channel = None
-            self._stub = None
-            logger.debug(f"Closed connection to {self._address}")
+        """Release the client's pooled channels.
+
+        Safe to call from any thread. Channels no other client uses are
+        closed on their own event loop.
+        """
+        with self._lock:
+            loops, self._pooled = list(self._pooled), {}
+        for loop in loops:
+            _release_channels(self._address, loop)
 
     def __repr__(self) -> str:  # noqa: D105
         mode = "streaming" if self._use_streaming else "unary"
@@ -1,20 +1,29 @@
-"""Thread-safe agent registry for gRPC-registered remote agents.
+"""Agent registry for gRPC-registered remote agents.
 
 Tracks agents that have registered via the BinduService.RegisterAgent RPC.
 Each entry maps an agent_id to its gRPC callback address, manifest, and
 lifecycle timestamps.
 
-Thread safety is required because the gRPC server uses a ThreadPoolExecutor
-for handling concurrent RegisterAgent/Heartbeat/UnregisterAgent calls.
+The registry belongs to the event loop running the gRPC server. Its methods
+never await, so each one runs atomically with respect to the servicer
+coroutines and no lock is needed.
+
+Agents that stop sending heartbeats are dropped after
+``app_settings.grpc.heartbeat_timeout`` seconds. Deadlines are kept in a
+heap and a single timer task sleeps until the earliest one, so thousands of
+agents cost one wakeup per expiry instead of a periodic scan.
 """
 
 from __future__ import annotations
 
-import threading
+import asyncio
+import heapq
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
+from bindu.settings import app_settings
 from bindu.utils.logging import get_logger
 
 if TYPE_CHECKING:
@@ -43,17 +52,39 @@ class RegisteredAgent:
     last_heartbeat: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+def _close_handler(entry: RegisteredAgent) -> None:
+    """Release the GrpcAgentClient behind an agent's manifest.run."""
+    run = entry.manifest.run
+    handler = getattr(run, "__wrapped__", run)
+    if hasattr(handler, "close"):
+        handler.close()
+
+
 class AgentRegistry:
-    """Thread-safe in-memory registry for gRPC-registered agents.
+    """In-memory registry of gRPC-registered agents with heartbeat expiry.
 
-    Provides register/unregister/lookup operations protected by a
-    threading.Lock, since the gRPC server's ThreadPoolExecutor may
-    call these concurrently.
+    Must be used from the event loop that runs the gRPC server.
     """
 
-    def __init__(self) -> None:  # noqa: D107
+    def __init__(self, heartbeat_timeout: float | None = None) -> None:
+        """Initialize the registry.
+
+        Args:
+            heartbeat_timeout: Seconds without a heartbeat before an agent is
+                dropped; 0 disables expiry. Defaults to
+                app_settings.grpc.heartbeat_timeout.
+        """
+        self.heartbeat_timeout = (
+            app_settings.grpc.heartbeat_timeout
+            if heartbeat_timeout is None
+            else heartbeat_timeout
+        )
         self._agents: dict[str, RegisteredAgent] = {}
-        self._lock = threading.Lock()
+        self._deadlines: dict[str, float] = {}
+        # (deadline, agent_id); entries are left in place when an agent
+        # heartbeats or leaves and skipped once they reach the top
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._expiry_task: asyncio.Task[None] | None = None
 
     def register(
         self,
@@ -76,8 +107,11 @@ class AgentRegistry:
             grpc_callback_address=grpc_callback_address,
             manifest=manifest,
         )
-        with self._lock:
-            self._agents[agent_id] = entry
+        previous = self._agents.get(agent_id)
+        self._agents[agent_id] = entry
+        if previous is not None and previous.manifest is not manifest:
+            _close_handler(previous)
+        self._schedule_expiry(agent_id)
         logger.info(
             f"Registered agent {agent_id} with callback at {grpc_callback_address}"
         )
@@ -92,11 +126,10 @@ class AgentRegistry:
         Returns:
             RegisteredAgent if found, None otherwise.
         """
-        with self._lock:
-            return self._agents.get(agent_id)
+        return self._agents.get(agent_id)
 
     def unregister(self, agent_id: str) -> bool:
-        """Remove an agent from the registry.
+        """Remove an agent from the registry and close its gRPC client.
 
         Args:
             agent_id: UUID string of the agent to remove.
@@ -104,9 +137,7 @@ class AgentRegistry:
         Returns:
             True if the agent was found and removed, False otherwise.
         """
-        with self._lock:
-            removed = self._agents.pop(agent_id, None)
-        if removed:
+        if self._remove(agent_id):
             logger.info(f"Unregistered agent {agent_id}")
             return True
         logger.warning(f"Attempted to unregister unknown agent {agent_id}")
@@ -121,12 +152,12 @@ class AgentRegistry:
         Returns:
             True if the agent was found and updated, False otherwise.
         """
-        with self._lock:
-            entry = self._agents.get(agent_id)
-            if entry:
-                entry.last_heartbeat = datetime.now(timezone.utc)
-                return True
-        return False
+        entry = self._agents.get(agent_id)
+        if entry is None:
+            return False
+        entry.last_heartbeat = datetime.now(timezone.utc)
+        self._schedule_expiry(agent_id)
+        return True
 
     def list_agents(self) -> list[RegisteredAgent]:
         """Return a snapshot of all registered agents.
@@ -134,9 +165,61 @@ class AgentRegistry:
         Returns:
             List of RegisteredAgent entries (copy, safe to iterate).
         """
-        with self._lock:
-            return list(self._agents.values())
+        return list(self._agents.values())
+
+    def close(self) -> None:
+        """Stop the expiry timer."""
+        if self._expiry_task is not None:
+            self._expiry_task.cancel()
+            self._expiry_task = None
 
     def __len__(self) -> int:  # noqa: D105
-        with self._lock:
-            return len(self._agents)
+        return len(self._agents)
+
+    def _remove(self, agent_id: str) -> bool:
+        entry = self._agents.pop(agent_id, None)
+        self._deadlines.pop(agent_id, None)
+        if entry is None:
+            return False
+        _close_handler(entry)
+        return True
+
+    def _schedule_expiry(self, agent_id: str) -> None:
+        if self.heartbeat_timeout <= 0:
+            return
+        deadline = time.monotonic() + self.heartbeat_timeout
+        self._deadlines[agent_id] = deadline
+        heapq.heappush(self._expiry_heap, (deadline, agent_id))
+        if len(self._expiry_heap) > 4 * len(self._deadlines) + 64:
+            # Mostly superseded heartbeats: rebuild from the live deadlines
+            self._expiry_heap = [(d, a) for a, d in self._deadlines.items()]
+            heapq.heapify(self._expiry_heap)
+
+        if self._expiry_task is None or self._expiry_task.done():
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # Not on a loop (e.g. tests); expiry starts with the next call on one
+                return
+            self._expiry_task = loop.create_task(self._expire_agents())
+
+    async def _expire_agents(self) -> None:
+        """Drop agents whose heartbeat deadline has passed.
+
+        Every agent gets the same timeout, so a new deadline is never earlier
+        than the heap's top and the timer can simply sleep until the top.
+        """
+        while self._expiry_heap:
+            deadline, agent_id = self._expiry_heap[0]
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            heapq.heappop(self._expiry_heap)
+            if self._deadlines.get(agent_id) != deadline:
+                continue  # heartbeat arrived or agent left meanwhile
+            self._remove(agent_id)
+            logger.warning(
+                f"Agent {agent_id} expired: no heartbeat for {self.heartbeat_timeout}s"
+            )
+        self._expiry_task = None
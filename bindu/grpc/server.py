@@ -4,24 +4,24 @@ This module starts a gRPC server that implements BinduService. External
 SDKs (TypeScript, Kotlin, Rust) connect to this server to register their
 agents via RegisterAgent.
 
-The server uses a ThreadPoolExecutor for concurrent request handling.
-It is started either:
+The server is a ``grpc.aio`` server on the caller's event loop, so
+registrations and heartbeats from thousands of SDK agents are handled
+without a thread per call. It is started either:
   - By the `bindu serve --grpc` CLI command (standalone mode)
-  - By BinduApplication lifespan when grpc.enabled=True (integrated mode)
+  - By BinduApplication lifespan when grpc.enabled=True (integrated mode),
+    sharing the loop that serves the A2A HTTP app
 
 Usage:
     from bindu.grpc.server import start_grpc_server
     from bindu.grpc.registry import AgentRegistry
 
     registry = AgentRegistry()
-    server = start_grpc_server(registry)
-    server.wait_for_termination()  # blocks
+    server = await start_grpc_server(registry)
+    await server.wait_for_termination()
 """
 
 from __future__ import annotations
 
-from concurrent import futures
-
 import grpc
 
 from bindu.grpc.generated import agent_handler_pb2_grpc
@@ -33,35 +33,34 @@ from bindu.utils.logging import get_logger
 logger = get_logger("bindu.grpc.server")
 
 
-def start_grpc_server(
+async def start_grpc_server(
     registry: AgentRegistry | None = None,
     host: str | None = None,
     port: int | None = None,
     max_workers: int | None = None,
-) -> grpc.Server:
+) -> grpc.aio.Server:
     """Start the Bindu gRPC server for SDK agent registration.
 
-    Creates a gRPC server that serves BinduService, allowing external SDKs
-    to register agents via RegisterAgent RPC.
+    Creates a gRPC server that serves BinduService on the running event loop,
+    allowing external SDKs to register agents via RegisterAgent RPC.
 
     Args:
         registry: Agent registry instance. Creates a new one if None.
         host: Bind host. Defaults to app_settings.grpc.host.
-        port: Bind port. Defaults to app_settings.grpc.port (3774).
-        max_workers: Thread pool size. Defaults to app_settings.grpc.max_workers.
+        port: Bind port. Defaults to app_settings.grpc.port (3774); 0 picks
+            a free port.
+        max_workers: Registrations set up concurrently. Defaults to
+            app_settings.grpc.max_workers.
 
     Returns:
-        The started grpc.Server instance. Call wait_for_termination() to block,
-        or stop() to shut down.
+        The started grpc.aio.Server. Await wait_for_termination() to block,
+        or stop() to shut down (then close() the registry).
     """
-    registry = registry or AgentRegistry()
+    registry = registry if registry is not None else AgentRegistry()
     host = host or app_settings.grpc.host
-    port = port or app_settings.grpc.port
-    max_workers = max_workers or app_settings.grpc.max_workers
+    port = app_settings.grpc.port if port is None else port
 
-    # Create gRPC server with thread pool
-    server = grpc.server(
-        futures.ThreadPoolExecutor(max_workers=max_workers),
+    server = grpc.aio.server(
         options=[
             (
                 "grpc.max_receive_message_length",
@@ -71,21 +70,31 @@ def start_grpc_server(
                 "grpc.max_send_message_length",
                 app_settings.grpc.max_message_length,
             ),
+            # Let heartbeat bursts from thousands of agents queue instead of
+            # being cancelled at gRPC's default of 1000 pending calls
+            (
+                "grpc.server.max_pending_requests",
+                app_settings.grpc.max_pending_requests,
+            ),
+            (
+                "grpc.server.max_pending_requests_hard_limit",
+                3 * app_settings.grpc.max_pending_requests,
+            ),
         ],
     )
 
     # Register BinduService
     agent_handler_pb2_grpc.add_BinduServiceServicer_to_server(
-        BinduServiceImpl(registry),
+        BinduServiceImpl(registry, max_workers=max_workers),
         server,
     )
 
     # Bind to address
-    bind_address = f"{host}:{port}"
-    server.add_insecure_port(bind_address)
+    bound_port = server.add_insecure_port(f"{host}:{port}")
+    bind_address = f"{host}:{bound_port}"
 
     # Start serving
-    server.start()
+    await server.start()
     logger.info(f"gRPC server started on {bind_address}")
     logger.info(
         "Waiting for SDK agent registrations... "
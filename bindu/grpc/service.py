@@ -10,12 +10,19 @@ When a TypeScript/Kotlin/Rust SDK calls RegisterAgent, this service:
 
 The _bindufy_core() function is the same code path as Python bindufy(),
 ensuring DRY — there is exactly one place that handles agent setup.
+
+The servicer runs on a grpc.aio server, so heartbeats and unregistrations are
+answered on the event loop without a thread each. Only _bindufy_core(), which
+generates keys and starts servers, runs on a small thread pool.
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import grpc
@@ -71,16 +78,22 @@ class BinduServiceImpl(agent_handler_pb2_grpc.BinduServiceServicer):
     this service to register their agents, send heartbeats, and unregister.
 
     Attributes:
-        registry: Thread-safe agent registry for tracking registered agents.
+        registry: Agent registry for tracking registered agents.
     """
 
-    def __init__(self, registry: AgentRegistry) -> None:  # noqa: D107
+    def __init__(  # noqa: D107
+        self, registry: AgentRegistry, max_workers: int | None = None
+    ) -> None:
         self.registry = registry
+        self._setup_pool = ThreadPoolExecutor(
+            max_workers=max_workers or app_settings.grpc.max_workers,
+            thread_name_prefix="bindu-grpc-register",
+        )
 
-    def RegisterAgent(
+    async def RegisterAgent(
         self,
         request: agent_handler_pb2.RegisterAgentRequest,
-        context: grpc.ServicerContext,
+        context: grpc.aio.ServicerContext,
     ) -> agent_handler_pb2.RegisterAgentResponse:
         """Register a remote agent and start its A2A HTTP server.
 
@@ -109,10 +122,14 @@ class BinduServiceImpl(agent_handler_pb2_grpc.BinduServiceServicer):
             # 2. Convert proto skills to inline dicts
             skills = _proto_skills_to_dicts(list(request.skills))
 
-            # 3. Create GrpcAgentClient as the handler callable
+            # 3. Create GrpcAgentClient as the handler callable. Agents that
+            # advertise streaming are called via HandleMessagesStream so their
+            # chunks reach message/stream clients as they are produced.
+            capabilities = config.get("capabilities") or {}
             grpc_client = GrpcAgentClient(
                 callback_address=request.grpc_callback_address,
                 timeout=app_settings.grpc.handler_timeout,
+                use_streaming=bool(capabilities.get("streaming", False)),
             )
 
             # 4. Determine key directory for this agent
@@ -124,16 +141,21 @@ class BinduServiceImpl(agent_handler_pb2_grpc.BinduServiceServicer):
             #    This is the SAME code path as Python bindufy() — DRY
             from bindu.penguin.bindufy import _bindufy_core
 
-            manifest = _bindufy_core(
-                config=config,
-                handler_callable=grpc_client,
-                run_server=True,
-                key_dir=key_dir,
-                launch=False,
-                caller_dir=key_dir,
-                skills_override=skills,
-                skip_handler_validation=True,
-                run_server_in_background=True,  # Don't block the gRPC call
+            #    It blocks (key generation, server startup), so it runs off the loop
+            manifest = await asyncio.get_running_loop().run_in_executor(
+                self._setup_pool,
+                functools.partial(
+                    _bindufy_core,
+                    config=config,
+                    handler_callable=grpc_client,
+                    run_server=True,
+                    key_dir=key_dir,
+                    launch=False,
+                    caller_dir=key_dir,
+                    skills_override=skills,
+                    skip_handler_validation=True,
+                    run_server_in_background=True,  # Don't block the gRPC call
+                ),
             )
 
             # 6. Register in our registry
@@ -169,10 +191,10 @@ class BinduServiceImpl(agent_handler_pb2_grpc.BinduServiceServicer):
                 success=False, error=error_msg
             )
 
-    def Heartbeat(
+    async def Heartbeat(
         self,
         request: agent_handler_pb2.HeartbeatRequest,
-        context: grpc.ServicerContext,
+        context: grpc.aio.ServicerContext,
     ) -> agent_handler_pb2.HeartbeatResponse:
         """Process a heartbeat from a registered SDK agent.
 
@@ -191,10 +213,10 @@ class BinduServiceImpl(agent_handler_pb2_grpc.BinduServiceServicer):
             server_timestamp=int(time.time() * 1000),
         )
 
-    def UnregisterAgent(
+    async def UnregisterAgent(
         self,
         request: agent_handler_pb2.UnregisterAgentRequest,
-        context: grpc.ServicerContext,
+        context: grpc.aio.ServicerContext,
     ) -> agent_handler_pb2.UnregisterAgentResponse:
         """Unregister an agent and clean up resources.
 
@@ -205,12 +227,7 @@ class BinduServiceImpl(agent_handler_pb2_grpc.BinduServiceServicer):
         Returns:
             UnregisterAgentResponse with success status.
         """
-        # Close the GrpcAgentClient connection if it exists
-        entry = self.registry.get(request.agent_id)
-        if entry and hasattr(entry.manifest.run, "close"):
-            close_fn = getattr(entry.manifest.run, "close")
-            close_fn()
-
+        # The registry also closes the agent's GrpcAgentClient
         removed = self.registry.unregister(request.agent_id)
         if removed:
             logger.info(f"Agent {request.agent_id} unregistered successfully")
@@ -245,7 +245,7 @@ def _setup_tunnel(
         bindu_app.url = tunnel_url
 
         # Invalidate cached agent card so it gets regenerated with new URL
-        bindu_app._agent_card_json_schema = None
+        bindu_app.invalidate_discovery_documents()
 
         return tunnel_url
 
@@ -521,6 +521,7 @@ def _bindufy_core(
             "enable_context_based_history", False
         ),
         negotiation=validated_config.get("negotiation"),
+        execution=validated_config.get("execution"),
         documentation_url=validated_config["documentation_url"],
         extra_metadata=validated_config["extra_metadata"],
         global_webhook_url=validated_config.get("global_webhook_url"),
@@ -645,6 +646,8 @@ def bindufy(
             - scheduler: Task scheduler configuration dict
             - global_webhook_url: Default webhook URL for all tasks (optional)
             - global_webhook_token: Authentication token for global webhook (optional)
+            - execution: Sync handler execution dict (optional) with keys
+              mode ('inline', 'thread' or 'process'), max_workers, timeout_seconds
         handler: The handler function that processes messages and returns responses.
                 Must have signature: (messages: list[dict[str, str]]) -> Any
         run_server: If True, starts the uvicorn server (blocking). If False, returns manifest
@@ -209,6 +209,9 @@ class ConfigValidator:
         if config.get("kind") not in ["agent", "team", "workflow"]:
             raise ValueError("Field 'kind' must be one of: agent, team, workflow")
 
+        if config.get("execution") is not None:
+            cls._validate_execution_config(config["execution"])
+
         # execution_cost can be either a single dict or a list of dicts
         if "execution_cost" in config and config["execution_cost"] is not None:
             execution_cost = config["execution_cost"]
@@ -232,6 +235,31 @@ class ConfigValidator:
                     "Field 'execution_cost' must be a dict or a list of dicts"
                 )
 
+    @classmethod
+    def _validate_execution_config(cls, execution: Any) -> None:
+        if not isinstance(execution, dict):
+            raise ValueError("Field 'execution' must be a dictionary")
+
+        mode = execution.get("mode", "thread")
+        if mode not in ("inline", "thread", "process"):
+            raise ValueError(
+                "Field 'execution.mode' must be one of: inline, thread, process"
+            )
+
+        max_workers = execution.get("max_workers")
+        if max_workers is not None and (
+            not isinstance(max_workers, int) or max_workers < 1
+        ):
+            raise ValueError("Field 'execution.max_workers' must be a positive integer")
+
+        timeout = execution.get("timeout_seconds")
+        if timeout is not None and (
+            not isinstance(timeout, (int, float)) or timeout <= 0
+        ):
+            raise ValueError(
+                "Field 'execution.timeout_seconds' must be a positive number"
+            )
+
     # ------------------------------------------------------------------
     # Auth validation
     # ------------------------------------------------------------------
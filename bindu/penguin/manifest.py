@@ -15,6 +15,7 @@ This module provides core functions for creating AgentManifests from user functi
 and validating protocol compliance for agents and workflows.
 """
 
+import functools
 import inspect
 from datetime import UTC, datetime
 from typing import Any, Callable, Literal
@@ -84,6 +85,38 @@ def validate_agent_function(agent_function: Callable) -> None:
     logger.debug(f"Agent function '{func_name}' validated successfully")
 
 
+def _resolve_params(has_context_param: bool, input_msg: str, **kwargs) -> tuple:
+    """Resolve function parameters based on signature analysis.
+
+    Note: Context is managed at session level via context_id in the architecture.
+    Each session IS a context, so no separate context parameter needed.
+
+    Args:
+        has_context_param: Whether the function accepts a context parameter
+        input_msg: The input message to process
+        **kwargs: Additional keyword arguments
+
+    Returns:
+        Tuple of parameters to pass to the agent function
+    """
+    if has_context_param:
+        session_context = kwargs.get("session_context", {})
+        return (input_msg, session_context)
+    else:
+        return (input_msg,)
+
+
+def _call_agent_function(
+    agent_function: Callable, has_context_param: bool, input_msg: str, **kwargs
+) -> Any:
+    """Call a sync agent function with its resolved parameters.
+
+    Module-level so that, bound with ``functools.partial`` to a module-level
+    agent function, it can be pickled into a worker process.
+    """
+    return agent_function(*_resolve_params(has_context_param, input_msg, **kwargs))
+
+
 def _create_run_method(
     agent_function: Callable,
     has_context_param: bool,
@@ -105,31 +138,12 @@ def _create_run_method(
         Callable: Appropriate run method for the function type
     """
 
-    def _resolve_params(input_msg: str, **kwargs) -> tuple:
-        """Resolve function parameters based on signature analysis.
-
-        Note: Context is managed at session level via context_id in the architecture.
-        Each session IS a context, so no separate context parameter needed.
-
-        Args:
-            input_msg: The input message to process
-            **kwargs: Additional keyword arguments
-
-        Returns:
-            Tuple of parameters to pass to the agent function
-        """
-        if has_context_param:
-            session_context = kwargs.get("session_context", {})
-            return (input_msg, session_context)
-        else:
-            return (input_msg,)
-
     # Async generator function (streaming)
     if inspect.isasyncgenfunction(agent_function):
         logger.debug(f"Creating async generator run method for '{manifest_name}'")
 
         async def run(input_msg: str, **kwargs):
-            params = _resolve_params(input_msg, **kwargs)
+            params = _resolve_params(has_context_param, input_msg, **kwargs)
             try:
                 gen = agent_function(*params)
                 value = None
@@ -140,12 +154,14 @@ def _create_run_method(
 
         return run
 
-    # Coroutine function (async single/multi result)
-    elif inspect.iscoroutinefunction(agent_function):
+    # Coroutine function or object with an async __call__ (e.g. GrpcAgentClient)
+    elif inspect.iscoroutinefunction(agent_function) or inspect.iscoroutinefunction(
+        getattr(type(agent_function), "__call__", None)
+    ):
         logger.debug(f"Creating coroutine run method for '{manifest_name}'")
 
         async def run(input_msg: str, **kwargs):
-            params = _resolve_params(input_msg, **kwargs)
+            params = _resolve_params(has_context_param, input_msg, **kwargs)
             result = await agent_function(*params)
 
             # Handle different result types
@@ -158,6 +174,8 @@ def _create_run_method(
             else:
                 yield result
 
+        # Expose the handler so owners can reach it (e.g. to close a client)
+        run.__wrapped__ = agent_function  # type: ignore[attr-defined]
         return run
 
     # Sync generator function
@@ -165,9 +183,14 @@ def _create_run_method(
         logger.debug(f"Creating sync generator run method for '{manifest_name}'")
 
         def run(input_msg: str, **kwargs):
-            params = _resolve_params(input_msg, **kwargs)
+            params = _resolve_params(has_context_param, input_msg, **kwargs)
             yield from agent_function(*params)
 
+        # Expose the user function, and a picklable call for process pools
+        run.__wrapped__ = agent_function  # type: ignore[attr-defined]
+        run.process_target = functools.partial(  # type: ignore[attr-defined]
+            _call_agent_function, agent_function, has_context_param
+        )
         return run
 
     # Regular sync function
@@ -175,9 +198,14 @@ def _create_run_method(
         logger.debug(f"Creating sync function run method for '{manifest_name}'")
 
         def run(input_msg: str, **kwargs):
-            params = _resolve_params(input_msg, **kwargs)
+            params = _resolve_params(has_context_param, input_msg, **kwargs)
             return agent_function(*params)
 
+        # Expose the user function, and a picklable call for process pools
+        run.__wrapped__ = agent_function  # type: ignore[attr-defined]
+        run.process_target = functools.partial(  # type: ignore[attr-defined]
+            _call_agent_function, agent_function, has_context_param
+        )
         return run
 
 
@@ -202,6 +230,7 @@ def create_manifest(
     oltp_service_name: str | None = None,
     num_history_sessions: int = 10,
     negotiation: dict[str, Any] | None = None,
+    execution: dict[str, Any] | None = None,
     enable_system_message: bool = True,
     enable_context_based_history: bool = False,
     documentation_url: str | None = None,
@@ -239,6 +268,7 @@ def create_manifest(
         telemetry: Enable telemetry data collection (default: True).
         num_history_sessions: Number of conversation history sessions to maintain (default: 10).
         negotiation: Negotiation configuration (optional).
+        execution: Handler execution configuration - mode, max_workers, timeout_seconds (optional).
         enable_system_message: Enable system message/prompt in agent execution (default: True).
         enable_context_based_history: Enable context-based history in agent execution (default: False).
         documentation_url: URL to agent documentation (optional).
@@ -305,6 +335,7 @@ def create_manifest(
         oltp_service_name=oltp_service_name,
         documentation_url=documentation_url,
         negotiation=negotiation,
+        execution=execution,
         global_webhook_url=global_webhook_url,
         global_webhook_token=global_webhook_token,
     )
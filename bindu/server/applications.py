@@ -19,7 +19,7 @@ from __future__ import annotations as _annotations
 
 from contextlib import asynccontextmanager
 from functools import partial
-from typing import Any, AsyncIterator, Callable, Sequence
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Sequence
 from uuid import UUID, uuid4
 
 from starlette.applications import Starlette
@@ -45,6 +45,11 @@ from .storage.base import Storage
 from .task_manager import TaskManager
 from bindu.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from bindu.grpc.registry import AgentRegistry
+
+    from .endpoints.discovery import DiscoveryDocuments
+
 logger = get_logger("bindu.server.applications")
 
 # Constants
@@ -145,9 +150,10 @@ class BinduApplication(Starlette):
         self.task_manager: TaskManager | None = None
         self._storage: Storage | None = None
         self._scheduler: Scheduler | None = None
-        self._agent_card_json_schema: bytes | None = None
+        self._discovery_documents: DiscoveryDocuments | None = None
         self._x402_ext = x402_ext
         self._payment_session_manager = None
+        self.grpc_registry: AgentRegistry | None = None
         self._payment_requirements = None
         self._paywall_config = None
 
@@ -266,6 +272,23 @@ class BinduApplication(Starlette):
             with_app=True,
         )
 
+    def discovery_documents(self) -> DiscoveryDocuments:
+        """Return the serialized agent card, skills and DID document.
+
+        Built on first use and again once the manifest, URL or version changed.
+        """
+        from .endpoints.discovery import DiscoveryDocuments, source_key
+
+        documents = self._discovery_documents
+        if documents is None or documents.source != source_key(self):
+            documents = DiscoveryDocuments(self)
+            self._discovery_documents = documents
+        return documents
+
+    def invalidate_discovery_documents(self) -> None:
+        """Rebuild the discovery documents after the manifest was edited in place."""
+        self._discovery_documents = None
+
     def _add_route(
         self,
         path: str,
@@ -364,15 +387,36 @@ class BinduApplication(Starlette):
                 # Try to initialize from environment variables
                 self._initialize_sentry(source="environment variables")
 
-            # Start payment session manager cleanup task if x402 enabled
+            # Start payment session expiry (or Redis connection) if x402 enabled
             if app._payment_session_manager:
-                await app._payment_session_manager.start_cleanup_task()
+                await app._payment_session_manager.start()
+
+            # Serve SDK registrations on this loop if the gRPC adapter is enabled
+            grpc_server = None
+            if app_settings.grpc.enabled:
+                from bindu.grpc import AgentRegistry, GrpcAgentClient, start_grpc_server
+
+                # Agents registered over gRPC run inside the core that serves it
+                handler = (
+                    getattr(manifest.run, "__wrapped__", None) if manifest else None
+                )
+                if not isinstance(handler, GrpcAgentClient):
+                    app.grpc_registry = AgentRegistry()
+                    grpc_server = await start_grpc_server(app.grpc_registry)
 
             # Start TaskManager
             if manifest:
+                # Serialize the agent card, skills and DID document up front
+                app.discovery_documents()
+
                 logger.info("🔧 Starting TaskManager...")
+                from .events.factory import create_event_bus
+
                 task_manager = TaskManager(
-                    scheduler=scheduler, storage=storage, manifest=manifest
+                    scheduler=scheduler,
+                    storage=storage,
+                    manifest=manifest,
+                    event_bus=create_event_bus(self._scheduler_config),
                 )
                 async with task_manager:
                     app.task_manager = task_manager
@@ -382,9 +426,14 @@ class BinduApplication(Starlette):
             else:
                 yield
 
-            # Stop payment session manager cleanup task
+            if grpc_server is not None:
+                await grpc_server.stop(grace=5)
+                if app.grpc_registry is not None:
+                    app.grpc_registry.close()
+
+            # Stop payment session manager
             if app._payment_session_manager:
-                await app._payment_session_manager.stop_cleanup_task()
+                await app._payment_session_manager.stop()
 
             # Cleanup storage
             logger.info("🧹 Cleaning up storage...")
@@ -648,13 +697,15 @@ class BinduApplication(Starlette):
             manifest: Agent manifest
             payment_requirements_for_middleware: Payment requirements from middleware setup
         """
-        from bindu.server.middleware.x402.payment_session_manager import (
-            PaymentSessionManager,
+        from bindu.server.middleware.x402.session_factory import (
+            create_payment_session_manager,
         )
         from x402.types import PaywallConfig
         import os
 
-        self._payment_session_manager = PaymentSessionManager()
+        self._payment_session_manager = create_payment_session_manager(
+            self._scheduler_config
+        )
 
         # Create payment requirements for endpoints (with /payment-capture resource)
         self._payment_requirements = [
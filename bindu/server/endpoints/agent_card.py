@@ -9,10 +9,11 @@ from uuid import UUID
 from starlette.requests import Request
 from starlette.responses import Response
 
-from bindu.common.protocol.types import AgentCard, AgentCapabilities, agent_card_ta
+from bindu.common.protocol.types import AgentCard, AgentCapabilities
 from bindu.server.applications import BinduApplication
 from bindu.utils.logging import get_logger
-from .utils import create_response_with_x402, handle_endpoint_errors, get_client_ip
+from .discovery import serve_discovery_document
+from .utils import handle_endpoint_errors, get_client_ip
 
 logger = get_logger("bindu.server.endpoints.agent_card")
 
@@ -140,16 +141,5 @@ async def agent_card_endpoint(app: BinduApplication, request: Request) -> Respon
     """
     client_ip = get_client_ip(request)
 
-    # Lazy initialization of agent card schema
-    if app._agent_card_json_schema is None:
-        logger.debug("Generating agent card schema")
-        agent_card = create_agent_card(app)
-        app._agent_card_json_schema = agent_card_ta.dump_json(agent_card, by_alias=True)
-
     logger.debug(f"Serving agent card to {client_ip}")
-    return create_response_with_x402(
-        request,
-        app._agent_card_json_schema,
-        response_type=Response,
-        media_type="application/json",
-    )
+    return serve_discovery_document(request, app.discovery_documents().agent_card)
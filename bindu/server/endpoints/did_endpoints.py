@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Optional
 
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import Response
 
 from bindu.common.protocol.types import (
     InternalError,
@@ -14,6 +14,7 @@ from bindu.common.protocol.types import (
 )
 from bindu.server.applications import BinduApplication
 from bindu.utils.logging import get_logger
+from .discovery import serve_discovery_document
 from .utils import (
     handle_endpoint_errors,
     extract_error_fields,
@@ -93,5 +94,6 @@ async def did_resolve_endpoint(app: BinduApplication, request: Request) -> Respo
         )
 
     logger.debug(f"Resolving DID {did} for {client_ip}")
-    did_document = did_extension.get_did_document()
-    return JSONResponse(content=did_document)
+    did_document = app.discovery_documents().did_document
+    assert did_document is not None
+    return serve_discovery_document(request, did_document)
@@ -0,0 +1,212 @@
+"""Precomputed discovery documents.
+
+Orchestrators poll the agent card, the skills endpoints and the DID document
+constantly, and none of them change while the agent runs. Each document is
+serialized once, when first needed and again after the manifest changes,
+and served from bytes:
+
+- Every variant has a strong ETag, and ``If-None-Match`` is answered with
+  ``304 Not Modified``
+- ``Cache-Control`` lets clients reuse a document for
+  ``NETWORK__DISCOVERY_MAX_AGE`` seconds
+- gzip variants are compressed up front, and br variants too when the
+  ``brotli`` package is installed
+- Skills are looked up by id or name in a dict
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from bindu.common.protocol.types import Skill, agent_card_ta
+from bindu.settings import app_settings
+from bindu.utils.logging import get_logger
+
+from .utils import create_response_with_x402
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+if TYPE_CHECKING:
+    from bindu.server.applications import BinduApplication
+
+logger = get_logger("bindu.server.endpoints.discovery")
+
+IDENTITY = "identity"
+# Preferred first when a client accepts several with the same quality
+COMPRESSED_ENCODINGS = ("br", "gzip")
+VARY = "Accept-Encoding, X-A2A-Extensions"
+
+
+def _compress(body: bytes, encoding: str) -> bytes | None:
+    if encoding == "gzip":
+        # Fixed mtime keeps the bytes, and so the ETag, stable across restarts
+        return gzip.compress(body, compresslevel=9, mtime=0)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(body)
+    return None
+
+
+def render_json(content: Any) -> bytes:
+    """Serialize content the way JSONResponse does."""
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class DiscoveryDocument:
+    """A serialized document with its encoded variants and their ETags."""
+
+    def __init__(self, body: bytes, media_type: str = "application/json") -> None:
+        """Serialize the variants of a document.
+
+        Args:
+            body: Uncompressed document
+            media_type: Content type of the document
+        """
+        self.media_type = media_type
+        digest = hashlib.sha256(body).hexdigest()
+        # encoding -> (body, ETag); each variant needs its own strong ETag
+        self.variants: dict[str, tuple[bytes, str]] = {IDENTITY: (body, f'"{digest}"')}
+        for encoding in COMPRESSED_ENCODINGS:
+            compressed = _compress(body, encoding)
+            if compressed is not None and len(compressed) < len(body):
+                self.variants[encoding] = (compressed, f'"{digest}-{encoding}"')
+
+    def select_encoding(self, accept_encoding: str) -> str:
+        """Pick the variant to send for an Accept-Encoding header."""
+        accepted: dict[str, float] = {}
+        for item in accept_encoding.split(","):
+            name, _, params = item.partition(";")
+            quality = 1.0
+            for param in params.split(";"):
+                key, _, value = param.strip().partition("=")
+                if key == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            accepted[name.strip().lower()] = quality
+
+        best, best_quality = IDENTITY, 0.0
+        for encoding in COMPRESSED_ENCODINGS:
+            if encoding not in self.variants:
+                continue
+            quality = accepted.get(encoding, accepted.get("*", 0.0))
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+
+class DiscoveryDocuments:
+    """All discovery documents of an application, built from its manifest."""
+
+    def __init__(self, app: BinduApplication) -> None:
+        """Build the documents.
+
+        Args:
+            app: BinduApplication with a manifest
+
+        Raises:
+            ValueError: If the application has no manifest
+        """
+        from .agent_card import create_agent_card
+        from .skills import skill_detail, skill_summary
+
+        self.source = source_key(app)
+        manifest = app.manifest
+        agent_card = create_agent_card(app)
+        self.agent_card = DiscoveryDocument(
+            agent_card_ta.dump_json(agent_card, by_alias=True)
+        )
+
+        assert manifest is not None
+        skills: list[Skill] = manifest.skills or []
+        summaries = [skill_summary(skill) for skill in skills]
+        self.skills_list = DiscoveryDocument(
+            render_json({"skills": summaries, "total": len(summaries)})
+        )
+
+        # Keyed by id and by name; the first skill to claim a key keeps it
+        self.skills: dict[str, Skill] = {}
+        self.skill_details: dict[str, DiscoveryDocument] = {}
+        for skill in skills:
+            document = DiscoveryDocument(render_json(skill_detail(skill)))
+            for key in (skill.get("id"), skill.get("name")):
+                if key is not None and key not in self.skills:
+                    self.skills[key] = skill
+                    self.skill_details[key] = document
+
+        did_extension = manifest.did_extension
+        self.did_document: DiscoveryDocument | None = None
+        if did_extension is not None and hasattr(did_extension, "get_did_document"):
+            self.did_document = DiscoveryDocument(
+                render_json(did_extension.get_did_document())
+            )
+
+        logger.debug(f"Built discovery documents for {len(skills)} skills")
+
+
+def source_key(app: BinduApplication) -> tuple[int, str, str]:
+    """Return what the documents are built from, to detect a replaced manifest.
+
+    In-place edits of the manifest are not detected; call
+    ``BinduApplication.invalidate_discovery_documents`` after them.
+    """
+    return id(app.manifest), app.url, app.version
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def serve_discovery_document(request: Request, document: DiscoveryDocument) -> Response:
+    """Send a discovery document, or 304 if the client's copy is current.
+
+    Args:
+        request: Starlette request
+        document: Document to send
+
+    Returns:
+        Response with the variant the client accepts best
+    """
+    encoding = document.select_encoding(request.headers.get("accept-encoding", ""))
+    body, etag = document.variants[encoding]
+
+    max_age = app_settings.network.discovery_max_age
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}" if max_age > 0 else "no-cache",
+        "Vary": VARY,
+    }
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return create_response_with_x402(
+            request, None, response_type=Response, status_code=304, headers=headers
+        )
+
+    if encoding != IDENTITY:
+        headers["Content-Encoding"] = encoding
+    return create_response_with_x402(
+        request,
+        body,
+        response_type=Response,
+        media_type=document.media_type,
+        headers=headers,
+    )
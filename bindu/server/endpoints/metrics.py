@@ -36,26 +36,30 @@ async def _update_agent_metrics(app: BinduApplication) -> None:
     agent_id = get_agent_did(app)
     if agent_id:
         try:
-            # Count active tasks (submitted, working, input-required)
-            from typing import cast
-            from bindu.common.protocol.types import TaskState
-
-            submitted = await app._storage.count_tasks(
-                status=cast(TaskState, ACTIVE_TASK_STATUSES[0])
-            )
-            working = await app._storage.count_tasks(
-                status=cast(TaskState, ACTIVE_TASK_STATUSES[1])
-            )
-            input_required = await app._storage.count_tasks(
-                status=cast(TaskState, ACTIVE_TASK_STATUSES[2])
-            )
-
-            active_count = submitted + working + input_required
+            # One read of the per-state counters covers every active state
+            counts = await app._storage.count_tasks_by_state()
+            active_count = sum(counts.get(state, 0) for state in ACTIVE_TASK_STATUSES)
             metrics.set_agent_tasks_active(agent_id, active_count)
         except Exception as e:
             logger.debug(f"Failed to update agent metrics: {e}")
 
 
+async def _update_worker_metrics(app: BinduApplication) -> None:
+    """Update worker queue depth from the task manager.
+
+    Args:
+        app: BinduApplication instance
+    """
+    if not app.task_manager:
+        return
+
+    try:
+        depth = await app.task_manager.queue_depth()
+        get_metrics().set_worker_queue_depth(depth)
+    except Exception as e:
+        logger.debug(f"Failed to update worker metrics: {e}")
+
+
 async def metrics_endpoint(app: BinduApplication, request: Request) -> Response:
     """Prometheus metrics endpoint.
 
@@ -64,17 +68,23 @@ async def metrics_endpoint(app: BinduApplication, request: Request) -> Response:
     Metrics exposed:
     - http_requests_total: Total number of HTTP requests by method, endpoint, and status
     - http_request_duration_seconds: HTTP request latency histogram
+    - http_time_to_first_byte_seconds: Time to the first response body byte
     - agent_tasks_active: Currently active tasks per agent
     - agent_tasks_completed_total: Total completed tasks per agent and status
+    - worker_slots_busy / worker_slots_total: Worker pool slot utilisation
+    - worker_queue_depth: Task operations waiting for a worker slot
     """
     logger.debug("Metrics endpoint called")
 
-    # Update agent metrics from current state
-    await _update_agent_metrics(app)
-
-    # Get metrics instance and generate Prometheus text
+    # Scrapes within metrics_cache_ttl of the last rendering share it and
+    # skip refreshing the gauges
     metrics = get_metrics()
-    prometheus_text = metrics.generate_prometheus_text()
+    prometheus_text = metrics.cached_prometheus_text()
+    if prometheus_text is None:
+        # Update agent metrics from current state
+        await _update_agent_metrics(app)
+        await _update_worker_metrics(app)
+        prometheus_text = metrics.generate_prometheus_text()
 
     return Response(
         content=prometheus_text,
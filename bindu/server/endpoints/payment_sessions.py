@@ -55,7 +55,7 @@ async def start_payment_session_endpoint(
         return error_resp
 
     assert app._payment_session_manager is not None  # Validated above
-    session = app._payment_session_manager.create_session()
+    session = await app._payment_session_manager.create_session()
 
     # Construct browser URL using app's base URL
     browser_url = f"{app.manifest.url}/payment-capture?session_id={session.session_id}"
@@ -91,7 +91,7 @@ async def payment_capture_endpoint(app: BinduApplication, request: Request) -> R
         )
 
     # Verify session exists
-    session = app._payment_session_manager.get_session(session_id)
+    session = await app._payment_session_manager.get_session(session_id)
     if session is None:
         return HTMLResponse(
             content=_get_error_html("Session not found or expired"), status_code=404
@@ -113,7 +113,9 @@ async def payment_capture_endpoint(app: BinduApplication, request: Request) -> R
             payment_payload = PaymentPayload.model_validate(payment_dict)
 
             # Store payment in session (NOT consumed yet!)
-            app._payment_session_manager.complete_session(session_id, payment_payload)
+            await app._payment_session_manager.complete_session(
+                session_id, payment_payload
+            )
 
             logger.info(f"Payment captured for session: {session_id}")
 
@@ -124,7 +126,7 @@ async def payment_capture_endpoint(app: BinduApplication, request: Request) -> R
             logger.error(
                 f"Payment capture error for session {session_id}: {e}", exc_info=True
             )
-            app._payment_session_manager.fail_session(session_id, error_msg)
+            await app._payment_session_manager.fail_session(session_id, error_msg)
 
             return HTMLResponse(content=_get_error_html(error_msg), status_code=400)
 
@@ -180,7 +182,7 @@ async def payment_status_endpoint(app: BinduApplication, request: Request) -> Re
         )
     else:
         # Get current status
-        session = app._payment_session_manager.get_session(session_id)
+        session = await app._payment_session_manager.get_session(session_id)
 
     if session is None:
         return JSONResponse(
@@ -6,12 +6,15 @@ intelligent agent selection and routing decisions.
 
 from __future__ import annotations
 
+from typing import Any
+
 from starlette.requests import Request
 from starlette.responses import Response
 
-from bindu.common.protocol.types import SkillNotFoundError
+from bindu.common.protocol.types import Skill, SkillNotFoundError
 from bindu.server.applications import BinduApplication
 from bindu.utils.logging import get_logger
+from .discovery import serve_discovery_document
 from .utils import (
     create_response_with_x402,
     extract_error_fields,
@@ -25,6 +28,43 @@ from .utils import (
 logger = get_logger("bindu.server.endpoints.skills")
 
 
+def skill_summary(skill: Skill) -> dict[str, Any]:
+    """Return the basic metadata of a skill listed by /agent/skills."""
+    summary = {
+        "id": skill.get("id"),
+        "name": skill.get("name"),
+        "description": skill.get("description"),
+        "version": skill.get("version", "unknown"),
+        "tags": skill.get("tags", []),
+        "input_modes": skill.get("input_modes", []),
+        "output_modes": skill.get("output_modes", []),
+    }
+
+    # Add optional fields if present
+    if "examples" in skill:
+        summary["examples"] = skill["examples"]
+
+    if "documentation_path" in skill:
+        summary["documentation_path"] = skill["documentation_path"]
+
+    return summary
+
+
+def skill_detail(skill: Skill) -> dict[str, Any]:
+    """Return the full metadata of a skill, without its documentation."""
+    detail: dict[str, Any] = dict(skill)
+
+    # Remove documentation_content from response (too large)
+    # Clients should use /agent/skills/{skill_id}/documentation for that
+    if "documentation_content" in detail:
+        detail["has_documentation"] = True
+        del detail["documentation_content"]
+    else:
+        detail["has_documentation"] = False
+
+    return detail
+
+
 @handle_endpoint_errors("skills list")
 async def skills_list_endpoint(app: BinduApplication, request: Request) -> Response:
     """List all skills available on this agent.
@@ -39,34 +79,7 @@ async def skills_list_endpoint(app: BinduApplication, request: Request) -> Respo
     if error_resp:
         return error_resp
 
-    # Get skills from manifest
-    skills = app.manifest.skills or []
-
-    # Build summary response
-    skills_summary = []
-    for skill in skills:
-        skill_summary = {
-            "id": skill.get("id"),
-            "name": skill.get("name"),
-            "description": skill.get("description"),
-            "version": skill.get("version", "unknown"),
-            "tags": skill.get("tags", []),
-            "input_modes": skill.get("input_modes", []),
-            "output_modes": skill.get("output_modes", []),
-        }
-
-        # Add optional fields if present
-        if "examples" in skill:
-            skill_summary["examples"] = skill["examples"]
-
-        if "documentation_path" in skill:
-            skill_summary["documentation_path"] = skill["documentation_path"]
-
-        skills_summary.append(skill_summary)
-
-    response_data = {"skills": skills_summary, "total": len(skills_summary)}
-
-    return create_response_with_x402(request, response_data)
+    return serve_discovery_document(request, app.discovery_documents().skills_list)
 
 
 @handle_endpoint_errors("skill detail")
@@ -93,22 +106,13 @@ async def skill_detail_endpoint(app: BinduApplication, request: Request) -> Resp
         return error_resp
 
     # Find skill in manifest
-    skill, error_resp = get_skill_or_error(app, skill_id)
+    _, error_resp = get_skill_or_error(app, skill_id)
     if error_resp:
         return error_resp
 
-    # Return full skill data (excluding documentation_content for size)
-    skill_detail = dict(skill) if skill else {}
-
-    # Remove documentation_content from response (too large)
-    # Clients should use /agent/skills/{skill_id}/documentation for that
-    if "documentation_content" in skill_detail:
-        skill_detail["has_documentation"] = True
-        del skill_detail["documentation_content"]
-    else:
-        skill_detail["has_documentation"] = False
-
-    return create_response_with_x402(request, skill_detail)
+    return serve_discovery_document(
+        request, app.discovery_documents().skill_details[skill_id]
+    )
 
 
 @handle_endpoint_errors("skill documentation")
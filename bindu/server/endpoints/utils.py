@@ -268,11 +268,9 @@ def get_skill_or_error(app: Any, skill_id: str) -> tuple[Any, JSONResponse | Non
     Returns:
         Tuple of (skill, error_response). One will be None.
     """
-    from bindu.utils.skills import find_skill_by_id
     from bindu.common.protocol.types import SkillNotFoundError
 
-    skills = app.manifest.skills or [] if app.manifest else []
-    skill = find_skill_by_id(skills, skill_id)
+    skill = app.discovery_documents().skills.get(skill_id) if app.manifest else None
 
     if not skill:
         logger.warning(f"Skill not found: {skill_id}")
@@ -0,0 +1,29 @@
+"""TASK EVENT BUS MODULE EXPORTS.
+
+This module provides the task event bus used to push task updates to
+``message/stream`` subscribers as they happen instead of polling storage.
+
+AVAILABLE EVENT BUS OPTIONS:
+- InMemoryTaskEventBus: In-process delivery for single-process deployments
+- RedisTaskEventBus: Redis pub/sub delivery for multi-process systems
+"""
+
+from __future__ import annotations as _annotations
+
+from .base import TaskEvent, TaskEventBus, TaskEventSubscription
+from .memory_event_bus import InMemoryTaskEventBus
+
+__all__ = [
+    "TaskEvent",
+    "TaskEventBus",
+    "TaskEventSubscription",
+    "InMemoryTaskEventBus",
+]
+
+# Conditionally export RedisTaskEventBus if the optional 'redis' dependency is installed.
+try:
+    from .redis_event_bus import RedisTaskEventBus  # noqa: F401
+
+    __all__.append("RedisTaskEventBus")
+except ImportError:
+    pass
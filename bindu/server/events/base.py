@@ -0,0 +1,169 @@
+"""Base task event bus module.
+
+The event bus carries task updates (status changes, agent messages and
+artifacts) from the worker that produced them to every open SSE stream for
+that task. Events are the same dicts that ``message/stream`` sends to clients,
+so subscribers can forward them without reloading the task from storage.
+"""
+
+from __future__ import annotations as _annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, Literal
+from uuid import UUID
+
+import anyio
+from typing_extensions import NotRequired, Self, TypedDict
+
+from bindu.utils.logging import get_logger
+
+logger = get_logger("bindu.server.events.base")
+
+TaskEventKind = Literal["status-update", "artifact-update", "message"]
+
+
+class TaskEvent(TypedDict):
+    """A task update as delivered to ``message/stream`` clients."""
+
+    kind: TaskEventKind
+    task_id: str
+    context_id: str
+    status: NotRequired[dict[str, Any]]
+    final: NotRequired[bool]
+    artifact: NotRequired[dict[str, Any]]
+    append: NotRequired[bool]
+    last_chunk: NotRequired[bool]
+    message: NotRequired[dict[str, Any]]
+
+
+class TaskEventSubscription:
+    """Bounded buffer of events for a single task.
+
+    Delivery never blocks the publisher: if a slow subscriber lets the buffer
+    fill up, further events are dropped and ``overflowed`` is set so the
+    subscriber knows to resynchronise from storage.
+    """
+
+    def __init__(self, task_id: str, buffer_size: int):
+        """Initialize the subscription.
+
+        Args:
+            task_id: Task whose events are delivered to this subscription
+            buffer_size: Maximum number of undelivered events to keep
+        """
+        self.task_id = task_id
+        self.overflowed = False
+        self._send, self._receive = anyio.create_memory_object_stream[TaskEvent](
+            buffer_size
+        )
+
+    def deliver(self, event: TaskEvent) -> None:
+        """Buffer an event without blocking."""
+        try:
+            self._send.send_nowait(event)
+        except anyio.WouldBlock:
+            if not self.overflowed:
+                logger.warning(
+                    f"Event buffer full for task {self.task_id}, subscriber will resync"
+                )
+            self.overflowed = True
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+            pass
+
+    async def next_event(self, timeout: float) -> TaskEvent | None:
+        """Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            The next event, or None if nothing arrived within the timeout
+        """
+        with anyio.move_on_after(timeout):
+            return await self._receive.receive()
+        return None
+
+    def close(self) -> None:
+        """Release the underlying streams."""
+        self._send.close()
+        self._receive.close()
+
+
+class TaskEventBus(ABC):
+    """Publishes task events to subscribers of that task.
+
+    Subscriptions are kept in-process; backends differ in how events reach
+    the process that holds the subscription.
+    """
+
+    def __init__(self, buffer_size: int = 256):
+        """Initialize the event bus.
+
+        Args:
+            buffer_size: Per-subscription event buffer size
+        """
+        self.buffer_size = buffer_size
+        self._subscribers: dict[str, set[TaskEventSubscription]] = {}
+
+    async def __aenter__(self) -> Self:
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        """Exit async context manager."""
+
+    @abstractmethod
+    async def publish(self, event: TaskEvent) -> None:
+        """Publish an event to all subscribers of ``event["task_id"]``.
+
+        Publishing is best effort: subscribers resynchronise from storage
+        periodically, so implementations log failures instead of raising.
+        """
+
+    @asynccontextmanager
+    async def subscribe(
+        self, task_id: UUID | str
+    ) -> AsyncIterator[TaskEventSubscription]:
+        """Subscribe to events of a task for the duration of the context.
+
+        Args:
+            task_id: Task to receive events for
+        """
+        key = str(task_id)
+        subscription = TaskEventSubscription(key, self.buffer_size)
+        self._subscribers.setdefault(key, set()).add(subscription)
+        try:
+            await self._watch_task(key)
+            yield subscription
+        finally:
+            subscribers = self._subscribers.get(key)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[key]
+                    # Shielded, so a cancelled stream still stops the feed
+                    with anyio.CancelScope(shield=True):
+                        await self._unwatch_task(key)
+            subscription.close()
+
+    async def _watch_task(self, task_id: str) -> None:
+        """Start receiving events of a task that has local subscribers.
+
+        Called for every new subscription and returns once the task's events
+        reach this process. Backends that receive every event keep the
+        default.
+        """
+
+    async def _unwatch_task(self, task_id: str) -> None:
+        """Stop receiving events of a task whose last local subscriber left."""
+
+    def subscriber_count(self, task_id: UUID | str) -> int:
+        """Return the number of local subscribers of a task."""
+        return len(self._subscribers.get(str(task_id), ()))
+
+    def _dispatch(self, event: TaskEvent) -> None:
+        """Deliver an event to the local subscribers of its task."""
+        for subscription in tuple(self._subscribers.get(event["task_id"], ())):
+            subscription.deliver(event)
@@ -0,0 +1,80 @@
+"""Event bus factory for creating task event bus instances.
+
+The backend follows the scheduler by default: with the Redis scheduler the
+worker may run in another process than the SSE connection, so events travel
+over Redis pub/sub; otherwise they stay in-process.
+"""
+
+from __future__ import annotations as _annotations
+
+from bindu.common.models import SchedulerConfig
+from bindu.utils.logging import get_logger
+
+from .base import TaskEventBus
+from .memory_event_bus import InMemoryTaskEventBus
+
+# Import RedisTaskEventBus conditionally
+try:
+    from .redis_event_bus import RedisTaskEventBus
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    RedisTaskEventBus = None  # type: ignore[assignment]  # redis not installed
+    REDIS_AVAILABLE = False
+
+logger = get_logger("bindu.server.events.factory")
+
+
+def create_event_bus(scheduler_config: SchedulerConfig | None = None) -> TaskEventBus:
+    """Create the task event bus based on settings.
+
+    Args:
+        scheduler_config: Scheduler config passed to the application, used to
+            resolve the "auto" backend and the Redis URL
+
+    Raises:
+        ValueError: If the Redis backend is requested but unavailable
+    """
+    from bindu.settings import app_settings
+
+    agent_settings = app_settings.agent
+    scheduler_backend = (
+        scheduler_config.type.lower()
+        if scheduler_config is not None
+        else app_settings.scheduler.backend
+    )
+    redis_url = (
+        scheduler_config.redis_url
+        if scheduler_config is not None and scheduler_config.redis_url
+        else app_settings.scheduler.redis_url
+    )
+
+    backend = agent_settings.stream_event_backend
+    if backend == "auto":
+        backend = "redis" if scheduler_backend == "redis" else "memory"
+
+    if backend == "memory":
+        logger.info("Using in-memory task event bus (single-process)")
+        return InMemoryTaskEventBus(buffer_size=agent_settings.stream_event_buffer_size)
+
+    if backend == "redis":
+        if not REDIS_AVAILABLE or RedisTaskEventBus is None:
+            raise ValueError(
+                "Redis event bus requires redis package. "
+                "Install with: pip install redis[hiredis]"
+            )
+        if not redis_url:
+            raise ValueError(
+                "Redis event bus requires a Redis URL. "
+                "Please provide it via REDIS_URL environment variable or config."
+            )
+        logger.info("Using Redis pub/sub task event bus (distributed)")
+        return RedisTaskEventBus(
+            redis_url=redis_url,
+            channel_prefix=agent_settings.stream_event_channel_prefix,
+            buffer_size=agent_settings.stream_event_buffer_size,
+        )
+
+    raise ValueError(
+        f"Unknown event bus backend: {backend}. Supported backends: memory, redis"
+    )
@@ -0,0 +1,17 @@
+"""In-memory task event bus implementation."""
+
+from __future__ import annotations as _annotations
+
+from bindu.server.events.base import TaskEvent, TaskEventBus
+
+
+class InMemoryTaskEventBus(TaskEventBus):
+    """Delivers events to subscribers in the same process.
+
+    Suitable when the worker and the HTTP server share a process, which is the
+    case with the in-memory scheduler.
+    """
+
+    async def publish(self, event: TaskEvent) -> None:
+        """Deliver the event to local subscribers."""
+        self._dispatch(event)
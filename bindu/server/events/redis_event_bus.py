@@ -0,0 +1,165 @@
+"""Redis pub/sub task event bus for multi-process deployments."""
+
+from __future__ import annotations as _annotations
+
+import asyncio
+import contextlib
+import json
+from typing import Any, cast
+
+import redis.asyncio as redis
+
+from bindu.server.events.base import TaskEvent, TaskEventBus
+from bindu.utils.logging import get_logger
+
+logger = get_logger("bindu.server.events.redis_event_bus")
+
+# Constants
+REDIS_ERROR_BACKOFF_SECONDS = 1
+LISTEN_TIMEOUT_SECONDS = 1.0
+
+
+class RedisTaskEventBus(TaskEventBus):
+    """Fans task events out to every process through Redis pub/sub.
+
+    Events are published on ``<channel_prefix>:<task_id>``. Each process
+    subscribes to the channel of a task while it has local subscribers for
+    it, over one connection, and dispatches incoming events to them. A pod
+    therefore only receives the events of tasks streamed from it, and the
+    Redis cost is one connection per process however many SSE clients are
+    open. Pub/sub is fire-and-forget; events missed during a reconnect are
+    recovered by the subscriber's periodic resync.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        channel_prefix: str = "bindu:task-events",
+        buffer_size: int = 256,
+    ):
+        """Initialize the Redis event bus.
+
+        Args:
+            redis_url: Redis connection URL
+            channel_prefix: Prefix of the per-task pub/sub channels
+            buffer_size: Per-subscription event buffer size
+        """
+        super().__init__(buffer_size=buffer_size)
+        self.redis_url = redis_url
+        self.channel_prefix = channel_prefix
+        self._redis_client: redis.Redis | None = None
+        self._pubsub: Any = None
+        self._listener: asyncio.Task[None] | None = None
+        # Tasks whose channel is subscribed; changed under _channels_lock so
+        # a subscription never races the unsubscription of the same channel
+        self._channels: set[str] = set()
+        self._channels_lock = asyncio.Lock()
+        # Set once a channel is subscribed and the pub/sub connection exists
+        self._connected = asyncio.Event()
+        self._closing = False
+
+    async def __aenter__(self):
+        """Connect to Redis and start listening for task events."""
+        self._redis_client = redis.from_url(
+            self.redis_url, encoding="utf-8", decode_responses=True
+        )
+        try:
+            await self._redis_client.ping()
+        except redis.RedisError as e:
+            logger.error(f"Failed to connect to Redis: {e}")
+            raise ConnectionError(
+                f"Unable to connect to Redis at {self.redis_url}: {e}"
+            )
+
+        self._pubsub = self._redis_client.pubsub(ignore_subscribe_messages=True)
+        self._closing = False
+        self._listener = asyncio.create_task(self._listen())
+        logger.info(f"Redis task event bus listening on {self.channel_prefix}:<task>")
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any):
+        """Stop the listener and close the Redis connection."""
+        if self._listener is not None:
+            self._closing = True
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        self._channels.clear()
+        self._connected.clear()
+        if self._redis_client is not None:
+            await self._redis_client.aclose()
+            self._redis_client = None
+
+    async def publish(self, event: TaskEvent) -> None:
+        """Publish the event on the task's channel."""
+        if self._redis_client is None:
+            logger.warning("Redis event bus not started, dropping task event")
+            return
+        channel = f"{self.channel_prefix}:{event['task_id']}"
+        try:
+            await self._redis_client.publish(channel, json.dumps(event, default=str))
+        except redis.RedisError as e:
+            logger.warning(f"Failed to publish task event on {channel}: {e}")
+
+    async def _watch_task(self, task_id: str) -> None:
+        """Subscribe to the task's channel unless it already is."""
+        async with self._channels_lock:
+            if (
+                self._pubsub is None
+                or task_id in self._channels
+                or task_id not in self._subscribers
+            ):
+                return
+            channel = f"{self.channel_prefix}:{task_id}"
+            try:
+                await self._pubsub.subscribe(channel)
+            except redis.RedisError as e:
+                logger.warning(f"Failed to subscribe to {channel}: {e}")
+                return
+            self._channels.add(task_id)
+            self._connected.set()
+
+    async def _unwatch_task(self, task_id: str) -> None:
+        """Unsubscribe from the task's channel once nobody here follows it."""
+        async with self._channels_lock:
+            if (
+                self._pubsub is None
+                or task_id not in self._channels
+                or task_id in self._subscribers
+            ):
+                return
+            channel = f"{self.channel_prefix}:{task_id}"
+            self._channels.discard(task_id)
+            try:
+                await self._pubsub.unsubscribe(channel)
+            except redis.RedisError as e:
+                logger.warning(f"Failed to unsubscribe from {channel}: {e}")
+
+    async def _listen(self) -> None:
+        """Dispatch events received from Redis to local subscribers."""
+        # The pub/sub connection is opened by the first subscription
+        await self._connected.wait()
+        # get_message can swallow a cancellation that lands while it handles
+        # an unsubscribe reply, so the flag ends the loop too
+        while not self._closing:
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=LISTEN_TIMEOUT_SECONDS
+                )
+            except redis.RedisError as e:
+                logger.error(f"Redis event bus error: {e}")
+                await asyncio.sleep(REDIS_ERROR_BACKOFF_SECONDS)
+                continue
+
+            if message is None or message.get("type") != "message":
+                continue
+            try:
+                event = cast(TaskEvent, json.loads(message["data"]))
+            except (TypeError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring malformed task event: {e}")
+                continue
+            self._dispatch(event)
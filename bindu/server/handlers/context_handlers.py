@@ -27,6 +27,7 @@ from bindu.common.protocol.types import (
 )
 
 from bindu.utils.task_telemetry import trace_context_operation
+from bindu.utils.worker import ChatHistoryCache
 
 from bindu.server.storage import Storage
 
@@ -37,15 +38,25 @@ class ContextHandlers:
 
     storage: Storage[Any]
     error_response_creator: Any = None
+    history_cache: ChatHistoryCache | None = None
 
     @trace_context_operation("list_contexts")
     async def list_contexts(self, request: ListContextsRequest) -> ListContextsResponse:
-        """List all contexts in storage."""
+        """List contexts in storage, newest first.
+
+        Pages are requested with ``length`` and ``cursor`` (the id of the last
+        context of the previous page); ``summary`` returns ContextSummary
+        projections without task ids.
+        """
         # Support both 'length' and 'history_length' for backwards compatibility
         params = request.get("params", {})
         length = params.get("length") or params.get("history_length")
+        cursor = params.get("cursor")
 
-        contexts = await self.storage.list_contexts(length)
+        if params.get("summary"):
+            contexts = await self.storage.list_context_summaries(length, cursor=cursor)
+        else:
+            contexts = await self.storage.list_contexts(length, cursor=cursor)
 
         # Return empty list if no contexts, not an error
         if contexts is None:
@@ -70,6 +81,9 @@ class ContextHandlers:
                 ClearContextsResponse, request["id"], ContextNotFoundError, str(e)
             )
 
+        if self.history_cache is not None:
+            self.history_cache.invalidate(context_id)
+
         return ClearContextsResponse(
             jsonrpc="2.0",
             id=request["id"],
@@ -17,7 +17,7 @@ from __future__ import annotations
 
 import anyio
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
@@ -34,6 +34,7 @@ from bindu.settings import app_settings
 from bindu.utils.logging import get_logger
 from bindu.utils.task_telemetry import trace_task_operation, track_active_task
 
+from bindu.server.events import InMemoryTaskEventBus, TaskEventBus
 from bindu.server.scheduler import Scheduler
 from bindu.server.storage import Storage
 
@@ -54,6 +55,7 @@ class MessageHandlers:
     workers: list[Any] | None = None
     context_id_parser: Any = None
     push_manager: Any | None = None
+    event_bus: TaskEventBus = field(default_factory=InMemoryTaskEventBus)
 
     async def _handle_stream_error(
         self,
@@ -90,7 +92,9 @@ class MessageHandlers:
             timestamp = loaded_task["status"]["timestamp"]
             if current_state not in terminal_states:
                 try:
-                    updated = await self.storage.update_task(task["id"], state="failed")
+                    updated = await self.storage.update_task_if_active(
+                        task["id"], state="failed", return_full=False
+                    )
                     if updated and "status" in updated:
                         current_state = updated["status"]["state"]
                         timestamp = updated["status"]["timestamp"]
@@ -151,6 +155,56 @@ class MessageHandlers:
         await self.scheduler.run_task(scheduler_params)
         return task, context_id
 
+    async def _load_streamed_task(self, task_id: UUID) -> Task | None:
+        """Load a streamed task, retrying briefly if it is not visible yet."""
+        missing_retries = max(app_settings.agent.stream_missing_task_retries, 0)
+        missing_retry_delay = max(
+            app_settings.agent.stream_missing_task_retry_delay_seconds,
+            0.0,
+        )
+
+        loaded_task = await self.storage.load_task(task_id)
+        for _ in range(missing_retries):
+            if loaded_task is not None:
+                break
+            await anyio.sleep(missing_retry_delay)
+            loaded_task = await self.storage.load_task(task_id)
+        return loaded_task
+
+    @staticmethod
+    def _status_event(
+        task_id: UUID, context_id: Any, status: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Build a status-update SSE payload."""
+        return {
+            "kind": "status-update",
+            "task_id": str(task_id),
+            "context_id": str(context_id),
+            "status": status,
+            "final": status["state"] in app_settings.agent.terminal_states,
+        }
+
+    @classmethod
+    def _task_snapshot_events(cls, task: Task, context_id: Any) -> list[dict[str, Any]]:
+        """Build artifact and status events describing a stored task.
+
+        Artifacts come first so the final status event is always the last
+        event of a completed stream, matching the order the worker publishes.
+        """
+        events: list[dict[str, Any]] = [
+            {
+                "kind": "artifact-update",
+                "task_id": str(task["id"]),
+                "context_id": str(context_id),
+                "artifact": artifact,
+                "append": artifact.get("append", False),
+                "last_chunk": artifact.get("last_chunk", False),
+            }
+            for artifact in task.get("artifacts", [])
+        ]
+        events.append(cls._status_event(task["id"], context_id, task["status"]))
+        return events
+
     @staticmethod
     def _to_jsonable(value: Any) -> Any:
         """Convert UUID-rich protocol objects into JSON-serializable values."""
@@ -192,104 +246,77 @@ class MessageHandlers:
         task, context_id = await self._submit_and_schedule_task(request["params"])
 
         async def stream_generator():
-            """Stream task status and artifact events from storage updates."""
+            """Stream task events published by the worker.
+
+            The stream waits on the task event bus instead of polling storage.
+            Storage is read once after subscribing (to catch up on anything
+            published earlier) and again only if no event arrives within the
+            resync interval or the subscription dropped events.
+            """
             seen_status = task["status"]["state"]
             seen_artifact_ids: set[str] = set()
             cancelled_exc = anyio.get_cancelled_exc_class()
-            poll_interval = max(app_settings.agent.stream_poll_interval_seconds, 0.01)
-            missing_retries = max(app_settings.agent.stream_missing_task_retries, 0)
-            missing_retry_delay = max(
-                app_settings.agent.stream_missing_task_retry_delay_seconds,
-                0.0,
+            resync_interval = max(
+                app_settings.agent.stream_resync_interval_seconds, 0.01
             )
             terminal_states = app_settings.agent.terminal_states
 
-            submitted_event = {
-                "kind": "status-update",
-                "task_id": str(task["id"]),
-                "context_id": str(context_id),
-                "status": task["status"],
-                "final": False,
-            }
-            yield self._sse_event(submitted_event)
+            yield self._sse_event(
+                self._status_event(task["id"], context_id, task["status"])
+            )
 
             try:
-                while True:
-                    loaded_task = await self.storage.load_task(task["id"])
-                    if loaded_task is None:
-                        for _ in range(missing_retries):
-                            await anyio.sleep(missing_retry_delay)
-                            loaded_task = await self.storage.load_task(task["id"])
-                            if loaded_task is not None:
-                                break
-                    if loaded_task is None:
-                        missing_event = {
-                            "kind": "status-update",
-                            "task_id": str(task["id"]),
-                            "context_id": str(context_id),
-                            "status": {
-                                "state": "failed",
-                                "timestamp": datetime.now(timezone.utc).isoformat(),
-                            },
-                            "final": True,
-                            "error": f"Task {task['id']} not found while streaming",
-                        }
-                        yield self._sse_event(missing_event)
-                        return
-
-                    status = loaded_task["status"]["state"]
-                    if status != seen_status:
-                        status_event = {
-                            "kind": "status-update",
-                            "task_id": str(task["id"]),
-                            "context_id": str(context_id),
-                            "status": loaded_task["status"],
-                            "final": status in app_settings.agent.terminal_states,
-                        }
-                        yield self._sse_event(status_event)
-                        seen_status = status
-
-                    for artifact in loaded_task.get("artifacts", []):
-                        artifact_id = str(artifact["artifact_id"])
-                        if artifact_id in seen_artifact_ids:
-                            continue
-                        seen_artifact_ids.add(artifact_id)
-
-                        artifact_event = {
-                            "kind": "artifact-update",
-                            "task_id": str(task["id"]),
-                            "context_id": str(context_id),
-                            "artifact": artifact,
-                            "append": artifact.get("append", False),
-                            "last_chunk": artifact.get("last_chunk", False),
-                        }
-                        yield self._sse_event(artifact_event)
-
-                    if status in terminal_states:
-                        return
-
-                    if status in PAUSED_STATES:
-                        # Re-check once before returning to avoid missing a quick
-                        # transition into a terminal state.
-                        latest_task = await self.storage.load_task(task["id"])
-                        if latest_task:
-                            latest_status = latest_task["status"]["state"]
-                            if latest_status != seen_status:
-                                yield self._sse_event(
+                async with self.event_bus.subscribe(task["id"]) as subscription:
+                    event: dict[str, Any] | None = None
+                    while True:
+                        if event is None or subscription.overflowed:
+                            subscription.overflowed = False
+                            loaded_task = await self._load_streamed_task(task["id"])
+                            if loaded_task is None:
+                                missing_event = self._status_event(
+                                    task["id"],
+                                    context_id,
                                     {
-                                        "kind": "status-update",
-                                        "task_id": str(task["id"]),
-                                        "context_id": str(context_id),
-                                        "status": latest_task["status"],
-                                        "final": latest_status in terminal_states,
-                                    }
+                                        "state": "failed",
+                                        "timestamp": datetime.now(
+                                            timezone.utc
+                                        ).isoformat(),
+                                    },
                                 )
-                                seen_status = latest_status
-                                if latest_status in terminal_states:
-                                    return
-                        return
-
-                    await anyio.sleep(poll_interval)
+                                missing_event["final"] = True
+                                missing_event["error"] = (
+                                    f"Task {task['id']} not found while streaming"
+                                )
+                                yield self._sse_event(missing_event)
+                                return
+                            events = self._task_snapshot_events(loaded_task, context_id)
+                        else:
+                            events = [event]
+
+                        for item in events:
+                            if item["kind"] == "status-update":
+                                status = item["status"]["state"]
+                                if status == seen_status:
+                                    continue
+                                seen_status = status
+                            elif item["kind"] == "artifact-update":
+                                # Appended chunks extend an artifact already sent;
+                                # only whole artifacts are deduplicated on resync
+                                artifact_id = str(item["artifact"]["artifact_id"])
+                                if artifact_id in seen_artifact_ids and not item.get(
+                                    "append"
+                                ):
+                                    continue
+                                seen_artifact_ids.add(artifact_id)
+                            yield self._sse_event(item)
+
+                        if (
+                            seen_status in terminal_states
+                            or seen_status in PAUSED_STATES
+                        ):
+                            return
+
+                        event = await subscription.next_event(resync_interval)
             except cancelled_exc:
                 logger.debug(f"Streaming client disconnected for task {task['id']}")
                 return
@@ -96,8 +96,20 @@ class TaskHandlers:
 
     @trace_task_operation("list_tasks", include_params=False)
     async def list_tasks(self, request: ListTasksRequest) -> ListTasksResponse:
-        """List all tasks in storage."""
-        tasks = await self.storage.list_tasks(request["params"].get("length"))
+        """List tasks in storage, newest first.
+
+        Pages are requested with ``length`` and ``cursor`` (the id of the last
+        task of the previous page); ``summary`` returns TaskSummary projections
+        without history and artifacts.
+        """
+        params = request["params"]
+        length = params.get("length")
+        cursor = params.get("cursor")
+
+        if params.get("summary"):
+            tasks = await self.storage.list_task_summaries(length, cursor=cursor)
+        else:
+            tasks = await self.storage.list_tasks(length, cursor=cursor)
 
         if tasks is None:
             return self.error_response_creator(
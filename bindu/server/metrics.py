@@ -1,63 +1,295 @@
 """Prometheus metrics collection for Bindu server monitoring.
 
 This module provides metrics collection for HTTP requests, latency, and agent tasks.
+
+Recording never takes a lock: every thread writes to its own shard of
+counters and histogram bucket arrays, and shards are merged only when the
+metrics are rendered. The rendered text is cached for
+``observability.metrics_cache_ttl`` seconds, so scrapes arriving within that
+window share one rendering.
+
+When uvicorn runs several worker processes, set
+``observability.metrics_multiprocess_dir`` to a directory shared by them.
+Each process then writes its samples there every
+``observability.metrics_flush_interval`` seconds, and a scrape served by any
+process aggregates all of them. Samples of exited processes are folded into
+one archive file and their own files deleted, and the first process of a new
+run deletes everything earlier runs left behind.
 """
 
 from __future__ import annotations
 
+import atexit
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
 from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
 from threading import Lock
+from typing import Literal
 
+from bindu.settings import app_settings
 from bindu.utils.logging import get_logger
 
 logger = get_logger("bindu.server.metrics")
 
+# (metric name, label values)
+SeriesKey = tuple[str, tuple[str, ...]]
+
+# Files in the multiprocess directory besides metrics_<pid>.json
+EXITED_SAMPLES_FILE = "exited.json"
+EXITED_LOCK_FILE = "exited.lock"
+
+# Upper bounds of the histogram buckets; +Inf is implicit
+HTTP_DURATION_BUCKETS = (0.1, 0.5, 1.0)
+TASK_DURATION_BUCKETS = (1.0, 5.0, 10.0, 30.0, 60.0)
+
+
+@dataclass(frozen=True)
+class _MetricSpec:
+    name: str
+    kind: Literal["counter", "gauge", "histogram", "summary"]
+    help: str
+    labels: tuple[str, ...] = ()
+    buckets: tuple[float, ...] = ()
+    # Rendered with a zero sample even before anything was recorded
+    always: bool = False
+    # Gauges across processes: "sum" adds per-process values, "local" keeps
+    # the value of the process serving the scrape (values read from shared
+    # state, e.g. storage, are the same in every process)
+    aggregate: Literal["sum", "local"] = "sum"
+
+
+# Rendered in this order
+_SPECS = {
+    spec.name: spec
+    for spec in (
+        _MetricSpec(
+            "http_requests_total",
+            "counter",
+            "Total number of HTTP requests",
+            labels=("method", "endpoint", "status"),
+            always=True,
+        ),
+        _MetricSpec(
+            "http_request_duration_seconds",
+            "histogram",
+            "HTTP request latency",
+            buckets=HTTP_DURATION_BUCKETS,
+            always=True,
+        ),
+        _MetricSpec(
+            "http_time_to_first_byte_seconds",
+            "histogram",
+            "Time until the first response body byte",
+            buckets=HTTP_DURATION_BUCKETS,
+        ),
+        _MetricSpec(
+            "agent_tasks_active",
+            "gauge",
+            "Currently active tasks",
+            labels=("agent_id",),
+            aggregate="local",
+        ),
+        _MetricSpec(
+            "agent_tasks_completed_total",
+            "counter",
+            "Total completed tasks",
+            labels=("agent_id", "status"),
+        ),
+        _MetricSpec(
+            "task_duration_seconds",
+            "histogram",
+            "Task execution duration",
+            labels=("agent_id", "status"),
+            buckets=TASK_DURATION_BUCKETS,
+        ),
+        _MetricSpec(
+            "agent_errors_total",
+            "counter",
+            "Total errors by type",
+            labels=("agent_id", "error_type"),
+        ),
+        _MetricSpec("http_request_size_bytes", "summary", "HTTP request body size"),
+        _MetricSpec("http_response_size_bytes", "summary", "HTTP response body size"),
+        _MetricSpec(
+            "http_requests_in_flight",
+            "gauge",
+            "Current number of HTTP requests being processed",
+            always=True,
+        ),
+        _MetricSpec(
+            "worker_slots_busy",
+            "gauge",
+            "Worker slots currently executing a task operation",
+        ),
+        _MetricSpec(
+            "worker_slots_total",
+            "gauge",
+            "Total worker slots available in this process",
+        ),
+        _MetricSpec(
+            "worker_queue_depth",
+            "gauge",
+            "Task operations waiting to be executed",
+            aggregate="local",
+        ),
+        _MetricSpec(
+            "auth_cache_lookups_total",
+            "counter",
+            "Authentication cache lookups by cache and result",
+            labels=("cache", "result"),
+        ),
+    )
+}
+
+
+class _Shard:
+    """Samples recorded by one thread; only that thread writes to it."""
+
+    __slots__ = ("counters", "histograms")
+
+    def __init__(self) -> None:
+        # Counters and gauge deltas (requests in flight)
+        self.counters: dict[SeriesKey, float] = defaultdict(int)
+        # Per-bucket (non-cumulative) counts, the +Inf bucket, then the sum.
+        # Summaries have no buckets: [count, sum].
+        self.histograms: dict[SeriesKey, list[float]] = {}
+
+
+@dataclass
+class _Samples:
+    """Merged samples, ready to render or to write for other processes."""
+
+    counters: dict[SeriesKey, float]
+    histograms: dict[SeriesKey, list[float]]
+    gauges: dict[SeriesKey, float]
+
+    def add(self, other: _Samples, gauges: bool) -> None:
+        for key, value in other.counters.items():
+            self.counters[key] = self.counters.get(key, 0) + value
+        for key, values in other.histograms.items():
+            merged = self.histograms.get(key)
+            if merged is None:
+                self.histograms[key] = list(values)
+            else:
+                for i, value in enumerate(values):
+                    merged[i] += value
+        if gauges:
+            for key, value in other.gauges.items():
+                if _SPECS[key[0]].aggregate == "sum":
+                    self.gauges[key] = self.gauges.get(key, 0) + value
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "counters": [[*key, value] for key, value in self.counters.items()],
+                "histograms": [
+                    [*key, values] for key, values in self.histograms.items()
+                ],
+                "gauges": [[*key, value] for key, value in self.gauges.items()],
+            }
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> _Samples:
+        data = json.loads(text)
+        return cls(
+            counters={(name, tuple(labels)): v for name, labels, v in data["counters"]},
+            histograms={
+                (name, tuple(labels)): v for name, labels, v in data["histograms"]
+            },
+            gauges={(name, tuple(labels)): v for name, labels, v in data["gauges"]},
+        )
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
 
 class PrometheusMetrics:
     """Prometheus metrics collector for Bindu server."""
 
-    def __init__(self):
-        """Initialize metrics collector."""
-        self._lock = Lock()
+    def __init__(
+        self,
+        cache_ttl: float | None = None,
+        multiprocess_dir: str | None = None,
+        flush_interval: float | None = None,
+    ):
+        """Initialize metrics collector.
 
-        # HTTP request counters: {(method, endpoint, status): count}
-        self._http_requests: dict[tuple[str, str, str], int] = defaultdict(int)
-
-        # HTTP request duration histograms: {bucket_le: count}
-        # Buckets: 0.1s, 0.5s, 1.0s, +Inf
-        self._duration_buckets = [0.1, 0.5, 1.0, float("inf")]
-        self._duration_counts: dict[float, int] = defaultdict(int)
-        self._duration_sum = 0.0
-        self._duration_total_count = 0
-
-        # Agent task gauges: {agent_id: active_count}
-        self._agent_tasks_active: dict[str, int] = defaultdict(int)
-
-        # Agent task completion counters: {(agent_id, status): count}
-        self._agent_tasks_completed: dict[tuple[str, str], int] = defaultdict(int)
-
-        # Task duration histogram: {bucket_le: count}
-        # Buckets: 1s, 5s, 10s, 30s, 60s, +Inf
-        self._task_duration_buckets = [1.0, 5.0, 10.0, 30.0, 60.0, float("inf")]
-        self._task_duration_counts: dict[tuple[str, str, float], int] = defaultdict(
-            int
-        )  # (agent_id, status, bucket)
-        self._task_duration_sum: dict[tuple[str, str], float] = defaultdict(
-            float
-        )  # (agent_id, status)
-        self._task_duration_total_count: dict[tuple[str, str], int] = defaultdict(
-            int
-        )  # (agent_id, status)
-
-        # Error tracking: {(agent_id, error_type): count}
-        self._agent_errors: dict[tuple[str, str], int] = defaultdict(int)
-
-        # Request/Response size metrics
-        self._http_request_size_sum = 0.0
-        self._http_request_size_count = 0
-        self._http_response_size_sum = 0.0
-        self._http_response_size_count = 0
-        self._http_requests_in_flight = 0
+        Args:
+            cache_ttl: Seconds a rendering is reused (defaults to settings)
+            multiprocess_dir: Directory shared by the worker processes, or
+                None for single-process metrics (defaults to settings)
+            flush_interval: Seconds between writes of this process's samples
+                to multiprocess_dir (defaults to settings)
+        """
+        settings = app_settings.observability
+        if cache_ttl is None:
+            cache_ttl = settings.metrics_cache_ttl
+        if multiprocess_dir is None:
+            multiprocess_dir = settings.metrics_multiprocess_dir
+        if flush_interval is None:
+            flush_interval = settings.metrics_flush_interval
+
+        self.cache_ttl = cache_ttl
+        self.multiprocess_dir = Path(multiprocess_dir) if multiprocess_dir else None
+        self.flush_interval = flush_interval
+
+        # Taken only to register a new thread's shard, never per sample
+        self._lock = Lock()
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        # Gauges are set, not incremented: last write wins
+        self._gauges: dict[SeriesKey, float] = {}
+        self._cache: tuple[float, str] | None = None
+
+        self._flusher: threading.Thread | None = None
+        self._stop_flushing = threading.Event()
+        if self.multiprocess_dir is not None:
+            self.multiprocess_dir.mkdir(parents=True, exist_ok=True)
+            self._claim_samples_file()
+            self._start_flusher()
+            atexit.register(self.flush)
+            os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+
+    def _observe(
+        self, name: str, labels: tuple[str, ...], value: float, shard: _Shard
+    ) -> None:
+        key = (name, labels)
+        buckets = _SPECS[name].buckets
+        values = shard.histograms.get(key)
+        if values is None:
+            values = shard.histograms[key] = [0] * (len(buckets) + 2)
+        values[bisect_left(buckets, value)] += 1
+        values[-1] += value
 
     def record_http_request(
         self,
@@ -67,6 +299,7 @@ class PrometheusMetrics:
         duration: float,
         request_size: int = 0,
         response_size: int = 0,
+        time_to_first_byte: float | None = None,
     ) -> None:
         """Record an HTTP request.
 
@@ -74,30 +307,25 @@ class PrometheusMetrics:
             method: HTTP method (GET, POST, etc.)
             endpoint: Request endpoint path
             status: HTTP status code
-            duration: Request duration in seconds
+            duration: Request duration in seconds, until the last body byte
             request_size: Request body size in bytes
-            response_size: Response body size in bytes
+            response_size: Response body bytes sent (all chunks of a stream)
+            time_to_first_byte: Seconds until the first response body byte,
+                or None if no body was sent
         """
-        with self._lock:
-            # Increment request counter
-            key = (method, endpoint, status)
-            self._http_requests[key] += 1
-
-            # Record duration in histogram buckets
-            for bucket in self._duration_buckets:
-                if duration <= bucket:
-                    self._duration_counts[bucket] += 1
-
-            self._duration_sum += duration
-            self._duration_total_count += 1
-
-            # Record request/response sizes
-            if request_size > 0:
-                self._http_request_size_sum += request_size
-                self._http_request_size_count += 1
-            if response_size > 0:
-                self._http_response_size_sum += response_size
-                self._http_response_size_count += 1
+        shard = self._shard()
+        shard.counters[("http_requests_total", (method, endpoint, status))] += 1
+        self._observe("http_request_duration_seconds", (), duration, shard)
+        if time_to_first_byte is not None:
+            self._observe(
+                "http_time_to_first_byte_seconds", (), time_to_first_byte, shard
+            )
+
+        # Record request/response sizes
+        if request_size > 0:
+            self._observe("http_request_size_bytes", (), request_size, shard)
+        if response_size > 0:
+            self._observe("http_response_size_bytes", (), response_size, shard)
 
     def set_agent_tasks_active(self, agent_id: str, count: int) -> None:
         """Set the number of active tasks for an agent.
@@ -106,8 +334,7 @@ class PrometheusMetrics:
             agent_id: Agent identifier
             count: Number of active tasks
         """
-        with self._lock:
-            self._agent_tasks_active[agent_id] = count
+        self._gauges[("agent_tasks_active", (agent_id,))] = count
 
     def increment_agent_tasks_completed(self, agent_id: str, status: str) -> None:
         """Increment completed task counter for an agent.
@@ -116,9 +343,8 @@ class PrometheusMetrics:
             agent_id: Agent identifier
             status: Task completion status (success, failed, canceled)
         """
-        with self._lock:
-            key = (agent_id, status)
-            self._agent_tasks_completed[key] += 1
+        key = ("agent_tasks_completed_total", (agent_id, status))
+        self._shard().counters[key] += 1
 
     def record_task_duration(self, agent_id: str, status: str, duration: float) -> None:
         """Record task execution duration.
@@ -128,17 +354,9 @@ class PrometheusMetrics:
             status: Task completion status (success, failed, canceled)
             duration: Task duration in seconds
         """
-        with self._lock:
-            key = (agent_id, status)
-
-            # Record in histogram buckets
-            for bucket in self._task_duration_buckets:
-                if duration <= bucket:
-                    bucket_key = (agent_id, status, bucket)
-                    self._task_duration_counts[bucket_key] += 1
-
-            self._task_duration_sum[key] += duration
-            self._task_duration_total_count[key] += 1
+        self._observe(
+            "task_duration_seconds", (agent_id, status), duration, self._shard()
+        )
 
     def increment_agent_error(self, agent_id: str, error_type: str) -> None:
         """Increment error counter for an agent.
@@ -147,9 +365,220 @@ class PrometheusMetrics:
             agent_id: Agent identifier
             error_type: Type of error (e.g., 'timeout', 'validation', 'execution')
         """
-        with self._lock:
-            key = (agent_id, error_type)
-            self._agent_errors[key] += 1
+        self._shard().counters[("agent_errors_total", (agent_id, error_type))] += 1
+
+    def increment_requests_in_flight(self) -> None:
+        """Increment the number of concurrent requests."""
+        self._shard().counters[("http_requests_in_flight", ())] += 1
+
+    def decrement_requests_in_flight(self) -> None:
+        """Decrement the number of concurrent requests."""
+        self._shard().counters[("http_requests_in_flight", ())] -= 1
+
+    def set_worker_slots(self, busy: int, total: int) -> None:
+        """Set worker pool slot utilisation.
+
+        Args:
+            busy: Number of slots currently executing a task operation
+            total: Total number of slots in the pool
+        """
+        self._gauges[("worker_slots_busy", ())] = busy
+        self._gauges[("worker_slots_total", ())] = total
+
+    def set_worker_queue_depth(self, depth: int) -> None:
+        """Set the number of task operations waiting to be executed.
+
+        Args:
+            depth: Pending operations (scheduler backlog plus operations
+                waiting on per-context ordering)
+        """
+        self._gauges[("worker_queue_depth", ())] = depth
+
+    def record_auth_cache_lookup(self, cache: str, hit: bool) -> None:
+        """Count a lookup in one of the authentication caches.
+
+        Args:
+            cache: Cache name (e.g., 'did_public_key')
+            hit: Whether the lookup was answered from the cache
+        """
+        result = "hit" if hit else "miss"
+        self._shard().counters[("auth_cache_lookups_total", (cache, result))] += 1
+
+    # -------------------------------------------------------------------------
+    # Collection
+    # -------------------------------------------------------------------------
+
+    def _collect_local(self) -> _Samples:
+        """Merge the shards of this process.
+
+        Reads other threads' shards without stopping them: copying a dict or
+        list is a single step under the GIL, and a sample landing mid-merge
+        shows up in the next rendering.
+        """
+        samples = _Samples(counters={}, histograms={}, gauges=dict(self._gauges))
+        for shard in list(self._shards):
+            samples.add(
+                _Samples(
+                    counters=dict(shard.counters),
+                    histograms={k: list(v) for k, v in list(shard.histograms.items())},
+                    gauges={},
+                ),
+                gauges=False,
+            )
+        # In-flight requests are tracked as per-thread deltas
+        in_flight = samples.counters.pop(("http_requests_in_flight", ()), 0)
+        samples.gauges[("http_requests_in_flight", ())] = max(0, in_flight)
+        return samples
+
+    def _collect(self) -> _Samples:
+        samples = self._collect_local()
+        if self.multiprocess_dir is None:
+            return samples
+
+        exited = []
+        for pid, path in self._samples_files():
+            if pid == os.getpid():
+                continue
+            if not _pid_alive(pid):
+                exited.append(path)
+                continue
+            try:
+                other = _Samples.from_json(path.read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable metrics file {path}: {e}")
+                continue
+            samples.add(other, gauges=True)
+
+        if exited:
+            self._archive_exited(exited)
+        # Counters of exited workers still count; their gauges do not
+        samples.add(self._read_exited(), gauges=False)
+        return samples
+
+    # -------------------------------------------------------------------------
+    # Multiprocess
+    # -------------------------------------------------------------------------
+
+    def _samples_path(self, pid: int) -> Path:
+        assert self.multiprocess_dir is not None
+        return self.multiprocess_dir / f"metrics_{pid}.json"
+
+    def _samples_files(self) -> list[tuple[int, Path]]:
+        """Return the per-process sample files with their PIDs."""
+        assert self.multiprocess_dir is not None
+        files = []
+        for path in self.multiprocess_dir.glob("metrics_*.json"):
+            try:
+                files.append((int(path.stem.removeprefix("metrics_")), path))
+            except ValueError:
+                logger.warning(f"Skipping unexpected metrics file {path}")
+        return files
+
+    def _claim_samples_file(self) -> None:
+        """Prepare the shared directory before this process first writes to it.
+
+        If no other live process has written there, this is the first
+        process of a new run, and the files of earlier runs are deleted so
+        their counters do not carry over. Otherwise a file already named
+        after this PID belongs to an exited process whose PID was reused,
+        and it is archived before this process overwrites it.
+        """
+        assert self.multiprocess_dir is not None
+        pid = os.getpid()
+        files = self._samples_files()
+        if not any(other != pid and _pid_alive(other) for other, _ in files):
+            for _, path in files:
+                path.unlink(missing_ok=True)
+            (self.multiprocess_dir / EXITED_SAMPLES_FILE).unlink(missing_ok=True)
+        elif any(other == pid for other, _ in files):
+            self._archive_exited([self._samples_path(pid)])
+
+    def _read_exited(self) -> _Samples:
+        """Read the archived samples of exited processes."""
+        assert self.multiprocess_dir is not None
+        path = self.multiprocess_dir / EXITED_SAMPLES_FILE
+        try:
+            return _Samples.from_json(path.read_text())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping unreadable metrics file {path}: {e}")
+        return _Samples(counters={}, histograms={}, gauges={})
+
+    def _archive_exited(self, paths: list[Path]) -> None:
+        """Fold the files of exited processes into the archive, then delete them.
+
+        Runs under an exclusive lock on the directory, so a file found by
+        several processes at once is archived only once.
+        """
+        # Unix only, like the fork handling multiprocess mode relies on
+        import fcntl
+
+        assert self.multiprocess_dir is not None
+        archive_path = self.multiprocess_dir / EXITED_SAMPLES_FILE
+        try:
+            with open(self.multiprocess_dir / EXITED_LOCK_FILE, "a") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                archive = self._read_exited()
+                archived = []
+                for path in paths:
+                    try:
+                        samples = _Samples.from_json(path.read_text())
+                    except FileNotFoundError:
+                        # Archived by another process meanwhile
+                        continue
+                    except (OSError, ValueError) as e:
+                        logger.warning(f"Skipping unreadable metrics file {path}: {e}")
+                        continue
+                    archive.add(samples, gauges=False)
+                    archived.append(path)
+                if not archived:
+                    return
+
+                tmp = archive_path.with_suffix(".tmp")
+                tmp.write_text(archive.to_json())
+                tmp.replace(archive_path)
+                for path in archived:
+                    path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to archive metrics of exited processes: {e}")
+
+    def flush(self) -> None:
+        """Write this process's samples for the other processes to read."""
+        if self.multiprocess_dir is None:
+            return
+        path = self._samples_path(os.getpid())
+        tmp = path.with_suffix(".tmp")
+        try:
+            tmp.write_text(self._collect_local().to_json())
+            tmp.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to write metrics to {path}: {e}")
+
+    def _start_flusher(self) -> None:
+        def run() -> None:
+            while not self._stop_flushing.wait(self.flush_interval):
+                self.flush()
+
+        self._flusher = threading.Thread(
+            target=run, name="bindu-metrics-flush", daemon=True
+        )
+        self._flusher.start()
+
+    def _reset_after_fork(self) -> None:
+        """Start the child with no samples and its own flusher thread."""
+        self._lock = Lock()
+        self._local = threading.local()
+        self._shards = []
+        self._gauges = {}
+        self._cache = None
+        self._stop_flushing = threading.Event()
+        self._claim_samples_file()
+        self._start_flusher()
+
+    # -------------------------------------------------------------------------
+    # Exposition
+    # -------------------------------------------------------------------------
 
     @staticmethod
     def _format_bucket(bucket: float) -> str:
@@ -178,169 +607,78 @@ class PrometheusMetrics:
         lines.append(f"# HELP {metric_name} {help_text}")
         lines.append(f"# TYPE {metric_name} {metric_type}")
 
-    def increment_requests_in_flight(self) -> None:
-        """Increment the number of concurrent requests."""
-        with self._lock:
-            self._http_requests_in_flight += 1
+    @staticmethod
+    def _labels(names: tuple[str, ...], values: tuple[str, ...], **extra: str) -> str:
+        pairs = [*zip(names, values), *extra.items()]
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{n}="{_escape(str(v))}"' for n, v in pairs) + "}"
 
-    def decrement_requests_in_flight(self) -> None:
-        """Decrement the number of concurrent requests."""
-        with self._lock:
-            self._http_requests_in_flight = max(0, self._http_requests_in_flight - 1)
+    def _render_histogram(
+        self,
+        lines: list[str],
+        spec: _MetricSpec,
+        labels: tuple[str, ...],
+        values: list[float],
+    ) -> None:
+        count = sum(values[:-1])
+        if spec.kind == "histogram":
+            cumulative = 0
+            for bound, bucket_count in zip((*spec.buckets, float("inf")), values[:-1]):
+                cumulative += bucket_count
+                le = self._format_bucket(bound)
+                series = self._labels(spec.labels, labels, le=le)
+                lines.append(f"{spec.name}_bucket{series} {cumulative}")
+        series = self._labels(spec.labels, labels)
+        lines.append(f"{spec.name}_sum{series} {values[-1]}")
+        lines.append(f"{spec.name}_count{series} {count}")
+
+    def _render(self, samples: _Samples) -> str:
+        series_by_metric: dict[str, list[tuple[tuple[str, ...], object]]] = defaultdict(
+            list
+        )
+        for source in (samples.counters, samples.histograms, samples.gauges):
+            for (name, labels), value in source.items():
+                series_by_metric[name].append((labels, value))
+
+        blocks = []
+        for spec in _SPECS.values():
+            series = sorted(series_by_metric.get(spec.name, ()))
+            if not series:
+                if not spec.always:
+                    continue
+                if spec.kind in ("histogram", "summary"):
+                    series = [((), [0] * (len(spec.buckets) + 2))]
+
+            lines: list[str] = []
+            self._add_metric_header(lines, spec.name, spec.help, spec.kind)
+            for labels, value in series:
+                if spec.kind in ("histogram", "summary"):
+                    self._render_histogram(lines, spec, labels, value)  # type: ignore[arg-type]
+                else:
+                    lines.append(
+                        f"{spec.name}{self._labels(spec.labels, labels)} {value}"
+                    )
+            blocks.append("\n".join(lines))
+
+        return "\n\n".join(blocks) + "\n"
 
     def generate_prometheus_text(self) -> str:
-        """Generate Prometheus text format metrics.
+        """Render the metrics in Prometheus text format and cache the result.
 
         Returns:
             Prometheus-formatted metrics string
         """
-        lines = []
-
-        with self._lock:
-            # HTTP requests total
-            self._add_metric_header(
-                lines, "http_requests_total", "Total number of HTTP requests", "counter"
-            )
-            for (method, endpoint, status), count in sorted(
-                self._http_requests.items()
-            ):
-                lines.append(
-                    f'http_requests_total{{method="{method}",endpoint="{endpoint}",status="{status}"}} {count}'
-                )
-
-            # HTTP request duration
-            lines.append("")
-            self._add_metric_header(
-                lines,
-                "http_request_duration_seconds",
-                "HTTP request latency",
-                "histogram",
-            )
-            for bucket in self._duration_buckets:
-                count = self._duration_counts[bucket]
-                bucket_str = self._format_bucket(bucket)
-                lines.append(
-                    f'http_request_duration_seconds_bucket{{le="{bucket_str}"}} {count}'
-                )
-            lines.append(f"http_request_duration_seconds_sum {self._duration_sum:.1f}")
-            lines.append(
-                f"http_request_duration_seconds_count {self._duration_total_count}"
-            )
-
-            # Agent tasks active
-            if self._agent_tasks_active:
-                lines.append("")
-                self._add_metric_header(
-                    lines, "agent_tasks_active", "Currently active tasks", "gauge"
-                )
-                for agent_id, count in sorted(self._agent_tasks_active.items()):
-                    lines.append(f'agent_tasks_active{{agent_id="{agent_id}"}} {count}')
-
-            # Agent tasks completed
-            if self._agent_tasks_completed:
-                lines.append("")
-                self._add_metric_header(
-                    lines,
-                    "agent_tasks_completed_total",
-                    "Total completed tasks",
-                    "counter",
-                )
-                for (agent_id, status), count in sorted(
-                    self._agent_tasks_completed.items()
-                ):
-                    lines.append(
-                        f'agent_tasks_completed_total{{agent_id="{agent_id}",status="{status}"}} {count}'
-                    )
-
-            # Task duration histogram
-            if self._task_duration_total_count:
-                lines.append("")
-                self._add_metric_header(
-                    lines,
-                    "task_duration_seconds",
-                    "Task execution duration",
-                    "histogram",
-                )
-
-                # Group by agent_id and status for histogram output
-                agent_status_pairs = set(
-                    (agent_id, status)
-                    for (agent_id, status, _) in self._task_duration_counts.keys()
-                )
-
-                for agent_id, status in sorted(agent_status_pairs):
-                    for bucket in self._task_duration_buckets:
-                        bucket_key = (agent_id, status, bucket)
-                        count = self._task_duration_counts.get(bucket_key, 0)
-                        bucket_str = self._format_bucket(bucket)
-                        lines.append(
-                            f'task_duration_seconds_bucket{{agent_id="{agent_id}",status="{status}",le="{bucket_str}"}} {count}'
-                        )
-
-                    key = (agent_id, status)
-                    duration_sum = self._task_duration_sum.get(key, 0.0)
-                    duration_count = self._task_duration_total_count.get(key, 0)
-                    lines.append(
-                        f'task_duration_seconds_sum{{agent_id="{agent_id}",status="{status}"}} {duration_sum:.1f}'
-                    )
-                    lines.append(
-                        f'task_duration_seconds_count{{agent_id="{agent_id}",status="{status}"}} {duration_count}'
-                    )
-
-            # Agent errors
-            if self._agent_errors:
-                lines.append("")
-                self._add_metric_header(
-                    lines, "agent_errors_total", "Total errors by type", "counter"
-                )
-                for (agent_id, error_type), count in sorted(self._agent_errors.items()):
-                    lines.append(
-                        f'agent_errors_total{{agent_id="{agent_id}",error_type="{error_type}"}} {count}'
-                    )
-
-            # Request size metrics
-            if self._http_request_size_count > 0:
-                lines.append("")
-                self._add_metric_header(
-                    lines,
-                    "http_request_size_bytes",
-                    "HTTP request body size",
-                    "summary",
-                )
-                lines.append(
-                    f"http_request_size_bytes_sum {self._http_request_size_sum:.0f}"
-                )
-                lines.append(
-                    f"http_request_size_bytes_count {self._http_request_size_count}"
-                )
-
-            # Response size metrics
-            if self._http_response_size_count > 0:
-                lines.append("")
-                self._add_metric_header(
-                    lines,
-                    "http_response_size_bytes",
-                    "HTTP response body size",
-                    "summary",
-                )
-                lines.append(
-                    f"http_response_size_bytes_sum {self._http_response_size_sum:.0f}"
-                )
-                lines.append(
-                    f"http_response_size_bytes_count {self._http_response_size_count}"
-                )
-
-            # Requests in flight
-            lines.append("")
-            self._add_metric_header(
-                lines,
-                "http_requests_in_flight",
-                "Current number of HTTP requests being processed",
-                "gauge",
-            )
-            lines.append(f"http_requests_in_flight {self._http_requests_in_flight}")
-
-        return "\n".join(lines) + "\n"
+        text = self._render(self._collect())
+        self._cache = (time.monotonic(), text)
+        return text
+
+    def cached_prometheus_text(self) -> str | None:
+        """Return the last rendering if it is younger than cache_ttl."""
+        cache = self._cache
+        if cache is None or time.monotonic() - cache[0] >= self.cache_ttl:
+            return None
+        return cache[1]
 
 
 # Global metrics instance
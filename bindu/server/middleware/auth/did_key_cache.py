@@ -0,0 +1,103 @@
+"""Cache of decoded client public keys for DID signature verification.
+
+HydraMiddleware checks each signed request against the public key the client
+registered in Hydra. Fetching the OAuth client from the Hydra admin API for
+every request doubles Hydra load and adds a round-trip to each A2A call, so
+decoded keys are kept per DID:
+
+- Bounded LRU with a TTL, so a rotated key is picked up eventually
+- Concurrent misses for the same DID share one Hydra request
+- ``invalidate()`` drops a DID's key at once, e.g. after a key rotation
+"""
+
+from __future__ import annotations as _annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from nacl.signing import VerifyKey
+
+from bindu.server.metrics import get_metrics
+from bindu.utils.did import decode_public_key
+
+from .single_flight import SingleFlight
+
+CACHE_NAME = "did_public_key"
+
+
+class DIDKeyCache:
+    """Decoded public keys by DID, bounded LRU with a TTL.
+
+    Owned by one event loop. Clients without a registered key are not cached,
+    since Hydra also reports lookup failures as a missing key.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[str | None]],
+        ttl: float,
+        max_size: int,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            fetch: Returns the base58 public key registered for a DID, or None
+            ttl: Seconds a key is reused (0 disables caching)
+            max_size: Keys kept before the least recently used is dropped
+        """
+        self._fetch = fetch
+        self.ttl = ttl
+        self.max_size = max_size
+        self._keys: OrderedDict[str, tuple[float, VerifyKey]] = OrderedDict()
+        self._loading: SingleFlight[str, VerifyKey | None] = SingleFlight()
+
+    def __len__(self) -> int:
+        """Return the number of cached keys, including expired ones."""
+        return len(self._keys)
+
+    def __contains__(self, did: str) -> bool:
+        """Return whether an unexpired key is cached for ``did``."""
+        entry = self._keys.get(did)
+        return entry is not None and entry[0] > time.monotonic()
+
+    async def get(self, did: str) -> VerifyKey | None:
+        """Return the DID's decoded public key, or None if it has none.
+
+        Raises:
+            ValueError: If the registered key is not a valid Ed25519 key
+        """
+        entry = self._keys.get(did)
+        if entry is not None:
+            expires_at, key = entry
+            if expires_at > time.monotonic():
+                self._keys.move_to_end(did)
+                get_metrics().record_auth_cache_lookup(CACHE_NAME, hit=True)
+                return key
+            del self._keys[did]
+        get_metrics().record_auth_cache_lookup(CACHE_NAME, hit=False)
+
+        return await self._loading.run(did, lambda: self._load(did))
+
+    def invalidate(self, did: str) -> None:
+        """Drop the DID's key, including one being fetched right now."""
+        self._keys.pop(did, None)
+        self._loading.forget(did)
+
+    def clear(self) -> None:
+        """Drop all keys."""
+        self._keys.clear()
+        self._loading.clear()
+
+    async def _load(self, did: str) -> VerifyKey | None:
+        public_key = await self._fetch(did)
+        if not public_key:
+            return None
+        key = decode_public_key(public_key)
+        # Not cached if invalidated while the fetch was in flight
+        if self.ttl > 0 and self._loading.is_current(did):
+            self._keys[did] = (time.monotonic() + self.ttl, key)
+            self._keys.move_to_end(did)
+            while len(self._keys) > self.max_size:
+                self._keys.popitem(last=False)
+        return key
@@ -14,8 +14,10 @@ import asyncio
 import hashlib
 import time
 import inspect
+from collections import deque
 from typing import Any, Callable
 
+import redis.asyncio as redis
 from starlette.requests import HTTPConnection
 from starlette.responses import JSONResponse
 from starlette.websockets import WebSocket
@@ -24,11 +26,17 @@ from bindu.auth.hydra.client import HydraClient
 from bindu.utils.logging import get_logger
 from bindu.server.endpoints.utils import extract_error_fields, jsonrpc_error
 from bindu.utils.did import (
+    SIGNATURE_VERSION_LEGACY,
+    SUPPORTED_SIGNATURE_VERSIONS,
     extract_signature_headers,
+    verify_digest_signature,
     verify_signature,
 )
 
 from .base import AuthMiddleware
+from .did_key_cache import DIDKeyCache
+from .introspection_cache import IntrospectionCache
+from .jwks_verifier import JWKSVerifier
 
 logger = get_logger("bindu.server.middleware.hydra")
 
@@ -45,9 +53,6 @@ class HydraMiddleware(AuthMiddleware):
         """Initialize Hydra middleware."""
         super().__init__(app, auth_config)
 
-        self._introspection_cache = {}
-        self._cache_locks = {}
-        self._cache_ttl = CACHE_TTL_SECONDS
         self._max_body_size = MAX_BODY_SIZE_BYTES
 
     def _initialize_provider(self) -> None:
@@ -59,6 +64,28 @@ class HydraMiddleware(AuthMiddleware):
                 timeout=getattr(self.config, "timeout", 10),
                 verify_ssl=getattr(self.config, "verify_ssl", True),
             )
+            self._did_keys = DIDKeyCache(
+                self.hydra_client.get_public_key_from_client,
+                ttl=getattr(self.config, "public_key_cache_ttl", CACHE_TTL_SECONDS),
+                max_size=getattr(self.config, "public_key_cache_size", 1000),
+            )
+            self._introspection_cache = IntrospectionCache(
+                self._introspect_token,
+                ttl=getattr(self.config, "cache_ttl", CACHE_TTL_SECONDS),
+                max_size=getattr(self.config, "max_cache_size", 1000),
+                redis_client=self._create_cache_redis_client(),
+                key_prefix=getattr(
+                    self.config, "cache_key_prefix", "bindu:hydra:introspection"
+                ),
+            )
+            self._jwks_verifier = (
+                JWKSVerifier(
+                    self.hydra_client.get_jwks,
+                    ttl=getattr(self.config, "jwks_cache_ttl", 3600),
+                )
+                if getattr(self.config, "verify_jwt_locally", False)
+                else None
+            )
             logger.info(
                 f"Hydra middleware initialized. Admin URL: {self.config.admin_url}"
             )
@@ -66,15 +93,36 @@ class HydraMiddleware(AuthMiddleware):
             logger.error(f"Failed to initialize Hydra client: {e}")
             raise
 
+    def _create_cache_redis_client(self) -> redis.Redis | None:
+        """Return a Redis client to share introspection results, if enabled."""
+        from bindu.settings import app_settings
+
+        backend = getattr(self.config, "cache_backend", "memory")
+        if backend == "auto":
+            backend = "redis" if app_settings.scheduler.backend == "redis" else "memory"
+        if backend == "memory":
+            return None
+
+        redis_url = app_settings.scheduler.redis_url
+        if not redis_url:
+            raise ValueError(
+                "Shared token introspection cache requires a Redis URL. "
+                "Please provide it via REDIS_URL environment variable or config."
+            )
+        logger.info("Sharing token introspection results through Redis")
+        return redis.from_url(redis_url, decode_responses=True)
+
     async def _validate_token(self, token: str) -> dict[str, Any]:
+        """Validate OAuth2 token locally if it is a Hydra JWT, else by introspection."""
+        if self._jwks_verifier is not None:
+            claims = await self._jwks_verifier.verify(token)
+            if claims is not None:
+                logger.debug("Token validated against Hydra JWKS")
+                return claims
+        return await self._introspection_cache.get(token)
+
+    async def _introspect_token(self, token: str) -> dict[str, Any]:
         """Validate OAuth2 token using Hydra introspection."""
-        cache_key = hashlib.sha256(token.encode()).hexdigest()
-        if cache_key in self._introspection_cache:
-            cached = self._introspection_cache[cache_key]
-            if cached["expires_at"] > time.time():
-                logger.debug("Token validated from cache")
-                return cached["data"]
-
         try:
             introspection_result = await self.hydra_client.introspect_token(token)
 
@@ -85,19 +133,9 @@ class HydraMiddleware(AuthMiddleware):
             if "exp" not in introspection_result:
                 raise ValueError("Token missing expiration (exp) claim")
 
-            current_time = time.time()
-            if introspection_result["exp"] < current_time:
+            if introspection_result["exp"] < time.time():
                 raise ValueError(f"Token expired at {introspection_result['exp']}")
 
-            expires_at = min(
-                introspection_result["exp"], current_time + self._cache_ttl
-            )
-            self._introspection_cache[cache_key] = {
-                "data": introspection_result,
-                "expires_at": expires_at,
-            }
-
-            self._lazy_clean_cache()
             return introspection_result
         except Exception as e:
             logger.error(f"Token introspection failed: {e}")
@@ -140,20 +178,9 @@ class HydraMiddleware(AuthMiddleware):
         logger.debug(f"Extracted user info for sub={user_info['sub']}, is_m2m={is_m2m}")
         return user_info
 
-    def _lazy_clean_cache(self) -> None:
-        """O(1) amortized cache cleanup."""
-        current_time = time.time()
-        expired_keys = []
-
-        for key, value in self._introspection_cache.items():
-            if value["expires_at"] <= current_time:
-                expired_keys.append(key)
-            else:
-                break
-
-        for key in expired_keys:
-            self._introspection_cache.pop(key, None)
-            self._cache_locks.pop(key, None)
+    def invalidate_did_key(self, client_did: str) -> None:
+        """Forget a client's cached public key, e.g. after it was rotated."""
+        self._did_keys.invalidate(client_did)
 
     async def _verify_did_signature_asgi(
         self, receive: Callable, client_did: str, headers: Any
@@ -171,10 +198,27 @@ class HydraMiddleware(AuthMiddleware):
         if signature_data["did"] != client_did:
             return False, {"did_verified": False, "reason": "did_mismatch"}, receive
 
-        public_key = await self.hydra_client.get_public_key_from_client(client_did)
-        if not public_key:
+        was_cached = client_did in self._did_keys
+        try:
+            public_key = await self._did_keys.get(client_did)
+        except ValueError as e:
+            logger.warning(f"Invalid public key registered for {client_did}: {e}")
+            return (
+                False,
+                {"did_verified": False, "reason": "invalid_signature"},
+                receive,
+            )
+        if public_key is None:
             return True, {"did_verified": False, "reason": "no_public_key"}, receive
 
+        version = signature_data["version"]
+        if version not in SUPPORTED_SIGNATURE_VERSIONS:
+            return (
+                False,
+                {"did_verified": False, "reason": "unsupported_signature_version"},
+                receive,
+            )
+
         # Memory Safety Guard
         content_length = int(headers.get("content-length", 0))
         if content_length > MAX_BODY_SIZE_BYTES:
@@ -187,37 +231,82 @@ class HydraMiddleware(AuthMiddleware):
                 receive,
             )
 
-        # Safely buffer the ASGI stream chunks
-        body = b""
+        # Buffer the ASGI stream chunks for the downstream app. Version 2
+        # only needs a running digest; the legacy scheme needs the whole body,
+        # copied once into a buffer sized from Content-Length.
+        messages: deque[dict[str, Any]] = deque()
+        digest = hashlib.sha256()
+        body = (
+            bytearray(content_length) if version == SIGNATURE_VERSION_LEGACY else None
+        )
+        size = 0
         more_body = True
-        messages = []
         while more_body:
             message = await receive()
             messages.append(message)
-            body += message.get("body", b"")
+            chunk = message.get("body", b"")
+            if size + len(chunk) > MAX_BODY_SIZE_BYTES:
+                logger.warning("Payload too large for signature verification")
+                return (
+                    False,
+                    {"did_verified": False, "reason": "payload_too_large"},
+                    receive,
+                )
+            if body is None:
+                digest.update(chunk)
+            else:
+                # Grows the buffer if Content-Length was missing or too small
+                body[size : size + len(chunk)] = chunk
+            size += len(chunk)
             more_body = message.get("more_body", False)
+        if body is not None:
+            del body[size:]
 
         # Create a proxy receiver to feed the downstream application
         async def cached_receive():
             if messages:
-                return messages.pop(0)
+                return messages.popleft()
             return {"type": "http.request", "body": b"", "more_body": False}
 
-        # Background thread crypto validation to prevent event loop blocking
-        is_valid = await asyncio.to_thread(
-            verify_signature,
-            body=body,
-            signature=signature_data["signature"],
-            did=signature_data["did"],
-            timestamp=signature_data["timestamp"],
-            public_key=public_key,
-            max_age_seconds=MAX_SIGNATURE_AGE_SECONDS,
+        common = {
+            "signature": signature_data["signature"],
+            "did": signature_data["did"],
+            "timestamp": signature_data["timestamp"],
+            "max_age_seconds": MAX_SIGNATURE_AGE_SECONDS,
+        }
+
+        async def verify(key: Any) -> bool:
+            if body is None:
+                # Hashing is done; one Ed25519 check is cheaper than a thread hop
+                return verify_digest_signature(
+                    body_digest=digest.digest(), public_key=key, **common
+                )
+            # Background thread crypto validation to prevent event loop blocking
+            return await asyncio.to_thread(
+                verify_signature, body=body, public_key=key, **common
+            )
+
+        is_valid = await verify(public_key)
+
+        fresh = (
+            abs(time.time() - signature_data["timestamp"]) <= MAX_SIGNATURE_AGE_SECONDS
         )
+        if not is_valid and was_cached and fresh:
+            # The client may have rotated its key since it was cached
+            self._did_keys.invalidate(client_did)
+            try:
+                current_key = await self._did_keys.get(client_did)
+            except ValueError:
+                current_key = None
+            if current_key is not None and current_key != public_key:
+                logger.info(f"Public key of {client_did} changed, verifying again")
+                is_valid = await verify(current_key)
 
         verification_result = {
             "did_verified": is_valid,
             "did": client_did,
             "timestamp": signature_data.get("timestamp"),
+            "signature_version": version,
             "reason": None if is_valid else "invalid_signature",
         }
         return is_valid, verification_result, cached_receive
@@ -0,0 +1,171 @@
+"""Cache of Hydra token introspection results.
+
+HydraMiddleware introspects every bearer token with Hydra's admin API. The
+result for a token is reused until the token expires or the cache TTL ends,
+whichever comes first:
+
+- Bounded by ``max_size``; when full, the entries closest to expiry go first
+- Expiry is tracked in a heap, so cleanup only touches expired entries
+- Concurrent misses for the same token share one introspection
+- With a Redis client, results are shared, so a token introspected on one
+  replica is not introspected again on the others
+
+Only tokens that passed validation are cached; a rejected token is
+introspected again on its next use.
+"""
+
+from __future__ import annotations as _annotations
+
+import hashlib
+import heapq
+import json
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import redis.asyncio as redis
+
+from bindu.server.metrics import get_metrics
+from bindu.utils.logging import get_logger
+
+from .single_flight import SingleFlight
+
+logger = get_logger("bindu.server.middleware.auth.introspection_cache")
+
+CACHE_NAME = "introspection"
+SHARED_CACHE_NAME = "introspection_redis"
+
+
+class IntrospectionCache:
+    """Validated introspection results by token hash, bounded with a TTL.
+
+    Owned by one event loop. Tokens are only kept as SHA-256 digests, both in
+    memory and in Redis. Redis errors are logged and the lookup falls through
+    to Hydra, so an unavailable Redis never fails authentication.
+    """
+
+    def __init__(
+        self,
+        introspect: Callable[[str], Awaitable[dict[str, Any]]],
+        ttl: float,
+        max_size: int,
+        redis_client: redis.Redis | None = None,
+        key_prefix: str = "bindu:hydra:introspection",
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            introspect: Returns the validated introspection result of a token,
+                raising if the token is not valid
+            ttl: Seconds a result is reused at most (0 disables caching)
+            max_size: Results kept in memory
+            redis_client: Shared tier; results are kept only in memory if None
+            key_prefix: Prefix of the Redis keys
+        """
+        self._introspect = introspect
+        self.ttl = ttl
+        self.max_size = max_size
+        self._redis = redis_client
+        self.key_prefix = key_prefix
+        self._entries: dict[str, tuple[float, dict[str, Any]]] = {}
+        # (expires_at, key); entries replaced since are skipped when popped
+        self._expiry: list[tuple[float, str]] = []
+        self._loading: SingleFlight[str, dict[str, Any]] = SingleFlight()
+
+    def __len__(self) -> int:
+        """Return the number of results in memory, including expired ones."""
+        return len(self._entries)
+
+    async def get(self, token: str) -> dict[str, Any]:
+        """Return the token's validated introspection result.
+
+        Raises:
+            Whatever ``introspect`` raises for a token that is not valid
+        """
+        key = hashlib.sha256(token.encode()).hexdigest()
+        now = time.time()
+        self._expire(now)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            get_metrics().record_auth_cache_lookup(CACHE_NAME, hit=True)
+            return entry[1]
+        get_metrics().record_auth_cache_lookup(CACHE_NAME, hit=False)
+
+        return await self._loading.run(key, lambda: self._load(token, key))
+
+    def clear(self) -> None:
+        """Drop all results held in memory."""
+        self._entries.clear()
+        self._expiry.clear()
+        self._loading.clear()
+
+    async def _load(self, token: str, key: str) -> dict[str, Any]:
+        if self._redis is not None and self.ttl > 0:
+            shared = await self._get_shared(key)
+            if shared is not None:
+                expires_at, result = shared
+                self._store(key, expires_at, result)
+                return result
+
+        result = await self._introspect(token)
+        if self.ttl > 0:
+            expires_at = min(float(result["exp"]), time.time() + self.ttl)
+            self._store(key, expires_at, result)
+            if self._redis is not None:
+                await self._set_shared(key, expires_at, result)
+        return result
+
+    def _store(self, key: str, expires_at: float, result: dict[str, Any]) -> None:
+        self._entries[key] = (expires_at, result)
+        heapq.heappush(self._expiry, (expires_at, key))
+        while len(self._entries) > self.max_size:
+            self._pop_soonest()
+        if len(self._expiry) > 2 * self.max_size:
+            # Replaced entries left their old deadlines behind
+            self._expiry = [(e, k) for k, (e, _) in self._entries.items()]
+            heapq.heapify(self._expiry)
+
+    def _expire(self, now: float) -> None:
+        while self._expiry and self._expiry[0][0] <= now:
+            self._pop_soonest()
+
+    def _pop_soonest(self) -> None:
+        expires_at, key = heapq.heappop(self._expiry)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == expires_at:
+            del self._entries[key]
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.key_prefix}:{key}"
+
+    async def _get_shared(self, key: str) -> tuple[float, dict[str, Any]] | None:
+        assert self._redis is not None
+        try:
+            data = await self._redis.get(self._redis_key(key))
+        except redis.RedisError as e:
+            logger.warning(f"Shared introspection cache unavailable: {e}")
+            return None
+
+        if data is None:
+            get_metrics().record_auth_cache_lookup(SHARED_CACHE_NAME, hit=False)
+            return None
+        entry = json.loads(data)
+        if entry["expires_at"] <= time.time():
+            get_metrics().record_auth_cache_lookup(SHARED_CACHE_NAME, hit=False)
+            return None
+        get_metrics().record_auth_cache_lookup(SHARED_CACHE_NAME, hit=True)
+        return entry["expires_at"], entry["result"]
+
+    async def _set_shared(
+        self, key: str, expires_at: float, result: dict[str, Any]
+    ) -> None:
+        assert self._redis is not None
+        ttl_ms = int((expires_at - time.time()) * 1000)
+        if ttl_ms <= 0:
+            return
+        data = json.dumps({"expires_at": expires_at, "result": result})
+        try:
+            await self._redis.set(self._redis_key(key), data, px=ttl_ms)
+        except redis.RedisError as e:
+            logger.warning(f"Shared introspection cache unavailable: {e}")
@@ -0,0 +1,64 @@
+"""Single-flight loading for the authentication caches.
+
+On a cache miss, concurrent requests for the same key would each call Hydra.
+``SingleFlight`` runs one load per key and lets every caller await it:
+
+- The load runs in its own task, so a caller giving up does not cancel it
+  for the others
+- A key is forgotten as soon as its load finishes; failures are not kept
+- ``forget()`` detaches a running load, so it can tell it was superseded
+"""
+
+from __future__ import annotations as _annotations
+
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+KeyT = TypeVar("KeyT")
+ValueT = TypeVar("ValueT")
+
+
+class SingleFlight(Generic[KeyT, ValueT]):
+    """Loads in progress by key. Owned by one event loop."""
+
+    def __init__(self) -> None:
+        """Initialize with no loads in progress."""
+        self._tasks: dict[KeyT, asyncio.Task[ValueT]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of loads in progress."""
+        return len(self._tasks)
+
+    async def run(self, key: KeyT, load: Callable[[], Awaitable[ValueT]]) -> ValueT:
+        """Return the result of the key's load, starting ``load`` if none runs.
+
+        Raises:
+            Whatever the load raises, in every caller awaiting it
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(load())
+            self._tasks[key] = task
+            task.add_done_callback(functools.partial(self._done, key))
+        return await asyncio.shield(task)
+
+    def is_current(self, key: KeyT) -> bool:
+        """Return whether the calling task is the key's load, not forgotten."""
+        return self._tasks.get(key) is asyncio.current_task()
+
+    def forget(self, key: KeyT) -> None:
+        """Detach the key's load; the next caller starts a new one."""
+        self._tasks.pop(key, None)
+
+    def clear(self) -> None:
+        """Detach all loads."""
+        self._tasks.clear()
+
+    def _done(self, key: KeyT, task: asyncio.Task[ValueT]) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Retrieved here in case every waiter was cancelled
+            task.exception()
@@ -1,16 +1,19 @@
-"""Metrics middleware for tracking HTTP requests."""
+"""Metrics middleware for tracking HTTP requests.
+
+Pure ASGI: the middleware wraps ``send`` instead of buffering the response,
+so streamed (SSE) bodies pass through untouched while time to first byte
+and the bytes actually sent are measured.
+"""
 
 from __future__ import annotations
 
 import re
 import time
-from typing import Callable
+from typing import Any
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from bindu.server.metrics import get_metrics
+from bindu.server.metrics import PrometheusMetrics, get_metrics
 from bindu.utils.logging import get_logger
 
 logger = get_logger("bindu.server.middleware.metrics")
@@ -25,82 +28,93 @@ UUID_PATTERN = re.compile(
 NUMERIC_ID_PATTERN = re.compile(r"/\d+")
 
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    """Middleware to track HTTP request metrics for Prometheus."""
+def _content_length(scope: Scope) -> int:
+    """Return the request's Content-Length header, or 0 if absent or invalid."""
+    for name, value in scope["headers"]:
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return 0
+    return 0
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request and record metrics.
 
-        Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/endpoint in chain
+class MetricsMiddleware:
+    """Middleware to track HTTP request metrics for Prometheus (Pure ASGI)."""
 
-        Returns:
-            HTTP response
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize metrics middleware.
+
+        Args:
+            app: The next ASGI application in the pipeline
         """
-        # Skip metrics collection for the metrics endpoint itself
-        if request.url.path == METRICS_ENDPOINT_PATH:
-            return await call_next(request)
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request and record metrics once the response has been sent."""
+        # Skip non-HTTP traffic and the metrics endpoint itself
+        if scope["type"] != "http" or scope["path"] == METRICS_ENDPOINT_PATH:
+            await self.app(scope, receive, send)
+            return
 
         metrics = get_metrics()
 
         # Increment requests in flight
         metrics.increment_requests_in_flight()
 
+        start_time = time.perf_counter()
+        # Reported if the application raises before starting a response
+        response: dict[str, Any] = {"status": 500, "ttfb": None, "size": 0}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                body = message.get("body", b"")
+                if body and response["ttfb"] is None:
+                    response["ttfb"] = time.perf_counter() - start_time
+                response["size"] += len(body)
+            await send(message)
+
         try:
-            # Get request size
-            request_size = 0
-            if request.headers.get("content-length"):
-                try:
-                    request_size = int(request.headers["content-length"])
-                except (ValueError, TypeError):
-                    pass
-
-            # Record start time
-            start_time = time.time()
-
-            # Process request
-            response = await call_next(request)
-
-            # Calculate duration
-            duration = time.time() - start_time
-
-            # Get response size
-            response_size = 0
-            if response.headers.get("content-length"):
-                try:
-                    response_size = int(response.headers["content-length"])
-                except (ValueError, TypeError):
-                    pass
-
-            # Record metrics
-            try:
-                method = request.method
-                # Sanitize endpoint to avoid high cardinality
-                # Replace UUIDs and numeric IDs with placeholders
-                endpoint = request.url.path
-                endpoint = UUID_PATTERN.sub("/:id", endpoint)
-                endpoint = NUMERIC_ID_PATTERN.sub("/:id", endpoint)
-
-                status = str(response.status_code)
-
-                metrics.record_http_request(
-                    method,
-                    endpoint,
-                    status,
-                    duration,
-                    request_size=request_size,
-                    response_size=response_size,
-                )
-
-                logger.debug(
-                    f"Recorded metrics: {method} {endpoint} {status} "
-                    f"{duration:.3f}s req={request_size}B resp={response_size}B"
-                )
-            except Exception as e:
-                logger.error(f"Failed to record metrics: {e}")
-
-            return response
+            await self.app(scope, receive, send_wrapper)
         finally:
+            duration = time.perf_counter() - start_time
             # Always decrement requests in flight
             metrics.decrement_requests_in_flight()
+            self._record(metrics, scope, response, duration)
+
+    def _record(
+        self,
+        metrics: PrometheusMetrics,
+        scope: Scope,
+        response: dict[str, Any],
+        duration: float,
+    ) -> None:
+        """Record one finished request."""
+        try:
+            method = scope["method"]
+            # Sanitize endpoint to avoid high cardinality
+            # Replace UUIDs and numeric IDs with placeholders
+            endpoint = UUID_PATTERN.sub("/:id", scope["path"])
+            endpoint = NUMERIC_ID_PATTERN.sub("/:id", endpoint)
+
+            status = str(response["status"])
+            request_size = _content_length(scope)
+
+            metrics.record_http_request(
+                method,
+                endpoint,
+                status,
+                duration,
+                request_size=request_size,
+                response_size=response["size"],
+                time_to_first_byte=response["ttfb"],
+            )
+
+            logger.debug(
+                f"Recorded metrics: {method} {endpoint} {status} "
+                f"{duration:.3f}s req={request_size}B resp={response['size']}B"
+            )
+        except Exception as e:
+            logger.error(f"Failed to record metrics: {e}")
@@ -0,0 +1,325 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Async on-chain lookups for x402 payment validation.
+
+ChainRpcClient answers the two questions X402Middleware asks a chain (is the
+token contract deployed, and what is the payer's balance) without blocking
+the event loop:
+
+- One AsyncWeb3 per RPC URL, reusing web3's pooled aiohttp session
+- Failover across ``rpc_urls_by_network``: if a node has not answered within
+  the hedge delay, the next one is raced against it and the first answer wins
+- A circuit breaker per RPC URL, so a dead node is skipped instead of costing
+  every payment a timeout
+- Short-lived caches for contract deployment and balance lookups
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from aiohttp import ClientTimeout
+from web3 import AsyncHTTPProvider, AsyncWeb3
+from web3.types import RPCEndpoint
+
+from bindu.settings import app_settings
+from bindu.utils.logging import get_logger
+
+logger = get_logger("bindu.server.middleware.x402.chain_rpc")
+
+T = TypeVar("T")
+
+# Entries kept per cache before expired ones are swept
+MAX_CACHE_ENTRIES = 10_000
+
+# ERC-20 balanceOf ABI
+ERC20_BALANCE_OF_ABI = [
+    {
+        "constant": True,
+        "inputs": [{"name": "_owner", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"name": "balance", "type": "uint256"}],
+        "type": "function",
+    }
+]
+
+
+class ChainRpcError(Exception):
+    """Raised when no RPC provider of a network could answer a call."""
+
+
+class _CircuitBreaker:
+    """Stop calling an RPC URL after consecutive failures.
+
+    After ``failure_threshold`` failures in a row the circuit opens and the
+    URL is skipped. Once ``reset_timeout`` has passed, one trial call is let
+    through: success closes the circuit, failure keeps it open for another
+    period.
+    """
+
+    __slots__ = ("_failures", "_opened_at", "failure_threshold", "reset_timeout")
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being refused."""
+        return (
+            self._opened_at is not None
+            and time.monotonic() - self._opened_at < self.reset_timeout
+        )
+
+    def allow(self) -> bool:
+        """Return whether a call may be made now."""
+        if self._opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self._opened_at < self.reset_timeout:
+            return False
+        # Half-open: this caller makes the trial call, others wait another period
+        self._opened_at = now
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold."""
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+
+
+class ChainRpcClient:
+    """Non-blocking token lookups across a network's RPC providers.
+
+    Settings default to ``app_settings.x402``.
+    """
+
+    def __init__(
+        self,
+        rpc_urls_by_network: dict[str, list[str]] | None = None,
+        *,
+        timeout: float | None = None,
+        hedge_delay: float | None = None,
+        failure_threshold: int | None = None,
+        reset_timeout: float | None = None,
+        balance_cache_ttl: float | None = None,
+        contract_cache_ttl: float | None = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            rpc_urls_by_network: RPC URLs to use per network, in order of preference
+            timeout: Seconds before a call to one RPC URL is abandoned
+            hedge_delay: Seconds to wait on an RPC URL before also trying the next
+            failure_threshold: Consecutive failures that open a URL's circuit
+            reset_timeout: Seconds an open circuit waits before a trial call
+            balance_cache_ttl: Seconds a token balance is reused
+            contract_cache_ttl: Seconds a contract deployment check is reused
+        """
+        settings = app_settings.x402
+        self.rpc_urls_by_network = (
+            settings.rpc_urls_by_network
+            if rpc_urls_by_network is None
+            else rpc_urls_by_network
+        )
+        self.timeout = settings.rpc_timeout_seconds if timeout is None else timeout
+        self.hedge_delay = (
+            settings.rpc_hedge_delay_seconds if hedge_delay is None else hedge_delay
+        )
+        self.failure_threshold = (
+            settings.rpc_circuit_failure_threshold
+            if failure_threshold is None
+            else failure_threshold
+        )
+        self.reset_timeout = (
+            settings.rpc_circuit_reset_seconds
+            if reset_timeout is None
+            else reset_timeout
+        )
+        self.balance_cache_ttl = (
+            settings.balance_cache_ttl_seconds
+            if balance_cache_ttl is None
+            else balance_cache_ttl
+        )
+        self.contract_cache_ttl = (
+            settings.contract_cache_ttl_seconds
+            if contract_cache_ttl is None
+            else contract_cache_ttl
+        )
+
+        self._web3: dict[str, AsyncWeb3] = {}
+        self._breakers: dict[str, _CircuitBreaker] = {}
+        self._contract_cache: dict[tuple[str, str], tuple[float, bool]] = {}
+        self._balance_cache: dict[tuple[str, str, str], tuple[float, int]] = {}
+
+    async def has_contract(self, network: str, address: str) -> bool:
+        """Return whether a contract is deployed at a checksummed address."""
+        key = (network, address)
+        deployed = _cache_get(self._contract_cache, key)
+        if deployed is None:
+            code = await self._call(network, lambda w3: w3.eth.get_code(address))
+            deployed = bytes(code) not in (b"", b"\x00")
+            _cache_put(self._contract_cache, key, deployed, self.contract_cache_ttl)
+        return deployed
+
+    async def token_balance(self, network: str, token: str, owner: str) -> int:
+        """Return the ERC-20 balance of ``owner``, both addresses checksummed."""
+        key = (network, token, owner)
+        balance = _cache_get(self._balance_cache, key)
+        if balance is None:
+
+            def balance_of(w3: AsyncWeb3) -> Awaitable[int]:
+                contract = w3.eth.contract(address=token, abi=ERC20_BALANCE_OF_ABI)
+                return contract.functions.balanceOf(owner).call()
+
+            balance = await self._call(network, balance_of)
+            _cache_put(self._balance_cache, key, balance, self.balance_cache_ttl)
+        return balance
+
+    async def close(self) -> None:
+        """Close the HTTP sessions of all RPC providers."""
+        for w3 in self._web3.values():
+            await w3.provider.disconnect()
+        self._web3.clear()
+
+    def _breaker(self, rpc_url: str) -> _CircuitBreaker:
+        breaker = self._breakers.get(rpc_url)
+        if breaker is None:
+            breaker = _CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            self._breakers[rpc_url] = breaker
+        return breaker
+
+    def _get_web3(self, rpc_url: str) -> AsyncWeb3:
+        w3 = self._web3.get(rpc_url)
+        if w3 is None:
+            # Failover replaces web3's own retries, which would hold a slow
+            # node for several attempts before the next URL is tried. web3
+            # validates every eth_call against the node's chain id, so that
+            # answer (fixed for a URL) is cached instead of fetched per call.
+            w3 = AsyncWeb3(
+                AsyncHTTPProvider(
+                    rpc_url,
+                    request_kwargs={"timeout": ClientTimeout(total=self.timeout)},
+                    exception_retry_configuration=None,
+                    cache_allowed_requests=True,
+                    cacheable_requests={RPCEndpoint("eth_chainId")},
+                )
+            )
+            self._web3[rpc_url] = w3
+        return w3
+
+    async def _call(
+        self, network: str, operation: Callable[[AsyncWeb3], Awaitable[T]]
+    ) -> T:
+        """Run ``operation`` against the network's RPC URLs, first answer wins.
+
+        Raises:
+            ChainRpcError: If no RPC URL answered
+        """
+        rpc_urls = self.rpc_urls_by_network.get(network)
+        if not rpc_urls:
+            raise ChainRpcError(f"No RPC URLs configured for network: {network}")
+
+        candidates = iter(rpc_urls)
+        pending: dict[asyncio.Task[T], str] = {}
+        errors: list[str] = []
+
+        def launch_next() -> None:
+            for rpc_url in candidates:
+                if self._breaker(rpc_url).allow():
+                    task = asyncio.create_task(self._call_url(rpc_url, operation))
+                    pending[task] = rpc_url
+                    return
+
+        launch_next()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=self.hedge_delay,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    # Slow node: race the next one against it
+                    launch_next()
+                    continue
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                for task in done:
+                    errors.append(f"{pending.pop(task)}: {task.exception()}")
+                    launch_next()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if not errors:
+            raise ChainRpcError(
+                f"All {network} RPC providers are unavailable (circuit open)"
+            )
+        raise ChainRpcError(
+            f"Failed to reach any {network} RPC provider. Last error: {errors[-1]}"
+        )
+
+    async def _call_url(
+        self, rpc_url: str, operation: Callable[[AsyncWeb3], Awaitable[T]]
+    ) -> T:
+        breaker = self._breaker(rpc_url)
+        try:
+            result = await asyncio.wait_for(
+                operation(self._get_web3(rpc_url)), self.timeout
+            )
+        except Exception as e:
+            breaker.record_failure()
+            if breaker.is_open:
+                logger.warning(f"Circuit opened for RPC provider {rpc_url}: {e}")
+            else:
+                logger.debug(f"RPC call to {rpc_url} failed: {e}")
+            raise
+        breaker.record_success()
+        return result
+
+
+def _cache_get(cache: dict[Any, tuple[float, T]], key: Any) -> T | None:
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at <= time.monotonic():
+        del cache[key]
+        return None
+    return value
+
+
+def _cache_put(
+    cache: dict[Any, tuple[float, T]], key: Any, value: T, ttl: float
+) -> None:
+    if ttl <= 0:
+        return
+    now = time.monotonic()
+    if len(cache) >= MAX_CACHE_ENTRIES:
+        for stale in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+            del cache[stale]
+        while len(cache) >= MAX_CACHE_ENTRIES:
+            # Entries are in insertion order, so this drops the oldest
+            del cache[next(iter(cache))]
+    cache.pop(key, None)
+    cache[key] = (now + ttl, value)
@@ -13,14 +13,20 @@ Manages payment sessions where users can:
 1. Start a payment session
 2. Complete payment in browser
 3. Retrieve payment token without consuming it
+
+Clients waiting for a payment are woken as soon as the session is completed
+or failed, instead of polling it.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import heapq
+import json
 import secrets
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Optional
 from dataclasses import dataclass, field
 
 from x402.types import PaymentPayload
@@ -51,9 +57,53 @@ class PaymentSession:
         """Check if payment is completed."""
         return self.status == "completed" and self.payment_payload is not None
 
+    def to_json(self) -> str:
+        """Serialize the session for a shared session store."""
+        return json.dumps(
+            {
+                "session_id": self.session_id,
+                "created_at": self.created_at.isoformat(),
+                "expires_at": self.expires_at.isoformat(),
+                "payment_payload": (
+                    self.payment_payload.model_dump(by_alias=True)
+                    if self.payment_payload is not None
+                    else None
+                ),
+                "status": self.status,
+                "error": self.error,
+            },
+            default=str,
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> PaymentSession:
+        """Deserialize a session written by to_json()."""
+        raw: dict[str, Any] = json.loads(data)
+        payload = raw.get("payment_payload")
+        return cls(
+            session_id=raw["session_id"],
+            created_at=datetime.fromisoformat(raw["created_at"]),
+            expires_at=datetime.fromisoformat(raw["expires_at"]),
+            payment_payload=(
+                PaymentPayload.model_validate(payload) if payload is not None else None
+            ),
+            status=raw["status"],
+            error=raw.get("error"),
+        )
+
 
 class PaymentSessionManager:
-    """Manages payment sessions for x402 payment flow."""
+    """Manages payment sessions for x402 payment flow.
+
+    Sessions live in process memory. Waiting clients are woken through an
+    asyncio.Event when their session is completed or failed, and a background
+    task removes expired sessions in expiry order from a heap, sleeping until
+    the next one is due.
+    """
+
+    # Seconds between re-reads of a session while waiting on it, to recover
+    # from a missed wakeup; None to rely on wakeups alone
+    resync_interval: Optional[float] = None
 
     def __init__(self, session_timeout_minutes: int = 15):
         """Initialize payment session manager.
@@ -63,15 +113,18 @@ class PaymentSessionManager:
         """
         self._sessions: dict[str, PaymentSession] = {}
         self._session_timeout = timedelta(minutes=session_timeout_minutes)
+        self._waiters: dict[str, set[asyncio.Event]] = {}
+        self._expiry_heap: list[tuple[datetime, str]] = []
+        self._expiry_wakeup = asyncio.Event()
         self._cleanup_task: Optional[asyncio.Task] = None
 
-    async def start_cleanup_task(self) -> None:
+    async def start(self) -> None:
         """Start background task to cleanup expired sessions."""
         if self._cleanup_task is None or self._cleanup_task.done():
             self._cleanup_task = asyncio.create_task(self._cleanup_expired_sessions())
             logger.info("Payment session cleanup task started")
 
-    async def stop_cleanup_task(self) -> None:
+    async def stop(self) -> None:
         """Stop background cleanup task."""
         if self._cleanup_task and not self._cleanup_task.done():
             self._cleanup_task.cancel()
@@ -82,40 +135,79 @@ class PaymentSessionManager:
             logger.info("Payment session cleanup task stopped")
 
     async def _cleanup_expired_sessions(self) -> None:
-        """Background task to cleanup expired sessions every minute."""
+        """Background task removing sessions as they expire."""
         while True:
             try:
-                await asyncio.sleep(60)  # Run every minute
-                expired_sessions = [
-                    session_id
-                    for session_id, session in self._sessions.items()
-                    if session.is_expired()
-                ]
-
-                for session_id in expired_sessions:
-                    session = self._sessions.pop(session_id, None)
-                    if session:
+                now = datetime.now(timezone.utc)
+                while self._expiry_heap and self._expiry_heap[0][0] < now:
+                    _, session_id = heapq.heappop(self._expiry_heap)
+                    session = self._sessions.get(session_id)
+                    # Entries of deleted sessions are skipped
+                    if session is not None and session.is_expired():
+                        self._drop_session(session_id)
                         logger.info(f"Cleaned up expired session: {session_id}")
 
+                # Sleep until the next expiry, or until an earlier one is added
+                self._expiry_wakeup.clear()
+                timeout = (
+                    (self._expiry_heap[0][0] - now).total_seconds()
+                    if self._expiry_heap
+                    else None
+                )
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._expiry_wakeup.wait(), timeout)
+
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in cleanup task: {e}", exc_info=True)
 
-    def create_session(self) -> PaymentSession:
+    def _new_session(self) -> PaymentSession:
+        now = datetime.now(timezone.utc)
+        return PaymentSession(
+            session_id=secrets.token_urlsafe(32),
+            created_at=now,
+            expires_at=now + self._session_timeout,
+        )
+
+    async def _insert_session(self, session: PaymentSession) -> None:
+        """Store a newly created session."""
+        self._sessions[session.session_id] = session
+        heapq.heappush(self._expiry_heap, (session.expires_at, session.session_id))
+        if self._expiry_heap[0][1] == session.session_id:
+            self._expiry_wakeup.set()
+
+    async def _save_session(self, session: PaymentSession) -> bool:
+        """Persist changes to a session, False if it no longer exists."""
+        # In memory the session object itself is the stored state
+        return session.session_id in self._sessions
+
+    def _drop_session(self, session_id: str) -> Optional[PaymentSession]:
+        session = self._sessions.pop(session_id, None)
+        self._wake_waiters(session_id)
+        return session
+
+    async def _notify_settled(self, session_id: str) -> None:
+        """Wake clients waiting for the session to complete or fail."""
+        self._wake_waiters(session_id)
+
+    def _wake_waiters(self, session_id: str) -> None:
+        for waiter in self._waiters.pop(session_id, ()):
+            waiter.set()
+
+    async def create_session(self) -> PaymentSession:
         """Create a new payment session.
 
         Returns:
             PaymentSession: New payment session
         """
-        session_id = secrets.token_urlsafe(32)
-        session = PaymentSession(session_id=session_id)
-        self._sessions[session_id] = session
+        session = self._new_session()
+        await self._insert_session(session)
 
-        logger.info(f"Created payment session: {session_id}")
+        logger.info(f"Created payment session: {session.session_id}")
         return session
 
-    def get_session(self, session_id: str) -> Optional[PaymentSession]:
+    async def get_session(self, session_id: str) -> Optional[PaymentSession]:
         """Get payment session by ID.
 
         Args:
@@ -132,13 +224,13 @@ class PaymentSessionManager:
         if session.is_expired():
             # Mark as expired and remove
             session.status = "expired"
-            self._sessions.pop(session_id, None)
+            self._drop_session(session_id)
             logger.info(f"Session expired: {session_id}")
             return None
 
         return session
 
-    def complete_session(
+    async def complete_session(
         self, session_id: str, payment_payload: PaymentPayload
     ) -> bool:
         """Mark session as completed with payment payload.
@@ -150,7 +242,7 @@ class PaymentSessionManager:
         Returns:
             True if session was completed successfully, False otherwise
         """
-        session = self.get_session(session_id)
+        session = await self.get_session(session_id)
 
         if session is None:
             logger.warning(
@@ -160,11 +252,15 @@ class PaymentSessionManager:
 
         session.payment_payload = payment_payload
         session.status = "completed"
+        if not await self._save_session(session):
+            logger.warning(f"Cannot complete session: removed meanwhile: {session_id}")
+            return False
+        await self._notify_settled(session_id)
 
         logger.info(f"Payment session completed: {session_id}")
         return True
 
-    def fail_session(self, session_id: str, error: str) -> bool:
+    async def fail_session(self, session_id: str, error: str) -> bool:
         """Mark session as failed.
 
         Args:
@@ -174,7 +270,7 @@ class PaymentSessionManager:
         Returns:
             True if session was marked as failed, False if not found
         """
-        session = self.get_session(session_id)
+        session = await self.get_session(session_id)
 
         if session is None:
             logger.warning(f"Cannot fail session: not found or expired: {session_id}")
@@ -182,6 +278,10 @@ class PaymentSessionManager:
 
         session.status = "failed"
         session.error = error
+        if not await self._save_session(session):
+            logger.warning(f"Cannot fail session: removed meanwhile: {session_id}")
+            return False
+        await self._notify_settled(session_id)
 
         logger.warning(f"Payment session failed: {session_id} - {error}")
         return True
@@ -189,42 +289,64 @@ class PaymentSessionManager:
     async def wait_for_completion(
         self, session_id: str, timeout_seconds: int = 300
     ) -> Optional[PaymentSession]:
-        """Wait for session to complete (polling).
+        """Wait for session to complete or fail.
+
+        Returns as soon as the session is settled; the wait is also bounded by
+        the session's own expiry.
 
         Args:
             session_id: Session ID
             timeout_seconds: Maximum time to wait in seconds (default: 300)
 
         Returns:
-            PaymentSession if completed, None if timeout or error
+            PaymentSession if completed or failed, None if timeout or error
         """
-        start_time = datetime.now(timezone.utc)
-        timeout = timedelta(seconds=timeout_seconds)
-
-        while datetime.now(timezone.utc) - start_time < timeout:
-            session = self.get_session(session_id)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+        waiter = asyncio.Event()
+        try:
+            while True:
+                # Register before reading the session so a settlement in
+                # between is not missed
+                waiter.clear()
+                self._waiters.setdefault(session_id, set()).add(waiter)
+                session = await self.get_session(session_id)
+                if session is None or session.status != "pending":
+                    break
+
+                remaining = (
+                    session.expires_at - datetime.now(timezone.utc)
+                ).total_seconds()
+                timeout = min(deadline - loop.time(), remaining)
+                if timeout <= 0:
+                    break
+                if self.resync_interval is not None:
+                    timeout = min(timeout, self.resync_interval)
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(waiter.wait(), timeout)
+        finally:
+            waiters = self._waiters.get(session_id)
+            if waiters is not None:
+                waiters.discard(waiter)
+                if not waiters:
+                    del self._waiters[session_id]
 
-            if session is None:
-                logger.warning(
-                    f"Session not found or expired during wait: {session_id}"
-                )
-                return None
-
-            if session.is_completed():
-                logger.info(f"Session completed during wait: {session_id}")
-                return session
+        if session is None:
+            logger.warning(f"Session not found or expired during wait: {session_id}")
+            return None
 
-            if session.status == "failed":
-                logger.warning(f"Session failed during wait: {session_id}")
-                return session
+        if session.is_completed():
+            logger.info(f"Session completed during wait: {session_id}")
+            return session
 
-            # Poll every second
-            await asyncio.sleep(1)
+        if session.status == "failed":
+            logger.warning(f"Session failed during wait: {session_id}")
+            return session
 
         logger.warning(f"Timeout waiting for session: {session_id}")
         return None
 
-    def delete_session(self, session_id: str) -> bool:
+    async def delete_session(self, session_id: str) -> bool:
         """Delete a session.
 
         Args:
@@ -233,7 +355,7 @@ class PaymentSessionManager:
         Returns:
             True if session was deleted, False if not found
         """
-        session = self._sessions.pop(session_id, None)
+        session = self._drop_session(session_id)
         if session:
             logger.info(f"Deleted payment session: {session_id}")
             return True
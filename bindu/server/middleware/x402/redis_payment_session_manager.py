@@ -0,0 +1,169 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Redis-backed payment sessions for multi-replica deployments."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import Any, Optional
+
+import redis.asyncio as redis
+
+from bindu.utils.logging import get_logger
+
+from .payment_session_manager import PaymentSession, PaymentSessionManager
+
+logger = get_logger("bindu.server.middleware.x402.redis_payment_session")
+
+# Constants
+REDIS_ERROR_BACKOFF_SECONDS = 1
+LISTEN_TIMEOUT_SECONDS = 1.0
+
+
+class RedisPaymentSessionManager(PaymentSessionManager):
+    """Payment sessions shared by every replica through Redis.
+
+    Each session is a JSON value under ``<key_prefix>:<session_id>`` that
+    Redis expires itself, so the browser capturing a payment and the client
+    waiting for it may hit different replicas. Completion and failure are
+    published on ``<key_prefix>:settled:<session_id>``; each process keeps a
+    single pattern subscription and wakes its local waiters from it. Pub/sub
+    is fire-and-forget, so waiters also re-read their session every
+    ``resync_interval`` seconds in case a wakeup was lost during a reconnect.
+    """
+
+    resync_interval = 10.0
+
+    def __init__(
+        self,
+        redis_url: str,
+        key_prefix: str = "bindu:payment-session",
+        session_timeout_minutes: int = 15,
+    ):
+        """Initialize the Redis payment session manager.
+
+        Args:
+            redis_url: Redis connection URL
+            key_prefix: Prefix of session keys and settlement channels
+            session_timeout_minutes: Session timeout in minutes (default: 15)
+        """
+        super().__init__(session_timeout_minutes=session_timeout_minutes)
+        self.redis_url = redis_url
+        self.key_prefix = key_prefix
+        self._redis_client: redis.Redis | None = None
+        self._pubsub: Any = None
+        self._listener: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Connect to Redis and listen for settled sessions."""
+        self._redis_client = redis.from_url(
+            self.redis_url, encoding="utf-8", decode_responses=True
+        )
+        try:
+            await self._redis_client.ping()
+        except redis.RedisError as e:
+            logger.error(f"Failed to connect to Redis: {e}")
+            raise ConnectionError(
+                f"Unable to connect to Redis at {self.redis_url}: {e}"
+            )
+
+        self._pubsub = self._redis_client.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.psubscribe(self._channel("*"))
+        self._listener = asyncio.create_task(self._listen())
+        logger.info(f"Redis payment sessions listening on {self._channel('*')}")
+
+    async def stop(self) -> None:
+        """Stop the listener and close the Redis connection."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        if self._redis_client is not None:
+            await self._redis_client.aclose()
+            self._redis_client = None
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.key_prefix}:{session_id}"
+
+    def _channel(self, session_id: str) -> str:
+        return f"{self.key_prefix}:settled:{session_id}"
+
+    def _client(self) -> redis.Redis:
+        if self._redis_client is None:
+            raise RuntimeError("Redis payment session manager not started")
+        return self._redis_client
+
+    async def _insert_session(self, session: PaymentSession) -> None:
+        ttl = max(1, int(self._session_timeout.total_seconds() * 1000))
+        await self._client().set(
+            self._key(session.session_id), session.to_json(), px=ttl
+        )
+
+    async def _save_session(self, session: PaymentSession) -> bool:
+        # XX: never recreate a session that expired meanwhile
+        saved = await self._client().set(
+            self._key(session.session_id), session.to_json(), keepttl=True, xx=True
+        )
+        return bool(saved)
+
+    async def _notify_settled(self, session_id: str) -> None:
+        await self._client().publish(self._channel(session_id), session_id)
+
+    async def get_session(self, session_id: str) -> Optional[PaymentSession]:
+        """Get payment session by ID.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            PaymentSession if found and not expired, None otherwise
+        """
+        data = await self._client().get(self._key(session_id))
+        if data is None:
+            return None
+        return PaymentSession.from_json(data)
+
+    async def delete_session(self, session_id: str) -> bool:
+        """Delete a session.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            True if session was deleted, False if not found
+        """
+        deleted = await self._client().delete(self._key(session_id))
+        # Waiters on any replica return instead of waiting for the timeout
+        await self._notify_settled(session_id)
+        if deleted:
+            logger.info(f"Deleted payment session: {session_id}")
+            return True
+        return False
+
+    async def _listen(self) -> None:
+        """Wake local waiters of sessions settled on any replica."""
+        while True:
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=LISTEN_TIMEOUT_SECONDS
+                )
+            except redis.RedisError as e:
+                logger.error(f"Redis payment session listener error: {e}")
+                await asyncio.sleep(REDIS_ERROR_BACKOFF_SECONDS)
+                continue
+
+            if message is None or message.get("type") != "pmessage":
+                continue
+            self._wake_waiters(message["data"])
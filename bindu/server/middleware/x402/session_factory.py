@@ -0,0 +1,87 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Payment session manager factory.
+
+The backend follows the scheduler by default: with the Redis scheduler the
+agent may run as several replicas behind a load balancer, so sessions are
+shared through Redis; otherwise they stay in-process.
+"""
+
+from __future__ import annotations as _annotations
+
+from bindu.common.models import SchedulerConfig
+from bindu.utils.logging import get_logger
+
+from .payment_session_manager import PaymentSessionManager
+
+# Import RedisPaymentSessionManager conditionally
+try:
+    from .redis_payment_session_manager import RedisPaymentSessionManager
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    RedisPaymentSessionManager = None  # type: ignore[assignment]  # redis not installed
+    REDIS_AVAILABLE = False
+
+logger = get_logger("bindu.server.middleware.x402.session_factory")
+
+
+def create_payment_session_manager(
+    scheduler_config: SchedulerConfig | None = None,
+) -> PaymentSessionManager:
+    """Create the payment session manager based on settings.
+
+    Args:
+        scheduler_config: Scheduler config passed to the application, used to
+            resolve the "auto" backend and the Redis URL
+
+    Raises:
+        ValueError: If the Redis backend is requested but unavailable
+    """
+    from bindu.settings import app_settings
+
+    scheduler_backend = (
+        scheduler_config.type.lower()
+        if scheduler_config is not None
+        else app_settings.scheduler.backend
+    )
+    redis_url = (
+        scheduler_config.redis_url
+        if scheduler_config is not None and scheduler_config.redis_url
+        else app_settings.scheduler.redis_url
+    )
+
+    backend = app_settings.x402.session_backend
+    if backend == "auto":
+        backend = "redis" if scheduler_backend == "redis" else "memory"
+
+    if backend == "memory":
+        logger.info("Using in-memory payment sessions (single-process)")
+        return PaymentSessionManager()
+
+    if backend == "redis":
+        if not REDIS_AVAILABLE or RedisPaymentSessionManager is None:
+            raise ValueError(
+                "Redis payment sessions require redis package. "
+                "Install with: pip install redis[hiredis]"
+            )
+        if not redis_url:
+            raise ValueError(
+                "Redis payment sessions require a Redis URL. "
+                "Please provide it via REDIS_URL environment variable or config."
+            )
+        logger.info("Using Redis payment sessions (shared across replicas)")
+        return RedisPaymentSessionManager(
+            redis_url=redis_url, key_prefix=app_settings.x402.session_key_prefix
+        )
+
+    raise ValueError(
+        f"Unknown payment session backend: {backend}. Supported backends: memory, redis"
+    )
@@ -10,7 +10,9 @@
 """X402 Payment Middleware for Bindu.
 
 This middleware implements the x402 payment protocol for HTTP requests,
-following the official Coinbase x402 specification.
+following the official Coinbase x402 specification. It is pure ASGI: the
+request body is read once to find the JSON-RPC method and replayed to the
+application, and responses (including SSE streams) pass through untouched.
 
 Based on: https://github.com/coinbase/x402/blob/main/python/x402/src/x402/fastapi/middleware.py
 """
@@ -20,9 +22,9 @@ from __future__ import annotations
 import json
 from web3 import Web3
 
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from x402.common import x402_VERSION, find_matching_payment_requirements
 from x402.encoding import safe_base64_decode
 from x402.facilitator import FacilitatorClient, FacilitatorConfig
@@ -38,29 +40,19 @@ from bindu.settings import app_settings
 
 from bindu.common.models import AgentManifest, VerifyResponse
 
+from .chain_rpc import ChainRpcClient, ChainRpcError
+
 logger = get_logger("bindu.server.middleware.x402")
 
 # Constants
 PROTECTED_PATH = "/"  # A2A protocol endpoint
 PROTECTED_METHOD = "POST"
-WEB3_RPC_TIMEOUT_SECONDS = 10
 SUPPORTED_X402_VERSION = 1
 SUPPORTED_PAYMENT_SCHEME = "exact"
 
-# ERC-20 balanceOf ABI
-ERC20_BALANCE_OF_ABI = [
-    {
-        "constant": True,
-        "inputs": [{"name": "_owner", "type": "address"}],
-        "name": "balanceOf",
-        "outputs": [{"name": "balance", "type": "uint256"}],
-        "type": "function",
-    }
-]
-
 
-class X402Middleware(BaseHTTPMiddleware):
-    """Middleware that enforces x402 payment protocol for agent execution.
+class X402Middleware:
+    """Middleware that enforces x402 payment protocol for agent execution (Pure ASGI).
 
     This middleware:
     1. Checks if the agent requires payment (has execution_cost configured)
@@ -76,7 +68,7 @@ class X402Middleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         manifest: AgentManifest,
         facilitator_config: FacilitatorConfig,
         x402_ext: X402AgentExtension | None,
@@ -91,7 +83,7 @@ class X402Middleware(BaseHTTPMiddleware):
             x402_ext: X402AgentExtension instance
             payment_requirements: Pre-configured payment requirements from application
         """
-        super().__init__(app)
+        self.app = app
         self.manifest = manifest
         self.x402_ext = x402_ext
         self.facilitator = FacilitatorClient(config=facilitator_config)
@@ -99,129 +91,87 @@ class X402Middleware(BaseHTTPMiddleware):
 
         self.protected_path = PROTECTED_PATH
 
-        # Web3 connection pool for performance optimization
-        self._web3_connections: dict[str, Web3] = {}
-
-    def _get_web3_connection(self, network: str) -> tuple[Web3 | None, str | None]:
-        """Get or create cached Web3 connection for network.
-
-        This method maintains a connection pool to avoid creating new Web3
-        instances for every payment validation request.
-
-        Args:
-            network: Network name (e.g., "base-sepolia", "base", "ethereum")
-
-        Returns:
-            Tuple of (Web3 instance or None, error message or None)
-        """
-        # Check if we have a cached connection
-        if network in self._web3_connections:
-            try:
-                # Verify connection is still alive
-                self._web3_connections[network].eth.chain_id
-                logger.debug(f"Using cached Web3 connection for {network}")
-                return self._web3_connections[network], None
-            except Exception as e:
-                logger.warning(
-                    f"Cached connection for {network} failed: {e}. Reconnecting..."
-                )
-                del self._web3_connections[network]
-
-        # Get RPC URLs for this network
-        rpc_urls = app_settings.x402.rpc_urls_by_network.get(network)
-        if not rpc_urls:
-            error_msg = f"No RPC URLs configured for network: {network}"
-            logger.warning(error_msg)
-            return None, error_msg
-
-        # Try each RPC URL until one succeeds
-        last_error = None
-        for rpc_url in rpc_urls:
-            try:
-                logger.debug(f"Creating new Web3 connection to {rpc_url}")
-                w3 = Web3(
-                    Web3.HTTPProvider(
-                        rpc_url, request_kwargs={"timeout": WEB3_RPC_TIMEOUT_SECONDS}
-                    )
-                )
-
-                # Test connection
-                chain_id = w3.eth.chain_id
-                logger.info(
-                    f"Successfully connected to {network} (chain_id={chain_id}) via {rpc_url}"
-                )
-
-                # Cache the connection
-                self._web3_connections[network] = w3
-                return w3, None
+        # Async RPC access with failover, circuit breakers and lookup caches
+        self._chain = ChainRpcClient()
 
-            except Exception as e:
-                last_error = str(e)
-                logger.warning(f"Failed to connect to {rpc_url}: {e}")
-                continue
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request and enforce payment if required."""
+        if scope["type"] == "lifespan":
+            await self.app(scope, self._close_on_shutdown(receive), send)
+            return
 
-        # All connections failed
-        error_msg = (
-            f"Failed to connect to any {network} RPC provider. Last error: {last_error}"
-        )
-        logger.error(error_msg)
-        return None, error_msg
-
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """Process request and enforce payment if required.
-
-        Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
-
-        Returns:
-            Response with payment enforcement or agent execution result
-        """
         if (
-            not self.x402_ext
-            or request.url.path != self.protected_path
-            or request.method != PROTECTED_METHOD
+            scope["type"] != "http"
+            or not self.x402_ext
+            or scope["path"] != self.protected_path
+            or scope["method"] != PROTECTED_METHOD
         ):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
+        body = await request.body()
+        receive = _replay_body(body, receive)
 
         # Check if the JSON-RPC method requires payment
         # Only methods in app_settings.x402.protected_methods require payment
         try:
-            body = await request.body()
             request_data = json.loads(body.decode("utf-8"))
             method = request_data.get("method", "")
+        except Exception as e:
+            logger.warning(f"Error parsing request body: {e}")
+            await self.app(scope, receive, send)
+            return
 
-            # Recreate request with consumed body
-            from starlette.requests import Request as StarletteRequest
+        # Check if method requires payment (configured in settings)
+        if method not in app_settings.x402.protected_methods:
+            logger.debug(
+                f"Method '{method}' does not require payment, allowing request"
+            )
+            await self.app(scope, receive, send)
+            return
 
-            async def receive():
-                return {"type": "http.request", "body": body}
+        logger.debug(f"Method '{method}' requires payment, checking X-PAYMENT header")
 
-            request = StarletteRequest(request.scope, receive)
+        client_host = request.client.host if request.client else "unknown"
+        payment_state = await self._verify_payment(request, client_host)
+        if isinstance(payment_state, JSONResponse):
+            await payment_state(scope, receive, send)
+            return
 
-            # Check if method requires payment (configured in settings)
-            if method not in app_settings.x402.protected_methods:
-                logger.debug(
-                    f"Method '{method}' does not require payment, allowing request"
-                )
-                return await call_next(request)
+        logger.info(f"Payment verified for {scope['path']} from {client_host}")
 
-            logger.debug(
-                f"Method '{method}' requires payment, checking X-PAYMENT header"
-            )
+        # Attach payment details to request state for later use by the worker
+        scope.setdefault("state", {}).update(payment_state)
 
-        except Exception as e:
-            logger.warning(f"Error parsing request body: {e}")
-            return await call_next(request)
+        # Process the request (execute agent)
+        # Payment settlement will be handled by ManifestWorker when task completes
+        await self.app(scope, receive, send)
+
+    def _close_on_shutdown(self, receive: Receive) -> Receive:
+        """Wrap lifespan receive to close RPC sessions on server shutdown."""
+
+        async def receive_closing() -> Message:
+            message = await receive()
+            if message["type"] == "lifespan.shutdown":
+                await self._chain.close()
+            return message
+
+        return receive_closing
 
-        # Check for X-PAYMENT header
+    async def _verify_payment(
+        self, request: Request, client_host: str
+    ) -> dict[str, object] | JSONResponse:
+        """Verify the X-PAYMENT header.
+
+        Returns:
+            Request state entries for a valid payment, or the 402 response
+        """
         payment_header = request.headers.get("X-PAYMENT", "")
 
         if not payment_header:
             # No payment provided - return 402 Payment Required
-            logger.info(
-                f"Payment required for {request.url.path} from {request.client.host if request.client else 'unknown'}"
-            )
+            logger.info(f"Payment required for {request.url.path} from {client_host}")
             return self._create_402_response("X-PAYMENT header required")
 
         # Decode and parse payment payload
@@ -229,9 +179,7 @@ class X402Middleware(BaseHTTPMiddleware):
             payment_dict = json.loads(safe_base64_decode(payment_header))
             payment_payload = PaymentPayload.model_validate(payment_dict)
         except Exception as e:
-            logger.warning(
-                f"Invalid X-PAYMENT header from {request.client.host if request.client else 'unknown'}: {e}"
-            )
+            logger.warning(f"Invalid X-PAYMENT header from {client_host}: {e}")
             return self._create_402_response(
                 f"Invalid X-PAYMENT header format: {str(e)}"
             )
@@ -256,28 +204,17 @@ class X402Middleware(BaseHTTPMiddleware):
 
         if not is_valid:
             logger.warning(
-                f"Payment verification failed from {request.client.host if request.client else 'unknown'}: {error_reason}"
+                f"Payment verification failed from {client_host}: {error_reason}"
             )
             logger.warning(f"Payment payload: {payment_payload}")
             logger.warning(f"Payment requirements: {selected_payment_requirements}")
             return self._create_402_response(f"Invalid payment: {error_reason}")
 
-        logger.info(
-            f"Payment verified for {request.url.path} from {request.client.host if request.client else 'unknown'}"
-        )
-
-        # Attach payment details to request for later use by the worker
-        request.state.payment_payload = payment_payload
-        request.state.payment_requirements = selected_payment_requirements
-        request.state.verify_response = VerifyResponse(
-            is_valid=True, invalid_reason=None
-        )
-
-        # Process the request (execute agent)
-        # Payment settlement will be handled by ManifestWorker when task completes
-        response = await call_next(request)
-
-        return response
+        return {
+            "payment_payload": payment_payload,
+            "payment_requirements": selected_payment_requirements,
+            "verify_response": VerifyResponse(is_valid=True, invalid_reason=None),
+        }
 
     async def _validate_payment_manually(
         self, payment_payload: PaymentPayload, payment_requirements: PaymentRequirements
@@ -329,40 +266,23 @@ class X402Middleware(BaseHTTPMiddleware):
                     f"Network mismatch: {payment_payload.network} != {payment_requirements.network}",
                 )
 
-            # 5. Get RPC URL for network
-            w3, connection_error = self._get_web3_connection(payment_payload.network)
-
-            if w3 is None:
-                return False, f"Cannot connect to {payment_payload.network} network"
-
-            # 6. Check balance on-chain (optional - skip if token contract unavailable)
+            # 5. Check balance on-chain (skipped if no token contract is deployed)
+            network = payment_payload.network
             try:
-                # Get token contract address
                 token_address = Web3.to_checksum_address(payment_requirements.asset)
-                logger.info(
-                    f"Checking token contract: {token_address} on {payment_payload.network}"
-                )
+                payer_address = Web3.to_checksum_address(auth.from_)
+                logger.info(f"Checking token contract: {token_address} on {network}")
 
-                # Check if contract is deployed at this address
-                code = w3.eth.get_code(token_address)
-                if code == b"" or code == b"\x00" or code.hex() == "0x":
+                if not await self._chain.has_contract(network, token_address):
                     logger.warning(
-                        f"No contract found at {token_address} on {payment_payload.network}. "
+                        f"No contract found at {token_address} on {network}. "
                         f"This may be an incorrect token address. Skipping balance check."
                     )
                 else:
-                    logger.info(
-                        f"Contract found at {token_address}, bytecode length: {len(code)} bytes"
-                    )
-
-                    token_contract = w3.eth.contract(
-                        address=token_address, abi=ERC20_BALANCE_OF_ABI
+                    balance = await self._chain.token_balance(
+                        network, token_address, payer_address
                     )
 
-                    # Check payer balance
-                    payer_address = Web3.to_checksum_address(auth.from_)
-                    balance = token_contract.functions.balanceOf(payer_address).call()
-
                     if balance < payment_value:
                         return (
                             False,
@@ -370,10 +290,14 @@ class X402Middleware(BaseHTTPMiddleware):
                         )
 
                     logger.info(
-                        f"Payment validation passed: network={payment_payload.network}, "
+                        f"Payment validation passed: network={network}, "
                         f"token={token_address}, amount={payment_value}, balance={balance}, payer={payer_address}"
                     )
 
+            except ChainRpcError as rpc_error:
+                logger.error(f"On-chain payment check failed: {rpc_error}")
+                return False, f"Cannot connect to {network} network"
+
             except Exception as balance_error:
                 # Balance check failed — reject payment rather than silently allowing
                 # an unverified charge. This prevents funds from being charged when the
@@ -425,3 +349,21 @@ class X402Middleware(BaseHTTPMiddleware):
             status_code=402,
             headers={"Content-Type": "application/json"},
         )
+
+
+def _replay_body(body: bytes, receive: Receive) -> Receive:
+    """Return a receive callable that yields the already-read body first.
+
+    Later calls go to the original receive, so the application still sees
+    http.disconnect (e.g. to stop an SSE stream).
+    """
+    replayed = False
+
+    async def replay() -> Message:
+        nonlocal replayed
+        if replayed:
+            return await receive()
+        replayed = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return replay
@@ -17,10 +17,13 @@ performance characteristics, and pricing constraints.
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from bindu.settings import app_settings
 from bindu.utils.logging import get_logger
 
@@ -45,6 +48,64 @@ LOW_MATCH_BOOST = 0.1
 CONSTRAINT_BOOST = 0.1
 
 
+class _SubstringMatcher:
+    """Find which of many substrings occur in a text with one regex scan.
+
+    Every pattern has owners (skill or specialization indices). The patterns
+    are compiled into a trie-shaped regex inside a lookahead, so the scan
+    visits each text position once and captures the longest pattern starting
+    there; that match also stands for every pattern that is a prefix of it.
+    """
+
+    def __init__(self, patterns: list[tuple[str, int]]) -> None:
+        owners: dict[str, set[int]] = {}
+        for pattern, owner in patterns:
+            owners.setdefault(pattern, set()).add(owner)
+        # The empty pattern occurs in every text
+        self._always = owners.pop("", set())
+        self._owners = {
+            pattern: set().union(
+                *(
+                    owners[pattern[:end]]
+                    for end in range(1, len(pattern) + 1)
+                    if pattern[:end] in owners
+                )
+            )
+            for pattern in owners
+        }
+        self._regex = (
+            re.compile(f"(?=({_trie_pattern(owners)}))", re.DOTALL) if owners else None
+        )
+
+    def owners_in(self, text: str) -> set[int]:
+        """Return the owners of all patterns occurring in ``text``."""
+        found = set(self._always)
+        if self._regex is not None:
+            for match in self._regex.finditer(text):
+                found |= self._owners[match.group(1)]
+        return found
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex matching any of ``words``, longest alternative first."""
+    trie: dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(node[char]) for char in node if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # Optional (greedy) when a word also ends here
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
 @dataclass(frozen=True)
 class ScoringWeights:
     """Configurable weights for scoring components.
@@ -151,10 +212,12 @@ class CapabilityCalculator:
         self._embedding_api_key = embedding_api_key
         self._embedder = None
         self._skill_embeddings = None
+        self._embedding_matrix: np.ndarray | None = None
         self._use_embeddings = app_settings.negotiation.use_embeddings
 
         # Pre-compute skill metadata for faster matching
         self._skill_metadata = self._precompute_skill_metadata()
+        self._build_match_indexes()
 
     async def calculate(
         self,
@@ -414,6 +477,77 @@ class CapabilityCalculator:
 
         return metadata
 
+    def _build_match_indexes(self) -> None:
+        """Index skill metadata so a task is matched against all skills at once.
+
+        - ``_keyword_index``: keyword -> indices of the skills having it, with
+          ``_keyword_counts`` holding each skill's keyword count for Jaccard
+        - ``_tag_index`` / ``_cap_index``: keyword -> (skill index, position)
+          of the tags and capabilities that keyword matches
+        - ``_anti_patterns`` / ``_specializations``: substring matchers over
+          all skills, owned by skill index and specialization index
+        """
+        keyword_index: dict[str, list[int]] = {}
+        self._tag_index: dict[str, list[tuple[int, int]]] = {}
+        self._cap_index: dict[str, list[tuple[int, int]]] = {}
+        anti_patterns: list[tuple[str, int]] = []
+        domains: list[tuple[str, int]] = []
+        self._specialization_boosts: list[tuple[int, float]] = []
+
+        for index, meta in enumerate(self._skill_metadata):
+            keywords = meta["keywords"]
+            for keyword in keywords:
+                keyword_index.setdefault(keyword, []).append(index)
+
+            # A tag or capability matches through its words that are keywords
+            for position, tag in enumerate(meta["tags"]):
+                for word in set(tag.lower().split()) & keywords:
+                    self._tag_index.setdefault(word, []).append((index, position))
+            if isinstance(meta["caps_detail"], dict):
+                for position, cap in enumerate(meta["caps_detail"]):
+                    for word in set(cap.lower().split("_")) & keywords:
+                        self._cap_index.setdefault(word, []).append((index, position))
+
+            anti_patterns.extend(
+                (pattern.lower(), index) for pattern in meta["anti_patterns"] or []
+            )
+            for spec in meta["specializations"] or []:
+                if isinstance(spec, dict) and spec.get("domain"):
+                    domains.append(
+                        (spec["domain"].lower(), len(self._specialization_boosts))
+                    )
+                    self._specialization_boosts.append(
+                        (index, spec.get("confidence_boost", 0.0))
+                    )
+
+        self._keyword_index = {
+            keyword: np.array(indices, dtype=np.intp)
+            for keyword, indices in keyword_index.items()
+        }
+        self._keyword_counts = np.array(
+            [len(meta["keywords"]) for meta in self._skill_metadata], dtype=np.intp
+        )
+        self._anti_patterns = _SubstringMatcher(anti_patterns)
+        self._specializations = _SubstringMatcher(domains)
+
+    def _build_embedding_matrix(self) -> np.ndarray | None:
+        """Stack skill embeddings into one matrix of unit rows.
+
+        Rows follow ``_skill_metadata``; a skill without an embedding gets a
+        zero row, so its similarity is 0.
+        """
+        if not self._skill_embeddings:
+            return None
+        dimensions = len(next(iter(self._skill_embeddings.values()))["embedding"])
+        matrix = np.zeros((len(self._skill_metadata), dimensions), dtype=np.float32)
+        for index, meta in enumerate(self._skill_metadata):
+            entry = self._skill_embeddings.get(meta["skill_id"])
+            if entry is not None:
+                matrix[index] = entry["embedding"]
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
     async def _ensure_embeddings(self) -> None:
         """Lazy load embedder and compute skill embeddings on first use (async)."""
         if self._skill_embeddings is not None:
@@ -429,6 +563,7 @@ class CapabilityCalculator:
             self._skill_embeddings = await self._embedder.compute_skill_embeddings(
                 self._skills
             )
+            self._embedding_matrix = self._build_embedding_matrix()
         except ImportError:
             logger = get_logger("bindu.server.negotiation.capability_calculator")
             logger.warning(
@@ -451,14 +586,14 @@ class CapabilityCalculator:
         """Calculate skill match score using hybrid approach (async).
 
         Uses embeddings for semantic matching (if enabled) combined with
-        keyword matching and assessment field boosting.
+        keyword matching and assessment field boosting. Every skill is scored
+        at once: similarities come from one matrix-vector product and keyword
+        overlaps from the inverted indexes built at initialization.
         """
         if not task_keywords and not task_summary:
             return 0.5, [], [], []
 
-        skill_matches: list[SkillMatchResult] = []
-        all_matched_tags: set[str] = set()
-        all_matched_caps: set[str] = set()
+        skill_count = len(self._skill_metadata)
 
         # Try to use embeddings if enabled
         task_embedding = None
@@ -476,96 +611,100 @@ class CapabilityCalculator:
                     )
                     logger.warning(f"Failed to embed task: {e}")
 
-        for skill_meta in self._skill_metadata:
-            skill_id = skill_meta["skill_id"]
-            skill_name = skill_meta["skill_name"]
-            tags = skill_meta["tags"]
-            caps_detail = skill_meta["caps_detail"]
-            assessment = skill_meta["assessment"]
-            anti_patterns = skill_meta["anti_patterns"]
-            specializations = skill_meta["specializations"]
-            skill_keywords = skill_meta["keywords"]  # Pre-computed!
-
-            # Check anti-patterns first (early rejection)
-            if anti_patterns and task_summary:
-                task_lower = task_summary.lower()
-                if task_details:
-                    task_lower += " " + task_details.lower()
-                if any(pattern.lower() in task_lower for pattern in anti_patterns):
-                    continue
-
-            # Calculate embedding similarity if available
-            embedding_score = 0.0
-            if (
-                task_embedding is not None
-                and self._skill_embeddings
-                and skill_id in self._skill_embeddings
-            ):
-                from bindu.server.negotiation.embedder import cosine_similarity
-
-                skill_emb = self._skill_embeddings[skill_id]["embedding"]
-                embedding_score = cosine_similarity(task_embedding, skill_emb)
-
-            # Calculate Jaccard similarity
-            intersection = task_keywords.intersection(skill_keywords)
-            union = task_keywords.union(skill_keywords)
-            keyword_score = len(intersection) / len(union) if union else 0.0
-
-            # Hybrid score: combine embedding and keyword scores
-            if task_embedding is not None and embedding_score > 0:
-                emb_weight = app_settings.negotiation.embedding_weight
-                kw_weight = app_settings.negotiation.keyword_weight
-                base_score = (emb_weight * embedding_score) + (
-                    kw_weight * keyword_score
-                )
-            else:
-                base_score = keyword_score
+        # Cosine similarity with every skill
+        similarities = np.zeros(skill_count)
+        if task_embedding is not None and self._embedding_matrix is not None:
+            task_norm = np.linalg.norm(task_embedding)
+            if task_norm > 0:
+                similarities = (self._embedding_matrix @ task_embedding) / task_norm
+                similarities = similarities.astype(np.float64)
+
+        # Jaccard similarity: intersections counted through the keyword index
+        hits = [
+            self._keyword_index[keyword]
+            for keyword in task_keywords
+            if keyword in self._keyword_index
+        ]
+        intersections = (
+            np.bincount(np.concatenate(hits), minlength=skill_count)
+            if hits
+            else np.zeros(skill_count, dtype=np.intp)
+        )
+        unions = len(task_keywords) + self._keyword_counts - intersections
+        keyword_scores = np.divide(
+            intersections,
+            unions,
+            out=np.zeros(skill_count),
+            where=unions > 0,
+        )
 
-            # Apply specialization boosts from assessment
-            if isinstance(assessment, dict) and "specializations" in assessment:
-                specializations = assessment.get("specializations", [])
-                for spec in specializations:
-                    if isinstance(spec, dict):
-                        domain = spec.get("domain", "")
-                        boost = spec.get("confidence_boost", 0.0)
-                        if (
-                            domain
-                            and task_summary
-                            and domain.lower() in task_summary.lower()
-                        ):
-                            base_score = min(1.0, base_score + boost)
-
-            match_score = base_score
+        # Hybrid score: combine embedding and keyword scores
+        semantic = similarities > 0
+        scores = np.where(
+            semantic,
+            app_settings.negotiation.embedding_weight * similarities
+            + app_settings.negotiation.keyword_weight * keyword_scores,
+            keyword_scores,
+        )
+
+        rejected: set[int] = set()
+        if task_summary:
+            summary_lower = task_summary.lower()
+
+            # Apply specialization boosts from assessment, in declaration order
+            for entry in sorted(self._specializations.owners_in(summary_lower)):
+                index, boost = self._specialization_boosts[entry]
+                scores[index] = min(1.0, scores[index] + boost)
+
+            # Skills whose anti-patterns appear in the task are skipped
+            task_lower = summary_lower
+            if task_details:
+                task_lower += " " + task_details.lower()
+            rejected = self._anti_patterns.owners_in(task_lower)
+
+        matched_tag_positions = self._matched_positions(self._tag_index, task_keywords)
+        matched_cap_positions = self._matched_positions(self._cap_index, task_keywords)
+
+        skill_matches: list[SkillMatchResult] = []
+        all_matched_tags: set[str] = set()
+        all_matched_caps: set[str] = set()
+
+        for index in sorted(
+            set(np.flatnonzero(scores > 0).tolist())
+            | matched_tag_positions.keys()
+            | matched_cap_positions.keys()
+        ):
+            if index in rejected:
+                continue
+            skill_meta = self._skill_metadata[index]
 
             # Track reasons for match
             reasons: list[str] = []
-            if task_embedding is not None and embedding_score > 0:
-                reasons.append(f"semantic similarity: {embedding_score:.2f}")
-
-            matched_tags_for_skill = [
-                tag
-                for tag in tags
-                if any(t.lower() in intersection for t in tag.lower().split())
-            ]
-            if matched_tags_for_skill:
+            if semantic[index]:
+                reasons.append(f"semantic similarity: {similarities[index]:.2f}")
+
+            if index in matched_tag_positions:
+                tags = skill_meta["tags"]
+                matched_tags_for_skill = [
+                    tags[position] for position in sorted(matched_tag_positions[index])
+                ]
                 reasons.append(f"tags: {', '.join(matched_tags_for_skill)}")
                 all_matched_tags.update(matched_tags_for_skill)
 
-            matched_caps_for_skill = [
-                cap
-                for cap in caps_detail.keys()
-                if isinstance(caps_detail, dict)
-                if any(t in intersection for t in cap.lower().split("_"))
-            ]
-            if matched_caps_for_skill:
+            if index in matched_cap_positions:
+                caps = list(skill_meta["caps_detail"])
+                matched_caps_for_skill = [
+                    caps[position] for position in sorted(matched_cap_positions[index])
+                ]
                 reasons.append(f"capabilities: {', '.join(matched_caps_for_skill)}")
                 all_matched_caps.update(matched_caps_for_skill)
 
+            match_score = float(scores[index])
             if match_score > 0:
                 skill_matches.append(
                     SkillMatchResult(
-                        skill_id=skill_id,
-                        skill_name=skill_name,
+                        skill_id=skill_meta["skill_id"],
+                        skill_name=skill_meta["skill_name"],
                         score=round(match_score, 4),
                         reasons=reasons,
                     )
@@ -577,6 +716,17 @@ class CapabilityCalculator:
 
         return best_score, skill_matches, list(all_matched_tags), list(all_matched_caps)
 
+    @staticmethod
+    def _matched_positions(
+        index: dict[str, list[tuple[int, int]]], task_keywords: set[str]
+    ) -> dict[int, set[int]]:
+        """Map skill index to the positions of its tags/capabilities matched."""
+        positions: dict[int, set[int]] = {}
+        for keyword in task_keywords:
+            for skill_index, position in index.get(keyword, ()):
+                positions.setdefault(skill_index, set()).add(position)
+        return positions
+
     def _calculate_io_compatibility(
         self,
         input_mime_types: list[str] | None,
@@ -4,6 +4,7 @@ This package handles all notification-related functionality including
 push notifications for task lifecycle events.
 """
 
+from .delivery import WebhookDispatcher
 from .push_manager import PushNotificationManager
 
-__all__ = ["PushNotificationManager"]
+__all__ = ["PushNotificationManager", "WebhookDispatcher"]
@@ -0,0 +1,337 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Background webhook delivery for push notifications.
+
+Task execution hands events to the WebhookDispatcher and moves on. Each
+webhook endpoint gets a bounded queue drained by its own worker task, so a
+slow or failing subscriber only delays its own events:
+
+    submit() -> outbox row -> endpoint queue -> worker -> POST (with retry)
+                                                       -> outbox row removed
+
+Events stay in the storage outbox until they are delivered (or given up on).
+Each dispatcher holds a lease on the outbox events it is delivering and
+renews it while they are queued, so replicas sharing one outbox never
+deliver the same event. Leases of a dispatcher that dies run out, and
+start() plus a periodic rescan claim expired events page by page. An event
+dropped because its queue was full is left to its lease and claimed again
+by a later rescan.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+from uuid import UUID, uuid4
+
+from bindu.common.protocol.types import PushNotificationConfig
+from bindu.settings import app_settings
+
+from ...utils.logging import get_logger
+from ...utils.notifications import NotificationDeliveryError, NotificationService
+
+if TYPE_CHECKING:
+    from bindu.server.storage.base import Storage
+
+logger = get_logger("bindu.server.notifications.delivery")
+
+# (url, token): events for the same URL under different credentials are
+# separate subscriptions and must not be batched together.
+EndpointKey = tuple[str, str | None]
+
+
+@dataclass
+class _QueuedEvent:
+    config: PushNotificationConfig
+    event: dict[str, Any]
+    event_id: UUID | None
+
+
+@dataclass
+class _Endpoint:
+    queue: asyncio.Queue[_QueuedEvent]
+    worker: asyncio.Task[None] | None = None
+
+
+@dataclass
+class WebhookDispatcher:
+    """Deliver push notification events through per-endpoint queues.
+
+    Events for one endpoint are delivered in submission order. With
+    max_batch_size > 1, events already waiting in an endpoint's queue are
+    sent together as ``{"kind": "batch", "events": [...]}``.
+    """
+
+    notification_service: NotificationService
+    storage: Storage | None = None
+    queue_size: int = field(default_factory=lambda: app_settings.push.queue_size)
+    max_batch_size: int = field(
+        default_factory=lambda: app_settings.push.max_batch_size
+    )
+    max_attempts: int = field(default_factory=lambda: app_settings.push.max_attempts)
+    min_wait: float = field(default_factory=lambda: app_settings.push.min_wait)
+    max_wait: float = field(default_factory=lambda: app_settings.push.max_wait)
+    idle_timeout: float = field(
+        default_factory=lambda: app_settings.push.endpoint_idle_timeout
+    )
+    use_outbox: bool = field(default_factory=lambda: app_settings.push.outbox_enabled)
+    lease_seconds: float = field(
+        default_factory=lambda: app_settings.push.outbox_lease_seconds
+    )
+    rescan_interval: float = field(
+        default_factory=lambda: app_settings.push.outbox_rescan_interval
+    )
+    page_size: int = field(default_factory=lambda: app_settings.push.outbox_page_size)
+
+    # --- Metrics ---
+    total_dropped: int = 0
+
+    _endpoints: dict[EndpointKey, _Endpoint] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _running: bool = field(default=False, init=False, repr=False)
+    # Names this dispatcher's leases in the outbox
+    _owner: str = field(default_factory=lambda: uuid4().hex, init=False)
+    # Outbox events queued or being delivered here, whose leases we renew
+    _held: set[UUID] = field(default_factory=set, init=False, repr=False)
+    _rescanner: asyncio.Task[None] | None = field(default=None, init=False, repr=False)
+
+    @property
+    def running(self) -> bool:
+        """Whether the dispatcher accepts events."""
+        return self._running
+
+    async def start(self) -> None:
+        """Start accepting events and claim undelivered outbox events."""
+        self._running = True
+        if not self._outbox_enabled():
+            return
+
+        try:
+            await self._claim_pending()
+        except Exception as exc:
+            logger.error(f"Failed to claim undelivered webhook events: {exc}")
+        self._rescanner = asyncio.create_task(self._rescan_outbox())
+
+    async def stop(self) -> None:
+        """Stop the endpoint workers and release the outbox leases.
+
+        Queued events are not flushed; with the outbox enabled they are
+        left for the other replicas or the next start().
+        """
+        self._running = False
+        if self._rescanner is not None:
+            self._rescanner.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._rescanner
+            self._rescanner = None
+
+        endpoints, self._endpoints = self._endpoints, {}
+        workers = [ep.worker for ep in endpoints.values() if ep.worker is not None]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        held, self._held = list(self._held), set()
+        if held and self._outbox_enabled():
+            await self._release(held)
+
+    async def submit(
+        self, config: PushNotificationConfig, event: dict[str, Any], task_id: UUID
+    ) -> None:
+        """Queue an event for background delivery.
+
+        Returns once the event is recorded and queued; delivery happens on
+        the endpoint's worker.
+        """
+        event_id = None
+        if self._outbox_enabled():
+            try:
+                event_id = UUID(str(event["event_id"]))
+                await self.storage.save_webhook_event(  # type: ignore[union-attr]
+                    event_id,
+                    task_id,
+                    config,
+                    event,
+                    owner=self._owner,
+                    lease_seconds=self.lease_seconds,
+                )
+            except Exception as exc:
+                event_id = None
+                logger.error(
+                    f"Failed to record webhook event in outbox: {exc}",
+                    task_id=str(task_id),
+                )
+
+        self._enqueue(_QueuedEvent(config, event, event_id))
+
+    def get_metrics(self) -> dict[str, int]:
+        """Return queue metrics for observability."""
+        return {
+            "endpoints": len(self._endpoints),
+            "queued": sum(ep.queue.qsize() for ep in self._endpoints.values()),
+            "total_dropped": self.total_dropped,
+        }
+
+    def _outbox_enabled(self) -> bool:
+        return self.use_outbox and self.storage is not None
+
+    async def _claim_pending(self) -> None:
+        """Queue claimable outbox events until the outbox or a queue runs out."""
+        claimed = 0
+        while True:
+            rows = await self.storage.claim_webhook_events(  # type: ignore[union-attr]
+                self._owner, self.page_size, self.lease_seconds
+            )
+            for row in rows:
+                if row["event_id"] in self._held:
+                    continue
+                if not self._enqueue(
+                    _QueuedEvent(row["config"], row["event"], row["event_id"])
+                ):
+                    # The rest of the page is claimed again once its lease
+                    # runs out
+                    rows = []
+                    break
+                claimed += 1
+            if len(rows) < self.page_size:
+                break
+        if claimed:
+            logger.info(f"Queued {claimed} undelivered webhook events from the outbox")
+
+    async def _rescan_outbox(self) -> None:
+        """Renew held leases and claim expired events every rescan_interval."""
+        while True:
+            await asyncio.sleep(self.rescan_interval)
+            try:
+                await self.storage.renew_webhook_events(  # type: ignore[union-attr]
+                    self._owner, list(self._held), self.lease_seconds
+                )
+                await self._claim_pending()
+            except Exception as exc:
+                logger.warning(f"Failed to rescan the webhook outbox: {exc}")
+
+    def _enqueue(self, item: _QueuedEvent) -> bool:
+        """Queue an event on its endpoint; return False if it was dropped."""
+        key = (item.config["url"], item.config.get("token"))
+        endpoint = self._endpoints.get(key)
+        if endpoint is None:
+            endpoint = _Endpoint(asyncio.Queue(maxsize=self.queue_size))
+            self._endpoints[key] = endpoint
+
+        try:
+            endpoint.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.total_dropped += 1
+            logger.warning(
+                "Webhook queue full, dropping push notification",
+                url=key[0],
+                event_id=item.event.get("event_id"),
+                kept_in_outbox=item.event_id is not None,
+            )
+            if item.event_id is not None:
+                self._held.discard(item.event_id)
+            return False
+
+        if item.event_id is not None:
+            self._held.add(item.event_id)
+        if endpoint.worker is None or endpoint.worker.done():
+            endpoint.worker = asyncio.create_task(self._drain(key, endpoint))
+        return True
+
+    async def _drain(self, key: EndpointKey, endpoint: _Endpoint) -> None:
+        """Deliver an endpoint's events until it has been idle for idle_timeout."""
+        while True:
+            try:
+                async with asyncio.timeout(self.idle_timeout):
+                    item = await endpoint.queue.get()
+            except TimeoutError:
+                # No await between the check and the removal, so nothing can
+                # be enqueued onto a queue that is no longer registered.
+                if endpoint.queue.empty() and self._endpoints.get(key) is endpoint:
+                    del self._endpoints[key]
+                    return
+                continue
+
+            batch = [item]
+            while len(batch) < self.max_batch_size and not endpoint.queue.empty():
+                batch.append(endpoint.queue.get_nowait())
+
+            try:
+                await self._deliver(batch)
+            except Exception as exc:
+                logger.error(f"Unexpected error delivering push notification: {exc}")
+
+    async def _deliver(self, batch: list[_QueuedEvent]) -> None:
+        """Send one event or batch, retrying transient failures.
+
+        If sending fails unexpectedly, the events' leases are released so
+        the next rescan, here or on another replica, retries them.
+        """
+        event_ids = [item.event_id for item in batch if item.event_id is not None]
+        completed = False
+        try:
+            await self._send(batch)
+            completed = True
+        finally:
+            self._held.difference_update(event_ids)
+            if event_ids and self._outbox_enabled():
+                if completed:
+                    await self._remove_delivered(event_ids)
+                else:
+                    await self._release(event_ids)
+
+    async def _send(self, batch: list[_QueuedEvent]) -> None:
+        """POST the batch until it is delivered or given up on."""
+        config = batch[0].config
+        if len(batch) == 1:
+            payload = batch[0].event
+        else:
+            payload = {"kind": "batch", "events": [item.event for item in batch]}
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                await self.notification_service.deliver(config, payload)
+                return
+            except NotificationDeliveryError as exc:
+                if not exc.retryable or attempt >= self.max_attempts:
+                    logger.warning(
+                        "Giving up on push notification",
+                        url=config["url"],
+                        status=exc.status,
+                        attempts=attempt,
+                        events=len(batch),
+                    )
+                    return
+            except ValueError as exc:
+                # The webhook URL no longer passes validation (SSRF check)
+                logger.warning(
+                    f"Dropping push notification for invalid webhook: {exc}",
+                    url=config["url"],
+                )
+                return
+
+            await asyncio.sleep(min(self.max_wait, self.min_wait * 2 ** (attempt - 1)))
+
+    async def _remove_delivered(self, event_ids: list[UUID]) -> None:
+        try:
+            await self.storage.delete_webhook_events(event_ids)  # type: ignore[union-attr]
+        except Exception as exc:
+            logger.error(f"Failed to remove delivered webhook events: {exc}")
+
+    async def _release(self, event_ids: list[UUID]) -> None:
+        try:
+            await self.storage.renew_webhook_events(self._owner, event_ids, 0)  # type: ignore[union-attr]
+        except Exception as exc:
+            logger.warning(f"Failed to release webhook event leases: {exc}")
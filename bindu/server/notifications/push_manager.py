@@ -17,6 +17,7 @@ Supports:
 - Global webhook fallback (from AgentManifest)
 - Persistent webhook storage for long-running tasks
 - Artifact update notifications
+- Background delivery through per-endpoint queues (see delivery.py)
 """
 
 from __future__ import annotations
@@ -42,9 +43,11 @@ from bindu.common.protocol.types import (
     TaskNotFoundError,
     TaskPushNotificationConfig,
 )
+from bindu.settings import app_settings
 
 from ...utils.logging import get_logger
 from ...utils.notifications import NotificationDeliveryError, NotificationService
+from .delivery import WebhookDispatcher
 
 if TYPE_CHECKING:
     from bindu.server.storage.base import Storage
@@ -73,13 +76,20 @@ class PushNotificationManager:
     - Global webhook fallback from AgentManifest
     - Artifact update notifications
     - Lifecycle event notifications
+
+    Once initialized, events are handed to the WebhookDispatcher and
+    delivered in the background; before that they are sent inline.
     """
 
     manifest: Any | None = None
     storage: Storage | None = None
     notification_service: NotificationService = field(
-        default_factory=NotificationService
+        default_factory=lambda: NotificationService(
+            timeout=app_settings.push.timeout,
+            dns_cache_ttl=app_settings.push.dns_cache_ttl,
+        )
     )
+    dispatcher: WebhookDispatcher | None = None
     _push_notification_configs: dict[uuid.UUID, PushNotificationConfig] = field(
         default_factory=dict, init=False
     )
@@ -87,12 +97,31 @@ class PushNotificationManager:
         default_factory=dict, init=False
     )
 
+    def __post_init__(self) -> None:
+        """Create the dispatcher if none was supplied."""
+        if self.dispatcher is None:
+            self.dispatcher = WebhookDispatcher(
+                notification_service=self.notification_service, storage=self.storage
+            )
+
     async def initialize(self) -> None:
         """Initialize the push notification manager.
 
         Loads persisted webhook configurations from storage to restore
-        state after server restarts. Should be called during startup.
+        state after server restarts, and starts background delivery
+        (re-queuing events a previous run did not deliver). Should be
+        called during startup.
         """
+        await self._load_webhook_configs()
+        if self.is_push_supported():
+            await self.dispatcher.start()  # type: ignore[union-attr]
+
+    async def close(self) -> None:
+        """Stop background delivery and close pooled HTTP sessions."""
+        await self.dispatcher.stop()  # type: ignore[union-attr]
+        await self.notification_service.close()
+
+    async def _load_webhook_configs(self) -> None:
         if self.storage is None:
             logger.debug(
                 "No storage configured, skipping webhook config initialization"
@@ -194,7 +223,7 @@ class PushNotificationManager:
             persist: If True, save to storage for long-running tasks
         """
         config_copy = self._sanitize_push_config(config)
-        self.notification_service.validate_config(config_copy)
+        await self.notification_service.validate_config_async(config_copy)
         self._push_notification_configs[task_id] = config_copy
         self._notification_sequences.setdefault(task_id, 0)
 
@@ -308,7 +337,7 @@ class PushNotificationManager:
             return
         event = self.build_lifecycle_event(task_id, context_id, state, final)
         try:
-            await self.notification_service.send_event(config, event)
+            await self._send(task_id, config, event)
         except Exception as exc:
             self._log_notification_error("push", task_id, context_id, exc, state=state)
 
@@ -350,13 +379,22 @@ class PushNotificationManager:
             return
         event = self.build_artifact_event(task_id, context_id, artifact)
         try:
-            await self.notification_service.send_event(config, event)
+            await self._send(task_id, config, event)
         except Exception as exc:
             artifact_name = artifact.get("name") if isinstance(artifact, dict) else None
             self._log_notification_error(
                 "artifact", task_id, context_id, exc, artifact_name=artifact_name
             )
 
+    async def _send(
+        self, task_id: uuid.UUID, config: PushNotificationConfig, event: dict[str, Any]
+    ) -> None:
+        """Queue the event for background delivery, or send it inline."""
+        if self.dispatcher is not None and self.dispatcher.running:
+            await self.dispatcher.submit(config, event, task_id)
+        else:
+            await self.notification_service.send_event(config, event)
+
     def schedule_notification(
         self, task_id: uuid.UUID, context_id: uuid.UUID, state: str, final: bool
     ) -> None:
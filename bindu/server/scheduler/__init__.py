@@ -24,6 +24,8 @@ Think of this as the restaurant's order board system catalog:
 2. SCHEDULER IMPLEMENTATIONS:
    - InMemoryScheduler: Simple whiteboard system (development/testing)
    - RedisScheduler: Distributed cloud system (production/multi-process)
+   - RedisStreamScheduler: Cloud system with receipts - orders stay on the
+     board until the cook confirms they are done
 
 3. TASK OPERATIONS:
    - TaskOperation: Union type for all task operations (run, cancel, pause, resume)
@@ -37,6 +39,7 @@ Think of this as the restaurant's order board system catalog:
 AVAILABLE SCHEDULER OPTIONS:
 - InMemoryScheduler: Fast in-memory task queue for single-process deployments
 - RedisScheduler: Distributed task queue using Redis for multi-process systems
+- RedisStreamScheduler: Redis Streams queue with acknowledgements and reclaim
 """
 
 from __future__ import annotations as _annotations
@@ -59,7 +62,8 @@ __all__ = [
 # This prevents fatal crashes on boot for users utilizing the InMemoryScheduler.
 try:
     from .redis_scheduler import RedisScheduler  # noqa: F401
+    from .redis_stream_scheduler import RedisStreamScheduler  # noqa: F401
 
-    __all__.append("RedisScheduler")
+    __all__.extend(["RedisScheduler", "RedisStreamScheduler"])
 except ImportError:
     pass
@@ -3,11 +3,12 @@
 from __future__ import annotations as _annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from typing import Annotated, Any, Generic, Literal, TypeVar
+from uuid import UUID
 
 from pydantic import Discriminator
-from typing_extensions import Self, TypedDict
+from typing_extensions import NotRequired, Self, TypedDict
 
 from bindu.common.protocol.types import TaskIdParams, TaskSendParams
 from bindu.utils.logging import get_logger
@@ -56,6 +57,48 @@ class Scheduler(ABC):
         between the workers.
         """
 
+    def set_capacity(self, free_slots: Callable[[], int]) -> None:
+        """Tell the scheduler how many operations its consumer can start now.
+
+        Workers call this before receiving operations. Backends that read in
+        batches use it so they never hold operations the worker cannot start
+        yet. The default ignores it.
+
+        Args:
+            free_slots: Returns the number of operations the consumer can
+                start, counting the one it is about to receive
+        """
+
+    async def get_queue_length(self) -> int:
+        """Get the number of task operations waiting to be received.
+
+        Backends that can report their backlog should override this; the
+        default reports an empty queue.
+        """
+        return 0
+
+    async def receive_cancellations(self) -> AsyncIterator[UUID]:
+        """Receive the ids of tasks cancelled through ``cancel_task``.
+
+        Unlike the queued cancel operation, which one worker takes to mark the
+        task as canceled, every worker receives each cancellation, so the one
+        executing the task can stop it at once. Backends that cannot
+        broadcast return immediately; the queued operation is then the only
+        signal.
+        """
+        return
+        yield
+
+    async def ack_task_operation(self, task_operation: TaskOperation) -> None:
+        """Acknowledge that a received task operation has been handled.
+
+        Workers call this once an operation has run to completion (including
+        operations that marked their task as failed). Operations that are not
+        acknowledged - because the worker crashed or was shut down mid-task -
+        may be redelivered by backends with at-least-once delivery. The
+        default is a no-op for backends that drop operations on receipt.
+        """
+
 
 OperationT = TypeVar("OperationT")
 ParamsT = TypeVar("ParamsT")
@@ -72,6 +115,8 @@ class _TaskOperation(TypedDict, Generic[OperationT, ParamsT]):
     params: ParamsT
     trace_id: str | None
     span_id: str | None
+    # Backend receipt used to acknowledge the operation (Redis Streams entry id)
+    delivery_id: NotRequired[str]
 
 
 _RunTask = _TaskOperation[Literal["run"], TaskSendParams]
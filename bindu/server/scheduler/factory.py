@@ -16,10 +16,12 @@ from .memory_scheduler import InMemoryScheduler
 # Import RedisScheduler conditionally
 try:
     from .redis_scheduler import RedisScheduler
+    from .redis_stream_scheduler import RedisStreamScheduler
 
     REDIS_AVAILABLE = True
 except ImportError:
     RedisScheduler = None  # type: ignore[assignment]  # redis not installed
+    RedisStreamScheduler = None  # type: ignore[assignment]  # redis not installed
     REDIS_AVAILABLE = False
 
 logger = get_logger("bindu.server.scheduler.factory")
@@ -59,6 +61,11 @@ async def create_scheduler(config: SchedulerConfig | None = None) -> Scheduler:
                 max_connections=scheduler_settings.max_connections,
                 retry_on_timeout=scheduler_settings.retry_on_timeout,
                 poll_timeout=scheduler_settings.poll_timeout,
+                queue_mode=scheduler_settings.queue_mode,
+                consumer_group=scheduler_settings.consumer_group,
+                visibility_timeout=scheduler_settings.visibility_timeout,
+                max_deliveries=scheduler_settings.max_deliveries,
+                batch_size=scheduler_settings.batch_size,
             )
         else:
             raise ValueError(f"Unknown scheduler backend in settings: {backend}")
@@ -78,8 +85,6 @@ async def create_scheduler(config: SchedulerConfig | None = None) -> Scheduler:
                 "Install with: pip install redis[hiredis]"
             )
 
-        logger.info("Using Redis scheduler (distributed, multi-process)")
-
         # Validate redis_url is provided
         redis_url = config.redis_url
         if not redis_url:
@@ -97,6 +102,24 @@ async def create_scheduler(config: SchedulerConfig | None = None) -> Scheduler:
                     "Please provide it via REDIS_URL environment variable or config."
                 )
 
+        if config.queue_mode == "stream":
+            assert RedisStreamScheduler is not None
+            logger.info(
+                "Using Redis Streams scheduler (distributed, at-least-once delivery)"
+            )
+            return RedisStreamScheduler(
+                redis_url=redis_url,
+                queue_name=config.queue_name,
+                max_connections=config.max_connections,
+                retry_on_timeout=config.retry_on_timeout,
+                poll_timeout=config.poll_timeout,
+                consumer_group=config.consumer_group,
+                visibility_timeout=config.visibility_timeout,
+                max_deliveries=config.max_deliveries,
+                batch_size=config.batch_size,
+            )
+
+        logger.info("Using Redis scheduler (distributed, multi-process)")
         scheduler = RedisScheduler(
             redis_url=redis_url,
             queue_name=config.queue_name,
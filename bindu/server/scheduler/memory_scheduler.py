@@ -6,6 +6,7 @@ import math
 from collections.abc import AsyncIterator
 from contextlib import AsyncExitStack
 from typing import Any
+from uuid import UUID
 
 import anyio
 
@@ -46,6 +47,7 @@ class InMemoryScheduler(Scheduler):
         ](math.inf)
         await self.aexit_stack.enter_async_context(self._read_stream)
         await self.aexit_stack.enter_async_context(self._write_stream)
+        self._cancel_subscribers: set[anyio.abc.ObjectSendStream[UUID]] = set()
 
         return self
 
@@ -91,6 +93,8 @@ class InMemoryScheduler(Scheduler):
         """Cancel a scheduled task."""
         logger.debug(f"Canceling task: {params}")
         await self._send_operation(_CancelTask, "cancel", params)
+        for subscriber in self._cancel_subscribers:
+            subscriber.send_nowait(params["task_id"])
 
     @retry_scheduler_operation(
         max_attempts=DEFAULT_RETRY_ATTEMPTS,
@@ -112,7 +116,23 @@ class InMemoryScheduler(Scheduler):
         logger.debug(f"Resuming task: {params}")
         await self._send_operation(_ResumeTask, "resume", params)
 
+    async def get_queue_length(self) -> int:
+        """Get the number of buffered task operations not yet received."""
+        return self._read_stream.statistics().current_buffer_used
+
     async def receive_task_operations(self) -> AsyncIterator[TaskOperation]:
         """Receive task operations from the scheduler."""
         async for task_operation in self._read_stream:
             yield task_operation
+
+    async def receive_cancellations(self) -> AsyncIterator[UUID]:
+        """Receive the ids of cancelled tasks, for every caller."""
+        send_stream, receive_stream = anyio.create_memory_object_stream[UUID](math.inf)
+        self._cancel_subscribers.add(send_stream)
+        try:
+            async with receive_stream:
+                async for task_id in receive_stream:
+                    yield task_id
+        finally:
+            self._cancel_subscribers.discard(send_stream)
+            send_stream.close()
@@ -29,6 +29,7 @@ logger = get_logger("bindu.server.scheduler.redis_scheduler")
 # Constants
 REDIS_NOT_INITIALIZED_ERROR = "Redis client not initialized. Use async context manager."
 REDIS_ERROR_BACKOFF_SECONDS = 1
+CANCEL_LISTEN_TIMEOUT_SECONDS = 1.0
 
 # Operation type mapping for deserialization
 OPERATION_TYPES = {
@@ -64,6 +65,7 @@ class RedisScheduler(Scheduler):
         self.max_connections = max_connections
         self.retry_on_timeout = retry_on_timeout
         self.poll_timeout = poll_timeout
+        self.cancel_channel = f"{queue_name}:cancel"
         self._redis_client: redis.Redis | None = None
 
     async def __aenter__(self):
@@ -130,6 +132,10 @@ class RedisScheduler(Scheduler):
         """
         logger.debug(f"Scheduling cancel task: {params}")
         await self._send_operation(_CancelTask, "cancel", params)
+        if not self._redis_client:
+            raise RuntimeError(REDIS_NOT_INITIALIZED_ERROR)
+        # Reaches the replica executing the task, whichever took the operation
+        await self._redis_client.publish(self.cancel_channel, str(params["task_id"]))
 
     @retry_scheduler_operation()
     async def pause_task(self, params: TaskIdParams) -> None:
@@ -197,6 +203,45 @@ class RedisScheduler(Scheduler):
                 logger.error(f"Unexpected error in receive_task_operations: {e}")
                 continue
 
+    async def receive_cancellations(self) -> AsyncIterator[UUID]:
+        """Receive the ids of tasks cancelled on any replica.
+
+        Cancellations are published on ``<queue_name>:cancel``. Pub/sub is
+        fire-and-forget, so a cancellation sent while this replica was
+        reconnecting is lost; the queued cancel operation still marks the
+        task as canceled, and the running task then keeps that state.
+
+        Raises:
+            RuntimeError: If Redis client is not initialized
+        """
+        if not self._redis_client:
+            raise RuntimeError(REDIS_NOT_INITIALIZED_ERROR)
+
+        pubsub = self._redis_client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.cancel_channel)
+        try:
+            while True:
+                try:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=CANCEL_LISTEN_TIMEOUT_SECONDS,
+                    )
+                except redis.RedisError as e:
+                    logger.error(f"Redis error in receive_cancellations: {e}")
+                    await asyncio.sleep(REDIS_ERROR_BACKOFF_SECONDS)
+                    continue
+
+                if message is None or message.get("type") != "message":
+                    continue
+                try:
+                    task_id = UUID(message["data"])
+                except ValueError:
+                    logger.warning(f"Ignoring invalid cancellation: {message['data']}")
+                    continue
+                yield task_id
+        finally:
+            await pubsub.aclose()
+
     async def _push_task_operation(self, task_operation: TaskOperation) -> None:
         if not self._redis_client:
             raise RuntimeError(REDIS_NOT_INITIALIZED_ERROR)
@@ -0,0 +1,427 @@
+"""Redis Streams scheduler with at-least-once delivery.
+
+Unlike the list-based RedisScheduler, where BLPOP removes an operation before
+the worker has run it, operations stay in the stream's pending entries list
+(PEL) until the worker acknowledges them:
+
+- XREADGROUP reads a batch of new operations per round-trip.
+- XACK + XDEL removes an operation once the worker has handled it.
+- While an operation runs, its entry is periodically re-claimed by its own
+  consumer (XCLAIM JUSTID) so long LLM calls do not exceed the visibility
+  timeout.
+- Entries of a consumer that died stop being refreshed; once idle for the
+  visibility timeout, XAUTOCLAIM hands them to a live consumer.
+- An entry delivered ``max_deliveries`` times is moved to a dead-letter
+  stream instead of being retried forever.
+"""
+
+from __future__ import annotations as _annotations
+
+import asyncio
+import contextlib
+import os
+import socket
+import time
+from collections.abc import AsyncIterator, Callable
+from typing import Any, cast
+from uuid import uuid4
+
+import redis.asyncio as redis
+
+from bindu.utils.logging import get_logger
+
+from .base import TaskOperation
+from .redis_scheduler import (
+    REDIS_ERROR_BACKOFF_SECONDS,
+    REDIS_NOT_INITIALIZED_ERROR,
+    RedisScheduler,
+)
+
+logger = get_logger("bindu.server.scheduler.redis_stream_scheduler")
+
+# Constants
+PAYLOAD_FIELD = "payload"
+AUTOCLAIM_START_ID = "0-0"
+# Wait before asking again when the consumer has no free slot
+NO_CAPACITY_BACKOFF_SECONDS = 0.05
+
+
+class RedisStreamScheduler(RedisScheduler):
+    """A Redis Streams scheduler that survives worker crashes and restarts."""
+
+    def __init__(
+        self,
+        redis_url: str,
+        queue_name: str = "bindu:tasks",
+        max_connections: int = 10,
+        retry_on_timeout: bool = True,
+        poll_timeout: int = 1,
+        consumer_group: str = "bindu-workers",
+        consumer_name: str | None = None,
+        visibility_timeout: float = 60.0,
+        max_deliveries: int = 5,
+        batch_size: int = 10,
+    ):
+        """Initialize the Redis Streams scheduler.
+
+        Args:
+            redis_url: Redis connection URL
+            queue_name: Name of the Redis stream for task operations
+            max_connections: Maximum number of Redis connections in the pool
+            retry_on_timeout: Whether to retry operations on timeout
+            poll_timeout: Seconds to block waiting for new operations
+            consumer_group: Consumer group shared by all workers
+            consumer_name: Unique name of this consumer (defaults to host-pid-random)
+            visibility_timeout: Seconds an unacknowledged operation may stay idle
+                before another consumer reclaims it
+            max_deliveries: Deliveries after which an operation is dead-lettered
+            batch_size: Maximum operations read or reclaimed per round-trip
+        """
+        super().__init__(
+            redis_url=redis_url,
+            queue_name=queue_name,
+            max_connections=max_connections,
+            retry_on_timeout=retry_on_timeout,
+            poll_timeout=poll_timeout,
+        )
+        self.consumer_group = consumer_group
+        self.consumer_name = (
+            consumer_name or f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:8]}"
+        )
+        self.visibility_timeout = visibility_timeout
+        self.max_deliveries = max_deliveries
+        self.batch_size = batch_size
+        self.dead_letter_queue = f"{queue_name}:dead"
+        self._in_flight: set[str] = set()
+        self._heartbeat: asyncio.Task[None] | None = None
+        self._free_slots: Callable[[], int] | None = None
+        # Where the next XAUTOCLAIM continues its scan of the PEL
+        self._autoclaim_cursor = AUTOCLAIM_START_ID
+
+    async def __aenter__(self):
+        """Connect, create the consumer group and start the visibility heartbeat."""
+        await super().__aenter__()
+        await self._ensure_group()
+        self._heartbeat = asyncio.create_task(self._heartbeat_loop())
+        logger.info(
+            f"Redis stream scheduler consuming {self.queue_name} "
+            f"as {self.consumer_group}/{self.consumer_name}"
+        )
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any):
+        """Stop the heartbeat and close the connection.
+
+        Unacknowledged operations stay pending and are reclaimed by another
+        consumer once their visibility timeout expires.
+        """
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._heartbeat
+            self._heartbeat = None
+        await super().__aexit__(exc_type, exc_value, traceback)
+
+    @property
+    def _visibility_timeout_ms(self) -> int:
+        return int(self.visibility_timeout * 1000)
+
+    async def _ensure_group(self) -> None:
+        """Create the consumer group (and stream) if it does not exist."""
+        assert self._redis_client is not None
+        try:
+            await self._redis_client.xgroup_create(
+                self.queue_name, self.consumer_group, id="0", mkstream=True
+            )
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    # -------------------------------------------------------------------------
+    # Producing
+    # -------------------------------------------------------------------------
+
+    async def _push_task_operation(self, task_operation: TaskOperation) -> None:
+        if not self._redis_client:
+            raise RuntimeError(REDIS_NOT_INITIALIZED_ERROR)
+
+        try:
+            serialized_task = self._serialize_task_operation(task_operation)
+            await self._redis_client.xadd(
+                self.queue_name, {PAYLOAD_FIELD: serialized_task}
+            )
+            logger.debug(
+                f"Added task operation to stream: {task_operation['operation']}"
+            )
+        except redis.RedisError as e:
+            logger.error(f"Failed to add task operation to Redis stream: {e}")
+            raise
+        except (TypeError, ValueError) as e:
+            logger.error(f"Failed to serialize task operation: {e}")
+            raise
+
+    # -------------------------------------------------------------------------
+    # Consuming
+    # -------------------------------------------------------------------------
+
+    def set_capacity(self, free_slots: Callable[[], int]) -> None:
+        """Read and reclaim at most as many operations as the worker can start.
+
+        Operations held here are refreshed by the heartbeat, so reading more
+        than the worker can start would hide them from other replicas.
+        """
+        self._free_slots = free_slots
+
+    def _capacity(self) -> int:
+        if self._free_slots is None:
+            return self.batch_size
+        return max(0, min(self.batch_size, self._free_slots()))
+
+    async def receive_task_operations(self) -> AsyncIterator[TaskOperation]:
+        """Receive task operations from the stream.
+
+        Each round reclaims operations abandoned by dead consumers (a full
+        scan of the PEL at most once per half visibility timeout), then reads
+        new ones. Neither takes more operations than the worker has free
+        slots, see ``set_capacity``.
+
+        Yields:
+            TaskOperation: Operations carrying their stream ``delivery_id``
+
+        Raises:
+            RuntimeError: If Redis client is not initialized
+        """
+        if not self._redis_client:
+            raise RuntimeError(REDIS_NOT_INITIALIZED_ERROR)
+
+        logger.info(
+            f"Starting to receive task operations from stream: {self.queue_name}"
+        )
+
+        next_reclaim = 0.0
+        while True:
+            try:
+                count = self._capacity()
+                if count == 0:
+                    await asyncio.sleep(NO_CAPACITY_BACKOFF_SECONDS)
+                    continue
+
+                if time.monotonic() >= next_reclaim:
+                    reclaimed = await self._reclaim_abandoned(count)
+                    # Keep scanning the PEL until the cursor wraps around
+                    if self._autoclaim_cursor == AUTOCLAIM_START_ID:
+                        next_reclaim = time.monotonic() + self.visibility_timeout / 2
+                    if reclaimed:
+                        for operation in reclaimed:
+                            yield operation
+                        continue
+
+                operations = await self._read_new(count)
+                if not operations:
+                    # Some Redis-compatible servers answer an empty XREADGROUP
+                    # without blocking; yield so the heartbeat is not starved.
+                    await asyncio.sleep(0)
+                for operation in operations:
+                    yield operation
+
+            except redis.ResponseError as e:
+                if "NOGROUP" in str(e):
+                    # Stream or group was deleted (e.g. clear_queue); recreate it
+                    self._autoclaim_cursor = AUTOCLAIM_START_ID
+                    await self._ensure_group()
+                    continue
+                logger.error(f"Redis error in receive_task_operations: {e}")
+                await asyncio.sleep(REDIS_ERROR_BACKOFF_SECONDS)
+            except redis.RedisError as e:
+                logger.error(f"Redis error in receive_task_operations: {e}")
+                await asyncio.sleep(REDIS_ERROR_BACKOFF_SECONDS)
+
+    async def _read_new(self, count: int) -> list[TaskOperation]:
+        """Read up to ``count`` never-delivered operations."""
+        assert self._redis_client is not None
+        response = await self._redis_client.xreadgroup(
+            self.consumer_group,
+            self.consumer_name,
+            {self.queue_name: ">"},
+            count=count,
+            block=int(self.poll_timeout * 1000),
+        )
+        if not response:
+            return []
+
+        _, entries = response[0]
+        return await self._decode_entries(entries, redelivered=False)
+
+    async def _reclaim_abandoned(self, count: int) -> list[TaskOperation]:
+        """Claim up to ``count`` operations whose consumer stopped refreshing them.
+
+        Each call continues the PEL scan where the previous one stopped, so
+        abandoned entries behind a run of busy ones are reached too.
+        Operations already delivered ``max_deliveries`` times are moved to the
+        dead-letter stream instead of being returned.
+        """
+        assert self._redis_client is not None
+        next_id, entries, *_ = await self._redis_client.xautoclaim(
+            self.queue_name,
+            self.consumer_group,
+            self.consumer_name,
+            min_idle_time=self._visibility_timeout_ms,
+            start_id=self._autoclaim_cursor,
+            count=count,
+        )
+        self._autoclaim_cursor = next_id
+        if not entries:
+            return []
+
+        ids = [entry_id for entry_id, _ in entries]
+        pending = await self._redis_client.xpending_range(
+            self.queue_name,
+            self.consumer_group,
+            min=ids[0],
+            max=ids[-1],
+            count=len(ids) + count,
+            consumername=self.consumer_name,
+        )
+        deliveries = {p["message_id"]: p["times_delivered"] for p in pending}
+
+        live_entries = []
+        for entry_id, fields in entries:
+            times_delivered = deliveries.get(entry_id, 1)
+            if times_delivered > self.max_deliveries:
+                await self._dead_letter(entry_id, fields, times_delivered)
+            else:
+                logger.warning(
+                    f"Reclaimed task operation {entry_id} from a dead consumer "
+                    f"(delivery {times_delivered}/{self.max_deliveries})"
+                )
+                live_entries.append((entry_id, fields))
+
+        return await self._decode_entries(live_entries, redelivered=True)
+
+    async def _decode_entries(
+        self, entries: list[tuple[str, dict[str, str]]], redelivered: bool
+    ) -> list[TaskOperation]:
+        """Deserialize stream entries and track them as in flight."""
+        operations: list[TaskOperation] = []
+        for entry_id, fields in entries:
+            try:
+                operation = self._deserialize_task_operation(fields[PAYLOAD_FIELD])
+            except (KeyError, TypeError, ValueError) as e:
+                logger.error(f"Dropping malformed task operation {entry_id}: {e}")
+                await self._dead_letter(entry_id, fields, 0)
+                continue
+
+            operation["delivery_id"] = entry_id
+            if redelivered and operation["operation"] == "run":
+                operation["params"]["redelivered"] = True
+            self._in_flight.add(entry_id)
+            operations.append(operation)
+        return operations
+
+    async def ack_task_operation(self, task_operation: TaskOperation) -> None:
+        """Acknowledge a handled operation and remove it from the stream.
+
+        Args:
+            task_operation: Operation yielded by receive_task_operations
+        """
+        delivery_id = task_operation.get("delivery_id")
+        if delivery_id is None:
+            return
+        if not self._redis_client:
+            raise RuntimeError(REDIS_NOT_INITIALIZED_ERROR)
+
+        self._in_flight.discard(delivery_id)
+        async with self._redis_client.pipeline(transaction=True) as pipe:
+            pipe.xack(self.queue_name, self.consumer_group, delivery_id)
+            pipe.xdel(self.queue_name, delivery_id)
+            await pipe.execute()
+
+    async def _dead_letter(
+        self, entry_id: str, fields: dict[str, str], times_delivered: int
+    ) -> None:
+        """Move an operation to the dead-letter stream."""
+        assert self._redis_client is not None
+        logger.error(
+            f"Moving task operation {entry_id} to {self.dead_letter_queue} "
+            f"after {times_delivered} deliveries"
+        )
+        self._in_flight.discard(entry_id)
+        async with self._redis_client.pipeline(transaction=True) as pipe:
+            pipe.xadd(
+                self.dead_letter_queue,
+                {
+                    **fields,
+                    "original_id": entry_id,
+                    "times_delivered": str(times_delivered),
+                },
+            )
+            pipe.xack(self.queue_name, self.consumer_group, entry_id)
+            pipe.xdel(self.queue_name, entry_id)
+            await pipe.execute()
+
+    async def _heartbeat_loop(self) -> None:
+        """Keep in-flight operations from reaching the visibility timeout."""
+        interval = max(self.visibility_timeout / 3, 0.01)
+        while True:
+            await asyncio.sleep(interval)
+            await self._refresh_in_flight()
+
+    async def _refresh_in_flight(self) -> None:
+        """Reset the idle time of operations this consumer is still handling."""
+        if not self._in_flight or not self._redis_client:
+            return
+        try:
+            # JUSTID claims do not increment the delivery counter
+            await self._redis_client.xclaim(
+                self.queue_name,
+                self.consumer_group,
+                self.consumer_name,
+                min_idle_time=0,
+                message_ids=list(self._in_flight),
+                justid=True,
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Failed to refresh in-flight task operations: {e}")
+
+    # -------------------------------------------------------------------------
+    # Introspection
+    # -------------------------------------------------------------------------
+
+    async def get_queue_length(self) -> int:
+        """Get the number of operations not yet delivered to any consumer.
+
+        Raises:
+            RuntimeError: If Redis client is not initialized
+        """
+        if not self._redis_client:
+            raise RuntimeError(REDIS_NOT_INITIALIZED_ERROR)
+        # Acknowledged entries are deleted, so the stream holds pending + new
+        length = await self._redis_client.xlen(self.queue_name)
+        pending = await self.get_pending_count()
+        return max(length - pending, 0)
+
+    async def get_pending_count(self) -> int:
+        """Get the number of delivered but unacknowledged operations."""
+        if not self._redis_client:
+            raise RuntimeError(REDIS_NOT_INITIALIZED_ERROR)
+        try:
+            summary = await self._redis_client.xpending(
+                self.queue_name, self.consumer_group
+            )
+        except redis.ResponseError:
+            return 0
+        return int(cast(dict[str, Any], summary)["pending"])
+
+    async def clear_queue(self) -> int:
+        """Delete the stream, including pending operations.
+
+        Returns:
+            int: Number of operations removed
+        """
+        if not self._redis_client:
+            raise RuntimeError(REDIS_NOT_INITIALIZED_ERROR)
+        length = await self._redis_client.xlen(self.queue_name)
+        await self._redis_client.delete(self.queue_name)
+        self._in_flight.clear()
+        await self._ensure_group()
+        return length
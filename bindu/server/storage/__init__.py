@@ -51,8 +51,10 @@ from .schema import (
     contexts_table,
     metadata,
     task_feedback_table,
+    task_messages_table,
     tasks_table,
     webhook_configs_table,
+    webhook_outbox_table,
 )
 
 __all__ = [
@@ -66,9 +68,11 @@ __all__ = [
     # SQLAlchemy schema
     "metadata",
     "tasks_table",
+    "task_messages_table",
     "contexts_table",
     "task_feedback_table",
     "webhook_configs_table",
+    "webhook_outbox_table",
 ]
 
 # Conditional import of PostgresStorage (requires SQLAlchemy)
@@ -10,10 +10,12 @@ from typing_extensions import TypeVar
 
 from bindu.common.protocol.types import (
     Artifact,
+    ContextSummary,
     Message,
     PushNotificationConfig,
     Task,
     TaskState,
+    TaskSummary,
 )
 
 ContextT = TypeVar("ContextT", default=dict[str, Any])
@@ -55,6 +57,20 @@ class Storage(ABC, Generic[ContextT]):
             Task object if found, None otherwise
         """
 
+    @abstractmethod
+    async def load_tasks(
+        self, task_ids: list[UUID], history_length: int | None = None
+    ) -> list[Task]:
+        """Load several tasks in one round-trip.
+
+        Args:
+            task_ids: Tasks to load
+            history_length: Optional limit on each task's message history length
+
+        Returns:
+            Tasks found, in the order of task_ids (missing ids are skipped)
+        """
+
     @abstractmethod
     async def submit_task(self, context_id: UUID, message: Message) -> Task:
         """Create and store a new task.
@@ -75,6 +91,7 @@ class Storage(ABC, Generic[ContextT]):
         new_artifacts: list[Artifact] | None = None,
         new_messages: list[Message] | None = None,
         metadata: dict[str, Any] | None = None,
+        return_full: bool = True,
     ) -> Task:
         """Update task state and append new content.
 
@@ -84,25 +101,76 @@ class Storage(ABC, Generic[ContextT]):
             new_artifacts: Optional artifacts to append
             new_messages: Optional messages to append to history
             metadata: Optional metadata to update/merge with task metadata
+            return_full: If False, return only id, context_id, kind and status,
+                without history, artifacts or metadata. Use it for state
+                transitions whose result is not needed.
 
         Returns:
             Updated task object
         """
 
+    @abstractmethod
+    async def update_task_if_active(
+        self,
+        task_id: UUID,
+        state: TaskState,
+        new_artifacts: list[Artifact] | None = None,
+        new_messages: list[Message] | None = None,
+        metadata: dict[str, Any] | None = None,
+        return_full: bool = True,
+    ) -> Task | None:
+        """Update a task unless it already reached a terminal state.
+
+        The state check and the update are one atomic step, so a task that
+        was canceled or finished concurrently is left as it is. Use it for
+        transitions that must not overwrite a terminal state.
+
+        Args:
+            task_id: Task to update
+            state: New task state
+            new_artifacts: Optional artifacts to append
+            new_messages: Optional messages to append to history
+            metadata: Optional metadata to update/merge with task metadata
+            return_full: If False, return only id, context_id, kind and status
+
+        Returns:
+            Updated task object, or None if the task is missing or terminal
+        """
+
     @abstractmethod
     async def list_tasks(
-        self, length: int | None = None, offset: int = 0
+        self, length: int | None = None, offset: int = 0, cursor: UUID | None = None
     ) -> list[Task]:
-        """List all tasks in storage.
+        """List tasks in storage, newest first.
+
+        Tasks are ordered by (created_at, id). Prefer cursor over offset for
+        pagination: the cursor seeks straight to the page instead of skipping
+        the rows before it.
 
         Args:
             length: Optional limit on number of tasks to return (most recent)
             offset: Optional offset for pagination
+            cursor: Optional id of the last task of the previous page; only
+                tasks listed after it are returned
 
         Returns:
             List of tasks
         """
 
+    @abstractmethod
+    async def list_task_summaries(
+        self, length: int | None = None, cursor: UUID | None = None
+    ) -> list[TaskSummary]:
+        """List task summaries, newest first, without history or artifacts.
+
+        Args:
+            length: Optional limit on number of summaries to return
+            cursor: Optional id of the last task of the previous page
+
+        Returns:
+            List of task summaries
+        """
+
     @abstractmethod
     async def count_tasks(self, status: TaskState | None = None) -> int:
         """Count number of tasks, optionally filtered by status.
@@ -118,6 +186,18 @@ class Storage(ABC, Generic[ContextT]):
             (e.g., SELECT COUNT(*)) rather than loading all records into Python memory.
         """
 
+    @abstractmethod
+    async def count_tasks_by_state(self) -> dict[str, int]:
+        """Count tasks in every state at once.
+
+        Returns:
+            Mapping of state to task count; states without tasks may be omitted
+
+        Note:
+            Called on every metrics scrape, so implementations should keep
+            per-state counters up to date on writes instead of counting tasks.
+        """
+
     @abstractmethod
     async def list_tasks_by_context(
         self, context_id: UUID, length: int | None = None, offset: int = 0
@@ -133,6 +213,22 @@ class Storage(ABC, Generic[ContextT]):
             List of tasks in the context
         """
 
+    @abstractmethod
+    async def list_task_summaries_by_context(
+        self, context_id: UUID
+    ) -> list[TaskSummary]:
+        """List summaries of a context's tasks, oldest first.
+
+        Lets callers see which tasks a context holds (and their states)
+        without reading any history.
+
+        Args:
+            context_id: Context to filter tasks by
+
+        Returns:
+            List of task summaries in creation order
+        """
+
     # -------------------------------------------------------------------------
     # Context Operations
     # -------------------------------------------------------------------------
@@ -172,18 +268,33 @@ class Storage(ABC, Generic[ContextT]):
 
     @abstractmethod
     async def list_contexts(
-        self, length: int | None = None, offset: int = 0
+        self, length: int | None = None, offset: int = 0, cursor: UUID | None = None
     ) -> list[ContextT]:
-        """List all contexts in storage.
+        """List contexts in storage, newest first.
 
         Args:
             length: Optional limit on number of contexts to return (most recent)
             offset: Optional offset for pagination
+            cursor: Optional id of the last context of the previous page
 
         Returns:
             List of strictly typed ContextT objects
         """
 
+    @abstractmethod
+    async def list_context_summaries(
+        self, length: int | None = None, cursor: UUID | None = None
+    ) -> list[ContextSummary]:
+        """List context summaries, newest first, without their task ids.
+
+        Args:
+            length: Optional limit on number of summaries to return
+            cursor: Optional id of the last context of the previous page
+
+        Returns:
+            List of context summaries
+        """
+
     # -------------------------------------------------------------------------
     # Utility & Lifecycle Operations
     # -------------------------------------------------------------------------
@@ -289,3 +400,83 @@ class Storage(ABC, Generic[ContextT]):
         Returns:
             Dictionary mapping task IDs to their webhook configurations
         """
+
+    # -------------------------------------------------------------------------
+    # Webhook Outbox Operations (undelivered push notification events)
+    # -------------------------------------------------------------------------
+
+    @abstractmethod
+    async def save_webhook_event(
+        self,
+        event_id: UUID,
+        task_id: UUID,
+        config: PushNotificationConfig,
+        event: dict[str, Any],
+        owner: str | None = None,
+        lease_seconds: float = 0.0,
+    ) -> None:
+        """Record a push notification event before it is delivered.
+
+        Args:
+            event_id: Event identifier (the payload's event_id)
+            task_id: Task the event is about
+            config: Webhook the event is addressed to
+            event: Notification payload
+            owner: Replica delivering the event itself, if any
+            lease_seconds: How long other replicas must not claim the event
+        """
+
+    @abstractmethod
+    async def delete_webhook_events(self, event_ids: list[UUID]) -> None:
+        """Remove delivered (or abandoned) events from the outbox.
+
+        Args:
+            event_ids: Events to remove
+
+        Note: Should not raise for events that don't exist.
+        """
+
+    @abstractmethod
+    async def claim_webhook_events(
+        self, owner: str, limit: int, lease_seconds: float
+    ) -> list[dict[str, Any]]:
+        """Claim undelivered events no other replica holds, oldest first.
+
+        Events whose lease has run out are leased to ``owner`` for
+        ``lease_seconds``. Concurrent claims never return the same event.
+
+        Args:
+            owner: Replica claiming the events
+            limit: Maximum number of events to claim
+            lease_seconds: Seconds until the events may be claimed again
+
+        Returns:
+            List of dicts with event_id, task_id, config and event keys
+        """
+
+    @abstractmethod
+    async def renew_webhook_events(
+        self, owner: str, event_ids: list[UUID], lease_seconds: float
+    ) -> None:
+        """Extend the lease of events still held by ``owner``.
+
+        A lease of 0 releases the events, so any replica may claim them.
+
+        Args:
+            owner: Replica holding the events
+            event_ids: Events to renew; those claimed by others are skipped
+            lease_seconds: Seconds until the events may be claimed again
+        """
+
+    @abstractmethod
+    async def load_webhook_events(
+        self, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Load undelivered events, oldest first, whoever holds them.
+
+        Args:
+            limit: Optional maximum number of events to load
+
+        Returns:
+            List of dicts with event_id, task_id, config and event keys
+        """
@@ -11,23 +11,34 @@ Hybrid Agent Pattern Support:
 - Supports incremental message history updates
 - Enables task refinements through context-based task lookup
 
+Reads are copy-on-write snapshots: load_task() returns a new task dict with its
+own status, history and artifacts containers, but the messages and artifacts
+themselves are shared with the store instead of deep-copied. Stored records only
+ever grow by appending, so a snapshot stays valid while the task keeps changing.
+Treat messages and artifacts in returned tasks as read-only.
+
 Note: All data is lost when the application stops. Use persistent storage for production.
 """
 
 from __future__ import annotations as _annotations
 
-import copy
+import itertools
+import time
+from bisect import bisect_left
+from collections import Counter
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, cast
 from uuid import UUID
 
 from bindu.common.protocol.types import (
     Artifact,
+    ContextSummary,
     Message,
     PushNotificationConfig,
     Task,
     TaskState,
     TaskStatus,
+    TaskSummary,
 )
 from bindu.settings import app_settings
 from bindu.utils.logging import get_logger
@@ -44,6 +55,61 @@ DEFAULT_STORAGE_MIN_WAIT = 0.1
 DEFAULT_STORAGE_MAX_WAIT = 1.0
 
 
+class _CreationOrder:
+    """Ids in creation order, paged newest first.
+
+    Plays the part of PostgreSQL's (created_at, id) index: a cursor page is
+    found by bisection and only the ids on the page are touched.
+    """
+
+    def __init__(self) -> None:
+        self._sequence = itertools.count()
+        self._order: list[tuple[int, UUID]] = []
+        self._created: dict[UUID, tuple[int, str]] = {}
+
+    def add(self, key: UUID, created_at: str) -> None:
+        """Record a newly created id and its ISO creation time."""
+        if key in self._created:
+            return
+        seq = next(self._sequence)
+        self._created[key] = (seq, created_at)
+        self._order.append((seq, key))
+
+    def discard(self, key: UUID) -> None:
+        """Forget a deleted id."""
+        entry = self._created.pop(key, None)
+        if entry is not None:
+            del self._order[bisect_left(self._order, (entry[0], key))]
+
+    def clear(self) -> None:
+        """Forget all ids."""
+        self._order.clear()
+        self._created.clear()
+
+    def created_at(self, key: UUID) -> str:
+        """Return the ISO creation time of an id."""
+        return self._created[key][1]
+
+    def page(
+        self, length: int | None = None, offset: int = 0, cursor: UUID | None = None
+    ) -> list[UUID]:
+        """Return up to length ids, newest first, after cursor and offset.
+
+        An unknown cursor yields an empty page, as it does in PostgreSQL.
+        """
+        if cursor is None:
+            end = len(self._order)
+        else:
+            entry = self._created.get(cursor)
+            if entry is None:
+                return []
+            end = bisect_left(self._order, (entry[0], cursor))
+
+        end = max(end - offset, 0)
+        start = max(end - length, 0) if length is not None and length > 0 else 0
+        return [key for _, key in reversed(self._order[start:end])]
+
+
 class InMemoryStorage(Storage[dict[str, Any]]):
     """In-memory storage implementation for tasks and contexts.
 
@@ -51,6 +117,9 @@ class InMemoryStorage(Storage[dict[str, Any]]):
     - tasks: Dict[UUID, Task] - All tasks indexed by task_id
     - contexts: Dict[UUID, list[UUID]] - Task IDs grouped by context_id
     - task_feedback: Dict[UUID, List[dict]] - Optional feedback storage
+
+    Task and context creation order is tracked separately for newest-first
+    listings with cursor pagination.
     """
 
     def __init__(self):
@@ -62,6 +131,12 @@ class InMemoryStorage(Storage[dict[str, Any]]):
         self.contexts: dict[UUID, list[UUID]] = {}
         self.task_feedback: dict[UUID, list[dict[str, Any]]] = {}
         self._webhook_configs: dict[UUID, PushNotificationConfig] = {}
+        self._webhook_outbox: dict[UUID, dict[str, Any]] = {}
+        # event_id -> (owner, monotonic time the event may be claimed again)
+        self._webhook_leases: dict[UUID, tuple[str | None, float]] = {}
+        self._task_order = _CreationOrder()
+        self._context_order = _CreationOrder()
+        self._state_counts: Counter[str] = Counter()
 
     @retry_storage_operation(
         max_attempts=DEFAULT_STORAGE_RETRY_ATTEMPTS,
@@ -86,14 +161,59 @@ class InMemoryStorage(Storage[dict[str, Any]]):
         if task is None:
             return None
 
-        # Always return a deep copy to prevent mutations affecting stored task
-        task_copy = copy.deepcopy(task)
+        return self._snapshot(task, history_length)
+
+    async def load_tasks(
+        self, task_ids: list[UUID], history_length: int | None = None
+    ) -> list[Task]:
+        """Load several tasks from memory.
+
+        Args:
+            task_ids: Tasks to load
+            history_length: Optional limit on each task's message history length
+
+        Returns:
+            Tasks found, in the order of task_ids (missing ids are skipped)
+        """
+        tasks: list[Task] = []
+        for task_id in task_ids:
+            task = self.tasks.get(validate_uuid_type(task_id, "task_id"))
+            if task is not None:
+                tasks.append(self._snapshot(task, history_length))
+        return tasks
+
+    @staticmethod
+    def _snapshot(task: Task, history_length: int | None = None) -> Task:
+        """Return a copy-on-write snapshot of a stored task.
 
-        # Limit history if requested
-        if history_length is not None and history_length > 0 and "history" in task:
-            task_copy["history"] = task["history"][-history_length:]
+        Only the containers the store mutates (the task dict, status, history,
+        artifacts and metadata) are copied; messages and artifacts are shared.
+        History limiting slices the stored list directly, so only the requested
+        window is copied.
 
-        return task_copy
+        Args:
+            task: Stored task record
+            history_length: Optional limit on message history length
+
+        Returns:
+            Snapshot safe to modify at the top level
+        """
+        snapshot = cast(Task, dict(task))
+        snapshot["status"] = cast(TaskStatus, dict(task["status"]))
+
+        if "history" in task:
+            history = task["history"]
+            snapshot["history"] = (
+                history[-history_length:]
+                if history_length is not None and history_length > 0
+                else history[:]
+            )
+        if "artifacts" in task:
+            snapshot["artifacts"] = task["artifacts"][:]
+        if "metadata" in task:
+            snapshot["metadata"] = dict(task["metadata"])
+
+        return snapshot
 
     @retry_storage_operation(
         max_attempts=DEFAULT_STORAGE_RETRY_ATTEMPTS,
@@ -187,11 +307,12 @@ class InMemoryStorage(Storage[dict[str, Any]]):
             existing_task["history"].append(message)
 
             # Reset to submitted state for re-execution
+            self._count_transition(current_state, "submitted")
             existing_task["status"] = TaskStatus(
                 state="submitted", timestamp=datetime.now(timezone.utc).isoformat()
             )
 
-            return existing_task
+            return self._snapshot(existing_task)
 
         # Task doesn't exist - create new task
         task_status = TaskStatus(
@@ -205,13 +326,16 @@ class InMemoryStorage(Storage[dict[str, Any]]):
             history=[message],
         )
         self.tasks[task_id] = task
+        self._task_order.add(task_id, task_status["timestamp"])
+        self._count_transition(None, "submitted")
 
         # Add task to context
         if context_id not in self.contexts:
             self.contexts[context_id] = []
+            self._context_order.add(context_id, task_status["timestamp"])
         self.contexts[context_id].append(task_id)
 
-        return task
+        return self._snapshot(task)
 
     @retry_storage_operation(
         max_attempts=DEFAULT_STORAGE_RETRY_ATTEMPTS,
@@ -225,6 +349,7 @@ class InMemoryStorage(Storage[dict[str, Any]]):
         new_artifacts: list[Artifact] | None = None,
         new_messages: list[Message] | None = None,
         metadata: dict[str, Any] | None = None,
+        return_full: bool = True,
     ) -> Task:
         """Update task state and append new content.
 
@@ -238,6 +363,8 @@ class InMemoryStorage(Storage[dict[str, Any]]):
             new_artifacts: Optional artifacts to append (for completion)
             new_messages: Optional messages to append to history
             metadata: Optional metadata to update/merge with task metadata
+            return_full: If False, return the task without history, artifacts
+                and metadata
 
         Returns:
             Updated task object
@@ -251,7 +378,79 @@ class InMemoryStorage(Storage[dict[str, Any]]):
         if task_id not in self.tasks:
             raise KeyError(f"Task {task_id} not found")
 
-        task = self.tasks[task_id]
+        return self._apply_update(
+            self.tasks[task_id],
+            state,
+            new_artifacts=new_artifacts,
+            new_messages=new_messages,
+            metadata=metadata,
+            return_full=return_full,
+        )
+
+    @retry_storage_operation(
+        max_attempts=DEFAULT_STORAGE_RETRY_ATTEMPTS,
+        min_wait=DEFAULT_STORAGE_MIN_WAIT,
+        max_wait=DEFAULT_STORAGE_MAX_WAIT,
+    )
+    async def update_task_if_active(
+        self,
+        task_id: UUID,
+        state: TaskState,
+        new_artifacts: list[Artifact] | None = None,
+        new_messages: list[Message] | None = None,
+        metadata: dict[str, Any] | None = None,
+        return_full: bool = True,
+    ) -> Task | None:
+        """Update a task unless it already reached a terminal state.
+
+        The state check and the update run without yielding to the event
+        loop, so a concurrent cancel cannot slip in between.
+
+        Args:
+            task_id: Task to update
+            state: New task state
+            new_artifacts: Optional artifacts to append
+            new_messages: Optional messages to append to history
+            metadata: Optional metadata to update/merge with task metadata
+            return_full: If False, return the task without history, artifacts
+                and metadata
+
+        Returns:
+            Updated task object, or None if the task is missing or terminal
+
+        Raises:
+            TypeError: If task_id is not UUID
+        """
+        task_id = validate_uuid_type(task_id, "task_id")
+
+        task = self.tasks.get(task_id)
+        if (
+            task is None
+            or task["status"]["state"] in app_settings.agent.terminal_states
+        ):
+            return None
+
+        return self._apply_update(
+            task,
+            state,
+            new_artifacts=new_artifacts,
+            new_messages=new_messages,
+            metadata=metadata,
+            return_full=return_full,
+        )
+
+    def _apply_update(
+        self,
+        task: Task,
+        state: TaskState,
+        new_artifacts: list[Artifact] | None = None,
+        new_messages: list[Message] | None = None,
+        metadata: dict[str, Any] | None = None,
+        return_full: bool = True,
+    ) -> Task:
+        """Set the state of a stored task and append new content."""
+        task_id = task["id"]
+        self._count_transition(task["status"]["state"], state)
         task["status"] = TaskStatus(
             state=state, timestamp=datetime.now(timezone.utc).isoformat()
         )
@@ -279,7 +478,14 @@ class InMemoryStorage(Storage[dict[str, Any]]):
                 message["context_id"] = task["context_id"]
                 task["history"].append(message)
 
-        return task
+        if not return_full:
+            return Task(
+                id=task["id"],
+                context_id=task["context_id"],
+                kind=task["kind"],
+                status=cast(TaskStatus, dict(task["status"])),
+            )
+        return self._snapshot(task)
 
     async def update_context(self, context_id: UUID, context: dict[str, Any]) -> None:
         """Store or update context metadata.
@@ -344,26 +550,50 @@ class InMemoryStorage(Storage[dict[str, Any]]):
         pass
 
     async def list_tasks(
-        self, length: int | None = None, offset: int = 0
+        self, length: int | None = None, offset: int = 0, cursor: UUID | None = None
     ) -> list[Task]:
-        """List all tasks in storage.
+        """List tasks in storage, newest first.
 
         Args:
             length: Optional limit on number of tasks to return
             offset: Optional offset for pagination
+            cursor: Optional id of the last task of the previous page
 
         Returns:
             List of tasks
         """
-        all_tasks = list(self.tasks.values())
+        return [
+            self._snapshot(self.tasks[task_id])
+            for task_id in self._task_order.page(length, offset, cursor)
+        ]
 
-        if offset > 0:
-            all_tasks = all_tasks[offset:]
+    async def list_task_summaries(
+        self, length: int | None = None, cursor: UUID | None = None
+    ) -> list[TaskSummary]:
+        """List task summaries, newest first, without history or artifacts.
 
-        if length is not None and length > 0:
-            all_tasks = all_tasks[:length]
+        Args:
+            length: Optional limit on number of summaries to return
+            cursor: Optional id of the last task of the previous page
 
-        return all_tasks
+        Returns:
+            List of task summaries
+        """
+        return [
+            self._summarize(self.tasks[task_id])
+            for task_id in self._task_order.page(length, cursor=cursor)
+        ]
+
+    def _summarize(self, task: Task) -> TaskSummary:
+        return TaskSummary(
+            id=task["id"],
+            context_id=task["context_id"],
+            kind=task["kind"],
+            status=cast(TaskStatus, dict(task["status"])),
+            created_at=self._task_order.created_at(task["id"]),
+            # Every update stamps the status, so it doubles as updated_at
+            updated_at=task["status"]["timestamp"],
+        )
 
     async def count_tasks(self, status: TaskState | None = None) -> int:
         """Count number of tasks, optionally filtered by status.
@@ -377,7 +607,26 @@ class InMemoryStorage(Storage[dict[str, Any]]):
         if status is None:
             return len(self.tasks)
 
-        return sum(1 for t in self.tasks.values() if t["status"]["state"] == status)
+        return self._state_counts[status]
+
+    async def count_tasks_by_state(self) -> dict[str, int]:
+        """Count tasks in every state from the maintained counters.
+
+        Returns:
+            Mapping of state to task count, for states with at least one task
+        """
+        return dict(self._state_counts)
+
+    def _count_transition(self, old_state: str | None, new_state: str | None) -> None:
+        """Move one task between state counters (None: created or deleted)."""
+        if old_state == new_state:
+            return
+        if new_state is not None:
+            self._state_counts[new_state] += 1
+        if old_state is not None:
+            self._state_counts[old_state] -= 1
+            if self._state_counts[old_state] <= 0:
+                del self._state_counts[old_state]
 
     async def list_tasks_by_context(
         self, context_id: UUID, length: int | None = None, offset: int = 0
@@ -411,36 +660,72 @@ class InMemoryStorage(Storage[dict[str, Any]]):
         if length is not None and length > 0:
             tasks = tasks[:length]
 
-        return tasks
+        return [self._snapshot(task) for task in tasks]
+
+    async def list_task_summaries_by_context(
+        self, context_id: UUID
+    ) -> list[TaskSummary]:
+        """List summaries of a context's tasks, oldest first.
+
+        Args:
+            context_id: Context to filter tasks by
+
+        Returns:
+            List of task summaries in creation order
+
+        Raises:
+            TypeError: If context_id is not UUID
+        """
+        context_id = validate_uuid_type(context_id, "context_id")
+
+        return [
+            self._summarize(self.tasks[task_id])
+            for task_id in self.contexts.get(context_id, [])
+            if task_id in self.tasks
+        ]
 
     async def list_contexts(
-        self, length: int | None = None, offset: int = 0
+        self, length: int | None = None, offset: int = 0, cursor: UUID | None = None
     ) -> list[dict[str, Any]]:
-        """List all contexts in storage.
+        """List contexts in storage, newest first.
 
         Args:
             length: Optional maximum number of contexts to return
             offset: Optional offset for pagination
+            cursor: Optional id of the last context of the previous page
 
         Returns:
             List of context dicts
         """
-        contexts = [
+        return [
             {
-                "context_id": ctx_id,
-                "task_count": len(task_ids),
-                "task_ids": task_ids,
+                "context_id": context_id,
+                "task_count": len(self.contexts[context_id]),
+                "task_ids": self.contexts[context_id],
             }
-            for ctx_id, task_ids in self.contexts.items()
+            for context_id in self._context_order.page(length, offset, cursor)
         ]
 
-        if offset > 0:
-            contexts = contexts[offset:]
+    async def list_context_summaries(
+        self, length: int | None = None, cursor: UUID | None = None
+    ) -> list[ContextSummary]:
+        """List context summaries, newest first, without their task ids.
 
-        if length is not None and length > 0:
-            contexts = contexts[:length]
+        Args:
+            length: Optional maximum number of summaries to return
+            cursor: Optional id of the last context of the previous page
 
-        return contexts
+        Returns:
+            List of context summaries
+        """
+        return [
+            ContextSummary(
+                context_id=context_id,
+                task_count=len(self.contexts[context_id]),
+                created_at=self._context_order.created_at(context_id),
+            )
+            for context_id in self._context_order.page(length, cursor=cursor)
+        ]
 
     async def clear_context(self, context_id: UUID) -> None:
         """Clear all tasks associated with a specific context.
@@ -466,13 +751,16 @@ class InMemoryStorage(Storage[dict[str, Any]]):
         # Remove all tasks associated with this context
         for task_id in task_ids:
             if task_id in self.tasks:
-                del self.tasks[task_id]
+                task = self.tasks.pop(task_id)
+                self._task_order.discard(task_id)
+                self._count_transition(task["status"]["state"], None)
             # Also clear feedback for these tasks
             if task_id in self.task_feedback:
                 del self.task_feedback[task_id]
 
         # Remove the context itself
         del self.contexts[context_id]
+        self._context_order.discard(context_id)
 
         logger.info(f"Cleared context {context_id}: removed {len(task_ids)} tasks")
 
@@ -485,6 +773,11 @@ class InMemoryStorage(Storage[dict[str, Any]]):
         self.contexts.clear()
         self.task_feedback.clear()
         self._webhook_configs.clear()
+        self._webhook_outbox.clear()
+        self._webhook_leases.clear()
+        self._task_order.clear()
+        self._context_order.clear()
+        self._state_counts.clear()
 
     async def close(self) -> None:
         """Safely close and cleanup resources."""
@@ -590,3 +883,107 @@ class InMemoryStorage(Storage[dict[str, Any]]):
             Dictionary mapping task IDs to their webhook configurations
         """
         return dict(self._webhook_configs)
+
+    # -------------------------------------------------------------------------
+    # Webhook Outbox Operations
+    # -------------------------------------------------------------------------
+
+    async def save_webhook_event(
+        self,
+        event_id: UUID,
+        task_id: UUID,
+        config: PushNotificationConfig,
+        event: dict[str, Any],
+        owner: str | None = None,
+        lease_seconds: float = 0.0,
+    ) -> None:
+        """Record a push notification event before it is delivered.
+
+        Args:
+            event_id: Event identifier (the payload's event_id)
+            task_id: Task the event is about
+            config: Webhook the event is addressed to
+            event: Notification payload
+            owner: Replica delivering the event itself, if any
+            lease_seconds: How long other replicas must not claim the event
+
+        Raises:
+            TypeError: If event_id or task_id is not UUID
+        """
+        event_id = validate_uuid_type(event_id, "event_id")
+        task_id = validate_uuid_type(task_id, "task_id")
+
+        if event_id in self._webhook_outbox:
+            return
+        self._webhook_outbox[event_id] = {
+            "event_id": event_id,
+            "task_id": task_id,
+            "config": config,
+            "event": event,
+        }
+        self._webhook_leases[event_id] = (owner, time.monotonic() + lease_seconds)
+
+    async def delete_webhook_events(self, event_ids: list[UUID]) -> None:
+        """Remove delivered (or abandoned) events from the outbox.
+
+        Args:
+            event_ids: Events to remove
+        """
+        for event_id in event_ids:
+            self._webhook_outbox.pop(event_id, None)
+            self._webhook_leases.pop(event_id, None)
+
+    async def claim_webhook_events(
+        self, owner: str, limit: int, lease_seconds: float
+    ) -> list[dict[str, Any]]:
+        """Claim undelivered events whose lease has run out, oldest first.
+
+        Args:
+            owner: Replica claiming the events
+            limit: Maximum number of events to claim
+            lease_seconds: Seconds until the events may be claimed again
+
+        Returns:
+            List of dicts with event_id, task_id, config and event keys
+        """
+        now = time.monotonic()
+        claimed = []
+        for event_id, event in self._webhook_outbox.items():
+            if len(claimed) >= limit:
+                break
+            if self._webhook_leases[event_id][1] <= now:
+                self._webhook_leases[event_id] = (owner, now + lease_seconds)
+                claimed.append(event)
+        return claimed
+
+    async def renew_webhook_events(
+        self, owner: str, event_ids: list[UUID], lease_seconds: float
+    ) -> None:
+        """Extend the lease of events still held by ``owner``.
+
+        Args:
+            owner: Replica holding the events
+            event_ids: Events to renew; those claimed by others are skipped
+            lease_seconds: Seconds until the events may be claimed again
+        """
+        visible_at = time.monotonic() + lease_seconds
+        for event_id in event_ids:
+            lease = self._webhook_leases.get(event_id)
+            if lease is not None and lease[0] == owner:
+                self._webhook_leases[event_id] = (owner, visible_at)
+
+    async def load_webhook_events(
+        self, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Load undelivered events, oldest first.
+
+        Args:
+            limit: Optional maximum number of events to load
+
+        Returns:
+            List of dicts with event_id, task_id, config and event keys
+        """
+        events = list(self._webhook_outbox.values())
+        if limit is not None and limit > 0:
+            events = events[:limit]
+        return events
@@ -25,21 +25,39 @@ Features:
 
 from __future__ import annotations as _annotations
 
+import asyncio
+import contextlib
+from datetime import timedelta
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import delete, func, select, update, cast
+from sqlalchemy import (
+    String,
+    cast,
+    delete,
+    exists,
+    func,
+    literal,
+    literal_column,
+    select,
+    true,
+    tuple_,
+    union_all,
+    update,
+)
 from sqlalchemy.dialects.postgresql import insert, JSON
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from bindu.common.protocol.types import (
     Artifact,
+    ContextSummary,
     Message,
     PushNotificationConfig,
     Task,
     TaskState,
     TaskStatus,
+    TaskSummary,
 )
 from bindu.settings import app_settings
 from bindu.utils.logging import get_logger
@@ -57,8 +75,11 @@ from .helpers.db_operations import get_current_utc_timestamp, prepare_jsonb_valu
 from .schema import (
     contexts_table,
     task_feedback_table,
+    task_messages_table,
+    task_state_counts_table,
     tasks_table,
     webhook_configs_table,
+    webhook_outbox_table,
 )
 
 logger = get_logger("bindu.server.storage.postgres_storage")
@@ -73,13 +94,21 @@ TERMINAL_STATE_ERROR_TEMPLATE = (
 )
 
 
+def _lease_end(lease_seconds: float):
+    """Return the SQL time at which a lease taken now runs out."""
+    return func.now() + timedelta(seconds=lease_seconds)
+
+
 class PostgresStorage(Storage[dict[str, Any]]):
     """PostgreSQL storage implementation using SQLAlchemy imperative mapping.
 
     Storage Structure:
-    - tasks_table: All tasks with JSONB history and artifacts
+    - tasks_table: All tasks with JSONB artifacts
+    - task_messages_table: Append-only task message history
+    - task_state_counts_table: Per-state task counters kept by triggers
     - contexts_table: Context metadata and message history
     - task_feedback_table: Optional feedback storage
+    - webhook_outbox_table: Push notification events awaiting delivery
 
     Uses protocol TypedDicts directly - no ORM model classes needed.
 
@@ -130,6 +159,7 @@ class PostgresStorage(Storage[dict[str, Any]]):
 
         self._engine = None
         self._session_factory = None
+        self._state_counts_reconciler: asyncio.Task[None] | None = None
         self.did = did
         self.schema_name: str | None = None
 
@@ -205,12 +235,24 @@ class PostgresStorage(Storage[dict[str, Any]]):
                 + (f" using schema '{self.schema_name}'" if self.schema_name else "")
             )
 
+            interval = app_settings.storage.postgres_state_counts_reconcile_interval
+            if interval > 0:
+                self._state_counts_reconciler = asyncio.create_task(
+                    self._reconcile_state_counts_periodically(interval)
+                )
+
         except (SQLAlchemyError, OSError, ConnectionError, Exception) as e:
             logger.error(f"Failed to connect to PostgreSQL: {e}")
             raise ConnectionError(f"Failed to connect to PostgreSQL: {e}") from e
 
     async def close(self) -> None:
         """Close SQLAlchemy engine and connection pool."""
+        if self._state_counts_reconciler is not None:
+            self._state_counts_reconciler.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._state_counts_reconciler
+            self._state_counts_reconciler = None
+
         if self._engine:
             await self._engine.dispose()
             logger.info("PostgreSQL connection pool closed")
@@ -269,11 +311,12 @@ class PostgresStorage(Storage[dict[str, Any]]):
             **kwargs,
         )
 
-    def _row_to_task(self, row) -> Task:
+    def _row_to_task(self, row, history: list[Message] | None = None) -> Task:
         """Convert database row to Task protocol type.
 
         Args:
             row: SQLAlchemy Row object
+            history: Task messages, loaded from task_messages
 
         Returns:
             Task TypedDict from protocol
@@ -285,11 +328,61 @@ class PostgresStorage(Storage[dict[str, Any]]):
             status=TaskStatus(
                 state=row.state, timestamp=row.state_timestamp.isoformat()
             ),
-            history=row.history or [],
+            history=history or [],
             artifacts=row.artifacts or [],
             metadata=row.metadata or {},
         )
 
+    @staticmethod
+    def _task_columns():
+        """Task columns without the legacy ``history`` column."""
+        return tuple(column for column in tasks_table.c if column.name != "history")
+
+    async def _load_histories(
+        self, session: AsyncSession, task_ids: list[UUID]
+    ) -> dict[UUID, list[Message]]:
+        """Load the full message history of several tasks in one query."""
+        histories: dict[UUID, list[Message]] = {task_id: [] for task_id in task_ids}
+        if not task_ids:
+            return histories
+
+        stmt = (
+            select(task_messages_table.c.task_id, task_messages_table.c.message)
+            .where(task_messages_table.c.task_id.in_(task_ids))
+            .order_by(task_messages_table.c.seq)
+        )
+        result = await session.execute(stmt)
+        for task_id, message in result:
+            histories[task_id].append(message)
+        return histories
+
+    @staticmethod
+    def _recent_history_statement(task_id: UUID, history_length: int | None = None):
+        """Select a task's messages, newest first.
+
+        With history_length, only the last N messages are read, walking the
+        (task_id, seq) index backwards instead of fetching the whole history.
+        """
+        stmt = (
+            select(task_messages_table.c.message)
+            .where(task_messages_table.c.task_id == task_id)
+            .order_by(task_messages_table.c.seq.desc())
+        )
+        if history_length is not None and history_length > 0:
+            stmt = stmt.limit(history_length)
+        return stmt
+
+    async def _load_history(
+        self, session: AsyncSession, task_id: UUID, history_length: int | None = None
+    ) -> list[Message]:
+        """Load a task's messages in chronological order."""
+        result = await session.execute(
+            self._recent_history_statement(task_id, history_length)
+        )
+        history = list(result.scalars())
+        history.reverse()
+        return history
+
     # -------------------------------------------------------------------------
     # Task Operations
     # -------------------------------------------------------------------------
@@ -315,20 +408,57 @@ class PostgresStorage(Storage[dict[str, Any]]):
 
         async def _load():
             async with self._get_session_with_schema() as session:
-                stmt = select(tasks_table).where(tasks_table.c.id == task_id)
+                stmt = select(*self._task_columns()).where(tasks_table.c.id == task_id)
                 result = await session.execute(stmt)
                 row = result.first()
 
                 if row is None:
                     return None
 
-                task = self._row_to_task(row)
+                history = await self._load_history(session, task_id, history_length)
+                return self._row_to_task(row, history)
+
+        return await self._retry_on_connection_error(_load)
+
+    async def load_tasks(
+        self, task_ids: list[UUID], history_length: int | None = None
+    ) -> list[Task]:
+        """Load several tasks and their histories in two queries.
+
+        Args:
+            task_ids: Tasks to load
+            history_length: Optional limit on each task's message history length
+
+        Returns:
+            Tasks found, in the order of task_ids (missing ids are skipped)
+
+        Raises:
+            TypeError: If any task_id is not UUID
+        """
+        task_ids = [validate_uuid_type(task_id, "task_id") for task_id in task_ids]
+        if not task_ids:
+            return []
 
-                # Limit history if requested
-                if history_length is not None and history_length > 0:
-                    task["history"] = task["history"][-history_length:]
+        self._ensure_connected()
 
-                return task
+        async def _load():
+            async with self._get_session_with_schema() as session:
+                stmt = select(*self._task_columns()).where(
+                    tasks_table.c.id.in_(task_ids)
+                )
+                rows = {row.id: row for row in await session.execute(stmt)}
+
+                histories = await self._load_histories(session, list(rows))
+                tasks: list[Task] = []
+                for task_id in task_ids:
+                    row = rows.get(task_id)
+                    if row is None:
+                        continue
+                    history = histories[task_id]
+                    if history_length is not None and history_length > 0:
+                        history = history[-history_length:]
+                    tasks.append(self._row_to_task(row, history))
+                return tasks
 
         return await self._retry_on_connection_error(_load)
 
@@ -340,6 +470,10 @@ class PostgresStorage(Storage[dict[str, Any]]):
         - If task exists and is in terminal state: Raise error (immutable)
         - If task doesn't exist: Create new task
 
+        Creating or continuing the task and appending the message run as one
+        statement (see _submit_task_statement). A continued task's history
+        is then read from task_messages.
+
         Args:
             context_id: Context to associate the task with
             message: Initial message containing task request
@@ -362,75 +496,98 @@ class PostgresStorage(Storage[dict[str, Any]]):
         async def _submit():
             async with self._get_session_with_schema() as session:
                 async with session.begin():
-                    # Check if task exists
-                    stmt = select(tasks_table).where(tasks_table.c.id == task_id)
+                    stmt = self._submit_task_statement(task_id, context_id, message)
                     result = await session.execute(stmt)
-                    existing = result.first()
-
-                    if existing:
-                        # Task exists - check if mutable
-                        current_state = existing.state
-
-                        if current_state in app_settings.agent.terminal_states:
-                            raise ValueError(
-                                TERMINAL_STATE_ERROR_TEMPLATE.format(
-                                    task_id=task_id, state=current_state
-                                )
+                    row = result.first()
+
+                    if row is None:
+                        # The upsert's WHERE clause rejected a terminal task;
+                        # only this (rare) path pays for a second query.
+                        result = await session.execute(
+                            select(tasks_table.c.state).where(
+                                tasks_table.c.id == task_id
                             )
-
-                        logger.info(
-                            f"Continuing existing task {task_id} from state '{current_state}'"
                         )
-
-                        stmt = (
-                            update(tasks_table)
-                            .where(tasks_table.c.id == task_id)
-                            .values(
-                                history=func.jsonb_concat(
-                                    tasks_table.c.history,
-                                    prepare_jsonb_value([message]),
-                                ),
-                                state="submitted",
-                                state_timestamp=get_current_utc_timestamp(),
-                                updated_at=get_current_utc_timestamp(),
+                        raise ValueError(
+                            TERMINAL_STATE_ERROR_TEMPLATE.format(
+                                task_id=task_id, state=result.scalar_one()
                             )
-                            .returning(tasks_table)
                         )
-                        result = await session.execute(stmt)
-                        updated_row = result.first()
 
-                        return self._row_to_task(updated_row)
+                    if row.inserted:
+                        return self._row_to_task(row, [message])
 
-                    # Ensure context exists BEFORE creating task (foreign key constraint)
-                    stmt = insert(contexts_table).values(
-                        id=context_id,
-                        context_data={},
-                        message_history=[],
-                    )
-                    stmt = stmt.on_conflict_do_nothing(index_elements=["id"])
-                    await session.execute(stmt)
+                    logger.info(f"Continuing existing task {task_id}")
+                    history = await self._load_history(session, task_id)
+                    return self._row_to_task(row, history)
 
-                    now = get_current_utc_timestamp()
-                    stmt = (
-                        insert(tasks_table)
-                        .values(
-                            id=task_id,
-                            context_id=context_id,
-                            kind="task",
-                            state="submitted",
-                            state_timestamp=now,
-                            history=prepare_jsonb_value([message]),
-                            artifacts=[],
-                            metadata={},
-                        )
-                        .returning(tasks_table)
-                    )
-                    result = await session.execute(stmt)
-                    new_row = result.first()
+        return await self._retry_on_connection_error(_submit)
 
-                    return self._row_to_task(new_row)
+    def _submit_task_statement(self, task_id: UUID, context_id: UUID, message: Message):
+        """Build the statement that creates or continues a task.
 
-        return await self._retry_on_connection_error(_submit)
+        - A data-modifying CTE creates the context row (required by the
+          foreign key) only when the task is new; continued tasks keep theirs.
+        - The task INSERT falls back to resetting the state to 'submitted'
+          when the task exists. The update is guarded by a WHERE clause on
+          terminal states, so a terminal task is left untouched and no row
+          is returned.
+        - The message is appended to task_messages only for a returned task.
+        """
+        now = get_current_utc_timestamp()
+
+        ensure_context = (
+            insert(contexts_table)
+            .from_select(
+                ["id"],
+                select(literal(context_id, contexts_table.c.id.type)).where(
+                    ~exists().where(tasks_table.c.id == task_id)
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=["id"])
+            .cte("ensure_context")
+        )
+
+        upserted = (
+            insert(tasks_table)
+            .values(
+                id=task_id,
+                context_id=context_id,
+                kind="task",
+                state="submitted",
+                state_timestamp=now,
+                artifacts=[],
+                metadata={},
+            )
+            .on_conflict_do_update(
+                index_elements=[tasks_table.c.id],
+                set_={
+                    "state": "submitted",
+                    "state_timestamp": now,
+                    "updated_at": now,
+                },
+                where=tasks_table.c.state.not_in(
+                    list(app_settings.agent.terminal_states)
+                ),
+            )
+            .returning(
+                *self._task_columns(),
+                # xmax is 0 for freshly inserted rows, set for upserted ones
+                literal_column("xmax = 0").label("inserted"),
+            )
+            .cte("upserted")
+        )
+
+        appended = (
+            insert(task_messages_table)
+            .from_select(
+                ["task_id", "message"],
+                select(upserted.c.id, prepare_jsonb_value(message)),
+            )
+            .cte("appended")
+        )
+
+        return select(upserted).add_cte(ensure_context).add_cte(appended)
 
     async def update_task(
         self,
@@ -439,15 +596,22 @@ class PostgresStorage(Storage[dict[str, Any]]):
         new_artifacts: list[Artifact] | None = None,
         new_messages: list[Message] | None = None,
         metadata: dict[str, Any] | None = None,
+        return_full: bool = True,
     ) -> Task:
         """Update task state and append new content using SQLAlchemy.
 
+        The update and the message append run as one statement. With
+        ``return_full=False`` only the status columns are returned, so state
+        transitions do not read the history, artifacts and metadata back.
+
         Args:
             task_id: Task to update
             state: New task state
             new_artifacts: Optional artifacts to append
             new_messages: Optional messages to append to history
             metadata: Optional metadata to update/merge
+            return_full: If False, return the task without history, artifacts
+                and metadata
 
         Returns:
             Updated task object
@@ -456,74 +620,289 @@ class PostgresStorage(Storage[dict[str, Any]]):
             TypeError: If task_id is not UUID
             KeyError: If task not found
         """
+        task = await self._execute_update(
+            task_id,
+            state,
+            new_artifacts=new_artifacts,
+            new_messages=new_messages,
+            metadata=metadata,
+            return_full=return_full,
+        )
+        if task is None:
+            raise KeyError(f"Task {task_id} not found")
+        return task
+
+    async def update_task_if_active(
+        self,
+        task_id: UUID,
+        state: TaskState,
+        new_artifacts: list[Artifact] | None = None,
+        new_messages: list[Message] | None = None,
+        metadata: dict[str, Any] | None = None,
+        return_full: bool = True,
+    ) -> Task | None:
+        """Update a task unless it already reached a terminal state.
+
+        The terminal states are excluded in the UPDATE's WHERE clause, so the
+        check holds under concurrent writers from any replica.
+
+        Args:
+            task_id: Task to update
+            state: New task state
+            new_artifacts: Optional artifacts to append
+            new_messages: Optional messages to append to history
+            metadata: Optional metadata to update/merge
+            return_full: If False, return the task without history, artifacts
+                and metadata
+
+        Returns:
+            Updated task object, or None if the task is missing or terminal
+
+        Raises:
+            TypeError: If task_id is not UUID
+        """
+        return await self._execute_update(
+            task_id,
+            state,
+            new_artifacts=new_artifacts,
+            new_messages=new_messages,
+            metadata=metadata,
+            return_full=return_full,
+            only_if_active=True,
+        )
+
+    async def _execute_update(
+        self,
+        task_id: UUID,
+        state: TaskState,
+        new_artifacts: list[Artifact] | None = None,
+        new_messages: list[Message] | None = None,
+        metadata: dict[str, Any] | None = None,
+        return_full: bool = True,
+        only_if_active: bool = False,
+    ) -> Task | None:
+        """Run the update statement; None if no task row was updated."""
         task_id = validate_uuid_type(task_id, "task_id")
 
+        if new_messages:
+            for message in new_messages:
+                if not isinstance(message, dict):
+                    raise TypeError(
+                        f"Message must be dict, got {type(message).__name__}"
+                    )
+                normalize_message_uuids(message, task_id=task_id)
+
         self._ensure_connected()
 
         async def _update():
             async with self._get_session_with_schema() as session:
                 async with session.begin():
-                    # Check if task exists
-                    stmt = select(tasks_table).where(tasks_table.c.id == task_id)
+                    stmt = self._update_task_statement(
+                        task_id,
+                        state,
+                        new_artifacts=new_artifacts,
+                        new_messages=new_messages,
+                        metadata=metadata,
+                        return_full=return_full,
+                        only_if_active=only_if_active,
+                    )
                     result = await session.execute(stmt)
-                    task_row = result.first()
+                    updated_row = result.first()
 
-                    if task_row is None:
-                        raise KeyError(f"Task {task_id} not found")
+                    if updated_row is None:
+                        return None
 
-                    now = get_current_utc_timestamp()
-                    update_values: dict[str, Any] = {
-                        "state": state,
-                        "state_timestamp": now,
-                        "updated_at": now,
-                    }
+                    if not return_full:
+                        return self._row_to_task_status(updated_row)
+                    history = await self._load_history(session, task_id)
+                    return self._row_to_task(updated_row, history)
 
-                    if metadata:
-                        update_values["metadata"] = func.jsonb_concat(
-                            tasks_table.c.metadata, prepare_jsonb_value(metadata)
-                        )
+        return await self._retry_on_connection_error(_update)
 
-                    if new_artifacts:
-                        update_values["artifacts"] = func.jsonb_concat(
-                            tasks_table.c.artifacts, prepare_jsonb_value(new_artifacts)
-                        )
+    def _update_task_statement(
+        self,
+        task_id: UUID,
+        state: TaskState,
+        new_artifacts: list[Artifact] | None = None,
+        new_messages: list[Message] | None = None,
+        metadata: dict[str, Any] | None = None,
+        return_full: bool = True,
+        only_if_active: bool = False,
+    ):
+        """Build the statement for update_task.
 
-                    if new_messages:
-                        for message in new_messages:
-                            if not isinstance(message, dict):
-                                raise TypeError(
-                                    f"Message must be dict, got {type(message).__name__}"
-                                )
-                            normalize_message_uuids(
-                                message, task_id=task_id, context_id=task_row.context_id
-                            )
+        The task UPDATE runs in a CTE; new messages are inserted into
+        task_messages from its result, with the task's stored context_id set
+        in SQL, so a missing task appends nothing. With ``only_if_active``
+        tasks in a terminal state are not matched either.
+        """
+        now = get_current_utc_timestamp()
+        update_values: dict[str, Any] = {
+            "state": state,
+            "state_timestamp": now,
+            "updated_at": now,
+        }
+
+        if metadata:
+            update_values["metadata"] = func.jsonb_concat(
+                tasks_table.c.metadata, prepare_jsonb_value(metadata)
+            )
 
-                        update_values["history"] = func.jsonb_concat(
-                            tasks_table.c.history, prepare_jsonb_value(new_messages)
-                        )
+        if new_artifacts:
+            update_values["artifacts"] = func.jsonb_concat(
+                tasks_table.c.artifacts, prepare_jsonb_value(new_artifacts)
+            )
 
-                    # Execute update
-                    stmt = (
-                        update(tasks_table)
-                        .where(tasks_table.c.id == task_id)
-                        .values(**update_values)
-                        .returning(tasks_table)
+        returning = self._task_columns() if return_full else self._task_status_columns()
+        condition = tasks_table.c.id == task_id
+        if only_if_active:
+            condition = condition & tasks_table.c.state.not_in(
+                list(app_settings.agent.terminal_states)
+            )
+        updated = (
+            update(tasks_table)
+            .where(condition)
+            .values(**update_values)
+            .returning(*returning)
+            .cte("updated")
+        )
+        stmt = select(updated)
+
+        if new_messages:
+            # Insert in list order so seq follows the order of new_messages
+            elements = (
+                func.jsonb_array_elements(prepare_jsonb_value(new_messages))
+                .table_valued("value", with_ordinality="ord")
+                .render_derived(name="new_messages")
+            )
+            stored_context_id = func.jsonb_build_object(
+                literal_column("'context_id'"), cast(updated.c.context_id, String)
+            )
+            appended = (
+                insert(task_messages_table)
+                .from_select(
+                    ["task_id", "message"],
+                    select(
+                        updated.c.id,
+                        func.jsonb_concat(elements.c.value, stored_context_id),
                     )
-                    result = await session.execute(stmt)
-                    updated_row = result.first()
+                    .select_from(updated.join(elements, true()))
+                    .order_by(elements.c.ord),
+                )
+                .cte("appended")
+            )
+            stmt = stmt.add_cte(appended)
+
+        return stmt
+
+    @staticmethod
+    def _task_status_columns():
+        """Columns needed to build a task without its JSONB content."""
+        return (
+            tasks_table.c.id,
+            tasks_table.c.context_id,
+            tasks_table.c.kind,
+            tasks_table.c.state,
+            tasks_table.c.state_timestamp,
+        )
 
-                    return self._row_to_task(updated_row)
+    def _row_to_task_status(self, row) -> Task:
+        """Convert a row of _task_status_columns to a Task without content."""
+        return Task(
+            id=row.id,
+            context_id=row.context_id,
+            kind=row.kind,
+            status=TaskStatus(
+                state=row.state, timestamp=row.state_timestamp.isoformat()
+            ),
+        )
 
-        return await self._retry_on_connection_error(_update)
+    @staticmethod
+    def _newest_first(stmt, table, cursor: UUID | None = None):
+        """Order a listing newest first, seeking past the cursor row.
+
+        Keyset pagination on (created_at, id): the cursor row's key is looked
+        up by primary key and the page continues strictly below it, so deep
+        pages cost the same as the first one. An unknown cursor matches
+        nothing and yields an empty page.
+        """
+        if cursor is not None:
+            anchor = (
+                select(table.c.created_at, table.c.id)
+                .where(table.c.id == cursor)
+                .subquery("anchor")
+            )
+            stmt = stmt.join(
+                anchor,
+                tuple_(table.c.created_at, table.c.id)
+                < tuple_(anchor.c.created_at, anchor.c.id),
+            )
+        return stmt.order_by(table.c.created_at.desc(), table.c.id.desc())
+
+    @staticmethod
+    def _paginate(stmt, length: int | None = None, offset: int = 0):
+        if length is not None and length > 0:
+            stmt = stmt.limit(length)
+        if offset > 0:
+            stmt = stmt.offset(offset)
+        return stmt
+
+    def _list_tasks_statement(
+        self, length: int | None = None, offset: int = 0, cursor: UUID | None = None
+    ):
+        return self._paginate(
+            self._newest_first(select(*self._task_columns()), tasks_table, cursor),
+            length,
+            offset,
+        )
+
+    @staticmethod
+    def _task_summary_columns():
+        return (
+            tasks_table.c.id,
+            tasks_table.c.context_id,
+            tasks_table.c.kind,
+            tasks_table.c.state,
+            tasks_table.c.state_timestamp,
+            tasks_table.c.created_at,
+            tasks_table.c.updated_at,
+        )
+
+    @staticmethod
+    def _row_to_task_summary(row) -> TaskSummary:
+        return TaskSummary(
+            id=row.id,
+            context_id=row.context_id,
+            kind=row.kind,
+            status=TaskStatus(
+                state=row.state, timestamp=row.state_timestamp.isoformat()
+            ),
+            created_at=row.created_at.isoformat(),
+            updated_at=row.updated_at.isoformat(),
+        )
+
+    def _list_task_summaries_statement(
+        self, length: int | None = None, cursor: UUID | None = None
+    ):
+        stmt = select(*self._task_summary_columns())
+        return self._paginate(self._newest_first(stmt, tasks_table, cursor), length)
+
+    def _context_task_summaries_statement(self, context_id: UUID):
+        return (
+            select(*self._task_summary_columns())
+            .where(tasks_table.c.context_id == context_id)
+            .order_by(tasks_table.c.created_at.asc(), tasks_table.c.id.asc())
+        )
 
     async def list_tasks(
-        self, length: int | None = None, offset: int = 0
+        self, length: int | None = None, offset: int = 0, cursor: UUID | None = None
     ) -> list[Task]:
-        """List all tasks using SQLAlchemy.
+        """List tasks using SQLAlchemy, newest first.
 
         Args:
             length: Optional limit on number of tasks to return
             offset: Optional offset for pagination
+            cursor: Optional id of the last task of the previous page
 
         Returns:
             List of tasks
@@ -532,17 +911,38 @@ class PostgresStorage(Storage[dict[str, Any]]):
 
         async def _list():
             async with self._get_session_with_schema() as session:
-                stmt = select(tasks_table).order_by(tasks_table.c.created_at.desc())
-
-                if length is not None:
-                    stmt = stmt.limit(length)
-                if offset > 0:
-                    stmt = stmt.offset(offset)
+                stmt = self._list_tasks_statement(length, offset, cursor)
 
                 result = await session.execute(stmt)
                 rows = result.fetchall()
 
-                return [self._row_to_task(row) for row in rows]
+                histories = await self._load_histories(
+                    session, [row.id for row in rows]
+                )
+                return [self._row_to_task(row, histories[row.id]) for row in rows]
+
+        return await self._retry_on_connection_error(_list)
+
+    async def list_task_summaries(
+        self, length: int | None = None, cursor: UUID | None = None
+    ) -> list[TaskSummary]:
+        """List task summaries, newest first, without history or artifacts.
+
+        Args:
+            length: Optional limit on number of summaries to return
+            cursor: Optional id of the last task of the previous page
+
+        Returns:
+            List of task summaries
+        """
+        self._ensure_connected()
+
+        async def _list():
+            async with self._get_session_with_schema() as session:
+                result = await session.execute(
+                    self._list_task_summaries_statement(length, cursor)
+                )
+                return [self._row_to_task_summary(row) for row in result]
 
         return await self._retry_on_connection_error(_list)
 
@@ -569,6 +969,118 @@ class PostgresStorage(Storage[dict[str, Any]]):
 
         return await self._retry_on_connection_error(_count)
 
+    async def count_tasks_by_state(self) -> dict[str, int]:
+        """Count tasks in every state from the trigger-maintained counters.
+
+        Reads at most one row per state and shard, whatever the size of the
+        tasks table. Drift is corrected in the background, see
+        ``reconcile_task_state_counts``.
+
+        Returns:
+            Mapping of state to task count, for states with at least one task
+        """
+        self._ensure_connected()
+
+        async def _count():
+            async with self._get_session_with_schema() as session:
+                result = await session.execute(self._state_counts_statement())
+                return {row.state: row.count for row in result if row.count > 0}
+
+        return await self._retry_on_connection_error(_count)
+
+    @staticmethod
+    def _state_counts_statement():
+        return select(
+            task_state_counts_table.c.state,
+            func.sum(task_state_counts_table.c.task_count).label("count"),
+        ).group_by(task_state_counts_table.c.state)
+
+    async def reconcile_task_state_counts(self) -> None:
+        """Recount the per-state task counters from the tasks table.
+
+        Corrects drift from writes made while the triggers were missing
+        (e.g. a restored dump). Runs as one statement, so the tasks and the
+        counters are read in the same snapshot and only the difference is
+        added to the counters. Task writes are not blocked while the tasks
+        table is scanned.
+        """
+        self._ensure_connected()
+
+        async def _reconcile():
+            async with self._get_session_with_schema() as session:
+                async with session.begin():
+                    await session.execute(self._reconcile_state_counts_statement())
+
+        await self._retry_on_connection_error(_reconcile)
+
+    @staticmethod
+    def _reconcile_state_counts_statement():
+        actual = select(tasks_table.c.state, func.count().label("change")).group_by(
+            tasks_table.c.state
+        )
+        counted = select(
+            task_state_counts_table.c.state,
+            (-func.sum(task_state_counts_table.c.task_count)).label("change"),
+        ).group_by(task_state_counts_table.c.state)
+        drift = union_all(actual, counted).subquery("drift")
+
+        stmt = insert(task_state_counts_table).from_select(
+            ["state", "shard", "task_count"],
+            select(drift.c.state, literal(0), func.sum(drift.c.change))
+            .group_by(drift.c.state)
+            .having(func.sum(drift.c.change) != 0)
+            # Same lock order as the triggers
+            .order_by(drift.c.state),
+        )
+        return stmt.on_conflict_do_update(
+            index_elements=["state", "shard"],
+            set_={
+                "task_count": task_state_counts_table.c.task_count
+                + stmt.excluded.task_count
+            },
+        )
+
+    async def _reconcile_state_counts_periodically(self, interval: float) -> None:
+        """Reconcile the counters every interval on one elected replica.
+
+        The replica holding the session advisory lock keeps its connection
+        and reconciles; the others retry the lock every interval and take
+        over once the holder's connection closes.
+        """
+        assert self._engine is not None
+        while True:
+            try:
+                async with self._engine.connect() as conn:
+                    elected = await conn.scalar(self._reconcile_lock_statement())
+                    await conn.commit()
+                    try:
+                        while elected:
+                            async with conn.begin():
+                                await conn.execute(
+                                    self._reconcile_state_counts_statement()
+                                )
+                            logger.debug("Reconciled per-state task counters")
+                            await asyncio.sleep(interval)
+                    finally:
+                        if elected:
+                            # Closing the session is what releases the lock;
+                            # it must not go back to the pool holding it
+                            with contextlib.suppress(Exception):
+                                await conn.invalidate()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Failed to reconcile per-state task counters: {e}")
+            await asyncio.sleep(interval)
+
+    @staticmethod
+    def _reconcile_lock_statement():
+        # One lock per schema, so each DID's counters get their own replica
+        key = func.hashtext(
+            func.concat("bindu:task_state_counts:", func.current_schema())
+        )
+        return select(func.pg_try_advisory_lock(key))
+
     async def list_tasks_by_context(
         self, context_id: UUID, length: int | None = None, offset: int = 0
     ) -> list[Task]:
@@ -592,7 +1104,7 @@ class PostgresStorage(Storage[dict[str, Any]]):
         async def _list():
             async with self._get_session_with_schema() as session:
                 stmt = (
-                    select(tasks_table)
+                    select(*self._task_columns())
                     .where(tasks_table.c.context_id == context_id)
                     .order_by(tasks_table.c.created_at.asc())
                 )
@@ -605,7 +1117,37 @@ class PostgresStorage(Storage[dict[str, Any]]):
                 result = await session.execute(stmt)
                 rows = result.fetchall()
 
-                return [self._row_to_task(row) for row in rows]
+                histories = await self._load_histories(
+                    session, [row.id for row in rows]
+                )
+                return [self._row_to_task(row, histories[row.id]) for row in rows]
+
+        return await self._retry_on_connection_error(_list)
+
+    async def list_task_summaries_by_context(
+        self, context_id: UUID
+    ) -> list[TaskSummary]:
+        """List summaries of a context's tasks, oldest first.
+
+        Args:
+            context_id: Context to filter tasks by
+
+        Returns:
+            List of task summaries in creation order
+
+        Raises:
+            TypeError: If context_id is not UUID
+        """
+        context_id = validate_uuid_type(context_id, "context_id")
+
+        self._ensure_connected()
+
+        async def _list():
+            async with self._get_session_with_schema() as session:
+                result = await session.execute(
+                    self._context_task_summaries_statement(context_id)
+                )
+                return [self._row_to_task_summary(row) for row in result]
 
         return await self._retry_on_connection_error(_list)
 
@@ -719,14 +1261,62 @@ class PostgresStorage(Storage[dict[str, Any]]):
 
         await self._retry_on_connection_error(_append)
 
+    def _list_contexts_statement(
+        self, length: int | None = None, offset: int = 0, cursor: UUID | None = None
+    ):
+        # Pick the page first so task ids are aggregated for its contexts only
+        page = self._paginate(
+            self._newest_first(
+                select(contexts_table.c.id, contexts_table.c.created_at),
+                contexts_table,
+                cursor,
+            ),
+            length,
+            offset,
+        ).subquery("page")
+
+        return (
+            select(
+                page.c.id.label("context_id"),
+                func.count(tasks_table.c.id).label("task_count"),
+                func.coalesce(
+                    func.json_agg(tasks_table.c.id).filter(
+                        tasks_table.c.id.isnot(None)
+                    ),
+                    cast("[]", JSON),
+                ).label("task_ids"),
+            )
+            .select_from(
+                page.outerjoin(tasks_table, page.c.id == tasks_table.c.context_id)
+            )
+            .group_by(page.c.id, page.c.created_at)
+            .order_by(page.c.created_at.desc(), page.c.id.desc())
+        )
+
+    def _list_context_summaries_statement(
+        self, length: int | None = None, cursor: UUID | None = None
+    ):
+        task_count = (
+            select(func.count())
+            .where(tasks_table.c.context_id == contexts_table.c.id)
+            .scalar_subquery()
+        )
+        stmt = select(
+            contexts_table.c.id.label("context_id"),
+            task_count.label("task_count"),
+            contexts_table.c.created_at,
+        )
+        return self._paginate(self._newest_first(stmt, contexts_table, cursor), length)
+
     async def list_contexts(
-        self, length: int | None = None, offset: int = 0
+        self, length: int | None = None, offset: int = 0, cursor: UUID | None = None
     ) -> list[dict[str, Any]]:
-        """List all contexts using SQLAlchemy.
+        """List contexts using SQLAlchemy, newest first.
 
         Args:
             length: Optional maximum number of contexts to return
             offset: Optional offset for pagination
+            cursor: Optional id of the last context of the previous page
 
         Returns:
             List of context dicts
@@ -735,29 +1325,7 @@ class PostgresStorage(Storage[dict[str, Any]]):
 
         async def _list():
             async with self._get_session_with_schema() as session:
-                # Query contexts with task counts
-                stmt = (
-                    select(
-                        contexts_table.c.id.label("context_id"),
-                        func.count(tasks_table.c.id).label("task_count"),
-                        func.coalesce(
-                            func.json_agg(tasks_table.c.id).filter(
-                                tasks_table.c.id.isnot(None)
-                            ),
-                            cast("[]", JSON),
-                        ).label("task_ids"),
-                    )
-                    .outerjoin(
-                        tasks_table, contexts_table.c.id == tasks_table.c.context_id
-                    )
-                    .group_by(contexts_table.c.id)
-                    .order_by(contexts_table.c.created_at.desc())
-                )
-
-                if length is not None:
-                    stmt = stmt.limit(length)
-                if offset > 0:
-                    stmt = stmt.offset(offset)
+                stmt = self._list_contexts_statement(length, offset, cursor)
 
                 result = await session.execute(stmt)
                 rows = result.fetchall()
@@ -773,6 +1341,39 @@ class PostgresStorage(Storage[dict[str, Any]]):
 
         return await self._retry_on_connection_error(_list)
 
+    async def list_context_summaries(
+        self, length: int | None = None, cursor: UUID | None = None
+    ) -> list[ContextSummary]:
+        """List context summaries, newest first, without their task ids.
+
+        Task counts come from the tasks.context_id index, one lookup per
+        context on the page.
+
+        Args:
+            length: Optional maximum number of summaries to return
+            cursor: Optional id of the last context of the previous page
+
+        Returns:
+            List of context summaries
+        """
+        self._ensure_connected()
+
+        async def _list():
+            async with self._get_session_with_schema() as session:
+                result = await session.execute(
+                    self._list_context_summaries_statement(length, cursor)
+                )
+                return [
+                    ContextSummary(
+                        context_id=row.context_id,
+                        task_count=row.task_count,
+                        created_at=row.created_at.isoformat(),
+                    )
+                    for row in result
+                ]
+
+        return await self._retry_on_connection_error(_list)
+
     # -------------------------------------------------------------------------
     # Utility Operations
     # -------------------------------------------------------------------------
@@ -835,9 +1436,12 @@ class PostgresStorage(Storage[dict[str, Any]]):
         async def _clear():
             async with self._get_session_with_schema() as session:
                 async with session.begin():
+                    await session.execute(delete(webhook_outbox_table))
                     await session.execute(delete(webhook_configs_table))
                     await session.execute(delete(task_feedback_table))
+                    await session.execute(delete(task_messages_table))
                     await session.execute(delete(tasks_table))
+                    await session.execute(delete(task_state_counts_table))
                     await session.execute(delete(contexts_table))
                     logger.info(
                         "Cleared all tasks, contexts, feedback, and webhook configs"
@@ -1033,3 +1637,202 @@ class PostgresStorage(Storage[dict[str, Any]]):
                 return {row.task_id: row.config for row in rows}
 
         return await self._retry_on_connection_error(_load_all)
+
+    # -------------------------------------------------------------------------
+    # Webhook Outbox Operations
+    # -------------------------------------------------------------------------
+
+    async def save_webhook_event(
+        self,
+        event_id: UUID,
+        task_id: UUID,
+        config: PushNotificationConfig,
+        event: dict[str, Any],
+        owner: str | None = None,
+        lease_seconds: float = 0.0,
+    ) -> None:
+        """Record a push notification event before it is delivered.
+
+        Args:
+            event_id: Event identifier (the payload's event_id)
+            task_id: Task the event is about
+            config: Webhook the event is addressed to
+            event: Notification payload
+            owner: Replica delivering the event itself, if any
+            lease_seconds: How long other replicas must not claim the event
+
+        Raises:
+            TypeError: If event_id or task_id is not UUID
+        """
+        event_id = validate_uuid_type(event_id, "event_id")
+        task_id = validate_uuid_type(task_id, "task_id")
+
+        self._ensure_connected()
+
+        async def _save():
+            async with self._get_session_with_schema() as session:
+                async with session.begin():
+                    stmt = (
+                        insert(webhook_outbox_table)
+                        .values(
+                            event_id=event_id,
+                            task_id=task_id,
+                            config=serialize_for_jsonb(config),
+                            event=serialize_for_jsonb(event),
+                            owner=owner,
+                            visible_at=_lease_end(lease_seconds),
+                        )
+                        .on_conflict_do_nothing(index_elements=["event_id"])
+                    )
+                    await session.execute(stmt)
+
+        await self._retry_on_connection_error(_save)
+
+    async def delete_webhook_events(self, event_ids: list[UUID]) -> None:
+        """Remove delivered (or abandoned) events from the outbox.
+
+        Args:
+            event_ids: Events to remove
+        """
+        if not event_ids:
+            return
+
+        self._ensure_connected()
+
+        async def _delete():
+            async with self._get_session_with_schema() as session:
+                async with session.begin():
+                    stmt = delete(webhook_outbox_table).where(
+                        webhook_outbox_table.c.event_id.in_(event_ids)
+                    )
+                    await session.execute(stmt)
+
+        await self._retry_on_connection_error(_delete)
+
+    async def claim_webhook_events(
+        self, owner: str, limit: int, lease_seconds: float
+    ) -> list[dict[str, Any]]:
+        """Claim undelivered events whose lease has run out, oldest first.
+
+        Rows locked by a concurrent claim are skipped, so replicas claiming
+        at the same time get disjoint events.
+
+        Args:
+            owner: Replica claiming the events
+            limit: Maximum number of events to claim
+            lease_seconds: Seconds until the events may be claimed again
+
+        Returns:
+            List of dicts with event_id, task_id, config and event keys
+        """
+        self._ensure_connected()
+
+        async def _claim():
+            async with self._get_session_with_schema() as session:
+                async with session.begin():
+                    stmt = self._claim_webhook_events_statement(
+                        owner, limit, lease_seconds
+                    )
+                    rows = sorted(
+                        await session.execute(stmt), key=lambda row: row.created_at
+                    )
+
+            return [
+                {
+                    "event_id": row.event_id,
+                    "task_id": row.task_id,
+                    "config": row.config,
+                    "event": row.event,
+                }
+                for row in rows
+            ]
+
+        return await self._retry_on_connection_error(_claim)
+
+    @staticmethod
+    def _claim_webhook_events_statement(owner: str, limit: int, lease_seconds: float):
+        """Build the UPDATE leasing the oldest claimable outbox events."""
+        claimable = (
+            select(webhook_outbox_table.c.event_id)
+            .where(webhook_outbox_table.c.visible_at <= func.now())
+            .order_by(webhook_outbox_table.c.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("claimable")
+        )
+        return (
+            update(webhook_outbox_table)
+            .where(webhook_outbox_table.c.event_id.in_(select(claimable.c.event_id)))
+            .values(owner=owner, visible_at=_lease_end(lease_seconds))
+            .returning(
+                webhook_outbox_table.c.event_id,
+                webhook_outbox_table.c.task_id,
+                webhook_outbox_table.c.config,
+                webhook_outbox_table.c.event,
+                webhook_outbox_table.c.created_at,
+            )
+        )
+
+    async def renew_webhook_events(
+        self, owner: str, event_ids: list[UUID], lease_seconds: float
+    ) -> None:
+        """Extend the lease of events still held by ``owner``.
+
+        Args:
+            owner: Replica holding the events
+            event_ids: Events to renew; those claimed by others are skipped
+            lease_seconds: Seconds until the events may be claimed again
+        """
+        if not event_ids:
+            return
+
+        self._ensure_connected()
+
+        async def _renew():
+            async with self._get_session_with_schema() as session:
+                async with session.begin():
+                    stmt = (
+                        update(webhook_outbox_table)
+                        .where(
+                            webhook_outbox_table.c.event_id.in_(event_ids),
+                            webhook_outbox_table.c.owner == owner,
+                        )
+                        .values(visible_at=_lease_end(lease_seconds))
+                    )
+                    await session.execute(stmt)
+
+        await self._retry_on_connection_error(_renew)
+
+    async def load_webhook_events(
+        self, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Load undelivered events, oldest first.
+
+        Args:
+            limit: Optional maximum number of events to load
+
+        Returns:
+            List of dicts with event_id, task_id, config and event keys
+        """
+        self._ensure_connected()
+
+        async def _load():
+            async with self._get_session_with_schema() as session:
+                stmt = select(webhook_outbox_table).order_by(
+                    webhook_outbox_table.c.created_at
+                )
+                if limit is not None and limit > 0:
+                    stmt = stmt.limit(limit)
+                result = await session.execute(stmt)
+
+                return [
+                    {
+                        "event_id": row.event_id,
+                        "task_id": row.task_id,
+                        "config": row.config,
+                        "event": row.event,
+                    }
+                    for row in result
+                ]
+
+        return await self._retry_on_connection_error(_load)
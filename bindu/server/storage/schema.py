@@ -18,14 +18,18 @@ from __future__ import annotations as _annotations
 
 
 from sqlalchemy import (
+    DDL,
     TIMESTAMP,
+    BigInteger,
     Column,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     MetaData,
     String,
     Table,
+    event,
     func,
     text,
 )
@@ -55,6 +59,7 @@ tasks_table = Table(
     Column("state", String(50), nullable=False),
     Column("state_timestamp", TIMESTAMP(timezone=True), nullable=False),
     # JSONB columns for A2A protocol data
+    # Legacy: message history now lives in task_messages; kept empty for rollback
     Column("history", JSONB, nullable=False, server_default=text("'[]'::jsonb")),
     Column("artifacts", JSONB, nullable=True, server_default=text("'[]'::jsonb")),
     Column("metadata", JSONB, nullable=True, server_default=text("'{}'::jsonb")),
@@ -75,11 +80,60 @@ tasks_table = Table(
     # Indexes
     Index("idx_tasks_context_id", "context_id"),
     Index("idx_tasks_state", "state"),
-    Index("idx_tasks_created_at", "created_at"),
+    Index("idx_tasks_created_at_id", "created_at", "id"),
     Index("idx_tasks_updated_at", "updated_at"),
     Index("idx_tasks_metadata_gin", "metadata", postgresql_using="gin"),
     # Table comment
-    comment="A2A protocol tasks with JSONB history and artifacts",
+    comment="A2A protocol tasks with JSONB artifacts",
+)
+
+# -----------------------------------------------------------------------------
+# Task Messages Table
+# -----------------------------------------------------------------------------
+
+task_messages_table = Table(
+    "task_messages",
+    metadata,
+    # Global, monotonically increasing sequence; orders messages within a task
+    Column("seq", BigInteger, Identity(), primary_key=True, nullable=False),
+    # Foreign key
+    Column(
+        "task_id",
+        PG_UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    # A2A protocol message
+    Column("message", JSONB, nullable=False),
+    # Timestamp
+    Column(
+        "created_at",
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    # Indexes
+    Index("idx_task_messages_task_id_seq", "task_id", "seq"),
+    # Table comment
+    comment="Append-only A2A message history of tasks",
+)
+
+# -----------------------------------------------------------------------------
+# Task State Counts Table
+# -----------------------------------------------------------------------------
+
+# Statements spread their counter updates over random shards, so concurrent
+# transitions into the same state do not queue on one hot row.
+TASK_STATE_COUNT_SHARDS = 16
+
+task_state_counts_table = Table(
+    "task_state_counts",
+    metadata,
+    Column("state", String(50), primary_key=True, nullable=False),
+    Column("shard", Integer, primary_key=True, nullable=False),
+    Column("task_count", BigInteger, nullable=False, server_default=text("0")),
+    # Table comment
+    comment="Number of tasks per state, maintained by triggers on tasks",
 )
 
 # -----------------------------------------------------------------------------
@@ -109,7 +163,7 @@ contexts_table = Table(
         onupdate=func.now(),
     ),
     # Indexes
-    Index("idx_contexts_created_at", "created_at"),
+    Index("idx_contexts_created_at_id", "created_at", "id"),
     Index("idx_contexts_updated_at", "updated_at"),
     Index("idx_contexts_data_gin", "context_data", postgresql_using="gin"),
     # Table comment
@@ -185,6 +239,102 @@ webhook_configs_table = Table(
     comment="Webhook configurations for long-running task notifications",
 )
 
+# -----------------------------------------------------------------------------
+# Webhook Outbox Table (push notification events awaiting delivery)
+# -----------------------------------------------------------------------------
+
+webhook_outbox_table = Table(
+    "webhook_outbox",
+    metadata,
+    # Primary key is the event id carried in the notification payload
+    Column("event_id", PG_UUID(as_uuid=True), primary_key=True, nullable=False),
+    # Foreign key
+    Column(
+        "task_id",
+        PG_UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    # Delivery target and payload
+    Column("config", JSONB, nullable=False),
+    Column("event", JSONB, nullable=False),
+    # Delivery lease: the replica holding the event, and when others may
+    # claim it if the lease is not renewed
+    Column("owner", String(255), nullable=True),
+    Column(
+        "visible_at",
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    # Timestamp
+    Column(
+        "created_at",
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    # Indexes
+    Index("idx_webhook_outbox_created_at", "created_at"),
+    Index("idx_webhook_outbox_visible_at", "visible_at"),
+    # Table comment
+    comment="Push notification events not yet delivered to their webhook",
+)
+
+# -----------------------------------------------------------------------------
+# Task State Count Triggers
+# -----------------------------------------------------------------------------
+
+
+def _upsert_state_counts(delta: str) -> str:
+    """Return the counter upsert for a query of (state, change) rows."""
+    return f"""
+        INSERT INTO task_state_counts (state, shard, task_count)
+        SELECT state, target_shard, sum(change) FROM ({delta}) AS delta
+        GROUP BY state HAVING sum(change) <> 0 ORDER BY state
+        ON CONFLICT (state, shard)
+        DO UPDATE SET task_count = task_state_counts.task_count + EXCLUDED.task_count;"""
+
+
+# Statement-level triggers fold each INSERT/UPDATE/DELETE on tasks into one
+# upsert per affected state, applied in state order so concurrent statements
+# lock counter rows in the same order. The function keeps the search_path it
+# was created with (the DID schema for per-DID tables), so it updates the
+# counters next to its own tasks table.
+COUNT_TASK_STATES_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION count_task_states() RETURNS trigger
+LANGUAGE plpgsql SET search_path FROM CURRENT AS $$
+DECLARE
+    target_shard integer := floor(random() * {TASK_STATE_COUNT_SHARDS})::integer;
+BEGIN
+    IF TG_OP = 'INSERT' THEN{_upsert_state_counts("SELECT state, 1 AS change FROM new_rows")}
+    ELSIF TG_OP = 'DELETE' THEN{_upsert_state_counts("SELECT state, -1 AS change FROM old_rows")}
+    ELSE{_upsert_state_counts("SELECT state, -1 AS change FROM old_rows UNION ALL SELECT state, 1 FROM new_rows")}
+    END IF;
+    RETURN NULL;
+END
+$$"""
+
+event.listen(
+    tasks_table,
+    "after_create",
+    DDL(COUNT_TASK_STATES_FUNCTION),
+)
+for _operation, _rows in (
+    ("INSERT", "NEW TABLE AS new_rows"),
+    ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    ("DELETE", "OLD TABLE AS old_rows"),
+):
+    event.listen(
+        tasks_table,
+        "after_create",
+        DDL(
+            f"CREATE TRIGGER trg_tasks_state_counts_{_operation.lower()} "
+            f"AFTER {_operation} ON tasks REFERENCING {_rows} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION count_task_states()"
+        ),
+    )
+
 # -----------------------------------------------------------------------------
 # Helper Functions
 # -----------------------------------------------------------------------------
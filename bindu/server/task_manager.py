@@ -94,7 +94,10 @@ from bindu.common.protocol.types import (
     TaskFeedbackResponse,
 )
 
+from ..settings import app_settings
 from ..utils.logging import get_logger
+from ..utils.worker import ChatHistoryCache
+from .events import InMemoryTaskEventBus, TaskEventBus
 from .handlers import ContextHandlers, MessageHandlers, TaskHandlers
 from .notifications import PushNotificationManager
 from .scheduler import Scheduler
@@ -115,10 +118,12 @@ class TaskManager:
     scheduler: Scheduler
     storage: Storage[Any]
     manifest: Any | None = None  # AgentManifest for creating workers
+    event_bus: TaskEventBus = field(default_factory=InMemoryTaskEventBus)
 
     _aexit_stack: AsyncExitStack | None = field(default=None, init=False)
     _workers: list[ManifestWorker] = field(default_factory=list, init=False)
     _push_manager: PushNotificationManager = field(init=False)
+    _history_cache: ChatHistoryCache = field(init=False)
     _message_handlers: MessageHandlers = field(init=False)
     _task_handlers: TaskHandlers = field(init=False)
     _context_handlers: ContextHandlers = field(init=False)
@@ -129,15 +134,23 @@ class TaskManager:
             manifest=self.manifest,
             storage=self.storage,
         )
+        # Shared by the workers (which fill it) and contexts/clear (which
+        # invalidates it)
+        self._history_cache = ChatHistoryCache(
+            app_settings.worker.history_cache_max_contexts
+        )
 
     async def __aenter__(self) -> TaskManager:
         """Initialize the task manager and start all components."""
         self._aexit_stack = AsyncExitStack()
         await self._aexit_stack.__aenter__()
         await self._aexit_stack.enter_async_context(self.scheduler)
+        await self._aexit_stack.enter_async_context(self.event_bus)
 
-        # Initialize push notification manager (loads persisted webhook configs)
+        # Initialize push notification manager (loads persisted webhook configs
+        # and starts background delivery)
         await self._push_manager.initialize()
+        self._aexit_stack.push_async_callback(self._push_manager.close)
 
         if self.manifest:
             worker = ManifestWorker(
@@ -145,6 +158,8 @@ class TaskManager:
                 storage=self.storage,
                 manifest=self.manifest,
                 lifecycle_notifier=self._push_manager.notify_lifecycle,
+                event_bus=self.event_bus,
+                history_cache=self._history_cache,
             )
             self._workers.append(worker)
             await self._aexit_stack.enter_async_context(worker.run())
@@ -157,6 +172,7 @@ class TaskManager:
             workers=self._workers,
             context_id_parser=self._parse_context_id,
             push_manager=self._push_manager,
+            event_bus=self.event_bus,
         )
         self._task_handlers = TaskHandlers(
             scheduler=self.scheduler,
@@ -166,6 +182,7 @@ class TaskManager:
         self._context_handlers = ContextHandlers(
             storage=self.storage,
             error_response_creator=self._create_error_response,
+            history_cache=self._history_cache,
         )
 
         return self
@@ -175,6 +192,15 @@ class TaskManager:
         """Check if the task manager is currently running."""
         return self._aexit_stack is not None
 
+    async def queue_depth(self) -> int:
+        """Count task operations not yet executing.
+
+        Includes the scheduler backlog plus operations a worker has received
+        but is holding back to preserve per-context ordering.
+        """
+        backlog = await self.scheduler.get_queue_length()
+        return backlog + sum(worker.waiting_operations for worker in self._workers)
+
     async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
         """Clean up resources and stop all components."""
         if self._aexit_stack is None:
@@ -11,6 +11,14 @@ Architecture:
 - Handle errors and state transitions
 - Provide observability through OpenTelemetry tracing
 
+Concurrency:
+- Each worker owns a pool of ``max_concurrent_tasks`` slots
+- A slot is acquired before an operation is pulled from the scheduler (back-pressure)
+- Run operations on the same context are serialized in arrival order; while
+  one runs, the others wait in a per-context queue without holding a slot
+- Cancellations are received outside the pool, so a saturated worker can
+  still stop a running task
+
 Hybrid Agent Pattern:
 Workers implement the hybrid pattern by:
 - Processing tasks through multiple state transitions
@@ -21,9 +29,11 @@ Workers implement the hybrid pattern by:
 from __future__ import annotations as _annotations
 
 from abc import ABC, abstractmethod
+from collections import deque
 from contextlib import asynccontextmanager, nullcontext
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, AsyncIterator
+from uuid import UUID
 
 import anyio
 from opentelemetry.trace import get_tracer, use_span
@@ -31,8 +41,10 @@ from opentelemetry.trace import get_tracer, use_span
 from bindu.server.scheduler import TaskOperation
 
 from bindu.common.protocol.types import Artifact, Message, TaskIdParams, TaskSendParams
+from bindu.server.metrics import get_metrics
 from bindu.server.scheduler.base import Scheduler
 from bindu.server.storage.base import Storage
+from bindu.settings import app_settings
 from bindu.utils.logging import get_logger
 
 tracer = get_tracer(__name__)
@@ -69,6 +81,20 @@ class Worker(ABC):
     storage: Storage[Any]
     """Storage backend for task and context persistence."""
 
+    max_concurrent_tasks: int = field(
+        default_factory=lambda: app_settings.worker.max_concurrent_tasks,
+        kw_only=True,
+    )
+    """Number of task operations this worker executes concurrently."""
+
+    _slots: anyio.Semaphore | None = field(default=None, init=False, repr=False)
+    _busy_slots: int = field(default=0, init=False, repr=False)
+    _waiting_operations: int = field(default=0, init=False, repr=False)
+    # Contexts with a running operation -> their operations waiting to run
+    _context_queues: dict[Any, deque[TaskOperation]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
     # -------------------------------------------------------------------------
     # Worker Lifecycle
     # -------------------------------------------------------------------------
@@ -88,19 +114,131 @@ class Worker(ABC):
                 ...
             # Worker stopped
         """
+        self._slots = anyio.Semaphore(self.max_concurrent_tasks)
+        self._context_queues.clear()
+        self._waiting_operations = 0
+        self._report_slot_usage()
         async with anyio.create_task_group() as tg:
             tg.start_soon(self._loop)
+            tg.start_soon(self._cancel_loop)
             yield
             tg.cancel_scope.cancel()
 
+    @property
+    def waiting_operations(self) -> int:
+        """Number of received operations waiting on per-context ordering."""
+        return self._waiting_operations
+
     async def _loop(self) -> None:
-        """Process task operations continuously.
+        """Process task operations with bounded parallelism.
+
+        A slot is acquired *before* the next operation is pulled from the
+        scheduler, so a saturated worker stops consuming the queue instead of
+        buffering it in memory. Each operation then runs in its own task and
+        releases its slot when done. A run operation whose context is busy
+        gives its slot back and waits in the context's queue, so a burst on
+        one context cannot starve the others. Runs until cancelled by the
+        task group.
+        """
+        assert self._slots is not None
+        slots = self._slots
+        # The slot held while waiting for the next operation counts as free
+        self.scheduler.set_capacity(lambda: slots.value + 1)
+        operations = self.scheduler.receive_task_operations()
+        async with anyio.create_task_group() as tg:
+            while True:
+                await self._slots.acquire()
+                try:
+                    task_operation = await anext(operations)
+                except StopAsyncIteration:
+                    self._slots.release()
+                    break
+
+                key = self._ordering_key(task_operation)
+                if key is not None:
+                    queue = self._context_queues.get(key)
+                    if queue is not None:
+                        queue.append(task_operation)
+                        self._waiting_operations += 1
+                        self._slots.release()
+                        continue
+                    self._context_queues[key] = deque()
+                tg.start_soon(self._run_in_slot, task_operation, key)
+
+    async def _cancel_loop(self) -> None:
+        """Stop tasks running here as soon as they are cancelled anywhere.
+
+        Needs no slot: the queued cancel operation may wait for one, or be
+        taken by another replica, while the task keeps running here.
+        """
+        async for task_id in self.scheduler.receive_cancellations():
+            if self.stop_task(task_id):
+                logger.info(f"Stopping cancelled task {task_id}")
 
-        Receives task operations from scheduler and dispatches them to handlers.
-        Runs until cancelled by the task group.
+    @staticmethod
+    def _ordering_key(task_operation: TaskOperation) -> Any:
+        """Return the key run operations are serialized on, None if unordered.
+
+        Control operations (cancel, pause, resume) bypass the ordering so they
+        can reach a running task.
+        """
+        if task_operation["operation"] != "run":
+            return None
+        return task_operation["params"].get("context_id")
+
+    async def _run_in_slot(self, task_operation: TaskOperation, key: Any) -> None:
+        """Execute an operation while holding a worker slot.
+
+        With an ordering key, the operations queued behind it on the same
+        context run next in the same slot, in arrival order, even if one of
+        them fails. The key is released once its queue is empty, or when the
+        slot is cancelled; unacknowledged queued operations are then left
+        to redelivery.
         """
-        async for task_operation in self.scheduler.receive_task_operations():
-            await self._handle_task_operation(task_operation)
+        assert self._slots is not None
+        self._busy_slots += 1
+        self._report_slot_usage()
+        try:
+            while True:
+                try:
+                    await self._handle_task_operation(task_operation)
+                except Exception as e:  # noqa: BLE001 - the context's next operations must still run
+                    logger.error(
+                        f"Failed to handle {task_operation['operation']} operation: {e}",
+                        exc_info=True,
+                    )
+                else:
+                    # Not reached on failure or cancellation, so such
+                    # operations are redelivered
+                    await self._ack_task_operation(task_operation)
+                if key is None:
+                    break
+                queue = self._context_queues[key]
+                if not queue:
+                    break
+                task_operation = queue.popleft()
+                self._waiting_operations -= 1
+        finally:
+            if key is not None:
+                dropped = self._context_queues.pop(key, None)
+                if dropped:
+                    self._waiting_operations -= len(dropped)
+            self._busy_slots -= 1
+            self._slots.release()
+            self._report_slot_usage()
+
+    async def _ack_task_operation(self, task_operation: TaskOperation) -> None:
+        """Acknowledge a handled operation to the scheduler."""
+        try:
+            await self.scheduler.ack_task_operation(task_operation)
+        except Exception as e:  # noqa: BLE001 - an unacknowledged operation is only redelivered
+            logger.warning(
+                f"Failed to acknowledge {task_operation['operation']} operation: {e}"
+            )
+
+    def _report_slot_usage(self) -> None:
+        """Publish slot utilisation to the Prometheus collector."""
+        get_metrics().set_worker_slots(self._busy_slots, self.max_concurrent_tasks)
 
     async def _handle_task_operation(self, task_operation: TaskOperation) -> None:
         """Dispatch task operation to appropriate handler.
@@ -145,7 +283,7 @@ class Worker(ABC):
             # Update task status to failed on any exception
             task_id = self._normalize_uuid(task_operation["params"]["task_id"])
             logger.error(f"Task {task_id} failed: {e}", exc_info=True)
-            await self.storage.update_task(task_id, state="failed")
+            await self.storage.update_task(task_id, state="failed", return_full=False)
 
     # -------------------------------------------------------------------------
     # Helper Methods
@@ -202,6 +340,21 @@ class Worker(ABC):
         """
         ...
 
+    def stop_task(self, task_id: UUID) -> bool:
+        """Stop executing a task if it runs in this worker.
+
+        Called on every worker for every cancellation, independently of the
+        queued cancel operation that marks the task as canceled. Workers that
+        cannot interrupt execution keep the default.
+
+        Args:
+            task_id: Task that was cancelled
+
+        Returns:
+            True if the task was running here and is being stopped
+        """
+        return False
+
     @abstractmethod
     def build_message_history(self, history: list[Message]) -> list[Any]:
         """Convert A2A protocol messages to agent-specific format.
@@ -4,7 +4,20 @@ This module contains extracted helper classes to keep ManifestWorker clean and f
 Each helper class handles a specific aspect of task execution.
 """
 
+from .chunk_streamer import ArtifactChunkStreamer
+from .handler_executor import (
+    HandlerCancelledError,
+    HandlerExecutor,
+    HandlerTimeoutError,
+)
 from .response_detector import ResponseDetector
 from .result_processor import ResultProcessor
 
-__all__ = ["ResultProcessor", "ResponseDetector"]
+__all__ = [
+    "ArtifactChunkStreamer",
+    "HandlerCancelledError",
+    "HandlerExecutor",
+    "HandlerTimeoutError",
+    "ResultProcessor",
+    "ResponseDetector",
+]
@@ -0,0 +1,154 @@
+"""Incremental forwarding of streamed handler output.
+
+When a handler yields chunks (an LLM token stream, or the gRPC
+``HandleMessagesStream`` RPC), each text chunk is published as an
+``artifact-update`` event with ``append=true`` as soon as it is produced, so
+``message/stream`` clients see the first token when the model emits it rather
+than when the whole generation finishes.
+
+Chunks can optionally be coalesced by time or size to bound the number of
+events per task. The first chunk is always sent immediately, and buffered
+text is sent when its time window ends even if no further chunk arrives.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID, uuid4
+
+from bindu.server.events import TaskEvent
+from bindu.settings import app_settings
+
+from .result_processor import ResultProcessor
+
+STREAMING_ARTIFACT_NAME = "streaming-response"
+
+
+@dataclass
+class ArtifactChunkStreamer:
+    """Publishes a handler's text chunks as one appended streaming artifact.
+
+    Non-text chunks (e.g. structured ``{"state": ...}`` responses) are not
+    forwarded; they only matter for the final result.
+    """
+
+    task_id: UUID
+    context_id: UUID
+    publish: Callable[[TaskEvent], Awaitable[None]]
+    coalesce_seconds: float = 0.0
+    coalesce_chars: int = 0
+    artifact_id: UUID = field(default_factory=uuid4)
+
+    _buffer: list[str] = field(default_factory=list, init=False, repr=False)
+    _buffered_chars: int = field(default=0, init=False, repr=False)
+    _last_flush: float = field(default=0.0, init=False, repr=False)
+    _chunks_sent: int = field(default=0, init=False, repr=False)
+    _publish_lock: asyncio.Lock = field(
+        default_factory=asyncio.Lock, init=False, repr=False
+    )
+    # Flushes the buffer when the time window ends without a new chunk
+    _timer: asyncio.TimerHandle | None = field(default=None, init=False, repr=False)
+    _timed_flush: asyncio.Future[None] | None = field(
+        default=None, init=False, repr=False
+    )
+
+    @classmethod
+    def from_settings(
+        cls,
+        task_id: UUID,
+        context_id: UUID,
+        publish: Callable[[TaskEvent], Awaitable[None]],
+    ) -> ArtifactChunkStreamer:
+        """Build a streamer with coalescing configured from ``app_settings.agent``."""
+        return cls(
+            task_id=task_id,
+            context_id=context_id,
+            publish=publish,
+            coalesce_seconds=app_settings.agent.stream_chunk_coalesce_seconds,
+            coalesce_chars=app_settings.agent.stream_chunk_coalesce_chars,
+        )
+
+    @property
+    def chunks_sent(self) -> int:
+        """Number of artifact-update events published so far."""
+        return self._chunks_sent
+
+    async def push(self, chunk: Any) -> None:
+        """Buffer a chunk and publish it once the coalescing window allows."""
+        text = ResultProcessor.chunk_text(chunk)
+        if not text:
+            return
+
+        self._buffer.append(text)
+        self._buffered_chars += len(text)
+        if self._should_flush():
+            self._cancel_timer()
+            await self._flush(last_chunk=False)
+        elif self._timer is None and self.coalesce_seconds > 0:
+            delay = self._last_flush + self.coalesce_seconds - time.monotonic()
+            self._timer = asyncio.get_running_loop().call_later(
+                max(delay, 0.0), self._flush_on_timer
+            )
+
+    async def close(self) -> None:
+        """Publish buffered text and mark the streaming artifact complete."""
+        self._cancel_timer()
+        if self._timed_flush is not None:
+            await self._timed_flush
+        if self._chunks_sent or self._buffer:
+            await self._flush(last_chunk=True)
+
+    def _flush_on_timer(self) -> None:
+        self._timer = None
+        if self._buffer:
+            self._timed_flush = asyncio.ensure_future(self._flush(last_chunk=False))
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _should_flush(self) -> bool:
+        if self._chunks_sent == 0:
+            return True
+        if self.coalesce_seconds <= 0 and self.coalesce_chars <= 0:
+            return True
+        if 0 < self.coalesce_chars <= self._buffered_chars:
+            return True
+        return (
+            self.coalesce_seconds > 0
+            and time.monotonic() - self._last_flush >= self.coalesce_seconds
+        )
+
+    async def _flush(self, last_chunk: bool) -> None:
+        # Serialized, so a timed flush cannot overtake a flush from push
+        async with self._publish_lock:
+            if not last_chunk and not self._buffer:
+                return
+            text = "".join(self._buffer)
+            self._buffer.clear()
+            self._buffered_chars = 0
+            self._last_flush = time.monotonic()
+
+            artifact: dict[str, Any] = {
+                "artifact_id": self.artifact_id,
+                "name": STREAMING_ARTIFACT_NAME,
+                "parts": [{"kind": "text", "text": text}] if text else [],
+                "append": self._chunks_sent > 0,
+                "last_chunk": last_chunk,
+            }
+            self._chunks_sent += 1
+            await self.publish(
+                {
+                    "kind": "artifact-update",
+                    "task_id": str(self.task_id),
+                    "context_id": str(self.context_id),
+                    "artifact": artifact,
+                    "append": artifact["append"],
+                    "last_chunk": last_chunk,
+                }
+            )
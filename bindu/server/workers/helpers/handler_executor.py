@@ -0,0 +1,267 @@
+"""Execution of agent handlers off the event loop.
+
+Agent handlers come in four shapes: coroutine functions, async generators,
+plain functions and sync generators. The async shapes cooperate with the event
+loop and are invoked directly (including the gRPC ``GrpcAgentClient``). The
+sync shapes would block the loop, so they are run on a bounded thread pool,
+or a process pool for CPU-bound agents.
+
+Sync generators are drained on the pool and their chunks are handed back to the
+loop through a bounded ``asyncio.Queue`` (inline mode iterates them on the
+loop), so callers always see an async iterator regardless of how the handler
+was written.
+
+Configured per agent via ``bindufy`` config::
+
+    "execution": {"mode": "thread", "max_workers": 8, "timeout_seconds": 120}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from bindu.settings import app_settings
+from bindu.utils.logging import get_logger
+
+logger = get_logger("bindu.server.workers.helpers.handler_executor")
+
+ExecutionMode = Literal["inline", "thread", "process"]
+EXECUTION_MODES: tuple[str, ...] = ("inline", "thread", "process")
+
+# Queue item markers for the generator bridge
+_CHUNK = "chunk"
+_DONE = "done"
+_ERROR = "error"
+
+
+class HandlerTimeoutError(Exception):
+    """Raised when an agent handler exceeds its execution timeout.
+
+    Deliberately not a ``TimeoutError`` subclass so worker retry policies,
+    which treat timeouts as transient, do not re-run a handler that already
+    consumed its whole budget.
+    """
+
+
+class HandlerCancelledError(Exception):
+    """Raised when a running agent handler is stopped by tasks/cancel."""
+
+
+def _is_async_callable(handler: Callable[..., Any]) -> bool:
+    """Check whether a handler (function or callable object) is async."""
+    if inspect.iscoroutinefunction(handler) or inspect.isasyncgenfunction(handler):
+        return True
+    call = getattr(type(handler), "__call__", None)
+    return inspect.iscoroutinefunction(call) or inspect.isasyncgenfunction(call)
+
+
+def _call_in_process(handler: Callable[..., Any], messages: list[Any]) -> Any:
+    """Invoke a handler inside a worker process.
+
+    Generators cannot cross process boundaries, so their chunks are
+    materialized in the child and sent back as a list.
+    """
+    result = handler(messages)
+    if inspect.isgenerator(result):
+        return _MaterializedChunks(list(result))
+    return result
+
+
+@dataclass
+class _MaterializedChunks:
+    """Generator output collected in a worker process."""
+
+    chunks: list[Any]
+
+
+@dataclass
+class HandlerExecutor:
+    """Runs agent handlers without blocking the event loop.
+
+    Modes:
+    - inline: call sync handlers directly on the loop (legacy behaviour)
+    - thread: run sync handlers and drain sync generators on a thread pool
+    - process: run sync handlers in a process pool; the handler must be
+      picklable (module-level function) and generator output is delivered
+      once the child finishes
+
+    Async handlers always run on the event loop, whatever the mode.
+    """
+
+    mode: ExecutionMode = "thread"
+    max_workers: int = 8
+    timeout_seconds: float | None = None
+    queue_size: int = 64
+
+    _pool: Executor | None = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def from_config(cls, config: Any = None) -> HandlerExecutor:
+        """Build an executor from a manifest ``execution`` dict.
+
+        Missing keys fall back to ``app_settings.worker``.
+
+        Args:
+            config: Execution config dict (mode, max_workers, timeout_seconds)
+
+        Raises:
+            ValueError: If mode is not one of inline, thread, process
+        """
+        settings = app_settings.worker
+        config = config if isinstance(config, dict) else {}
+
+        mode = config.get("mode", settings.execution_mode)
+        if mode not in EXECUTION_MODES:
+            raise ValueError(
+                f"Invalid execution mode '{mode}'. Must be one of: {', '.join(EXECUTION_MODES)}"
+            )
+
+        return cls(
+            mode=mode,
+            max_workers=config.get("max_workers", settings.executor_max_workers),
+            timeout_seconds=config.get(
+                "timeout_seconds", settings.task_timeout_seconds
+            ),
+            queue_size=settings.stream_queue_size,
+        )
+
+    # -------------------------------------------------------------------------
+    # Invocation
+    # -------------------------------------------------------------------------
+
+    async def invoke(self, handler: Callable[..., Any], messages: list[Any]) -> Any:
+        """Invoke a handler and return its result without blocking the loop.
+
+        Args:
+            handler: The manifest run callable
+            messages: Chat-formatted message history
+
+        Returns:
+            The handler's return value. Sync generators are returned as async
+            generators bridged from the pool; async results are returned as-is.
+        """
+        if _is_async_callable(handler):
+            result = handler(messages)
+            return self._bridge(result) if inspect.isgenerator(result) else result
+
+        if self.mode == "inline":
+            result = handler(messages)
+            return self._iterate(result) if inspect.isgenerator(result) else result
+
+        loop = asyncio.get_running_loop()
+
+        if self.mode == "process":
+            # Manifest handlers expose a picklable call that resolves parameters
+            target = getattr(handler, "process_target", handler)
+            result = await loop.run_in_executor(
+                self._get_pool(), _call_in_process, target, messages
+            )
+            if isinstance(result, _MaterializedChunks):
+                return self._replay(result.chunks)
+            return result
+
+        result = await loop.run_in_executor(
+            self._get_pool(), functools.partial(handler, messages)
+        )
+        if inspect.isawaitable(result):
+            result = await result
+        if isinstance(result, Iterator) and not isinstance(result, (str, bytes)):
+            return self._bridge(result)
+        return result
+
+    async def _bridge(self, iterator: Iterator[Any]) -> AsyncIterator[Any]:
+        """Drain a sync iterator on the pool and yield its chunks on the loop.
+
+        The producer blocks once ``queue_size`` chunks are buffered. If the
+        consumer stops early (cancellation or timeout), the producer stops at
+        the next chunk boundary and closes the generator.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[tuple[str, Any]] = asyncio.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+
+        def put(item: tuple[str, Any]) -> None:
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+        def produce() -> None:
+            item: tuple[str, Any] = (_DONE, None)
+            try:
+                for chunk in iterator:
+                    if stop.is_set():
+                        break
+                    put((_CHUNK, chunk))
+            except BaseException as e:  # noqa: BLE001 - forwarded to the consumer
+                item = (_ERROR, e)
+            finally:
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+            if not stop.is_set():
+                put(item)
+
+        producer = loop.run_in_executor(self._get_pool(), produce)
+        try:
+            while True:
+                kind, value = await queue.get()
+                if kind == _CHUNK:
+                    yield value
+                elif kind == _ERROR:
+                    raise value
+                else:
+                    break
+        finally:
+            stop.set()
+            # Unblock a producer waiting on a full queue so it can observe stop
+            while not queue.empty():
+                queue.get_nowait()
+            if producer.done():
+                producer.exception()
+
+    @staticmethod
+    async def _iterate(iterator: Iterator[Any]) -> AsyncIterator[Any]:
+        """Iterate a sync generator on the loop, as inline mode promises."""
+        try:
+            for chunk in iterator:
+                yield chunk
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    @staticmethod
+    async def _replay(chunks: list[Any]) -> AsyncIterator[Any]:
+        """Yield chunks materialized by a worker process."""
+        for chunk in chunks:
+            yield chunk
+
+    # -------------------------------------------------------------------------
+    # Pool Lifecycle
+    # -------------------------------------------------------------------------
+
+    def _get_pool(self) -> Executor:
+        """Lazily create the bounded thread or process pool."""
+        if self._pool is None:
+            if self.mode == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="bindu-handler",
+                )
+            logger.debug(
+                f"Started {self.mode} pool for agent handlers (max_workers={self.max_workers})"
+            )
+        return self._pool
+
+    def shutdown(self) -> None:
+        """Release pool resources without waiting for running handlers."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
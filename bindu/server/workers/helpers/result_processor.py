@@ -7,6 +7,7 @@ different data structures.
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from bindu.utils.logging import get_logger
@@ -26,7 +27,10 @@ class ResultProcessor:
     """
 
     @staticmethod
-    async def collect_results(raw_results: Any) -> Any:
+    async def collect_results(
+        raw_results: Any,
+        on_chunk: Callable[[Any], Awaitable[None]] | None = None,
+    ) -> Any:
         """Collect results from manifest execution.
 
         Handles different result types:
@@ -34,38 +38,81 @@ class ResultProcessor:
         - Generator: Collect all yielded values
         - Async generator: Await and collect all yielded values
 
+        Yielded text chunks are deltas, as streamed to clients, so when a
+        generator ends on a text chunk its text chunks are joined into the
+        result. A final non-text chunk (e.g. ``{"state": ...}``) is returned
+        as is.
+
         Args:
             raw_results: Raw result from manifest.run()
+            on_chunk: Optional callback awaited with each yielded chunk as it
+                arrives, used to stream partial output to clients
 
         Returns:
-            Collected result (single value or last yielded value)
+            Collected result (single value, joined text or last yielded value)
+
+        Generators are closed when collection stops early, e.g. on
+        cancellation, so their cleanup (closing a gRPC stream, stopping a
+        bridged sync generator) runs at once instead of on garbage collection.
         """
         # Check if it's an async generator
         if hasattr(raw_results, "__anext__"):
-            collected = []
+            last = None
+            texts: list[str] = []
             try:
                 async for chunk in raw_results:
-                    collected.append(chunk)
-            except StopAsyncIteration:
-                pass
-            # Return last chunk or all chunks if multiple
-            return collected[-1] if collected else None
+                    last = chunk
+                    ResultProcessor._append_text(texts, chunk)
+                    if on_chunk is not None:
+                        await on_chunk(chunk)
+            finally:
+                aclose = getattr(raw_results, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+            return ResultProcessor._join_text(texts, last)
 
         # Check if it's a sync generator
         elif hasattr(raw_results, "__next__"):
-            collected = []
+            last = None
+            texts = []
             try:
                 for chunk in raw_results:
-                    collected.append(chunk)
-            except StopIteration:
-                pass
-            # Return last chunk or all chunks if multiple
-            return collected[-1] if collected else None
+                    last = chunk
+                    ResultProcessor._append_text(texts, chunk)
+                    if on_chunk is not None:
+                        await on_chunk(chunk)
+            finally:
+                close = getattr(raw_results, "close", None)
+                if close is not None:
+                    close()
+            return ResultProcessor._join_text(texts, last)
 
         # Direct return value (str, dict, list, etc.)
         else:
             return raw_results
 
+    @staticmethod
+    def chunk_text(chunk: Any) -> str | None:
+        """Extract the text of a yielded chunk, if it has any."""
+        if isinstance(chunk, str):
+            return chunk
+        content = getattr(chunk, "content", None)
+        if isinstance(content, str):
+            return content
+        return None
+
+    @staticmethod
+    def _append_text(texts: list[str], chunk: Any) -> None:
+        text = ResultProcessor.chunk_text(chunk)
+        if text is not None:
+            texts.append(text)
+
+    @staticmethod
+    def _join_text(texts: list[str], last: Any) -> Any:
+        if len(texts) > 1 and ResultProcessor.chunk_text(last) is not None:
+            return "".join(texts)
+        return last
+
     @staticmethod
     def normalize_result(result: Any) -> Any:
         """Intelligently normalize agent result to extract final response.
@@ -28,10 +28,13 @@ Hybrid Agent Architecture (A2A Protocol):
 from __future__ import annotations
 
 import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from typing import Any, Callable, Optional
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Optional
 from uuid import UUID
 
+import anyio
 from opentelemetry.trace import Status, StatusCode, get_current_span, get_tracer
 from x402.facilitator import FacilitatorClient, FacilitatorConfig
 
@@ -46,11 +49,25 @@ from bindu.common.protocol.types import (
     TaskState,
 )
 from bindu.penguin.manifest import AgentManifest
+from bindu.server.events import TaskEvent, TaskEventBus
 from bindu.server.workers.base import Worker
-from bindu.server.workers.helpers import ResponseDetector, ResultProcessor
+from bindu.server.workers.helpers import (
+    ArtifactChunkStreamer,
+    HandlerCancelledError,
+    HandlerExecutor,
+    HandlerTimeoutError,
+    ResponseDetector,
+    ResultProcessor,
+)
 from bindu.utils.logging import get_logger
 from bindu.utils.retry import retry_worker_operation
-from bindu.utils.worker import ArtifactBuilder, MessageConverter, TaskStateManager
+from bindu.utils.worker import (
+    ArtifactBuilder,
+    ChatHistoryCache,
+    FileInterceptor,
+    MessageConverter,
+    TaskStateManager,
+)
 
 tracer = get_tracer("bindu.server.workers.manifest_worker")
 logger = get_logger("bindu.server.workers.manifest_worker")
@@ -93,6 +110,49 @@ class ManifestWorker(Worker):
     )
     """Optional callback for task lifecycle notifications (task_id, context_id, state, final)."""
 
+    event_bus: Optional[TaskEventBus] = field(default=None)
+    """Optional bus that streams status, message and artifact events to SSE subscribers."""
+
+    history_cache: ChatHistoryCache = field(
+        default_factory=lambda: ChatHistoryCache(
+            app_settings.worker.history_cache_max_contexts
+        )
+    )
+    """Chat history of finished tasks per context, reused across turns."""
+
+    history_max_messages: int | None = field(
+        default_factory=lambda: app_settings.worker.history_max_messages
+    )
+    """Most recent chat messages handed to the handler (None keeps all)."""
+
+    history_max_tokens: int | None = field(
+        default_factory=lambda: app_settings.worker.history_max_tokens
+    )
+    """Approximate token budget for the history handed to the handler."""
+
+    executor: HandlerExecutor = field(init=False, repr=False)
+    """Runs sync handlers off the event loop (configured from manifest.execution)."""
+
+    _handler_scopes: dict[UUID, anyio.CancelScope] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    """Cancel scopes of handlers running in this worker, by task id."""
+
+    def __post_init__(self) -> None:
+        """Create the handler executor from the manifest's execution config."""
+        self.executor = HandlerExecutor.from_config(
+            getattr(self.manifest, "execution", None)
+        )
+
+    @asynccontextmanager
+    async def run(self) -> AsyncIterator[None]:
+        """Start the worker and release the handler pool on exit."""
+        try:
+            async with super().run():
+                yield
+        finally:
+            self.executor.shutdown()
+
     @retry_worker_operation()
     async def run_task(self, params: TaskSendParams) -> None:
         """Execute a task using the AgentManifest.
@@ -124,13 +184,32 @@ class ManifestWorker(Worker):
         # Extract payment context if available (from x402 middleware)
         payment_context = params.get("payment_context")
 
-        await TaskStateManager.validate_task_state(task)
+        if params.get("redelivered"):
+            # A previous worker took this operation but never acknowledged it.
+            # Re-run only if it did not get past "working"; otherwise the
+            # earlier run already produced a result.
+            state = task["status"]["state"]
+            if state not in ("submitted", "working"):
+                logger.info(
+                    f"Skipping redelivered task {task['id']} already in state {state}"
+                )
+                return
+            logger.warning(f"Re-running redelivered task {task['id']} (state: {state})")
+        else:
+            await TaskStateManager.validate_task_state(task)
 
         # Add span event for state transition
         self._add_state_change_event(to_state="working")
 
-        # Transition to working
-        await self.storage.update_task(task["id"], state="working")
+        # Transition to working, unless the task was canceled meanwhile
+        if (
+            await self.storage.update_task_if_active(
+                task["id"], state="working", return_full=False
+            )
+            is None
+        ):
+            logger.info(f"Not running task {task['id']}, it was canceled")
+            return
         await self._notify_lifecycle(task["id"], task["context_id"], "working", False)
 
         # Step 2: Build conversation history (A2A Protocol)
@@ -164,15 +243,18 @@ class ManifestWorker(Worker):
                     }
                 )
 
+                # Forward streamed chunks to SSE subscribers as they arrive
+                streamer = (
+                    ArtifactChunkStreamer.from_settings(
+                        task["id"], task["context_id"], self._publish_event
+                    )
+                    if self.event_bus is not None
+                    else None
+                )
+
                 try:
-                    # Type narrowing: manifest.run should be callable
-                    assert self.manifest.run is not None
-                    # Pass message history as structured list of dicts
-                    raw_results = self.manifest.run(message_history or [])
-
-                    # Handle generator/async generator responses
-                    collected_results = await ResultProcessor.collect_results(
-                        raw_results
+                    collected_results = await self._execute_handler(
+                        message_history or [], streamer, task_id=task["id"]
                     )
 
                     # Normalize result to extract final response (intelligent extraction)
@@ -216,9 +298,17 @@ class ManifestWorker(Worker):
                 # Add span event for state transition
                 self._add_state_change_event(from_state="working", to_state=state)
                 await self._handle_terminal_state(
-                    task, results, state, payment_context=payment_context
+                    task,
+                    results,
+                    state,
+                    payment_context=payment_context,
+                    streamed=streamer is not None and streamer.chunks_sent > 0,
                 )
 
+        except HandlerCancelledError:
+            # cancel_task already moved the task to canceled, here or on
+            # another replica; its result, if any, was not stored
+            logger.info(f"Stopped handler of canceled task {task['id']}")
         except Exception as e:
             # Handle task failure with error message
             # Add span event for failure
@@ -229,6 +319,61 @@ class ManifestWorker(Worker):
             raise
         return
 
+    async def _execute_handler(
+        self,
+        message_history: list[dict[str, str]],
+        streamer: ArtifactChunkStreamer | None = None,
+        task_id: UUID | None = None,
+    ) -> Any:
+        """Run the manifest handler and collect its result.
+
+        Sync handlers and generators are executed on the executor's pool so the
+        event loop stays responsive. The whole run, including draining any
+        generator, is bounded by the executor's timeout, which async handlers
+        such as GrpcAgentClient also see as their deadline.
+
+        Args:
+            message_history: Chat-formatted conversation history
+            streamer: Optional streamer that publishes chunks as they are yielded
+            task_id: Task the handler runs for, so cancel_task can stop it
+
+        Raises:
+            HandlerTimeoutError: If the handler exceeds the configured timeout
+            HandlerCancelledError: If cancel_task stopped the handler
+        """
+        # Type narrowing: manifest.run should be callable
+        assert self.manifest.run is not None
+        timeout = self.executor.timeout_seconds
+        on_chunk = streamer.push if streamer is not None else None
+        cancel_scope = anyio.CancelScope()
+        if task_id is not None:
+            self._handler_scopes[task_id] = cancel_scope
+
+        try:
+            with cancel_scope, anyio.fail_after(timeout) as scope:
+                # Pass message history as structured list of dicts
+                raw_results = await self.executor.invoke(
+                    self.manifest.run, message_history
+                )
+                # Handle generator/async generator responses
+                return await ResultProcessor.collect_results(
+                    raw_results, on_chunk=on_chunk
+                )
+        except TimeoutError as e:
+            if not scope.cancelled_caught:
+                raise
+            raise HandlerTimeoutError(
+                f"Agent handler exceeded timeout of {timeout}s"
+            ) from e
+        finally:
+            if task_id is not None:
+                self._handler_scopes.pop(task_id, None)
+            if streamer is not None:
+                await streamer.close()
+
+        # Only reached when cancel_task cancelled the scope
+        raise HandlerCancelledError(f"Agent handler for task {task_id} was cancelled")
+
     @retry_worker_operation(max_attempts=2)
     async def cancel_task(self, params: TaskIdParams) -> None:
         """Cancel a running task.
@@ -236,16 +381,43 @@ class ManifestWorker(Worker):
         Args:
             params: Task identification parameters containing task_id
         """
+        # Stop the handler if it runs here; other replicas get the broadcast
+        self.stop_task(params["task_id"])
+
         task = await self.storage.load_task(params["task_id"])
-        if task:
-            # Add span event for cancellation
-            self._add_state_change_event(
-                from_state=task["status"]["state"], to_state="canceled"
-            )
-            await self.storage.update_task(params["task_id"], state="canceled")
-            await self._notify_lifecycle(
-                params["task_id"], task["context_id"], "canceled", True
-            )
+        if task is None:
+            return
+
+        # Conditional, so a task finishing concurrently keeps its result
+        canceled = await self.storage.update_task_if_active(
+            params["task_id"], state="canceled", return_full=False
+        )
+        if canceled is None:
+            # Finished before the cancellation arrived; tasks are immutable
+            logger.info(f"Not canceling task {params['task_id']}, it already finished")
+            return
+
+        # Add span event for cancellation
+        self._add_state_change_event(
+            from_state=task["status"]["state"], to_state="canceled"
+        )
+        await self._notify_lifecycle(
+            params["task_id"], task["context_id"], "canceled", True
+        )
+
+    def stop_task(self, task_id: UUID) -> bool:
+        """Cancel the task's handler if it runs here.
+
+        Cancelling the handler's scope interrupts async handlers at their next
+        await, closes generators (ending gRPC streams) and cancels unary gRPC
+        calls. Sync generators on the pool stop at their next chunk; a plain
+        sync function cannot be interrupted, and its result is discarded.
+        """
+        handler_scope = self._handler_scopes.get(task_id)
+        if handler_scope is None:
+            return False
+        handler_scope.cancel()
+        return True
 
     def build_message_history(self, history: list[Message]) -> list[dict[str, str]]:
         """Convert A2A protocol messages to chat format for manifest execution.
@@ -285,6 +457,11 @@ class ManifestWorker(Worker):
         - Parallel task execution within same context
         - Conversation continuity across multiple tasks
 
+        Referenced tasks are loaded in one batch. For context history, only
+        the context's task list is read each turn; finished tasks come from
+        history_cache and the rest are loaded in one batch. The result is
+        trimmed to the configured message/token window.
+
         Args:
             task: Current task being executed
 
@@ -300,38 +477,82 @@ class ManifestWorker(Worker):
 
         if reference_task_ids:
             # Strategy 1: Explicit references (A2A refinement pattern)
+            ref_tasks = await self.storage.load_tasks(
+                [UUID(str(task_id)) for task_id in reference_task_ids]
+            )
             referenced_messages: list[Message] = []
-            for task_id in reference_task_ids:
-                # Ensure task_id is UUID object
-                task_id_uuid = UUID(task_id) if isinstance(task_id, str) else task_id
-                ref_task = await self.storage.load_task(task_id_uuid)
-                if ref_task and ref_task.get("history"):
-                    referenced_messages.extend(ref_task["history"])
+            for ref_task in ref_tasks:
+                referenced_messages.extend(ref_task.get("history") or [])
 
-            current_messages = task.get("history", [])
-            all_messages = referenced_messages + current_messages
+            chat_history = await self._to_chat_format(
+                referenced_messages + task.get("history", [])
+            )
 
         elif self.manifest.enable_context_based_history:
             # Strategy 2: Context-based history (implicit continuation)
             # Only enabled if configured in manifest
-            tasks_by_context = await self.storage.list_tasks_by_context(
-                task["context_id"]
-            )
-            previous_tasks = [t for t in tasks_by_context if t["id"] != task["id"]]
-
-            all_previous_messages: list[Message] = []
-            for prev_task in previous_tasks:
-                history = prev_task.get("history", [])
-                if history:
-                    all_previous_messages.extend(history)
-
-            current_messages = task.get("history", [])
-            all_messages = all_previous_messages + current_messages
+            chat_history = await self._previous_context_history(task)
+            chat_history += await self._to_chat_format(task.get("history", []))
         else:
             # No context-based history - only use current task messages
-            all_messages = task.get("history", [])
+            chat_history = await self._to_chat_format(task.get("history", []))
 
-        return self.build_message_history(all_messages) if all_messages else []
+        return MessageConverter.apply_window(
+            chat_history,
+            max_messages=self.history_max_messages,
+            max_tokens=self.history_max_tokens,
+        )
+
+    async def _previous_context_history(self, task: Task) -> list[dict[str, str]]:
+        """Chat history of the other tasks in the task's context, oldest first."""
+        context_id = task["context_id"]
+        summaries = [
+            summary
+            for summary in await self.storage.list_task_summaries_by_context(context_id)
+            if summary["id"] != task["id"]
+        ]
+        self.history_cache.retain(context_id, {s["id"] for s in summaries})
+
+        cached = self.history_cache.get(context_id)
+        missing = [s["id"] for s in summaries if s["id"] not in cached]
+        loaded = (
+            {t["id"]: t for t in await self.storage.load_tasks(missing)}
+            if missing
+            else {}
+        )
+
+        chat_history: list[dict[str, str]] = []
+        for summary in summaries:
+            messages = cached.get(summary["id"])
+            if messages is None:
+                prev_task = loaded.get(summary["id"])
+                if prev_task is None:
+                    continue
+                messages = await self._to_chat_format(prev_task.get("history", []))
+                if prev_task["status"]["state"] in app_settings.agent.terminal_states:
+                    self.history_cache.put(context_id, summary["id"], messages)
+            chat_history.extend(messages)
+        return chat_history
+
+    async def _to_chat_format(self, messages: list[Message]) -> list[dict[str, str]]:
+        if not messages:
+            return []
+        if FileInterceptor.contains_files(messages):
+            # Documents not yet in the parsed-text cache are decoded and
+            # parsed synchronously; keep that off the event loop
+            return await anyio.to_thread.run_sync(self.build_message_history, messages)
+        return self.build_message_history(messages)
+
+    async def _remember_history(
+        self, task: Task, new_messages: list[Message] | None = None
+    ) -> None:
+        """Cache the chat history of a task that just reached a terminal state."""
+        if not self.manifest.enable_context_based_history:
+            return
+        messages = await self._to_chat_format(
+            list(task.get("history", [])) + list(new_messages or [])
+        )
+        self.history_cache.put(task["context_id"], task["id"], messages)
 
     # -------------------------------------------------------------------------
     # Helper Methods
@@ -416,9 +637,13 @@ class ManifestWorker(Worker):
         metadata: dict[str, Any] | None = None
 
         # Update task with state and append agent messages to history
-        await self.storage.update_task(
-            task["id"], state=state, new_messages=agent_messages, metadata=metadata
+        await self._store_result(
+            task,
+            state,
+            new_messages=agent_messages,
+            metadata=metadata,
         )
+        await self._publish_messages(task["id"], task["context_id"], agent_messages)
         await self._notify_lifecycle(task["id"], task["context_id"], state, False)
 
     async def _handle_terminal_state(
@@ -428,6 +653,7 @@ class ManifestWorker(Worker):
         state: TaskState = "completed",
         additional_metadata: dict[str, Any] | None = None,
         payment_context: dict[str, Any] | None = None,
+        streamed: bool = False,
     ) -> None:
         """Handle terminal task states (completed/failed).
 
@@ -443,7 +669,9 @@ class ManifestWorker(Worker):
 
         X402 Payment Flow:
         - If payment_context is provided and state is completed, settle payment
-        - Payment settlement happens ONLY when task successfully completes
+        - Payment settlement happens ONLY when task successfully completes:
+          the completion is stored first, so a task canceled meanwhile is
+          never charged, and the settlement result is added afterwards
 
         Args:
             task: Task dict being finalized
@@ -451,9 +679,12 @@ class ManifestWorker(Worker):
             state: Terminal state (completed or failed)
             additional_metadata: Optional metadata to attach to task
             payment_context: Optional payment details from x402 middleware
+            streamed: Whether the result text already reached event bus
+                subscribers as a streaming artifact
 
         Raises:
             ValueError: If state is not a terminal state
+            HandlerCancelledError: If the task reached a terminal state meanwhile
         """
         # Validate that state is terminal
         if state not in app_settings.agent.terminal_states:
@@ -471,29 +702,37 @@ class ManifestWorker(Worker):
             )
             artifacts = self.build_artifacts(results)
 
-            # Handle payment settlement if payment context is available
-            if payment_context:
-                settlement_metadata = await self._settle_payment(payment_context)
-                if additional_metadata:
-                    additional_metadata.update(settlement_metadata)
-                else:
-                    additional_metadata = settlement_metadata
-
             # Persist task state BEFORE sending any notifications (outbox pattern).
             # If a notification fires before the DB write and then the process crashes,
             # clients receive an artifact webhook but the task is still "working" in the
             # DB — an inconsistent state.  Write first, then notify.
-            await self.storage.update_task(
-                task["id"],
-                state=state,
+            await self._store_result(
+                task,
+                state,
                 new_artifacts=artifacts,
                 new_messages=agent_messages,
                 metadata=additional_metadata,
             )
 
-            # Send artifact notifications after the DB is committed
+            # Settle only once the task is known to have completed; a task
+            # canceled before the write above raised and is not charged
+            if payment_context:
+                settlement_metadata = await self._settle_payment(payment_context)
+                await self.storage.update_task(
+                    task["id"],
+                    state=state,
+                    metadata=settlement_metadata,
+                    return_full=False,
+                )
+
+            await self._remember_history(task, agent_messages)
+
+            # Send message and artifact notifications after the DB is committed
+            await self._publish_messages(task["id"], task["context_id"], agent_messages)
             for artifact in artifacts:
-                await self._notify_artifact(task["id"], task["context_id"], artifact)
+                await self._notify_artifact(
+                    task["id"], task["context_id"], artifact, streamed=streamed
+                )
 
             await self._notify_lifecycle(task["id"], task["context_id"], state, True)
 
@@ -502,19 +741,49 @@ class ManifestWorker(Worker):
             error_message = MessageConverter.to_protocol_messages(
                 results, task["id"], task["context_id"]
             )
-            await self.storage.update_task(
-                task["id"],
-                state=state,
+            await self._store_result(
+                task,
+                state,
                 new_messages=error_message,
                 metadata=additional_metadata,
             )
+            await self._remember_history(task, error_message)
+            await self._publish_messages(task["id"], task["context_id"], error_message)
             await self._notify_lifecycle(task["id"], task["context_id"], state, True)
 
         elif state == "canceled":
             # Canceled: State change only, NO new content
-            await self.storage.update_task(task["id"], state=state)
+            await self._store_result(task, state)
+            await self._remember_history(task)
             await self._notify_lifecycle(task["id"], task["context_id"], state, True)
 
+    async def _store_result(
+        self,
+        task: Task,
+        state: TaskState,
+        new_artifacts: list[Artifact] | None = None,
+        new_messages: list[Message] | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Store a handler's result unless the task reached a terminal state.
+
+        Raises:
+            HandlerCancelledError: If the task was canceled or finished
+                meanwhile, here or on another replica
+        """
+        updated = await self.storage.update_task_if_active(
+            task["id"],
+            state=state,
+            new_artifacts=new_artifacts,
+            new_messages=new_messages,
+            metadata=metadata,
+            return_full=False,
+        )
+        if updated is None:
+            raise HandlerCancelledError(
+                f"Task {task['id']} was canceled while its handler finished"
+            )
+
     async def _handle_task_failure(self, task: Task, error: str) -> None:
         """Handle task execution failure.
 
@@ -531,9 +800,19 @@ class ManifestWorker(Worker):
         error_message = MessageConverter.to_protocol_messages(
             f"Task execution failed: {error}", task["id"], task["context_id"]
         )
-        await self.storage.update_task(
-            task["id"], state="failed", new_messages=error_message
-        )
+        if (
+            await self.storage.update_task_if_active(
+                task["id"],
+                state="failed",
+                new_messages=error_message,
+                return_full=False,
+            )
+            is None
+        ):
+            logger.info(f"Not failing task {task['id']}, it already finished")
+            return
+        await self._remember_history(task, error_message)
+        await self._publish_messages(task["id"], task["context_id"], error_message)
         await self._notify_lifecycle(task["id"], task["context_id"], "failed", True)
 
     async def _settle_payment(self, payment_context: dict[str, Any]) -> dict[str, Any]:
@@ -596,7 +875,11 @@ class ManifestWorker(Worker):
             }
 
     async def _notify_artifact(
-        self, task_id: UUID, context_id: UUID, artifact: Artifact
+        self,
+        task_id: UUID,
+        context_id: UUID,
+        artifact: Artifact,
+        streamed: bool = False,
     ) -> None:
         """Notify about artifact generation if push manager is available.
 
@@ -604,7 +887,26 @@ class ManifestWorker(Worker):
             task_id: Task identifier
             context_id: Context identifier
             artifact: The artifact that was generated
+            streamed: Whether its text was already streamed to event bus
+                subscribers; their copy then omits the text parts, and is
+                not sent if nothing else is left. Webhooks get it whole.
         """
+        published: Artifact | None = artifact
+        if streamed:
+            parts = [p for p in artifact.get("parts", []) if p.get("kind") != "text"]
+            published = Artifact(**{**artifact, "parts": parts}) if parts else None
+        if published is not None:
+            await self._publish_event(
+                {
+                    "kind": "artifact-update",
+                    "task_id": str(task_id),
+                    "context_id": str(context_id),
+                    "artifact": published,
+                    "append": published.get("append", False),
+                    "last_chunk": published.get("last_chunk", False),
+                }
+            )
+
         if self.lifecycle_notifier:
             try:
                 # Get push manager from lifecycle_notifier's bound instance
@@ -628,6 +930,19 @@ class ManifestWorker(Worker):
             state: New task state
             final: Whether this is a terminal state
         """
+        await self._publish_event(
+            {
+                "kind": "status-update",
+                "task_id": str(task_id),
+                "context_id": str(context_id),
+                "status": {
+                    "state": state,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                },
+                "final": final,
+            }
+        )
+
         if self.lifecycle_notifier:
             try:
                 result = self.lifecycle_notifier(task_id, context_id, state, final)
@@ -639,3 +954,38 @@ class ManifestWorker(Worker):
                 self._log_notification_error(
                     "Lifecycle", task_id, context_id, e, state=state
                 )
+
+    async def _publish_messages(
+        self, task_id: UUID, context_id: UUID, messages: list[Message]
+    ) -> None:
+        """Stream agent messages appended to the task history.
+
+        Args:
+            task_id: Task identifier
+            context_id: Context identifier
+            messages: Messages that were just persisted
+        """
+        for message in messages:
+            await self._publish_event(
+                {
+                    "kind": "message",
+                    "task_id": str(task_id),
+                    "context_id": str(context_id),
+                    "message": message,
+                }
+            )
+
+    async def _publish_event(self, event: TaskEvent) -> None:
+        """Publish an event to the task event bus if one is configured."""
+        if self.event_bus is None:
+            return
+        try:
+            await self.event_bus.publish(event)
+        except Exception as e:
+            # Subscribers resync from storage, so a lost event only adds latency
+            logger.warning(
+                "Event bus notification failed",
+                task_id=event["task_id"],
+                context_id=event["context_id"],
+                error=str(e),
+            )
@@ -116,6 +116,10 @@ class NetworkSettings(BaseSettings):
     request_timeout: int = 30
     connection_timeout: int = 10
 
+    # Seconds clients may reuse the agent card, skills and DID document
+    # before revalidating them with If-None-Match (0 always revalidates)
+    discovery_max_age: int = 60
+
     @computed_field
     @property
     def default_url(self) -> str:
@@ -277,6 +281,15 @@ class ObservabilitySettings(BaseSettings):
         "opentelemetry-exporter-otlp",
     ]
 
+    # Prometheus /metrics exposition
+    # Seconds a rendering of /metrics is served to later scrapes
+    metrics_cache_ttl: float = 5.0
+    # Directory shared by uvicorn worker processes for aggregated metrics
+    # (None: each process reports only its own samples). Wipe it between runs.
+    metrics_multiprocess_dir: str | None = None
+    # Seconds between writes of a process's samples to metrics_multiprocess_dir
+    metrics_flush_interval: float = 5.0
+
 
 class X402Settings(BaseSettings):
     """x402 payments configuration settings."""
@@ -317,6 +330,26 @@ class X402Settings(BaseSettings):
     status_completed: str = "payment-completed"
     status_failed: str = "payment-failed"
 
+    # Payment session store
+    # "auto" shares sessions through Redis when the scheduler backend is redis,
+    # so any replica can serve the payment capture and status endpoints
+    session_backend: Literal["auto", "memory", "redis"] = "auto"
+    session_key_prefix: str = "bindu:payment-session"
+
+    # On-chain payment validation
+    # Seconds before a call to one RPC URL is abandoned
+    rpc_timeout_seconds: float = 10.0
+    # Seconds to wait on an RPC URL before also trying the next one
+    rpc_hedge_delay_seconds: float = 1.0
+    # Consecutive failures after which an RPC URL is skipped
+    rpc_circuit_failure_threshold: int = 3
+    # Seconds a skipped RPC URL waits before a trial call
+    rpc_circuit_reset_seconds: float = 30.0
+    # Seconds a payer's token balance is reused across payment checks
+    balance_cache_ttl_seconds: float = 5.0
+    # Seconds a token contract deployment check is reused
+    contract_cache_ttl_seconds: float = 3600.0
+
     # RPC URLs by network
     # Always look https://chainlist.org/chain/84532?testnets=true for latest RPC URLs
     rpc_urls_by_network: dict[str, list[str]] = {
@@ -391,8 +424,17 @@ class AgentSettings(BaseSettings):
         }
     )
 
-    # message/stream polling behavior
-    stream_poll_interval_seconds: float = 0.1
+    # message/stream event delivery
+    # "auto" uses Redis pub/sub when the scheduler backend is redis, else in-process
+    stream_event_backend: Literal["auto", "memory", "redis"] = "auto"
+    stream_event_channel_prefix: str = "bindu:task-events"
+    stream_event_buffer_size: int = Field(default=256, ge=1)
+    # Safety net: reload the task from storage if no event arrives in this window
+    stream_resync_interval_seconds: float = 5.0
+    # Coalesce streamed handler chunks into fewer artifact-update events
+    # (0 disables; the first chunk is always sent immediately)
+    stream_chunk_coalesce_seconds: float = 0.0
+    stream_chunk_coalesce_chars: int = 0
     stream_missing_task_retries: int = 2
     stream_missing_task_retry_delay_seconds: float = 0.05
 
@@ -585,6 +627,19 @@ class HydraSettings(BaseSettings):
     # Token cache settings
     cache_ttl: int = 300  # Token introspection cache TTL (5 minutes)
     max_cache_size: int = 1000  # Maximum cache entries
+    # Share introspection results across replicas through Redis; "auto" does
+    # so with the Redis scheduler, whose REDIS_URL is used
+    cache_backend: Literal["auto", "memory", "redis"] = "auto"
+    cache_key_prefix: str = "bindu:hydra:introspection"
+
+    # Verify JWT access tokens against Hydra's JWKS instead of introspecting
+    # them. A revoked token is then accepted until it expires.
+    verify_jwt_locally: bool = False
+    jwks_cache_ttl: int = 3600  # Seconds Hydra's signing keys are reused
+
+    # Client public key cache for DID signature verification
+    public_key_cache_ttl: int = 300  # Seconds a client's key is reused (0 disables)
+    public_key_cache_size: int = 1000  # Maximum cached keys
 
     # Auto-registration settings
     auto_register_agents: bool = True  # Auto-register agents as OAuth clients
@@ -664,6 +719,10 @@ class StorageSettings(BaseSettings):
     postgres_max_retries: int = 3
     postgres_retry_delay: float = 1.0
 
+    # Seconds between background recounts of the trigger-maintained per-state
+    # task counters, run by one replica per schema (0 disables them)
+    postgres_state_counts_reconcile_interval: float = 3600.0
+
     # Migration settings
     run_migrations_on_startup: bool = False  # Safer default for production
 
@@ -675,6 +734,10 @@ class SchedulerSettings(BaseSettings):
     - memory: In-memory scheduler (default, single-process)
     - redis: Redis scheduler (distributed, multi-process)
 
+    The Redis scheduler keeps its queue either in a list (BLPOP, at-most-once)
+    or in a stream with a consumer group (at-least-once: operations are
+    acknowledged after they ran and reclaimed from crashed workers).
+
     Redis settings must be provided via environment variables or config.
     """
 
@@ -707,6 +770,152 @@ class SchedulerSettings(BaseSettings):
         description="Timeout in seconds for Redis blpop operations. Higher values reduce API calls but increase task start latency.",
     )
 
+    # Redis Streams configuration (queue_mode="stream")
+    queue_mode: Literal["list", "stream"] = Field(
+        default="list",
+        validation_alias=AliasChoices("queue_mode", "REDIS_QUEUE_MODE"),
+        description="Redis queue structure: 'list' (BLPOP) or 'stream' (consumer group with acknowledgements).",
+    )
+    consumer_group: str = "bindu-workers"
+    visibility_timeout: float = Field(
+        default=60.0,
+        validation_alias=AliasChoices("visibility_timeout", "REDIS_VISIBILITY_TIMEOUT"),
+        description="Seconds an unacknowledged stream operation may stay idle before another worker reclaims it. Running operations are refreshed automatically.",
+    )
+    max_deliveries: int = Field(
+        default=5,
+        validation_alias=AliasChoices("max_deliveries", "REDIS_MAX_DELIVERIES"),
+        description="Deliveries after which a stream operation is moved to the '<queue_name>:dead' stream.",
+    )
+    batch_size: int = Field(
+        default=10,
+        validation_alias=AliasChoices("batch_size", "REDIS_BATCH_SIZE"),
+        description="Maximum stream operations read per XREADGROUP round-trip.",
+    )
+
+
+class WorkerSettings(BaseSettings):
+    """Worker pool configuration settings.
+
+    Controls how many task operations a single process executes concurrently.
+    Each slot runs one task at a time; operations for the same context are
+    always serialized, and the worker stops pulling from the scheduler while
+    every slot is busy.
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="WORKER__",
+        extra="allow",
+    )
+
+    max_concurrent_tasks: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum number of task operations executed concurrently per process",
+    )
+
+    # Sync handler execution (overridable per agent via bindufy "execution" config)
+    execution_mode: Literal["inline", "thread", "process"] = Field(
+        default="thread",
+        description="Where sync handlers run: inline on the event loop, a thread pool, or a process pool",
+    )
+    executor_max_workers: int = Field(
+        default=8,
+        ge=1,
+        description="Size of the thread/process pool used for sync handlers",
+    )
+    task_timeout_seconds: float | None = Field(
+        default=None,
+        description="Per-task handler execution timeout in seconds (None disables it)",
+    )
+    stream_queue_size: int = Field(
+        default=64,
+        ge=1,
+        description="Chunks buffered between a sync generator handler and the event loop",
+    )
+
+    # Conversation history handed to the handler
+    history_cache_max_contexts: int = Field(
+        default=1024,
+        ge=0,
+        description="Contexts whose finished tasks' chat history is kept in memory (0 disables)",
+    )
+    history_max_messages: int | None = Field(
+        default=None,
+        ge=1,
+        description="Keep only the most recent N chat messages (None keeps all)",
+    )
+    history_max_tokens: int | None = Field(
+        default=None,
+        ge=1,
+        description="Keep only the most recent messages within ~N tokens, estimated at 4 chars per token (None keeps all)",
+    )
+
+
+class PushNotificationSettings(BaseSettings):
+    """Webhook delivery configuration settings.
+
+    Push notification events are queued per webhook endpoint and delivered in
+    the background, so task execution never waits on a subscriber.
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="PUSH__",
+        extra="allow",
+    )
+
+    queue_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Events buffered per webhook endpoint before new ones are dropped",
+    )
+    max_batch_size: int = Field(
+        default=1,
+        ge=1,
+        description="Queued events sent to an endpoint in one request (1 disables batching)",
+    )
+    timeout: float = Field(
+        default=5.0, gt=0, description="Per-request webhook timeout in seconds"
+    )
+    max_attempts: int = Field(
+        default=3, ge=1, description="Delivery attempts per event or batch"
+    )
+    min_wait: float = Field(
+        default=0.5, ge=0, description="Initial retry backoff in seconds"
+    )
+    max_wait: float = Field(default=5.0, ge=0, description="Maximum retry backoff")
+    endpoint_idle_timeout: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds an endpoint worker waits for events before exiting",
+    )
+    dns_cache_ttl: float = Field(
+        default=60.0,
+        ge=0,
+        description="Seconds a webhook host's SSRF check result is reused (0 disables)",
+    )
+    outbox_enabled: bool = Field(
+        default=True,
+        description="Persist events in storage until delivered so they survive restarts",
+    )
+    outbox_lease_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds an outbox event stays claimed by one replica without renewal",
+    )
+    outbox_rescan_interval: float = Field(
+        default=15.0,
+        gt=0,
+        description="Seconds between outbox scans; also renews held leases, so keep it below the lease",
+    )
+    outbox_page_size: int = Field(
+        default=100,
+        ge=1,
+        description="Outbox events claimed per query",
+    )
+
 
 class RetrySettings(BaseSettings):
     """Retry mechanism configuration settings using Tenacity.
@@ -991,10 +1200,10 @@ class GrpcSettings(BaseSettings):
         description="Port for the gRPC server (default: 3774)",
     )
 
-    # Thread pool size for gRPC server
+    # Threads running blocking registration work (DID keys, HTTP server startup)
     max_workers: int = Field(
         default=10,
-        description="Maximum number of gRPC server worker threads",
+        description="Maximum number of agent registrations set up concurrently",
     )
 
     # Maximum message size (4MB default)
@@ -1009,12 +1218,41 @@ class GrpcSettings(BaseSettings):
         description="Timeout in seconds for calling SDK's HandleMessages",
     )
 
+    # Calls queued for the servicer before the server starts rejecting them
+    max_pending_requests: int = Field(
+        default=10_000,
+        description="Calls waiting to be handled before new ones are rejected (gRPC default: 1000)",
+    )
+
+    # Registered agents without a heartbeat for this long are dropped (seconds)
+    heartbeat_timeout: float = Field(
+        default=90.0,
+        description="Seconds without a heartbeat before a registered agent is dropped (0 disables)",
+    )
+
     # Health check interval for registered agents (seconds)
     health_check_interval: int = Field(
         default=30,
         description="Interval in seconds for health checking registered agents",
     )
 
+    # Channels to an SDK callback address, shared by all clients of that address
+    client_pool_size: int = Field(
+        default=2,
+        ge=1,
+        description="HTTP/2 connections opened per SDK callback address; calls are spread across them",
+    )
+
+    # Keepalive pings to SDK callback addresses (5 min is what gRPC servers accept by default)
+    keepalive_time_ms: int = Field(
+        default=300_000,
+        description="Interval in milliseconds between keepalive pings to an SDK during calls",
+    )
+    keepalive_timeout_ms: int = Field(
+        default=10_000,
+        description="Milliseconds to wait for a keepalive ack before the connection is dropped",
+    )
+
 
 class Settings(BaseSettings):
     """Main settings class that aggregates all configuration components."""
@@ -1040,6 +1278,8 @@ class Settings(BaseSettings):
     oauth: OAuthSettings = OAuthSettings()
     storage: StorageSettings = StorageSettings()
     scheduler: SchedulerSettings = SchedulerSettings()
+    worker: WorkerSettings = WorkerSettings()
+    push: PushNotificationSettings = PushNotificationSettings()
     retry: RetrySettings = RetrySettings()
     negotiation: NegotiationSettings = NegotiationSettings()
     sentry: SentrySettings = SentrySettings()
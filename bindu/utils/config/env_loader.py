@@ -80,6 +80,7 @@ def create_scheduler_config_from_env(user_config: Dict[str, Any]):
         return SchedulerConfig(
             type=scheduler_type,
             redis_url=scheduler_dict.get("redis_url"),
+            **_redis_queue_options(scheduler_dict),
         )
 
     # Load from environment
@@ -101,10 +102,34 @@ def create_scheduler_config_from_env(user_config: Dict[str, Any]):
             logger.debug("Loaded REDIS_URL from environment")
 
     return SchedulerConfig(
-        type=cast(Literal["redis", "memory"], scheduler_type), redis_url=redis_url
+        type=cast(Literal["redis", "memory"], scheduler_type),
+        redis_url=redis_url,
+        **_redis_queue_options({}),
     )
 
 
+def _redis_queue_options(scheduler_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Resolve Redis queue options from user config, falling back to settings.
+
+    Settings are read from the environment (REDIS_QUEUE_MODE,
+    REDIS_VISIBILITY_TIMEOUT, ...), so they apply whether or not the agent
+    config declares a scheduler section.
+    """
+    from bindu.settings import app_settings
+
+    settings = app_settings.scheduler
+    return {
+        key: scheduler_dict.get(key, getattr(settings, key))
+        for key in (
+            "queue_mode",
+            "consumer_group",
+            "visibility_timeout",
+            "max_deliveries",
+            "batch_size",
+        )
+    }
+
+
 def create_tunnel_config_from_env(user_config: Dict[str, Any]):
     """Create TunnelConfig from environment variables and user config.
 
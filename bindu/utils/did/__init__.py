@@ -5,8 +5,15 @@ and validation.
 """
 
 from .signature import (
+    SIGNATURE_VERSION_DIGEST,
+    SIGNATURE_VERSION_HEADER,
+    SIGNATURE_VERSION_LEGACY,
+    SUPPORTED_SIGNATURE_VERSIONS,
+    create_digest_signature_payload,
     create_signature_payload,
+    decode_public_key,
     sign_request,
+    verify_digest_signature,
     verify_signature,
     extract_signature_headers,
 )
@@ -14,8 +21,15 @@ from .validation import validate_did_extension, check_did_match
 
 __all__ = [
     # Signature utilities
+    "SIGNATURE_VERSION_DIGEST",
+    "SIGNATURE_VERSION_HEADER",
+    "SIGNATURE_VERSION_LEGACY",
+    "SUPPORTED_SIGNATURE_VERSIONS",
+    "create_digest_signature_payload",
     "create_signature_payload",
+    "decode_public_key",
     "sign_request",
+    "verify_digest_signature",
     "verify_signature",
     "extract_signature_headers",
     # Validation utilities
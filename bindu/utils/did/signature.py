@@ -2,21 +2,41 @@
 
 This module provides utilities for signing and verifying requests using
 DID-based cryptographic signatures for enhanced security.
+
+Two signature schemes are supported, selected by the X-DID-Signature-Version
+header:
+
+- Version 1 (legacy, header absent): the body is decoded to a string, wrapped
+  in a dict with the DID and timestamp, and signed as sorted JSON
+- Version 2: the DID, timestamp and SHA-256 digest of the raw body bytes are
+  signed, so a verifier can hash the body chunk by chunk as it arrives
+  instead of decoding and re-serializing it
 """
 
 from __future__ import annotations as _annotations
 
+import hashlib
 import json
 import time
 from typing import Any, Dict, Optional
 
+import base58
+from nacl.exceptions import BadSignatureError
+from nacl.signing import VerifyKey
+
 from bindu.utils.logging import get_logger
 
 logger = get_logger("bindu.utils.did_signature")
 
+# Header selecting the signature scheme; absent means the legacy scheme
+SIGNATURE_VERSION_HEADER = "X-DID-Signature-Version"
+SIGNATURE_VERSION_LEGACY = 1
+SIGNATURE_VERSION_DIGEST = 2
+SUPPORTED_SIGNATURE_VERSIONS = (SIGNATURE_VERSION_LEGACY, SIGNATURE_VERSION_DIGEST)
+
 
 def create_signature_payload(
-    body: str | bytes | dict, did: str, timestamp: Optional[int] = None
+    body: str | bytes | bytearray | dict, did: str, timestamp: Optional[int] = None
 ) -> Dict[str, Any]:
     """Create signature payload for request signing.
 
@@ -34,7 +54,7 @@ def create_signature_payload(
     # Convert body to string
     if isinstance(body, dict):
         body_str = json.dumps(body, sort_keys=True)
-    elif isinstance(body, bytes):
+    elif isinstance(body, (bytes, bytearray)):
         body_str = body.decode("utf-8")
     else:
         body_str = str(body)
@@ -42,8 +62,40 @@ def create_signature_payload(
     return {"body": body_str, "timestamp": timestamp, "did": did}
 
 
+def create_digest_signature_payload(
+    body_digest: bytes, did: str, timestamp: int
+) -> str:
+    """Create the version 2 signature payload.
+
+    Args:
+        body_digest: SHA-256 digest of the raw request body
+        did: Client's DID
+        timestamp: Unix timestamp
+
+    Returns:
+        Text to sign
+    """
+    return f"bindu-did-v2\n{did}\n{timestamp}\n{body_digest.hex()}"
+
+
+def _body_bytes(body: str | bytes | dict) -> bytes:
+    """Return the bytes a version 2 signature covers.
+
+    These must be exactly the bytes sent; a dict is sent as ``json.dumps(body)``.
+    """
+    if isinstance(body, dict):
+        return json.dumps(body).encode("utf-8")
+    if isinstance(body, (bytes, bytearray)):
+        return bytes(body)
+    return str(body).encode("utf-8")
+
+
 def sign_request(
-    body: str | bytes | dict, did: str, did_extension, timestamp: Optional[int] = None
+    body: str | bytes | dict,
+    did: str,
+    did_extension,
+    timestamp: Optional[int] = None,
+    version: int = SIGNATURE_VERSION_LEGACY,
 ) -> Dict[str, str]:
     """Sign a request with DID private key.
 
@@ -52,87 +104,162 @@ def sign_request(
         did: Client's DID
         did_extension: DIDExtension instance with private key
         timestamp: Unix timestamp (defaults to current time)
+        version: Signature scheme; servers before version 2 only verify 1
 
     Returns:
-        Dict with signature headers (X-DID, X-DID-Signature, X-DID-Timestamp)
+        Dict with signature headers (X-DID, X-DID-Signature, X-DID-Timestamp,
+        and X-DID-Signature-Version for version 2)
     """
-    # Create signature payload
-    payload = create_signature_payload(body, did, timestamp)
-    payload_str = json.dumps(payload, sort_keys=True)
+    if timestamp is None:
+        timestamp = int(time.time())
+
+    if version == SIGNATURE_VERSION_DIGEST:
+        payload_str = create_digest_signature_payload(
+            hashlib.sha256(_body_bytes(body)).digest(), did, timestamp
+        )
+    elif version == SIGNATURE_VERSION_LEGACY:
+        payload = create_signature_payload(body, did, timestamp)
+        payload_str = json.dumps(payload, sort_keys=True)
+    else:
+        raise ValueError(f"Unsupported DID signature version: {version}")
 
     # Sign with private key
-    signature = did_extension.sign_message(payload_str)
+    signature = did_extension.sign_text(payload_str)
 
-    return {
+    headers = {
         "X-DID": did,
         "X-DID-Signature": signature,
-        "X-DID-Timestamp": str(payload["timestamp"]),
+        "X-DID-Timestamp": str(timestamp),
     }
+    if version != SIGNATURE_VERSION_LEGACY:
+        headers[SIGNATURE_VERSION_HEADER] = str(version)
+    return headers
+
+
+def decode_public_key(public_key: str) -> VerifyKey:
+    """Decode a base58-encoded Ed25519 public key.
+
+    Args:
+        public_key: Public key as registered in the client's Hydra metadata
+
+    Returns:
+        Key ready to verify signatures
+
+    Raises:
+        ValueError: If the value is not a base58-encoded Ed25519 public key
+    """
+    try:
+        return VerifyKey(base58.b58decode(public_key))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid Ed25519 public key: {e}") from e
+
+
+def _verify_payload(
+    payload: bytes,
+    signature: str,
+    did: str,
+    timestamp: int,
+    public_key: str | VerifyKey,
+    max_age_seconds: int,
+) -> bool:
+    """Check the timestamp, then the Ed25519 signature of ``payload``."""
+    # Check timestamp to prevent replay attacks
+    current_time = int(time.time())
+    if abs(current_time - timestamp) > max_age_seconds:
+        logger.warning(
+            f"Request timestamp too old: {timestamp} vs {current_time} "
+            f"(max age: {max_age_seconds}s)"
+        )
+        return False
+
+    # Decode the base58-encoded public key and signature
+    try:
+        signature_bytes = base58.b58decode(signature)
+
+        verify_key = (
+            public_key
+            if isinstance(public_key, VerifyKey)
+            else decode_public_key(public_key)
+        )
+
+        # Verify the signature
+        verify_key.verify(payload, signature_bytes)
+        is_valid = True
+    except (BadSignatureError, ValueError, TypeError, Exception) as e:
+        logger.debug(f"Signature verification failed: {e}")
+        is_valid = False
+
+    if not is_valid:
+        logger.warning(f"Invalid DID signature for {did}")
+
+    return is_valid
 
 
 def verify_signature(
-    body: str | bytes | dict,
+    body: str | bytes | bytearray | dict,
     signature: str,
     did: str,
     timestamp: int,
-    public_key: str,
+    public_key: str | VerifyKey,
     max_age_seconds: int = 300,
 ) -> bool:
-    """Verify DID signature on a request.
+    """Verify a legacy (version 1) DID signature on a request.
 
     Args:
         body: Request body
         signature: DID signature from X-DID-Signature header
         did: Client's DID from X-DID header
         timestamp: Timestamp from X-DID-Timestamp header
-        public_key: Client's public key (multibase encoded)
+        public_key: Client's public key, base58 encoded or already decoded
         max_age_seconds: Maximum age of request in seconds (default 5 minutes)
 
     Returns:
         True if signature is valid, False otherwise
     """
     try:
-        # Check timestamp to prevent replay attacks
-        current_time = int(time.time())
-        if abs(current_time - timestamp) > max_age_seconds:
-            logger.warning(
-                f"Request timestamp too old: {timestamp} vs {current_time} "
-                f"(max age: {max_age_seconds}s)"
-            )
-            return False
-
         # Reconstruct signature payload
         payload = create_signature_payload(body, did, timestamp)
         payload_str = json.dumps(payload, sort_keys=True)
 
-        # Verify signature with public key
-        import base58
-        from nacl.signing import VerifyKey
-        from nacl.exceptions import BadSignatureError
-
-        # Decode the base58-encoded public key and signature
-        try:
-            public_key_bytes = base58.b58decode(public_key)
-            signature_bytes = base58.b58decode(signature)
+        return _verify_payload(
+            payload_str.encode("utf-8"),
+            signature,
+            did,
+            timestamp,
+            public_key,
+            max_age_seconds,
+        )
 
-            # Create verify key from public key bytes
-            verify_key = VerifyKey(public_key_bytes)
+    except (UnicodeEncodeError, UnicodeDecodeError, ValueError, TypeError) as e:
+        logger.error(f"Failed to verify DID signature: {e}")
+        return False
 
-            # Verify the signature
-            verify_key.verify(payload_str.encode("utf-8"), signature_bytes)
-            is_valid = True
-        except (BadSignatureError, ValueError, TypeError, Exception) as e:
-            logger.debug(f"Signature verification failed: {e}")
-            is_valid = False
 
-        if not is_valid:
-            logger.warning(f"Invalid DID signature for {did}")
+def verify_digest_signature(
+    body_digest: bytes,
+    signature: str,
+    did: str,
+    timestamp: int,
+    public_key: str | VerifyKey,
+    max_age_seconds: int = 300,
+) -> bool:
+    """Verify a version 2 DID signature on a request.
 
-        return is_valid
+    Args:
+        body_digest: SHA-256 digest of the raw request body
+        signature: DID signature from X-DID-Signature header
+        did: Client's DID from X-DID header
+        timestamp: Timestamp from X-DID-Timestamp header
+        public_key: Client's public key, base58 encoded or already decoded
+        max_age_seconds: Maximum age of request in seconds (default 5 minutes)
 
-    except (ImportError, UnicodeEncodeError, ValueError, TypeError) as e:
-        logger.error(f"Failed to verify DID signature: {e}")
-        return False
+    Returns:
+        True if signature is valid, False otherwise
+    """
+    payload = create_digest_signature_payload(body_digest, did, timestamp)
+    return _verify_payload(
+        payload.encode("utf-8"), signature, did, timestamp, public_key, max_age_seconds
+    )
 
 
 def extract_signature_headers(headers: dict) -> Optional[Dict[str, Any]]:
@@ -142,11 +269,16 @@ def extract_signature_headers(headers: dict) -> Optional[Dict[str, Any]]:
         headers: Request headers dict
 
     Returns:
-        Dict with did, signature, timestamp or None if missing
+        Dict with did, signature, timestamp and version, or None if missing.
+        A version that is not an integer is returned as sent, so it is
+        rejected as unsupported instead of passing as unsigned.
     """
     did = headers.get("X-DID") or headers.get("x-did")
     signature = headers.get("X-DID-Signature") or headers.get("x-did-signature")
     timestamp_str = headers.get("X-DID-Timestamp") or headers.get("x-did-timestamp")
+    version_str = headers.get(SIGNATURE_VERSION_HEADER) or headers.get(
+        SIGNATURE_VERSION_HEADER.lower()
+    )
 
     if not all([did, signature, timestamp_str]):
         return None
@@ -159,4 +291,16 @@ def extract_signature_headers(headers: dict) -> Optional[Dict[str, Any]]:
         logger.warning(f"Invalid timestamp format: {timestamp_str}")
         return None
 
-    return {"did": did, "signature": signature, "timestamp": timestamp}
+    version: int | str
+    try:
+        version = int(version_str) if version_str else SIGNATURE_VERSION_LEGACY
+    except (ValueError, TypeError):
+        logger.warning(f"Invalid signature version: {version_str}")
+        version = str(version_str)
+
+    return {
+        "did": did,
+        "signature": signature,
+        "timestamp": timestamp,
+        "version": version,
+    }
@@ -11,7 +11,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 from urllib.parse import urlparse
 
-from bindu.utils.did import sign_request
+from bindu.utils.did import SIGNATURE_VERSION_DIGEST, sign_request
 from .client import AsyncHTTPClient
 from bindu.utils.logging import get_logger
 from .tokens import get_client_credentials_token
@@ -92,9 +92,12 @@ class HybridAuthClient:
         assert self.credentials is not None
         assert self.access_token is not None
 
-        # Get DID signature headers
+        # Get DID signature headers, signing a digest of the raw body
         signature_headers = sign_request(
-            body, self.credentials.client_id, self.did_extension
+            body,
+            self.credentials.client_id,
+            self.did_extension,
+            version=SIGNATURE_VERSION_DIGEST,
         )
 
         # Combine with OAuth token
@@ -133,9 +136,10 @@ class HybridAuthClient:
         base_url = f"{parsed.scheme}://{parsed.netloc}"
         path = parsed.path or "/"
 
-        # Create signed request headers
-        body_str = json.dumps(data)
-        auth_headers = self._create_signed_request_headers(body_str)
+        # Create signed request headers. The body is sent as these exact
+        # bytes, since the signature covers their digest.
+        body = json.dumps(data).encode("utf-8")
+        auth_headers = self._create_signed_request_headers(body)
 
         # Merge with additional headers
         if headers:
@@ -143,7 +147,7 @@ class HybridAuthClient:
 
         # Make request
         async with AsyncHTTPClient(base_url=base_url) as client:
-            response = await client.post(path, headers=auth_headers, json=data)
+            response = await client.post(path, headers=auth_headers, data=body)
 
             if response.status == 401:
                 # Token might be expired, refresh and retry
@@ -151,12 +155,12 @@ class HybridAuthClient:
                 await self.refresh_token()
 
                 # Update headers with new token
-                auth_headers = self._create_signed_request_headers(body_str)
+                auth_headers = self._create_signed_request_headers(body)
                 if headers:
                     auth_headers.update(headers)
 
                 # Retry request
-                response = await client.post(path, headers=auth_headers, json=data)
+                response = await client.post(path, headers=auth_headers, data=body)
 
             return await response.json()
 
@@ -93,7 +93,7 @@ class AsyncHTTPClient:
         endpoint: str,
         *,
         params: dict[str, Any] | None = None,
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | None = None,
         json: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         **kwargs,
@@ -106,7 +106,7 @@ class AsyncHTTPClient:
             method: HTTP method (GET, POST, PUT, DELETE, etc.)
             endpoint: API endpoint (will be appended to base_url)
             params: URL query parameters
-            data: Form data to send
+            data: Form data or raw body bytes to send
             json: JSON data to send
             headers: Additional headers for this request
             **kwargs: Additional arguments for aiohttp request
@@ -209,7 +209,7 @@ class AsyncHTTPClient:
         self,
         endpoint: str,
         *,
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | None = None,
         json: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         **kwargs,
@@ -218,7 +218,7 @@ class AsyncHTTPClient:
 
         Args:
             endpoint: API endpoint
-            data: Form data to send
+            data: Form data or raw body bytes to send
             json: JSON data to send
             headers: Additional headers
             **kwargs: Additional arguments
@@ -235,7 +235,7 @@ class AsyncHTTPClient:
         self,
         endpoint: str,
         *,
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | None = None,
         json: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         **kwargs,
@@ -244,7 +244,7 @@ class AsyncHTTPClient:
 
         Args:
             endpoint: API endpoint
-            data: Form data to send
+            data: Form data or raw body bytes to send
             json: JSON data to send
             headers: Additional headers
             **kwargs: Additional arguments
@@ -281,7 +281,7 @@ class AsyncHTTPClient:
         self,
         endpoint: str,
         *,
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | None = None,
         json: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         **kwargs,
@@ -290,7 +290,7 @@ class AsyncHTTPClient:
 
         Args:
             endpoint: API endpoint
-            data: Form data to send
+            data: Form data or raw body bytes to send
             json: JSON data to send
             headers: Additional headers
             **kwargs: Additional arguments
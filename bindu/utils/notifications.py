@@ -6,12 +6,16 @@ import asyncio
 import ipaddress
 import json
 import socket
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from typing import Any
-from urllib import error, request
 from urllib.parse import urlparse
 
+import aiohttp
+
 from bindu.common.protocol.types import PushNotificationConfig
+from bindu.utils.exceptions import HTTPError
+from bindu.utils.http.client import AsyncHTTPClient
 from bindu.utils.logging import get_logger
 from bindu.utils.retry import create_retry_decorator
 
@@ -48,27 +52,45 @@ class NotificationDeliveryError(Exception):
         super().__init__(message)
         self.status = status
 
+    @property
+    def retryable(self) -> bool:
+        """Whether a later attempt may succeed (network errors, 5xx and 429)."""
+        return self.status is None or self.status >= 500 or self.status == 429
+
 
 @dataclass
 class NotificationService:
     """Deliver push notification events to configured HTTP endpoints.
 
+    Requests go through one keep-alive aiohttp session per webhook origin.
+    The SSRF check's verdict for a hostname is cached for dns_cache_ttl
+    seconds, and validate_config_async resolves without blocking the loop.
+
     Includes lightweight in-memory delivery metrics for observability.
     Uses unified retry decorator for consistent retry behavior.
     """
 
     timeout: float = 5.0
+    dns_cache_ttl: float = 60.0
 
     # --- Metrics ---
     total_sent: int = 0
     total_success: int = 0
     total_failures: int = 0
 
+    # hostname -> (expiry, rejection reason or None if allowed)
+    _host_verdicts: dict[str, tuple[float, str | None]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _clients: dict[str, AsyncHTTPClient] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
     async def send_event(
         self, config: PushNotificationConfig, event: dict[str, Any]
     ) -> None:
         """Send an event to the configured HTTP webhook."""
-        self.validate_config(config)
+        await self.validate_config_async(config)
 
         payload = json.dumps(event, separators=(",", ":")).encode("utf-8")
         headers = self._build_headers(config)
@@ -76,6 +98,22 @@ class NotificationService:
         # Use unified retry decorator for consistent retry behavior
         await self._post_with_retry(config["url"], headers, payload, event)
 
+    async def deliver(
+        self, config: PushNotificationConfig, event: dict[str, Any]
+    ) -> None:
+        """Send an event once, leaving retries to the caller.
+
+        Raises:
+            ValueError: If the webhook URL fails validation
+            NotificationDeliveryError: If the webhook does not accept the event
+        """
+        await self.validate_config_async(config)
+
+        payload = json.dumps(event, separators=(",", ":")).encode("utf-8")
+        await self._send_once(
+            config["url"], self._build_headers(config), payload, event
+        )
+
     def validate_config(self, config: PushNotificationConfig) -> None:
         """Validate push notification configuration before use.
 
@@ -83,41 +121,89 @@ class NotificationService:
         and rejects any address that falls within a private, loopback, link-local
         or cloud-metadata range to prevent Server-Side Request Forgery (SSRF).
         """
-        parsed = urlparse(config["url"])
+        hostname = self._validate_url(config["url"])
+        verdict = self._host_verdicts.get(hostname)
+        if verdict is None or time.monotonic() >= verdict[0]:
+            try:
+                addresses = socket.getaddrinfo(hostname, None)
+            except socket.gaierror as exc:
+                raise self._unresolved(exc) from exc
+            verdict = self._store_verdict(hostname, addresses)
+        if verdict[1] is not None:
+            raise ValueError(verdict[1])
+
+    async def validate_config_async(self, config: PushNotificationConfig) -> None:
+        """Validate like validate_config, resolving off the event loop."""
+        hostname = self._validate_url(config["url"])
+        verdict = self._host_verdicts.get(hostname)
+        if verdict is None or time.monotonic() >= verdict[0]:
+            try:
+                addresses = await asyncio.get_running_loop().getaddrinfo(hostname, None)
+            except socket.gaierror as exc:
+                raise self._unresolved(exc) from exc
+            verdict = self._store_verdict(hostname, addresses)
+        if verdict[1] is not None:
+            raise ValueError(verdict[1])
+
+    @staticmethod
+    def _validate_url(url: str) -> str:
+        """Check the URL structure and return its hostname."""
+        parsed = urlparse(url)
         if parsed.scheme not in {"http", "https"}:
             raise ValueError("Push notification URL must use http or https scheme.")
         if not parsed.netloc:
             raise ValueError("Push notification URL must include a network location.")
 
-        # SSRF defence: resolve the hostname and reject internal/private addresses.
         hostname = parsed.hostname
         if not hostname:
             raise ValueError("Push notification URL must include a valid hostname.")
-        try:
-            resolved_ip = socket.getaddrinfo(hostname, None)[0][4][0]
-            addr = ipaddress.ip_address(resolved_ip)
-        except (socket.gaierror, ValueError) as exc:
-            raise ValueError(
-                f"Push notification URL hostname could not be resolved: {exc}"
-            ) from exc
-
-        for blocked in _BLOCKED_NETWORKS:
-            if addr in blocked:
-                raise ValueError(
+        return hostname
+
+    @staticmethod
+    def _unresolved(exc: Exception) -> ValueError:
+        return ValueError(
+            f"Push notification URL hostname could not be resolved: {exc}"
+        )
+
+    def _store_verdict(
+        self, hostname: str, addresses: list[tuple[Any, ...]]
+    ) -> tuple[float, str | None]:
+        """Check every resolved address against the blocked ranges."""
+        reason = None
+        for *_, sockaddr in addresses:
+            try:
+                addr = ipaddress.ip_address(sockaddr[0])
+            except ValueError as exc:
+                raise self._unresolved(exc) from exc
+            blocked = next((net for net in _BLOCKED_NETWORKS if addr in net), None)
+            if blocked is not None:
+                reason = (
                     f"Push notification URL resolves to a blocked address range "
                     f"({addr} is in {blocked}). Internal addresses are not allowed."
                 )
+                break
+
+        verdict = (time.monotonic() + self.dns_cache_ttl, reason)
+        if self.dns_cache_ttl > 0:
+            self._host_verdicts[hostname] = verdict
+        return verdict
 
     @create_retry_decorator("api", max_attempts=3, min_wait=0.5, max_wait=5.0)
     async def _post_with_retry(
         self, url: str, headers: dict[str, str], payload: bytes, event: dict[str, Any]
     ) -> None:
         """Send POST request with automatic retry via unified retry decorator."""
+        await self._send_once(url, headers, payload, event)
+
+    async def _send_once(
+        self, url: str, headers: dict[str, str], payload: bytes, event: dict[str, Any]
+    ) -> None:
+        """Send one POST request and record delivery metrics."""
         # --- Metrics: count total attempts to send ---
         self.total_sent += 1
 
         try:
-            status = await asyncio.to_thread(self._post_once, url, headers, payload)
+            status = await self._post(url, headers, payload)
             logger.debug(
                 "Delivered push notification",
                 event_id=event.get("event_id"),
@@ -149,35 +235,44 @@ class NotificationService:
             self.total_failures += 1
             raise
 
-    def _post_once(self, url: str, headers: dict[str, str], payload: bytes) -> int:
-        req = request.Request(url, data=payload, method="POST")
-        for key, value in headers.items():
-            req.add_header(key, value)
+    async def _post(self, url: str, headers: dict[str, str], payload: bytes) -> int:
+        """POST the payload through the origin's pooled session."""
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        path = parsed.path or "/"
+        if parsed.query:
+            path = f"{path}?{parsed.query}"
+
+        client = self._clients.get(origin)
+        if client is None:
+            client = AsyncHTTPClient(origin, timeout=self.timeout)  # type: ignore[arg-type]
+            self._clients[origin] = client
 
         try:
-            # URL scheme is validated in validate_config() to only allow http/https
-            with request.urlopen(req, timeout=self.timeout) as response:  # nosec B310
-                status = response.getcode()
-                if 200 <= status < 300:
-                    return status
-                raise NotificationDeliveryError(
-                    status, f"Unexpected status code: {status}"
-                )
-        except error.HTTPError as exc:
-            status = exc.code
-            body = b""
-            try:
-                body = exc.read() or b""
-            except OSError:
-                body = b""
-            message = body.decode("utf-8", errors="ignore").strip()
-            raise NotificationDeliveryError(
-                status, message or f"HTTP error {status}"
-            ) from exc
-        except error.URLError as exc:
+            # Redirects are not followed: the target was never SSRF-checked
+            response = await client.request(
+                "POST",
+                path,
+                data=payload,  # type: ignore[arg-type]
+                headers=headers,
+                allow_redirects=False,
+            )
+        except HTTPError as exc:
+            raise NotificationDeliveryError(exc.status, exc.message) from exc
+        except aiohttp.ClientError as exc:
+            raise NotificationDeliveryError(None, f"Connection error: {exc}") from exc
+
+        if not 200 <= response.status < 300:
             raise NotificationDeliveryError(
-                None, f"Connection error: {exc.reason}"
-            ) from exc
+                response.status, f"Unexpected status code: {response.status}"
+            )
+        return response.status
+
+    async def close(self) -> None:
+        """Close the pooled HTTP sessions."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.close()
 
     def _build_headers(self, config: PushNotificationConfig) -> dict[str, str]:
         headers = {"Content-Type": "application/json"}
@@ -7,13 +7,21 @@ This package provides utilities for worker operations including:
 - Task state management
 """
 
-from .messages import MessageConverter, ChatMessage, ProtocolMessage
+from .messages import (
+    ChatHistoryCache,
+    FileInterceptor,
+    MessageConverter,
+    ChatMessage,
+    ProtocolMessage,
+)
 from .parts import PartConverter
 from .artifacts import ArtifactBuilder
 from .tasks import TaskStateManager
 
 __all__ = [
     # Message conversion
+    "ChatHistoryCache",
+    "FileInterceptor",
     "MessageConverter",
     "ChatMessage",
     "ProtocolMessage",
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import io
+import threading
+from collections import OrderedDict
 from typing import Any, Optional, Union
 from uuid import UUID, uuid4
 
@@ -22,8 +25,112 @@ logger = get_logger("bindu.utils.worker.messages")
 ChatMessage = dict[str, str]
 ProtocolMessage = Message
 
+# Upper bound on extracted document text kept in memory (in characters)
+MAX_PARSED_TEXT_CACHE_CHARS = 16 * 1024 * 1024
+
+
+class ParsedTextCache:
+    """Size-bounded LRU of extracted document text, keyed by content hash.
+
+    Thread-safe, since extraction runs in worker threads.
+    """
+
+    def __init__(self, max_chars: int = MAX_PARSED_TEXT_CACHE_CHARS):
+        self.max_chars = max_chars
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> str | None:
+        """Return the cached text for key, marking it recently used."""
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+            return text
+
+    def put(self, key: str, text: str) -> None:
+        """Cache text for key, evicting least recently used entries."""
+        if len(text) > self.max_chars:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = text
+            self._size += len(text)
+            while self._size > self.max_chars:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        """Drop all cached text."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class ChatHistoryCache:
+    """Chat-formatted history of finished tasks, grouped by context.
+
+    Only terminal tasks are cached: they are immutable, so their converted
+    history never goes stale. Contexts are evicted least recently used.
+    """
+
+    def __init__(self, max_contexts: int = 1024):
+        self.max_contexts = max_contexts
+        self._contexts: OrderedDict[UUID, dict[UUID, list[ChatMessage]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._contexts)
+
+    def get(self, context_id: UUID) -> dict[UUID, list[ChatMessage]]:
+        """Return the cached task histories of a context (task_id -> messages)."""
+        tasks = self._contexts.get(context_id)
+        if tasks is None:
+            return {}
+        self._contexts.move_to_end(context_id)
+        return dict(tasks)
+
+    def put(self, context_id: UUID, task_id: UUID, history: list[ChatMessage]) -> None:
+        """Cache the chat history of a finished task."""
+        if self.max_contexts <= 0:
+            return
+        tasks = self._contexts.get(context_id)
+        if tasks is None:
+            tasks = self._contexts[context_id] = {}
+            while len(self._contexts) > self.max_contexts:
+                self._contexts.popitem(last=False)
+        else:
+            self._contexts.move_to_end(context_id)
+        tasks[task_id] = history
+
+    def retain(self, context_id: UUID, task_ids: set[UUID]) -> None:
+        """Forget cached tasks of a context that are no longer in storage."""
+        tasks = self._contexts.get(context_id)
+        if tasks is None:
+            return
+        for task_id in tasks.keys() - task_ids:
+            del tasks[task_id]
+
+    def invalidate(self, context_id: UUID) -> None:
+        """Drop everything cached for a context."""
+        self._contexts.pop(context_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached history."""
+        self._contexts.clear()
+
+
 class FileInterceptor:
-    """Native pipeline for intercepting and parsing Base64 file parts."""
+    """Native pipeline for intercepting and parsing Base64 file parts.
+
+    Extracted text is cached by content hash, so a document uploaded early in
+    a conversation is parsed once rather than on every later turn.
+    """
     
     SUPPORTED_MIME_TYPES = {
         "application/pdf",
@@ -31,6 +138,24 @@ class FileInterceptor:
         "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
     }
 
+    parsed_text_cache = ParsedTextCache()
+
+    @staticmethod
+    def contains_files(history: list[Message]) -> bool:
+        """Check whether any message in history carries a file part."""
+        return any(
+            part.get("kind") == "file"
+            for msg in history
+            for part in msg.get("parts", [])
+        )
+
+    @staticmethod
+    def _cache_key(mime_type: str, base64_data: str) -> str:
+        digest = hashlib.sha256(mime_type.encode())
+        digest.update(b"\0")
+        digest.update(base64_data.encode())
+        return digest.hexdigest()
+
     @staticmethod
     def _extract_pdf(file_bytes: bytes) -> str:
         """Extract text from a PDF buffer."""
@@ -72,6 +197,12 @@ class FileInterceptor:
                 })
                 continue
                 
+            cache_key = cls._cache_key(mime_type, base64_data)
+            cached_text = cls.parsed_text_cache.get(cache_key)
+            if cached_text is not None:
+                processed_parts.append({"kind": "text", "text": cached_text})
+                continue
+
             try:
                 # Decode the Base64 payload
                 file_bytes = base64.b64decode(base64_data)
@@ -86,10 +217,9 @@ class FileInterceptor:
                     extracted_text = cls._extract_docx(file_bytes)
                     
                 # Inject the parsed document as a formatted text prompt
-                processed_parts.append({
-                    "kind": "text",
-                    "text": f"--- Document Uploaded ---\n{extracted_text}\n--- End of Document ---"
-                })
+                document_text = f"--- Document Uploaded ---\n{extracted_text}\n--- End of Document ---"
+                cls.parsed_text_cache.put(cache_key, document_text)
+                processed_parts.append({"kind": "text", "text": document_text})
                 
             except Exception as e:
                 logger.error(f"Base64 decoding or routing failed: {e}")
@@ -130,6 +260,32 @@ class MessageConverter:
 
         return result
 
+    @staticmethod
+    def apply_window(
+        history: list[ChatMessage],
+        max_messages: int | None = None,
+        max_tokens: int | None = None,
+    ) -> list[ChatMessage]:
+        """Keep the most recent messages that fit the window.
+
+        Tokens are estimated at four characters each. The newest message is
+        always kept, even if it alone exceeds max_tokens.
+        """
+        if max_messages is not None and len(history) > max_messages:
+            history = history[-max_messages:]
+        if max_tokens is None:
+            return history
+
+        budget = max_tokens
+        start = len(history)
+        while start > 0:
+            cost = len(history[start - 1].get("content", "")) // 4 + 1
+            if cost > budget and start < len(history):
+                break
+            budget -= cost
+            start -= 1
+        return history[start:]
+
     @staticmethod
     def to_protocol_messages(
         result: Any,
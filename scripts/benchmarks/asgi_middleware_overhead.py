@@ -0,0 +1,175 @@
+"""Benchmark per-request overhead of the metrics and x402 middleware.
+
+Sends JSON-RPC requests straight into the ASGI stack for the ``/`` endpoint
+and compares the pure ASGI MetricsMiddleware and X402Middleware with
+equivalent BaseHTTPMiddleware versions (the previous implementation). The
+x402 middleware runs for a method that does not require payment, so the
+numbers cover reading and replaying the body, not payment verification.
+
+Usage:
+    uv run python scripts/benchmarks/asgi_middleware_overhead.py
+    uv run python scripts/benchmarks/asgi_middleware_overhead.py --requests 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from bindu.server.metrics import get_metrics
+from bindu.server.middleware import MetricsMiddleware, X402Middleware
+from bindu.server.middleware.metrics import NUMERIC_ID_PATTERN, UUID_PATTERN
+from bindu.settings import app_settings
+
+BODY = json.dumps(
+    {"jsonrpc": "2.0", "id": 1, "method": "tasks/get", "params": {"taskId": "1"}}
+).encode()
+
+
+class LegacyMetricsMiddleware(BaseHTTPMiddleware):
+    """The BaseHTTPMiddleware metrics implementation, for comparison."""
+
+    async def dispatch(self, request, call_next):
+        metrics = get_metrics()
+        metrics.increment_requests_in_flight()
+        try:
+            request_size = int(request.headers.get("content-length") or 0)
+            start_time = time.time()
+            response = await call_next(request)
+            duration = time.time() - start_time
+            endpoint = UUID_PATTERN.sub("/:id", request.url.path)
+            endpoint = NUMERIC_ID_PATTERN.sub("/:id", endpoint)
+            metrics.record_http_request(
+                request.method,
+                endpoint,
+                str(response.status_code),
+                duration,
+                request_size=request_size,
+                response_size=int(response.headers.get("content-length") or 0),
+            )
+            return response
+        finally:
+            metrics.decrement_requests_in_flight()
+
+
+class LegacyX402Middleware(BaseHTTPMiddleware):
+    """The BaseHTTPMiddleware x402 pass-through path, for comparison."""
+
+    async def dispatch(self, request, call_next):
+        body = await request.body()
+        method = json.loads(body.decode("utf-8")).get("method", "")
+
+        async def receive():
+            return {"type": "http.request", "body": body}
+
+        request = Request(request.scope, receive)
+        if method not in app_settings.x402.protected_methods:
+            return await call_next(request)
+        raise AssertionError("benchmark only sends unprotected methods")
+
+
+async def _endpoint(request: Request) -> JSONResponse:
+    body = await request.json()
+    return JSONResponse({"jsonrpc": "2.0", "id": body["id"], "result": {}})
+
+
+def _app(middleware: list[Middleware]) -> Starlette:
+    return Starlette(
+        routes=[Route("/", _endpoint, methods=["POST"])], middleware=middleware
+    )
+
+
+def _stacks() -> dict[str, Starlette]:
+    x402_options = {
+        "manifest": SimpleNamespace(name="bench", description="", did_extension=None),
+        "facilitator_config": {"url": "https://facilitator.example"},
+        "x402_ext": SimpleNamespace(),
+        "payment_requirements": [],
+    }
+    return {
+        "no middleware": _app([]),
+        "BaseHTTPMiddleware": _app(
+            [Middleware(LegacyX402Middleware), Middleware(LegacyMetricsMiddleware)]
+        ),
+        "pure ASGI": _app(
+            [
+                Middleware(X402Middleware, **x402_options),
+                Middleware(MetricsMiddleware),
+            ]
+        ),
+    }
+
+
+async def _call(app: Starlette) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/",
+        "raw_path": b"/",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(BODY)).encode()),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 3773),
+    }
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": BODY, "more_body": False}
+        await asyncio.sleep(3600)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        return None
+
+    await app(scope, receive, send)
+
+
+async def _time_per_request(app: Starlette, requests: int) -> float:
+    for _ in range(100):
+        await _call(app)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await _call(app)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+async def main() -> None:
+    """Run the benchmark and print per-request latency for each stack."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    results = {
+        name: await _time_per_request(app, args.requests)
+        for name, app in _stacks().items()
+    }
+    baseline = results["no middleware"]
+
+    print(f"requests: {args.requests}, endpoint: POST / (tasks/get)")
+    print(f"{'stack':>20} {'us/request':>12} {'overhead us':>12}")
+    for name, micros in results.items():
+        print(f"{name:>20} {micros:>12.1f} {micros - baseline:>12.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
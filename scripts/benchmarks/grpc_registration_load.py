@@ -0,0 +1,135 @@
+"""Load-test BinduService registration and heartbeats for many SDK agents.
+
+Starts the core's grpc.aio server, then simulates ``--agents`` SDK agents
+spread over ``--connections`` connections: all register at once, send
+``--rounds`` bursts of heartbeats and unregister. Prints calls per second for
+each phase.
+
+_bindufy_core() is replaced by a stub returning a minimal manifest: creating
+DID keys and an HTTP server per agent would measure those instead of the
+gRPC service and registry.
+
+Usage:
+    uv run python scripts/benchmarks/grpc_registration_load.py
+    uv run python scripts/benchmarks/grpc_registration_load.py --agents 10000 --connections 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import grpc
+
+from bindu.grpc.generated import agent_handler_pb2, agent_handler_pb2_grpc
+from bindu.grpc.registry import AgentRegistry
+from bindu.grpc.server import start_grpc_server
+
+
+def _stub_bindufy_core(config: dict, **kwargs) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=config["name"],
+        url="http://localhost:3773",
+        did_extension=SimpleNamespace(did=f"did:bindu:load:{config['name']}"),
+        run=kwargs["handler_callable"],
+    )
+
+
+def _register_request(index: int) -> agent_handler_pb2.RegisterAgentRequest:
+    config = {"author": "load@example.com", "name": f"agent-{index}"}
+    return agent_handler_pb2.RegisterAgentRequest(
+        config_json=json.dumps(config),
+        grpc_callback_address=f"localhost:{50000 + index % 10000}",
+    )
+
+
+async def _phase(name: str, calls: list, count: int) -> list:
+    start = time.perf_counter()
+    responses = await asyncio.gather(*calls)
+    elapsed = time.perf_counter() - start
+    print(f"{name:>12} {count:>8} {elapsed:>10.2f} {count / elapsed:>12.0f}")
+    return responses
+
+
+async def main() -> None:
+    """Run the load test and print per-phase throughput."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=5000)
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--port", type=int, default=13774)
+    args = parser.parse_args()
+
+    # Per-agent INFO lines would dominate the measurement
+    logging.disable(logging.INFO)
+    registry = AgentRegistry()
+    server = await start_grpc_server(registry, host="127.0.0.1", port=args.port)
+    channels = [
+        grpc.aio.insecure_channel(
+            f"127.0.0.1:{args.port}", options=[("grpc.use_local_subchannel_pool", 1)]
+        )
+        for _ in range(args.connections)
+    ]
+    stubs = [agent_handler_pb2_grpc.BinduServiceStub(c) for c in channels]
+
+    def stub(index: int) -> agent_handler_pb2_grpc.BinduServiceStub:
+        return stubs[index % len(stubs)]
+
+    print(f"agents: {args.agents}, connections: {args.connections}")
+    print(f"{'phase':>12} {'calls':>8} {'seconds':>10} {'calls/s':>12}")
+    try:
+        with (
+            patch("bindu.penguin.bindufy._bindufy_core", _stub_bindufy_core),
+            patch("bindu.grpc.registry.logger"),
+            patch("bindu.grpc.service.logger"),
+        ):
+            registered = await _phase(
+                "register",
+                [
+                    stub(i).RegisterAgent(_register_request(i))
+                    for i in range(args.agents)
+                ],
+                args.agents,
+            )
+            agent_ids = [r.agent_id for r in registered if r.success]
+
+            for round_number in range(args.rounds):
+                acks = await _phase(
+                    f"heartbeat {round_number + 1}",
+                    [
+                        stub(i).Heartbeat(
+                            agent_handler_pb2.HeartbeatRequest(
+                                agent_id=agent_id, timestamp=int(time.time() * 1000)
+                            )
+                        )
+                        for i, agent_id in enumerate(agent_ids)
+                    ],
+                    len(agent_ids),
+                )
+                assert all(a.acknowledged for a in acks)
+
+            await _phase(
+                "unregister",
+                [
+                    stub(i).UnregisterAgent(
+                        agent_handler_pb2.UnregisterAgentRequest(agent_id=agent_id)
+                    )
+                    for i, agent_id in enumerate(agent_ids)
+                ],
+                len(agent_ids),
+            )
+        print(f"registered at end: {len(registry)}")
+    finally:
+        for channel in channels:
+            await channel.close()
+        await server.stop(grace=None)
+        registry.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
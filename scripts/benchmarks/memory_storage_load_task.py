@@ -0,0 +1,95 @@
+"""Benchmark InMemoryStorage.load_task latency against history size.
+
+Each message carries a base64 file part to mimic conversations with uploaded
+documents. Compares the copy-on-write snapshot returned by load_task with the
+previous deep-copy behaviour.
+
+Usage:
+    uv run python scripts/benchmarks/memory_storage_load_task.py
+    uv run python scripts/benchmarks/memory_storage_load_task.py --sizes 10 100 1000 --file-kb 256
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import copy
+import os
+import time
+from uuid import uuid4
+
+from bindu.server.storage.memory_storage import InMemoryStorage
+
+
+def _message(task_id, context_id, payload: str) -> dict:
+    return {
+        "message_id": uuid4(),
+        "task_id": task_id,
+        "context_id": context_id,
+        "kind": "message",
+        "role": "user",
+        "parts": [
+            {"kind": "text", "text": "Please review the attached document."},
+            {
+                "kind": "file",
+                "mimeType": "application/pdf",
+                "data": payload,
+            },
+        ],
+    }
+
+
+async def _build_task(storage: InMemoryStorage, history_size: int, payload: str):
+    task_id, context_id = uuid4(), uuid4()
+    await storage.submit_task(context_id, _message(task_id, context_id, payload))
+    for _ in range(history_size - 1):
+        await storage.update_task(
+            task_id,
+            "working",
+            new_messages=[_message(task_id, context_id, payload)],
+        )
+    return task_id
+
+
+async def _time_per_call(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def main() -> None:
+    """Run the benchmark and print a table of per-call latencies."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--file-kb", type=int, default=64)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    payload = base64.b64encode(os.urandom(args.file_kb * 1024)).decode()
+    storage = InMemoryStorage()
+
+    print(f"file part size: {args.file_kb} KiB, iterations: {args.iterations}")
+    print(f"{'history':>8} {'load_task us':>14} {'last 10 us':>12} {'deepcopy us':>13}")
+    for size in args.sizes:
+        task_id = await _build_task(storage, size, payload)
+
+        async def load_full():
+            await storage.load_task(task_id)
+
+        async def load_window():
+            await storage.load_task(task_id, history_length=10)
+
+        async def deep_copy():
+            copy.deepcopy(storage.tasks[task_id])
+
+        full = await _time_per_call(load_full, args.iterations)
+        window = await _time_per_call(load_window, args.iterations)
+        # Deep copies are slow; cap iterations so large histories finish quickly
+        baseline = await _time_per_call(deep_copy, max(1, args.iterations // size))
+        print(f"{size:>8} {full:>14.1f} {window:>12.1f} {baseline:>13.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,180 @@
+"""Benchmark CapabilityCalculator skill matching against many skills.
+
+Builds ``--skills`` synthetic skills (tags, capabilities, assessment
+keywords, anti-patterns and specializations drawn from a shared vocabulary)
+and times _calculate_skill_match() for one task, with keyword matching only
+and with hybrid embedding matching. Embeddings are random vectors served by
+a stub embedder, so no API calls are made. Each run is compared with the
+previous per-skill loop, kept below as ``legacy_skill_match``.
+
+Usage:
+    uv run python scripts/benchmarks/skill_matching.py
+    uv run python scripts/benchmarks/skill_matching.py --skills 1000 5000 --dimensions 1536
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import random
+import time
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+
+import numpy as np
+
+from bindu.server.negotiation.capability_calculator import CapabilityCalculator
+from bindu.server.negotiation.embedder import cosine_similarity
+from bindu.settings import app_settings
+
+VOCABULARY = [f"term{i}" for i in range(3000)]
+
+
+def _synthetic_skill(index: int, rng: random.Random) -> dict:
+    def words(count: int) -> list[str]:
+        return rng.sample(VOCABULARY, count)
+
+    return {
+        "id": f"skill-{index}",
+        "name": " ".join(words(2)),
+        "tags": [" ".join(words(2)) for _ in range(4)],
+        "capabilities_detail": {"_".join(words(2)): {} for _ in range(3)},
+        "assessment": {
+            "keywords": words(5),
+            "anti_patterns": [" ".join(words(2)) for _ in range(3)],
+            "specializations": [{"domain": words(1)[0], "confidence_boost": 0.1}],
+        },
+    }
+
+
+async def legacy_skill_match(
+    calculator: CapabilityCalculator,
+    task_keywords: set[str],
+    task_summary: str,
+    task_details: str | None,
+    task_embedding: np.ndarray | None,
+) -> list[tuple[str, float, list[str], list[str]]]:
+    """The previous per-skill loop, for comparison."""
+    matches = []
+    for meta in calculator._skill_metadata:
+        if meta["anti_patterns"] and task_summary:
+            task_lower = task_summary.lower()
+            if task_details:
+                task_lower += " " + task_details.lower()
+            if any(p.lower() in task_lower for p in meta["anti_patterns"]):
+                continue
+        embedding_score = 0.0
+        if task_embedding is not None and meta["skill_id"] in (
+            calculator._skill_embeddings or {}
+        ):
+            embedding_score = cosine_similarity(
+                task_embedding,
+                calculator._skill_embeddings[meta["skill_id"]]["embedding"],
+            )
+        intersection = task_keywords.intersection(meta["keywords"])
+        union = task_keywords.union(meta["keywords"])
+        keyword_score = len(intersection) / len(union) if union else 0.0
+        if embedding_score > 0:
+            score = (
+                app_settings.negotiation.embedding_weight * embedding_score
+                + app_settings.negotiation.keyword_weight * keyword_score
+            )
+        else:
+            score = keyword_score
+        for spec in meta["specializations"]:
+            if spec["domain"].lower() in task_summary.lower():
+                score = min(1.0, score + spec["confidence_boost"])
+        tags = [
+            t for t in meta["tags"] if any(w in intersection for w in t.lower().split())
+        ]
+        caps = [
+            c
+            for c in meta["caps_detail"]
+            if any(w in intersection for w in c.split("_"))
+        ]
+        if score > 0:
+            matches.append((meta["skill_id"], round(score, 4), tags, caps))
+    matches.sort(key=lambda m: m[1], reverse=True)
+    return matches
+
+
+def _calculator(
+    skills: list[dict], dimensions: int, embeddings: bool, rng: np.random.Generator
+) -> CapabilityCalculator:
+    calculator = CapabilityCalculator(skills)
+    calculator._use_embeddings = embeddings
+    if embeddings:
+        calculator._skill_embeddings = {
+            skill["id"]: {"embedding": rng.standard_normal(dimensions, np.float32)}
+            for skill in skills
+        }
+        calculator._embedding_matrix = calculator._build_embedding_matrix()
+        task_embedding = rng.standard_normal(dimensions, np.float32)
+
+        async def embed_task_cached(summary: str, details: str = "") -> np.ndarray:
+            return task_embedding
+
+        calculator._embedder = SimpleNamespace(embed_task_cached=embed_task_cached)
+    return calculator
+
+
+async def _time_ms(run: Callable[[], Awaitable[object]], repeats: int) -> float:
+    await run()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        await run()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+async def main() -> None:
+    """Run the benchmark and print matching latency per skill count."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skills", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--dimensions", type=int, default=1536)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    np_rng = np.random.default_rng(0)
+    summary = " ".join(rng.sample(VOCABULARY, 30))
+    details = " ".join(rng.sample(VOCABULARY, 100))
+
+    print(f"task: 130 words, embedding dimensions: {args.dimensions}")
+    print(
+        f"{'skills':>8} {'mode':>10} {'legacy ms':>10} {'vector ms':>10} {'speedup':>8}"
+    )
+    for count in args.skills:
+        skills = [_synthetic_skill(i, rng) for i in range(count)]
+        for embeddings in (False, True):
+            calculator = _calculator(skills, args.dimensions, embeddings, np_rng)
+            keywords = calculator._extract_keywords(summary, details)
+            task_embedding = (
+                await calculator._embedder.embed_task_cached(summary)
+                if embeddings
+                else None
+            )
+
+            vectorized = functools.partial(
+                calculator._calculate_skill_match, keywords, summary, details
+            )
+            legacy = functools.partial(
+                legacy_skill_match,
+                calculator,
+                keywords,
+                summary,
+                details,
+                task_embedding,
+            )
+
+            legacy_ms = await _time_ms(legacy, args.repeats)
+            vector_ms = await _time_ms(vectorized, args.repeats)
+            mode = "hybrid" if embeddings else "keywords"
+            print(
+                f"{count:>8} {mode:>10} {legacy_ms:>10.2f} {vector_ms:>10.2f}"
+                f" {legacy_ms / vector_ms:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -15,7 +15,9 @@ Run with: uv run pytest tests/integration/grpc/ -v -m e2e
 
 from __future__ import annotations
 
+import asyncio
 import json
+import threading
 import time
 from concurrent import futures
 from typing import Any
@@ -135,10 +137,22 @@ HTTP_PORT = 13773  # A2A HTTP server port
 @pytest.fixture(scope="module")
 def grpc_server():
     """Start the Bindu core gRPC server for the test session."""
+    # The aio server runs on its own loop so these tests can stay synchronous
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    def run(coro: Any) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
     registry = AgentRegistry()
-    server = start_grpc_server(registry=registry, port=GRPC_PORT, host="localhost")
+    server = run(start_grpc_server(registry=registry, port=GRPC_PORT, host="localhost"))
     yield server, registry
-    server.stop(grace=1)
+    run(server.stop(grace=1))
+    loop.call_soon_threadsafe(registry.close)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
 
 
 @pytest.fixture(scope="module")
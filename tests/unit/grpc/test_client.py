@@ -1,10 +1,89 @@
 """Tests for GrpcAgentClient — the callable that replaces manifest.run."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import time
 
+import anyio
+import grpc
+import pytest
+import pytest_asyncio
 
+from bindu.grpc import client as client_module
 from bindu.grpc.client import GrpcAgentClient
-from bindu.grpc.generated import agent_handler_pb2
+from bindu.grpc.generated import agent_handler_pb2, agent_handler_pb2_grpc
+
+
+class StubAgentHandler(agent_handler_pb2_grpc.AgentHandlerServicer):
+    """In-process SDK handler recording what the core sends."""
+
+    def __init__(self):
+        self.response = agent_handler_pb2.HandleResponse(content="ok")
+        self.chunks: list[agent_handler_pb2.HandleResponse] = []
+        self.delay = 0.0
+        self.requests: list[agent_handler_pb2.HandleRequest] = []
+        self.time_remaining: list[float | None] = []
+        self.cancelled = asyncio.Event()
+        self.calls = {"unary": 0, "stream": 0}
+
+    async def HandleMessages(self, request, context):
+        self.calls["unary"] += 1
+        self.requests.append(request)
+        self.time_remaining.append(context.time_remaining())
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+        return self.response
+
+    async def HandleMessagesStream(self, request, context):
+        self.calls["stream"] += 1
+        self.requests.append(request)
+        try:
+            for chunk in self.chunks:
+                yield chunk
+                await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+
+    async def HealthCheck(self, request, context):
+        return agent_handler_pb2.HealthCheckResponse(healthy=True, message="OK")
+
+    async def GetCapabilities(self, request, context):
+        return agent_handler_pb2.GetCapabilitiesResponse(name="stub", version="1.0")
+
+
+@pytest_asyncio.fixture
+async def handler():
+    """Serve a StubAgentHandler on a free local port."""
+    servicer = StubAgentHandler()
+    server = grpc.aio.server()
+    agent_handler_pb2_grpc.add_AgentHandlerServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    servicer.address = f"127.0.0.1:{port}"
+    yield servicer
+    await server.stop(grace=None)
+
+
+_clients: list[GrpcAgentClient] = []
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def close_clients():
+    """Release the pooled channels opened by each test."""
+    yield
+    while _clients:
+        _clients.pop().close()
+    # Let channel closes scheduled on this loop run
+    await asyncio.sleep(0)
+
+
+def _client(address, **kwargs) -> GrpcAgentClient:
+    client = GrpcAgentClient(address, **kwargs)
+    _clients.append(client)
+    return client
 
 
 class TestGrpcAgentClient:
@@ -15,8 +94,7 @@ class TestGrpcAgentClient:
         client = GrpcAgentClient("localhost:50052", timeout=15.0)
         assert client._address == "localhost:50052"
         assert client._timeout == 15.0
-        assert client._channel is None
-        assert client._stub is None
+        assert client._pooled == {}
 
     def test_repr(self):
         """Test string representation."""
@@ -24,278 +102,283 @@ class TestGrpcAgentClient:
         assert "localhost:50052" in repr(client)
         assert "30.0" in repr(client)
 
-    @patch("bindu.grpc.client.grpc.insecure_channel")
-    @patch("bindu.grpc.client.agent_handler_pb2_grpc.AgentHandlerStub")
-    def test_plain_string_response(self, mock_stub_class, mock_channel):
-        """Test that plain text response returns str (maps to 'completed')."""
-        mock_stub = MagicMock()
-        mock_stub_class.return_value = mock_stub
-        mock_stub.HandleMessages.return_value = agent_handler_pb2.HandleResponse(
-            content="Hello from agent",
-            state="",
-            prompt="",
-        )
+    def test_init_streaming_mode(self):
+        """Test client can be initialized in streaming mode."""
+        client = GrpcAgentClient("localhost:50052", timeout=15.0, use_streaming=True)
+        assert client._use_streaming is True
+        assert "streaming" in repr(client)
 
+    def test_init_unary_mode_default(self):
+        """Test client defaults to unary mode."""
         client = GrpcAgentClient("localhost:50052")
-        result = client([{"role": "user", "content": "Hi"}])
+        assert client._use_streaming is False
+        assert "unary" in repr(client)
+
+    @pytest.mark.asyncio
+    async def test_plain_string_response(self, handler):
+        """Test that plain text response returns str (maps to 'completed')."""
+        handler.response = agent_handler_pb2.HandleResponse(content="Hello from agent")
+
+        result = await _client(handler.address)([{"role": "user", "content": "Hi"}])
 
-        assert isinstance(result, str)
         assert result == "Hello from agent"
 
-    @patch("bindu.grpc.client.grpc.insecure_channel")
-    @patch("bindu.grpc.client.agent_handler_pb2_grpc.AgentHandlerStub")
-    def test_input_required_response(self, mock_stub_class, mock_channel):
+    @pytest.mark.asyncio
+    async def test_input_required_response(self, handler):
         """Test that input-required state returns dict with state key."""
-        mock_stub = MagicMock()
-        mock_stub_class.return_value = mock_stub
-        mock_stub.HandleMessages.return_value = agent_handler_pb2.HandleResponse(
-            content="",
-            state="input-required",
-            prompt="Can you clarify?",
+        handler.response = agent_handler_pb2.HandleResponse(
+            state="input-required", prompt="Can you clarify?"
         )
 
-        client = GrpcAgentClient("localhost:50052")
-        result = client([{"role": "user", "content": "Do something"}])
+        result = await _client(handler.address)([{"role": "user", "content": "Do"}])
 
-        assert isinstance(result, dict)
-        assert result["state"] == "input-required"
-        assert result["prompt"] == "Can you clarify?"
+        assert result == {"state": "input-required", "prompt": "Can you clarify?"}
 
-    @patch("bindu.grpc.client.grpc.insecure_channel")
-    @patch("bindu.grpc.client.agent_handler_pb2_grpc.AgentHandlerStub")
-    def test_auth_required_response(self, mock_stub_class, mock_channel):
+    @pytest.mark.asyncio
+    async def test_auth_required_response(self, handler):
         """Test that auth-required state returns dict with state key."""
-        mock_stub = MagicMock()
-        mock_stub_class.return_value = mock_stub
-        mock_stub.HandleMessages.return_value = agent_handler_pb2.HandleResponse(
-            content="",
-            state="auth-required",
-            prompt="Please authenticate",
+        handler.response = agent_handler_pb2.HandleResponse(
+            state="auth-required", prompt="Please authenticate"
         )
 
-        client = GrpcAgentClient("localhost:50052")
-        result = client([{"role": "user", "content": "Secret data"}])
+        result = await _client(handler.address)([{"role": "user", "content": "x"}])
 
-        assert isinstance(result, dict)
         assert result["state"] == "auth-required"
         assert result["prompt"] == "Please authenticate"
 
-    @patch("bindu.grpc.client.grpc.insecure_channel")
-    @patch("bindu.grpc.client.agent_handler_pb2_grpc.AgentHandlerStub")
-    def test_response_with_metadata(self, mock_stub_class, mock_channel):
+    @pytest.mark.asyncio
+    async def test_response_with_metadata(self, handler):
         """Test that metadata from response is included in result dict."""
-        mock_stub = MagicMock()
-        mock_stub_class.return_value = mock_stub
-
-        response = agent_handler_pb2.HandleResponse(
-            content="Processing",
-            state="input-required",
-            prompt="Which format?",
+        handler.response = agent_handler_pb2.HandleResponse(
+            content="Processing", state="input-required", prompt="Which format?"
         )
-        response.metadata["source"] = "test"
-        mock_stub.HandleMessages.return_value = response
+        handler.response.metadata["source"] = "test"
 
-        client = GrpcAgentClient("localhost:50052")
-        result = client([{"role": "user", "content": "Convert"}])
+        result = await _client(handler.address)([{"role": "user", "content": "x"}])
 
-        assert isinstance(result, dict)
         assert result["source"] == "test"
+        assert result["content"] == "Processing"
 
-    @patch("bindu.grpc.client.grpc.insecure_channel")
-    @patch("bindu.grpc.client.agent_handler_pb2_grpc.AgentHandlerStub")
-    def test_messages_converted_to_proto(self, mock_stub_class, mock_channel):
+    @pytest.mark.asyncio
+    async def test_messages_converted_to_proto(self, handler):
         """Test that input messages are correctly converted to proto format."""
-        mock_stub = MagicMock()
-        mock_stub_class.return_value = mock_stub
-        mock_stub.HandleMessages.return_value = agent_handler_pb2.HandleResponse(
-            content="ok", state=""
-        )
-
-        client = GrpcAgentClient("localhost:50052")
         messages = [
             {"role": "system", "content": "You are helpful"},
             {"role": "user", "content": "Hello"},
             {"role": "assistant", "content": "Hi there"},
         ]
-        client(messages)
 
-        # Verify the proto request was constructed correctly
-        call_args = mock_stub.HandleMessages.call_args
-        request = call_args[0][0]
-        assert len(request.messages) == 3
-        assert request.messages[0].role == "system"
+        await _client(handler.address)(messages)
+
+        request = handler.requests[0]
+        assert [m.role for m in request.messages] == ["system", "user", "assistant"]
         assert request.messages[0].content == "You are helpful"
-        assert request.messages[1].role == "user"
-        assert request.messages[2].role == "assistant"
 
-    @patch("bindu.grpc.client.grpc.insecure_channel")
-    @patch("bindu.grpc.client.agent_handler_pb2_grpc.AgentHandlerStub")
-    def test_lazy_connection(self, mock_stub_class, mock_channel):
-        """Test that gRPC channel is not created until first call."""
-        client = GrpcAgentClient("localhost:50052")
-        assert client._channel is None
+    @pytest.mark.asyncio
+    async def test_unary_calls_correct_rpc(self, handler):
+        """Test unary mode calls HandleMessages, not HandleMessagesStream."""
+        await _client(handler.address)([{"role": "user", "content": "Hi"}])
 
-        mock_stub = MagicMock()
-        mock_stub_class.return_value = mock_stub
-        mock_stub.HandleMessages.return_value = agent_handler_pb2.HandleResponse(
-            content="ok", state=""
-        )
+        assert handler.calls == {"unary": 1, "stream": 0}
 
-        client([{"role": "user", "content": "test"}])
-        mock_channel.assert_called_once()
+    @pytest.mark.asyncio
+    async def test_unavailable_agent_raises(self):
+        """Test a call to an SDK that is not running fails with an RPC error."""
+        client = _client("127.0.0.1:1", timeout=2.0)
 
-    @patch("bindu.grpc.client.grpc.insecure_channel")
-    @patch("bindu.grpc.client.agent_handler_pb2_grpc.AgentHandlerStub")
-    def test_health_check_healthy(self, mock_stub_class, mock_channel):
-        """Test health check returns True for healthy agent."""
-        mock_stub = MagicMock()
-        mock_stub_class.return_value = mock_stub
-        mock_stub.HealthCheck.return_value = agent_handler_pb2.HealthCheckResponse(
-            healthy=True, message="OK"
-        )
+        with pytest.raises(grpc.aio.AioRpcError) as exc_info:
+            await client([{"role": "user", "content": "Hi"}])
 
-        client = GrpcAgentClient("localhost:50052")
-        assert client.health_check() is True
+        assert exc_info.value.code() == grpc.StatusCode.UNAVAILABLE
 
-    @patch("bindu.grpc.client.grpc.insecure_channel")
-    @patch("bindu.grpc.client.agent_handler_pb2_grpc.AgentHandlerStub")
-    def test_health_check_unhealthy(self, mock_stub_class, mock_channel):
-        """Test health check returns False on gRPC error."""
-        import grpc as grpc_module
 
-        mock_stub = MagicMock()
-        mock_stub_class.return_value = mock_stub
-        mock_stub.HealthCheck.side_effect = grpc_module.RpcError()
+class TestStreaming:
+    """Test HandleMessagesStream surfaced as an async generator."""
 
-        client = GrpcAgentClient("localhost:50052")
-        assert client.health_check() is False
+    @pytest.mark.asyncio
+    async def test_streaming_response_returns_async_generator(self, handler):
+        """Test that streaming mode yields each chunk as it arrives."""
+        handler.chunks = [
+            agent_handler_pb2.HandleResponse(content="chunk 1"),
+            agent_handler_pb2.HandleResponse(content="chunk 2"),
+            agent_handler_pb2.HandleResponse(content="final answer", is_final=True),
+        ]
+        client = _client(handler.address, use_streaming=True)
 
-    def test_close(self):
-        """Test close cleans up channel and stub."""
-        client = GrpcAgentClient("localhost:50052")
-        mock_channel = MagicMock()
-        client._channel = mock_channel
-        client._stub = MagicMock()
+        result = await client([{"role": "user", "content": "Hello"}])
 
-        client.close()
+        assert hasattr(result, "__anext__")
+        assert [chunk async for chunk in result] == [
+            "chunk 1",
+            "chunk 2",
+            "final answer",
+        ]
+        assert handler.calls == {"unary": 0, "stream": 1}
 
-        mock_channel.close.assert_called_once()
-        assert client._channel is None
-        assert client._stub is None
+    @pytest.mark.asyncio
+    async def test_streaming_response_with_state_transition(self, handler):
+        """Test streaming where final chunk has a state transition."""
+        handler.chunks = [
+            agent_handler_pb2.HandleResponse(content="thinking..."),
+            agent_handler_pb2.HandleResponse(
+                state="input-required", prompt="What format?", is_final=True
+            ),
+        ]
+        client = _client(handler.address, use_streaming=True)
 
-    def test_close_when_not_connected(self):
-        """Test close is safe when not connected."""
-        client = GrpcAgentClient("localhost:50052")
-        client.close()  # Should not raise
+        chunks = [chunk async for chunk in await client([])]
 
-    def test_init_streaming_mode(self):
-        """Test client can be initialized in streaming mode."""
-        client = GrpcAgentClient("localhost:50052", timeout=15.0, use_streaming=True)
-        assert client._use_streaming is True
-        assert "streaming" in repr(client)
+        assert chunks[0] == "thinking..."
+        assert chunks[1] == {"state": "input-required", "prompt": "What format?"}
+
+    @pytest.mark.asyncio
+    async def test_first_chunk_arrives_before_stream_ends(self, handler):
+        """Test chunks are not buffered until the SDK finishes."""
+        handler.chunks = [
+            agent_handler_pb2.HandleResponse(content="early"),
+            agent_handler_pb2.HandleResponse(content="late", is_final=True),
+        ]
+        handler.delay = 1.0
+        client = _client(handler.address, use_streaming=True)
+
+        stream = await client([])
+        started = time.perf_counter()
+        first = await stream.__anext__()
+
+        assert first == "early"
+        assert time.perf_counter() - started < 0.5
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_cancels_rpc(self, handler):
+        """Test a consumer giving up early cancels the SDK's handler."""
+        handler.chunks = [
+            agent_handler_pb2.HandleResponse(content="chunk 1"),
+            agent_handler_pb2.HandleResponse(content="chunk 2"),
+        ]
+        handler.delay = 5.0
+        client = _client(handler.address, use_streaming=True)
 
-    def test_init_unary_mode_default(self):
-        """Test client defaults to unary mode."""
-        client = GrpcAgentClient("localhost:50052")
-        assert client._use_streaming is False
-        assert "unary" in repr(client)
+        stream = await client([])
+        assert await stream.__anext__() == "chunk 1"
+        await stream.aclose()
 
-    @patch("bindu.grpc.client.grpc.insecure_channel")
-    @patch("bindu.grpc.client.agent_handler_pb2_grpc.AgentHandlerStub")
-    def test_streaming_response_returns_generator(self, mock_stub_class, mock_channel):
-        """Test that streaming mode returns a generator (has __next__)."""
-        mock_stub = MagicMock()
-        mock_stub_class.return_value = mock_stub
-
-        # Simulate a streaming response (iterable of HandleResponse)
-        mock_stub.HandleMessagesStream.return_value = iter(
-            [
-                agent_handler_pb2.HandleResponse(
-                    content="chunk 1", state="", is_final=False
-                ),
-                agent_handler_pb2.HandleResponse(
-                    content="chunk 2", state="", is_final=False
-                ),
-                agent_handler_pb2.HandleResponse(
-                    content="final answer", state="", is_final=True
-                ),
-            ]
-        )
+        await asyncio.wait_for(handler.cancelled.wait(), timeout=2.0)
 
-        client = GrpcAgentClient("localhost:50052", use_streaming=True)
-        result = client([{"role": "user", "content": "Hello"}])
 
-        # Result should be a generator (has __next__)
-        assert hasattr(result, "__next__")
+class TestDeadlinesAndCancellation:
+    """Test deadline propagation and cancellation of in-flight calls."""
 
-        # Drain the generator — simulates what ResultProcessor.collect_results() does
-        chunks = list(result)
-        assert len(chunks) == 3
-        assert chunks[0] == "chunk 1"
-        assert chunks[1] == "chunk 2"
-        assert chunks[2] == "final answer"
+    @pytest.mark.asyncio
+    async def test_client_timeout_is_the_deadline(self, handler):
+        """Test the SDK sees the client timeout when the caller has no deadline."""
+        await _client(handler.address, timeout=20.0)([])
 
-    @patch("bindu.grpc.client.grpc.insecure_channel")
-    @patch("bindu.grpc.client.agent_handler_pb2_grpc.AgentHandlerStub")
-    def test_streaming_response_with_state_transition(
-        self, mock_stub_class, mock_channel
-    ):
-        """Test streaming where final chunk has a state transition."""
-        mock_stub = MagicMock()
-        mock_stub_class.return_value = mock_stub
-
-        mock_stub.HandleMessagesStream.return_value = iter(
-            [
-                agent_handler_pb2.HandleResponse(
-                    content="thinking...", state="", is_final=False
-                ),
-                agent_handler_pb2.HandleResponse(
-                    content="",
-                    state="input-required",
-                    prompt="What format?",
-                    is_final=True,
-                ),
-            ]
-        )
+        # gRPC rounds deadlines up on the wire
+        assert 15.0 < handler.time_remaining[0] < 21.0
 
-        client = GrpcAgentClient("localhost:50052", use_streaming=True)
-        result = client([{"role": "user", "content": "Process data"}])
+    @pytest.mark.asyncio
+    async def test_caller_deadline_is_propagated(self, handler):
+        """Test a shorter task timeout of the caller caps the RPC deadline."""
+        with anyio.fail_after(2.0):
+            await _client(handler.address, timeout=30.0)([])
 
-        chunks = list(result)
-        assert len(chunks) == 2
-        assert chunks[0] == "thinking..."
-        assert isinstance(chunks[1], dict)
-        assert chunks[1]["state"] == "input-required"
-        assert chunks[1]["prompt"] == "What format?"
-
-    @patch("bindu.grpc.client.grpc.insecure_channel")
-    @patch("bindu.grpc.client.agent_handler_pb2_grpc.AgentHandlerStub")
-    def test_streaming_calls_correct_rpc(self, mock_stub_class, mock_channel):
-        """Test streaming mode calls HandleMessagesStream, not HandleMessages."""
-        mock_stub = MagicMock()
-        mock_stub_class.return_value = mock_stub
-        mock_stub.HandleMessagesStream.return_value = iter([])
-
-        client = GrpcAgentClient("localhost:50052", use_streaming=True)
-        result = client([{"role": "user", "content": "Hi"}])
-        # Drain the generator to trigger the call
-        list(result)
-
-        mock_stub.HandleMessagesStream.assert_called_once()
-        mock_stub.HandleMessages.assert_not_called()
-
-    @patch("bindu.grpc.client.grpc.insecure_channel")
-    @patch("bindu.grpc.client.agent_handler_pb2_grpc.AgentHandlerStub")
-    def test_unary_calls_correct_rpc(self, mock_stub_class, mock_channel):
-        """Test unary mode calls HandleMessages, not HandleMessagesStream."""
-        mock_stub = MagicMock()
-        mock_stub_class.return_value = mock_stub
-        mock_stub.HandleMessages.return_value = agent_handler_pb2.HandleResponse(
-            content="ok", state=""
+        assert handler.time_remaining[0] < 3.0
+
+    @pytest.mark.asyncio
+    async def test_deadline_exceeded(self, handler):
+        """Test a handler slower than the timeout fails with DEADLINE_EXCEEDED."""
+        handler.delay = 5.0
+        client = _client(handler.address, timeout=0.2)
+
+        with pytest.raises(grpc.aio.AioRpcError) as exc_info:
+            await client([])
+
+        assert exc_info.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+
+    @pytest.mark.asyncio
+    async def test_cancelling_caller_cancels_rpc(self, handler):
+        """Test cancelling the awaiting task cancels the SDK's handler."""
+        handler.delay = 5.0
+        client = _client(handler.address)
+
+        call = asyncio.create_task(client([]))
+        await asyncio.sleep(0.2)
+        call.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await call
+        await asyncio.wait_for(handler.cancelled.wait(), timeout=2.0)
+
+    @pytest.mark.asyncio
+    async def test_calls_run_concurrently(self, handler):
+        """Test many slow remote calls overlap instead of queueing."""
+        handler.delay = 0.3
+        client = _client(handler.address)
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(client([]) for _ in range(50)))
+
+        assert results == ["ok"] * 50
+        assert time.perf_counter() - started < 2.0
+
+
+class TestChannelPool:
+    """Test channel sharing between clients of one callback address."""
+
+    @pytest.mark.asyncio
+    async def test_clients_share_channels(self, handler):
+        """Test two clients of the same address reuse the same channels."""
+        first = _client(handler.address)
+        second = _client(handler.address, use_streaming=True)
+
+        await first([])
+        await second([])
+
+        loop = asyncio.get_running_loop()
+        assert first._pooled[loop] is second._pooled[loop]
+        assert len(first._pooled[loop].channels) == (
+            client_module.app_settings.grpc.client_pool_size
         )
 
-        client = GrpcAgentClient("localhost:50052", use_streaming=False)
-        client([{"role": "user", "content": "Hi"}])
+    @pytest.mark.asyncio
+    async def test_channels_closed_with_last_client(self, handler):
+        """Test pooled channels are closed once every client is closed."""
+        first = _client(handler.address)
+        second = _client(handler.address)
+        await first([])
+        await second([])
+        loop = asyncio.get_running_loop()
+        key = (handler.address, loop)
+
+        first.close()
+        assert key in client_module._pool
+
+        second.close()
+        assert key not in client_module._pool
+
+    def test_close_when_not_connected(self):
+        """Test close is safe when not connected."""
+        client = GrpcAgentClient("localhost:50052")
+        client.close()  # Should not raise
+
+
+class TestProbes:
+    """Test health and capability probes."""
+
+    @pytest.mark.asyncio
+    async def test_health_check_healthy(self, handler):
+        """Test health check returns True for healthy agent."""
+        assert await _client(handler.address).health_check() is True
+
+    @pytest.mark.asyncio
+    async def test_health_check_unhealthy(self):
+        """Test health check returns False on gRPC error."""
+        assert await _client("127.0.0.1:1").health_check() is False
+
+    @pytest.mark.asyncio
+    async def test_get_capabilities(self, handler):
+        """Test capabilities are returned from the SDK."""
+        capabilities = await _client(handler.address).get_capabilities()
 
-        mock_stub.HandleMessages.assert_called_once()
-        mock_stub.HandleMessagesStream.assert_not_called()
+        assert capabilities.name == "stub"
@@ -0,0 +1,151 @@
+"""Tests for the grpc.aio BinduService server."""
+
+import asyncio
+import json
+import socket
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import grpc
+import pytest
+import pytest_asyncio
+
+from bindu.grpc.generated import agent_handler_pb2, agent_handler_pb2_grpc
+from bindu.grpc.registry import AgentRegistry
+from bindu.grpc.server import start_grpc_server
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest_asyncio.fixture
+async def core():
+    """Serve BinduService on the test's event loop."""
+    registry = AgentRegistry()
+    port = _free_port()
+    server = await start_grpc_server(registry, host="127.0.0.1", port=port)
+    channel = grpc.aio.insecure_channel(f"127.0.0.1:{port}")
+    registry.address = f"127.0.0.1:{port}"
+    yield registry, agent_handler_pb2_grpc.BinduServiceStub(channel)
+    await channel.close()
+    await server.stop(grace=None)
+    registry.close()
+
+
+def _register_request(name: str) -> agent_handler_pb2.RegisterAgentRequest:
+    config = {
+        "author": "dev@example.com",
+        "name": name,
+        "description": "A test agent",
+        "deployment": {"url": "http://localhost:3773", "expose": True},
+    }
+    return agent_handler_pb2.RegisterAgentRequest(
+        config_json=json.dumps(config), grpc_callback_address="localhost:50052"
+    )
+
+
+class TestGrpcServer:
+    """Test BinduService served by grpc.aio."""
+
+    @pytest.mark.asyncio
+    async def test_serves_on_callers_loop(self, core):
+        """Test heartbeats are answered by the loop that started the server."""
+        registry, stub = core
+        registry.register("agent-1", "localhost:50052", MagicMock())
+
+        response = await stub.Heartbeat(
+            agent_handler_pb2.HeartbeatRequest(agent_id="agent-1", timestamp=1)
+        )
+
+        assert response.acknowledged is True
+        assert registry._expiry_task.get_loop() is asyncio.get_running_loop()
+
+    @pytest.mark.asyncio
+    async def test_register_runs_setup_off_the_loop(self, core):
+        """Test a slow registration does not hold up other agents' heartbeats."""
+        registry, stub = core
+        registry.register("agent-1", "localhost:50052", MagicMock())
+        setup_threads = []
+
+        def slow_bindufy_core(**kwargs):
+            setup_threads.append(threading.current_thread().name)
+            time.sleep(0.5)
+            manifest = MagicMock()
+            manifest.id = "agent-2"
+            manifest.url = "http://localhost:3773"
+            manifest.did_extension.did = "did:bindu:dev:slow:agent-2"
+            return manifest
+
+        with patch("bindu.penguin.bindufy._bindufy_core", slow_bindufy_core):
+            registration = asyncio.ensure_future(
+                stub.RegisterAgent(_register_request("slow"))
+            )
+            await asyncio.sleep(0.1)
+
+            started = time.perf_counter()
+            heartbeat = await stub.Heartbeat(
+                agent_handler_pb2.HeartbeatRequest(agent_id="agent-1", timestamp=1)
+            )
+            heartbeat_latency = time.perf_counter() - started
+            response = await registration
+
+        assert heartbeat.acknowledged is True
+        assert heartbeat_latency < 0.25
+        assert response.success is True
+        assert registry.get("agent-2") is not None
+        assert setup_threads[0].startswith("bindu-grpc-register")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_heartbeats_from_many_agents(self, core):
+        """Test a burst of heartbeats from thousands of agents is acknowledged."""
+        registry, _ = core
+        # Each SDK process has its own connection to the core
+        channels = [
+            grpc.aio.insecure_channel(
+                registry.address, options=[("grpc.use_local_subchannel_pool", 1)]
+            )
+            for _ in range(20)
+        ]
+        stubs = [agent_handler_pb2_grpc.BinduServiceStub(c) for c in channels]
+        # More than gRPC's default limit of 1000 pending calls
+        agent_ids = [f"agent-{i}" for i in range(2000)]
+        manifest = MagicMock()
+        with patch("bindu.grpc.registry.logger"):
+            for agent_id in agent_ids:
+                registry.register(agent_id, "localhost:50052", manifest)
+
+        try:
+            responses = await asyncio.gather(
+                *(
+                    stubs[i % len(stubs)].Heartbeat(
+                        agent_handler_pb2.HeartbeatRequest(
+                            agent_id=agent_id, timestamp=1
+                        )
+                    )
+                    for i, agent_id in enumerate(agent_ids)
+                )
+            )
+        finally:
+            for channel in channels:
+                await channel.close()
+
+        assert all(r.acknowledged for r in responses)
+
+    @pytest.mark.asyncio
+    async def test_unregister(self, core):
+        """Test UnregisterAgent removes the agent and closes its client."""
+        registry, stub = core
+        manifest = MagicMock()
+        registry.register("agent-1", "localhost:50052", manifest)
+
+        response = await stub.UnregisterAgent(
+            agent_handler_pb2.UnregisterAgentRequest(agent_id="agent-1")
+        )
+
+        assert response.success is True
+        assert len(registry) == 0
+        manifest.run.close.assert_called_once()
@@ -1,13 +1,15 @@
 """Tests for the gRPC agent registry."""
 
+import asyncio
 from unittest.mock import MagicMock
 
+import pytest
 
 from bindu.grpc.registry import AgentRegistry, RegisteredAgent
 
 
 class TestAgentRegistry:
-    """Test thread-safe agent registry operations."""
+    """Test agent registry operations."""
 
     def _make_mock_manifest(self, name: str = "test-agent") -> MagicMock:
         """Create a mock AgentManifest for testing."""
@@ -113,3 +115,95 @@ class TestAgentRegistry:
         assert entry.grpc_callback_address == "localhost:50053"
         assert entry.manifest.name == "v2"
         assert len(registry) == 1
+
+    def test_unregister_closes_handler(self):
+        """Test unregistering releases the agent's gRPC client."""
+        registry = AgentRegistry()
+        manifest = self._make_mock_manifest()
+        registry.register("agent-1", "localhost:50052", manifest)
+
+        registry.unregister("agent-1")
+
+        manifest.run.close.assert_called_once()
+
+    def test_reregister_closes_previous_handler(self):
+        """Test a replaced registration releases the old gRPC client."""
+        registry = AgentRegistry()
+        m1 = self._make_mock_manifest("v1")
+        registry.register("agent-1", "localhost:50052", m1)
+
+        registry.register("agent-1", "localhost:50053", self._make_mock_manifest())
+
+        m1.run.close.assert_called_once()
+
+
+class TestHeartbeatExpiry:
+    """Test dropping agents that stop sending heartbeats."""
+
+    def _manifest(self) -> MagicMock:
+        return MagicMock()
+
+    @pytest.mark.asyncio
+    async def test_agent_without_heartbeat_expires(self):
+        """Test an agent is dropped and its client closed after the timeout."""
+        registry = AgentRegistry(heartbeat_timeout=0.05)
+        manifest = self._manifest()
+        registry.register("agent-1", "localhost:50052", manifest)
+
+        await asyncio.sleep(0.15)
+
+        assert registry.get("agent-1") is None
+        manifest.run.close.assert_called_once()
+        registry.close()
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_postpones_expiry(self):
+        """Test heartbeats keep an agent registered past the timeout."""
+        registry = AgentRegistry(heartbeat_timeout=0.1)
+        registry.register("alive", "localhost:50052", self._manifest())
+        registry.register("silent", "localhost:50053", self._manifest())
+
+        for _ in range(5):
+            await asyncio.sleep(0.04)
+            assert registry.update_heartbeat("alive") is True
+
+        assert registry.get("alive") is not None
+        assert registry.get("silent") is None
+        registry.close()
+
+    @pytest.mark.asyncio
+    async def test_zero_timeout_disables_expiry(self):
+        """Test heartbeat_timeout=0 keeps agents forever."""
+        registry = AgentRegistry(heartbeat_timeout=0)
+        registry.register("agent-1", "localhost:50052", self._manifest())
+
+        await asyncio.sleep(0.05)
+
+        assert registry.get("agent-1") is not None
+        assert registry._expiry_task is None
+
+    @pytest.mark.asyncio
+    async def test_timer_stops_when_registry_empties(self):
+        """Test the expiry task exits once no agent is left to expire."""
+        registry = AgentRegistry(heartbeat_timeout=0.02)
+        registry.register("agent-1", "localhost:50052", self._manifest())
+        task = registry._expiry_task
+
+        await asyncio.sleep(0.1)
+
+        assert task is not None and task.done()
+        assert registry._expiry_task is None
+
+    @pytest.mark.asyncio
+    async def test_heap_stays_bounded(self):
+        """Test superseded heartbeat deadlines do not accumulate."""
+        registry = AgentRegistry(heartbeat_timeout=60)
+        for i in range(100):
+            registry.register(f"agent-{i}", "localhost:50052", self._manifest())
+
+        for _ in range(50):
+            for i in range(100):
+                registry.update_heartbeat(f"agent-{i}")
+
+        assert len(registry._expiry_heap) <= 4 * 100 + 64 + 1
+        registry.close()
@@ -3,6 +3,7 @@
 import json
 from unittest.mock import MagicMock, patch
 
+import pytest
 
 from bindu.grpc.generated import agent_handler_pb2
 from bindu.grpc.registry import AgentRegistry
@@ -68,7 +69,8 @@ class TestProtoSkillConversion:
 class TestBinduServiceImpl:
     """Test BinduService gRPC implementation."""
 
-    def test_register_agent_invalid_json(self):
+    @pytest.mark.asyncio
+    async def test_register_agent_invalid_json(self):
         """Test RegisterAgent with invalid JSON config."""
         registry = AgentRegistry()
         service = BinduServiceImpl(registry)
@@ -79,12 +81,13 @@ class TestBinduServiceImpl:
             grpc_callback_address="localhost:50052",
         )
 
-        response = service.RegisterAgent(request, context)
+        response = await service.RegisterAgent(request, context)
         assert response.success is False
         assert "Invalid config_json" in response.error
 
+    @pytest.mark.asyncio
     @patch("bindu.penguin.bindufy._bindufy_core")
-    def test_register_agent_success(self, mock_bindufy_core):
+    async def test_register_agent_success(self, mock_bindufy_core):
         """Test successful agent registration via gRPC."""
         # Mock the manifest returned by _bindufy_core
         mock_manifest = MagicMock()
@@ -109,7 +112,7 @@ class TestBinduServiceImpl:
             grpc_callback_address="localhost:50052",
         )
 
-        response = service.RegisterAgent(request, context)
+        response = await service.RegisterAgent(request, context)
 
         assert response.success is True
         assert response.agent_id == "test-agent-id-123"
@@ -122,8 +125,38 @@ class TestBinduServiceImpl:
         assert call_kwargs["skip_handler_validation"] is True
         assert call_kwargs["run_server_in_background"] is True
 
+    @pytest.mark.asyncio
     @patch("bindu.penguin.bindufy._bindufy_core")
-    def test_register_agent_failure(self, mock_bindufy_core):
+    async def test_register_streaming_agent_uses_stream_rpc(self, mock_bindufy_core):
+        """Agents advertising streaming are called via HandleMessagesStream."""
+        mock_manifest = MagicMock()
+        mock_manifest.id = "test-agent-id-123"
+        mock_manifest.url = "http://localhost:3773"
+        mock_manifest.did_extension.did = "did:key:z6Mk..."
+        mock_bindufy_core.return_value = mock_manifest
+
+        service = BinduServiceImpl(AgentRegistry())
+        config = {
+            "author": "dev@example.com",
+            "name": "streaming-agent",
+            "description": "A streaming agent",
+            "deployment": {"url": "http://localhost:3773", "expose": True},
+            "capabilities": {"streaming": True},
+        }
+        request = agent_handler_pb2.RegisterAgentRequest(
+            config_json=json.dumps(config),
+            grpc_callback_address="localhost:50052",
+        )
+
+        response = await service.RegisterAgent(request, MagicMock())
+
+        assert response.success is True
+        handler = mock_bindufy_core.call_args[1]["handler_callable"]
+        assert handler._use_streaming is True
+
+    @pytest.mark.asyncio
+    @patch("bindu.penguin.bindufy._bindufy_core")
+    async def test_register_agent_failure(self, mock_bindufy_core):
         """Test RegisterAgent when _bindufy_core raises an exception."""
         mock_bindufy_core.side_effect = ValueError("Missing required field")
 
@@ -137,11 +170,12 @@ class TestBinduServiceImpl:
             grpc_callback_address="localhost:50052",
         )
 
-        response = service.RegisterAgent(request, context)
+        response = await service.RegisterAgent(request, context)
         assert response.success is False
         assert "Registration failed" in response.error
 
-    def test_heartbeat_known_agent(self):
+    @pytest.mark.asyncio
+    async def test_heartbeat_known_agent(self):
         """Test heartbeat for a registered agent."""
         registry = AgentRegistry()
         manifest = MagicMock()
@@ -153,12 +187,13 @@ class TestBinduServiceImpl:
         request = agent_handler_pb2.HeartbeatRequest(
             agent_id="agent-1", timestamp=1234567890
         )
-        response = service.Heartbeat(request, context)
+        response = await service.Heartbeat(request, context)
 
         assert response.acknowledged is True
         assert response.server_timestamp > 0
 
-    def test_heartbeat_unknown_agent(self):
+    @pytest.mark.asyncio
+    async def test_heartbeat_unknown_agent(self):
         """Test heartbeat for unknown agent."""
         registry = AgentRegistry()
         service = BinduServiceImpl(registry)
@@ -167,11 +202,12 @@ class TestBinduServiceImpl:
         request = agent_handler_pb2.HeartbeatRequest(
             agent_id="unknown", timestamp=1234567890
         )
-        response = service.Heartbeat(request, context)
+        response = await service.Heartbeat(request, context)
 
         assert response.acknowledged is False
 
-    def test_unregister_known_agent(self):
+    @pytest.mark.asyncio
+    async def test_unregister_known_agent(self):
         """Test unregistering a known agent."""
         registry = AgentRegistry()
         manifest = MagicMock()
@@ -183,20 +219,21 @@ class TestBinduServiceImpl:
         context = MagicMock()
 
         request = agent_handler_pb2.UnregisterAgentRequest(agent_id="agent-1")
-        response = service.UnregisterAgent(request, context)
+        response = await service.UnregisterAgent(request, context)
 
         assert response.success is True
         assert registry.get("agent-1") is None
         manifest.run.close.assert_called_once()
 
-    def test_unregister_unknown_agent(self):
+    @pytest.mark.asyncio
+    async def test_unregister_unknown_agent(self):
         """Test unregistering unknown agent."""
         registry = AgentRegistry()
         service = BinduServiceImpl(registry)
         context = MagicMock()
 
         request = agent_handler_pb2.UnregisterAgentRequest(agent_id="unknown")
-        response = service.UnregisterAgent(request, context)
+        response = await service.UnregisterAgent(request, context)
 
         assert response.success is False
         assert "not found" in response.error
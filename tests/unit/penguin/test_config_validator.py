@@ -49,3 +49,15 @@ class TestConfigValidator:
         assert result["kind"] == "agent"
         assert result["num_history_sessions"] == 10
         assert result["debug_mode"] is False
+
+    def test_invalid_execution_mode_raises(self):
+        """Test that an unknown execution mode is rejected."""
+        config = {
+            "author": "test@example.com",
+            "name": "TestAgent",
+            "deployment": {"url": "http://localhost:3773"},
+            "execution": {"mode": "gpu"},
+        }
+
+        with pytest.raises(ValueError, match="execution.mode"):
+            ConfigValidator.validate_and_process(config)
@@ -0,0 +1,224 @@
+"""Tests for the precomputed discovery documents."""
+
+import gzip
+import json
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import pytest
+from starlette.testclient import TestClient
+
+from bindu.common.models import AgentManifest
+from bindu.server.applications import BinduApplication
+from bindu.server.endpoints.discovery import DiscoveryDocument
+
+DID = "did:bindu:test:agent"
+
+
+def _manifest(skills: list[dict]) -> Mock:
+    manifest = Mock(spec=AgentManifest)
+    manifest.id = uuid4()
+    manifest.name = "test-agent"
+    manifest.description = "Test agent"
+    manifest.capabilities = {}
+    manifest.skills = skills
+    manifest.kind = "agent"
+    manifest.num_history_sessions = 10
+    manifest.extra_data = {"server_info": "test"}
+    manifest.debug_mode = False
+    manifest.debug_level = 1
+    manifest.monitoring = False
+    manifest.telemetry = False
+    manifest.agent_trust = {}
+    manifest.did_extension = Mock(did=DID)
+    manifest.did_extension.get_did_document.return_value = {"id": DID}
+    return manifest
+
+
+@pytest.fixture
+def skills() -> list[dict]:
+    return [
+        {
+            "id": "summarize",
+            "name": "Summarize",
+            "description": "Summarizes text " * 20,
+            "documentation_content": "name: summarize",
+        },
+        {"id": "translate", "name": "Translate", "description": "Translates"},
+    ]
+
+
+@pytest.fixture
+def app(skills) -> BinduApplication:
+    app = BinduApplication(manifest=_manifest(skills))
+    app.task_manager = Mock(is_running=True)
+    return app
+
+
+@pytest.fixture
+def client(app) -> TestClient:
+    return TestClient(app)
+
+
+class TestDiscoveryDocument:
+    """Test variants and encoding negotiation."""
+
+    def test_variants_have_distinct_strong_etags(self):
+        """Test each encoding has its own quoted ETag."""
+        body = b'{"skills":[]}' * 50
+        document = DiscoveryDocument(body)
+
+        assert gzip.decompress(document.variants["gzip"][0]) == body
+        etags = {etag for _, etag in document.variants.values()}
+        assert len(etags) == len(document.variants)
+        assert all(etag.startswith('"') and etag.endswith('"') for etag in etags)
+
+    def test_small_body_is_not_compressed(self):
+        """Test variants larger than the body are dropped."""
+        document = DiscoveryDocument(b"{}")
+
+        assert "gzip" not in document.variants
+
+    def test_etag_is_stable(self):
+        """Test the same bytes always get the same ETags."""
+        body = b"x" * 1000
+
+        assert DiscoveryDocument(body).variants == DiscoveryDocument(body).variants
+
+    @pytest.mark.parametrize(
+        "accept_encoding, expected",
+        [
+            ("", "identity"),
+            ("gzip", "gzip"),
+            ("gzip, deflate", "gzip"),
+            ("gzip;q=0", "identity"),
+            ("*", "gzip"),
+            ("identity", "identity"),
+        ],
+    )
+    def test_select_encoding(self, accept_encoding, expected):
+        """Test the client's accepted encodings pick the variant."""
+        document = DiscoveryDocument(b"x" * 1000)
+        document.variants.pop("br", None)
+
+        assert document.select_encoding(accept_encoding) == expected
+
+
+class TestDiscoveryEndpoints:
+    """Test the discovery endpoints serve cached documents."""
+
+    def test_agent_card_has_cache_headers(self, client):
+        """Test the agent card is sent with an ETag and Cache-Control."""
+        response = client.get("/.well-known/agent.json")
+
+        assert response.status_code == 200
+        assert response.json()["name"] == "test-agent"
+        assert response.headers["etag"]
+        assert response.headers["cache-control"] == "public, max-age=60"
+        assert "Accept-Encoding" in response.headers["vary"]
+
+    def test_if_none_match_returns_304(self, client):
+        """Test a current copy is answered with 304 and no body."""
+        etag = client.get("/.well-known/agent.json").headers["etag"]
+
+        response = client.get(
+            "/.well-known/agent.json", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_stale_etag_returns_document(self, client):
+        """Test a mismatching ETag gets the full document."""
+        response = client.get(
+            "/.well-known/agent.json", headers={"If-None-Match": '"stale"'}
+        )
+
+        assert response.status_code == 200
+
+    def test_gzip_variant(self, client):
+        """Test clients accepting gzip get the precompressed body."""
+        response = client.get("/agent/skills", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"].endswith('-gzip"')
+        assert response.json()["total"] == 2
+
+    def test_identity_variant(self, client):
+        """Test clients not accepting compression get the plain body."""
+        response = client.get("/agent/skills", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+        assert [s["id"] for s in response.json()["skills"]] == [
+            "summarize",
+            "translate",
+        ]
+
+    def test_skill_detail_by_id_and_name(self, client):
+        """Test skills are found by id and by name."""
+        by_id = client.get("/agent/skills/summarize")
+        by_name = client.get("/agent/skills/Summarize")
+
+        assert by_id.status_code == by_name.status_code == 200
+        assert by_id.json() == by_name.json()
+        assert by_id.json()["has_documentation"] is True
+        assert "documentation_content" not in by_id.json()
+
+    def test_unknown_skill_returns_404(self, client):
+        """Test an unknown skill id is still rejected."""
+        response = client.get("/agent/skills/unknown")
+
+        assert response.status_code == 404
+
+    def test_did_document_is_cached(self, app, client):
+        """Test the DID document is serialized once."""
+        for _ in range(3):
+            response = client.get("/did/resolve", params={"did": DID})
+            assert response.status_code == 200
+            assert response.json() == {"id": DID}
+
+        app.manifest.did_extension.get_did_document.assert_called_once()
+
+    def test_max_age_setting(self, client):
+        """Test a zero max age makes clients always revalidate."""
+        with patch(
+            "bindu.server.endpoints.discovery.app_settings.network.discovery_max_age",
+            0,
+        ):
+            response = client.get("/agent/skills")
+
+        assert response.headers["cache-control"] == "no-cache"
+
+
+class TestDiscoveryRebuild:
+    """Test the documents are rebuilt when the manifest changes."""
+
+    def test_documents_are_reused(self, app):
+        """Test the documents are built once."""
+        assert app.discovery_documents() is app.discovery_documents()
+
+    def test_url_change_rebuilds(self, app, client):
+        """Test the agent card follows a new URL."""
+        app.url = "https://tunnel.example.com"
+
+        response = client.get("/.well-known/agent.json")
+
+        assert response.json()["url"] == "https://tunnel.example.com"
+
+    def test_new_manifest_rebuilds(self, app, client):
+        """Test replacing the manifest serves the new skills."""
+        app.manifest = _manifest([{"id": "only", "name": "Only"}])
+
+        response = client.get("/agent/skills")
+
+        assert json.loads(response.content)["total"] == 1
+
+    def test_invalidate(self, app):
+        """Test in-place manifest edits are picked up after invalidation."""
+        documents = app.discovery_documents()
+        app.manifest.skills.append({"id": "new", "name": "New"})
+        app.invalidate_discovery_documents()
+
+        assert app.discovery_documents() is not documents
+        assert "new" in app.discovery_documents().skills
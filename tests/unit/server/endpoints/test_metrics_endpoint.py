@@ -0,0 +1,70 @@
+"""Tests for the Prometheus metrics endpoint."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from bindu.server.endpoints.metrics import _update_agent_metrics, metrics_endpoint
+
+
+class TestUpdateAgentMetrics:
+    """Test the active task gauge refresh."""
+
+    @pytest.mark.asyncio
+    async def test_reads_all_states_in_one_call(self):
+        """Test active tasks are summed from a single per-state count."""
+        storage = Mock()
+        storage.count_tasks_by_state = AsyncMock(
+            return_value={"submitted": 2, "working": 3, "completed": 40}
+        )
+        storage.count_tasks = AsyncMock()
+        app = SimpleNamespace(task_manager=Mock(), _storage=storage)
+        metrics = Mock()
+
+        with (
+            patch("bindu.server.endpoints.metrics.get_metrics", return_value=metrics),
+            patch(
+                "bindu.server.endpoints.metrics.get_agent_did",
+                return_value="did:bindu:test",
+            ),
+        ):
+            await _update_agent_metrics(app)
+
+        storage.count_tasks_by_state.assert_awaited_once()
+        storage.count_tasks.assert_not_called()
+        metrics.set_agent_tasks_active.assert_called_once_with("did:bindu:test", 5)
+
+
+class TestMetricsEndpoint:
+    """Test scrapes of the metrics endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_cached_rendering_skips_refresh(self):
+        """Test a scrape within the cache TTL reuses the last rendering."""
+        app = SimpleNamespace(task_manager=Mock(), _storage=Mock())
+        metrics = Mock()
+        metrics.cached_prometheus_text.return_value = "cached 1\n"
+
+        with patch("bindu.server.endpoints.metrics.get_metrics", return_value=metrics):
+            response = await metrics_endpoint(app, Mock())
+
+        assert response.body == b"cached 1\n"
+        app.task_manager.queue_depth.assert_not_called()
+        metrics.generate_prometheus_text.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_expired_cache_renders_fresh_metrics(self):
+        """Test the gauges are refreshed before rendering on a cache miss."""
+        app = SimpleNamespace(
+            task_manager=Mock(queue_depth=AsyncMock(return_value=4)), _storage=None
+        )
+        metrics = Mock()
+        metrics.cached_prometheus_text.return_value = None
+        metrics.generate_prometheus_text.return_value = "fresh 1\n"
+
+        with patch("bindu.server.endpoints.metrics.get_metrics", return_value=metrics):
+            response = await metrics_endpoint(app, Mock())
+
+        assert response.body == b"fresh 1\n"
+        metrics.set_worker_queue_depth.assert_called_once_with(4)
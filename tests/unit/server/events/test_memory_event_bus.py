@@ -0,0 +1,96 @@
+"""Tests for the in-memory task event bus and event bus factory."""
+
+from uuid import uuid4
+
+import pytest
+
+from bindu.common.models import SchedulerConfig
+from bindu.server.events import InMemoryTaskEventBus
+from bindu.server.events.factory import create_event_bus
+
+
+def _status_event(task_id, state="working"):
+    return {
+        "kind": "status-update",
+        "task_id": str(task_id),
+        "context_id": str(uuid4()),
+        "status": {"state": state, "timestamp": "2024-01-01T00:00:00Z"},
+        "final": False,
+    }
+
+
+class TestInMemoryTaskEventBus:
+    """Test in-process event delivery."""
+
+    @pytest.mark.asyncio
+    async def test_delivers_events_to_task_subscribers(self):
+        """Every subscriber of a task receives its events, in order."""
+        task_id = uuid4()
+        async with InMemoryTaskEventBus() as bus:
+            async with (
+                bus.subscribe(task_id) as first,
+                bus.subscribe(task_id) as second,
+            ):
+                await bus.publish(_status_event(task_id, "working"))
+                await bus.publish(_status_event(task_id, "completed"))
+
+                for subscription in (first, second):
+                    assert (await subscription.next_event(1))["status"][
+                        "state"
+                    ] == "working"
+                    assert (await subscription.next_event(1))["status"][
+                        "state"
+                    ] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_ignores_events_of_other_tasks(self):
+        """Subscribers only see events of the task they subscribed to."""
+        async with InMemoryTaskEventBus() as bus:
+            async with bus.subscribe(uuid4()) as subscription:
+                await bus.publish(_status_event(uuid4()))
+
+                assert await subscription.next_event(0.05) is None
+
+    @pytest.mark.asyncio
+    async def test_unsubscribes_on_exit(self):
+        """Leaving the subscription context removes the subscriber."""
+        task_id = uuid4()
+        bus = InMemoryTaskEventBus()
+        async with bus.subscribe(task_id):
+            assert bus.subscriber_count(task_id) == 1
+
+        assert bus.subscriber_count(task_id) == 0
+        await bus.publish(_status_event(task_id))
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_marks_subscription_overflowed(self):
+        """A slow subscriber never blocks the publisher; it is told to resync."""
+        task_id = uuid4()
+        bus = InMemoryTaskEventBus(buffer_size=1)
+        async with bus.subscribe(task_id) as subscription:
+            await bus.publish(_status_event(task_id, "working"))
+            await bus.publish(_status_event(task_id, "completed"))
+
+            assert subscription.overflowed is True
+            assert (await subscription.next_event(1))["status"]["state"] == "working"
+
+
+class TestCreateEventBus:
+    """Test event bus backend selection."""
+
+    def test_memory_scheduler_uses_in_memory_bus(self):
+        """The auto backend stays in-process with the memory scheduler."""
+        bus = create_event_bus(SchedulerConfig(type="memory"))
+
+        assert isinstance(bus, InMemoryTaskEventBus)
+
+    def test_redis_scheduler_uses_redis_bus(self):
+        """The auto backend follows the Redis scheduler across processes."""
+        from bindu.server.events import RedisTaskEventBus
+
+        bus = create_event_bus(
+            SchedulerConfig(type="redis", redis_url="redis://localhost:6379/0")
+        )
+
+        assert isinstance(bus, RedisTaskEventBus)
+        assert bus.redis_url == "redis://localhost:6379/0"
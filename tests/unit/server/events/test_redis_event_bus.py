@@ -0,0 +1,80 @@
+"""Tests for the Redis pub/sub task event bus."""
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from bindu.server.events.redis_event_bus import RedisTaskEventBus
+
+
+@pytest.fixture
+def fake_redis_server():
+    """Share one fake Redis server between buses, like pods sharing Redis."""
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    with patch(
+        "bindu.server.events.redis_event_bus.redis.from_url",
+        side_effect=lambda *args, **kwargs: fakeredis.aioredis.FakeRedis(
+            server=server, decode_responses=True
+        ),
+    ):
+        yield server
+
+
+class TestRedisTaskEventBus:
+    """Test cross-process event delivery over Redis pub/sub."""
+
+    @pytest.mark.asyncio
+    async def test_event_reaches_subscriber_on_another_bus(self, fake_redis_server):
+        """An event published by one process reaches SSE subscribers on another."""
+        task_id = uuid4()
+        event = {
+            "kind": "artifact-update",
+            "task_id": str(task_id),
+            "context_id": str(uuid4()),
+            "artifact": {"artifact_id": uuid4(), "parts": []},
+            "append": False,
+            "last_chunk": True,
+        }
+
+        async with (
+            RedisTaskEventBus("redis://fake") as worker_bus,
+            RedisTaskEventBus("redis://fake") as server_bus,
+        ):
+            async with server_bus.subscribe(task_id) as subscription:
+                await worker_bus.publish(event)
+                received = await subscription.next_event(2)
+
+        assert received is not None
+        assert received["kind"] == "artifact-update"
+        assert received["artifact"]["artifact_id"] == str(
+            event["artifact"]["artifact_id"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_subscribes_only_to_followed_tasks(self, fake_redis_server):
+        """A pod listens on a task's channel only while it has subscribers."""
+        fakeredis = pytest.importorskip("fakeredis")
+        client = fakeredis.aioredis.FakeRedis(
+            server=fake_redis_server, decode_responses=True
+        )
+        task_id = uuid4()
+        channel = f"bindu:task-events:{task_id}"
+
+        async with RedisTaskEventBus("redis://fake") as bus:
+            assert await client.pubsub_channels() == []
+            async with bus.subscribe(task_id):
+                async with bus.subscribe(task_id):
+                    assert await client.pubsub_channels() == [channel]
+                assert await client.pubsub_channels() == [channel]
+            assert await client.pubsub_channels() == []
+
+    @pytest.mark.asyncio
+    async def test_publish_without_connection_is_dropped(self):
+        """Publishing before the bus is started is a logged no-op."""
+        bus = RedisTaskEventBus("redis://fake")
+
+        await bus.publish(
+            {"kind": "message", "task_id": str(uuid4()), "context_id": str(uuid4())}
+        )
@@ -1,9 +1,11 @@
 """Minimal tests for context handlers."""
 
 from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
 import pytest
 
 from bindu.server.handlers.context_handlers import ContextHandlers
+from bindu.utils.worker import ChatHistoryCache
 
 
 class TestContextHandlers:
@@ -26,7 +28,26 @@ class TestContextHandlers:
         assert response["jsonrpc"] == "2.0"
         assert response["id"] == "1"
         assert len(response["result"]) == 2
-        mock_storage.list_contexts.assert_called_once_with(10)
+        mock_storage.list_contexts.assert_called_once_with(10, cursor=None)
+
+    @pytest.mark.asyncio
+    async def test_list_contexts_summary_page(self):
+        """Test listing a page of context summaries."""
+        mock_storage = AsyncMock()
+        mock_storage.list_context_summaries.return_value = [{"context_id": "ctx2"}]
+
+        handler = ContextHandlers(storage=mock_storage)
+        request = {
+            "jsonrpc": "2.0",
+            "id": "1",
+            "params": {"length": 1, "cursor": "ctx1", "summary": True},
+        }
+
+        response = await handler.list_contexts(request)
+
+        assert response["result"] == [{"context_id": "ctx2"}]
+        mock_storage.list_context_summaries.assert_called_once_with(1, cursor="ctx1")
+        mock_storage.list_contexts.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_list_contexts_empty(self):
@@ -69,6 +90,20 @@ class TestContextHandlers:
         assert "cleared successfully" in response["result"]["message"]
         mock_storage.clear_context.assert_called_once_with("ctx123")
 
+    @pytest.mark.asyncio
+    async def test_clear_context_invalidates_history_cache(self):
+        """Test clearing a context drops its cached chat history."""
+        context_id = uuid4()
+        cache = ChatHistoryCache()
+        cache.put(context_id, uuid4(), [{"role": "user", "content": "hi"}])
+
+        handler = ContextHandlers(storage=AsyncMock(), history_cache=cache)
+        request = {"jsonrpc": "2.0", "id": "3", "params": {"contextId": context_id}}
+
+        await handler.clear_context(request)
+
+        assert cache.get(context_id) == {}
+
     @pytest.mark.asyncio
     async def test_clear_context_not_found(self):
         """Test clearing non-existent context."""
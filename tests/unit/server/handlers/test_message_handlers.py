@@ -1,12 +1,15 @@
 """Minimal tests for message handler utilities."""
 
+import json
 from unittest.mock import AsyncMock, Mock
+import anyio
 import pytest
 from datetime import datetime, timezone
 from typing import cast
 from uuid import uuid4
 
 from bindu.common.protocol.types import Task
+from bindu.server.events import InMemoryTaskEventBus
 from bindu.server.handlers.message_handlers import MessageHandlers
 
 
@@ -63,7 +66,7 @@ class TestMessageHandlers:
             },
         }
         mock_storage.load_task.return_value = mock_task
-        mock_storage.update_task.return_value = updated_task
+        mock_storage.update_task_if_active.return_value = updated_task
 
         handler = MessageHandlers(scheduler=Mock(), storage=mock_storage)
 
@@ -77,7 +80,9 @@ class TestMessageHandlers:
 
         assert result["status"]["state"] == "failed"
         assert result["final"] is True
-        mock_storage.update_task.assert_called_once_with("task123", state="failed")
+        mock_storage.update_task_if_active.assert_called_once_with(
+            "task123", state="failed", return_full=False
+        )
 
     @pytest.mark.asyncio
     async def test_handle_stream_error_handles_load_failure(self):
@@ -385,3 +390,157 @@ class TestMessageHandlers:
         response = handler.stream_message(request)
 
         assert response is not None
+
+    @pytest.mark.asyncio
+    async def test_stream_message_forwards_bus_events_without_polling(self):
+        """Stream wakes on published events and reads storage only once."""
+        mock_scheduler = AsyncMock()
+        mock_storage = AsyncMock()
+        event_bus = InMemoryTaskEventBus()
+
+        task_id = uuid4()
+        context_id = uuid4()
+        mock_storage.submit_task.return_value = {
+            "id": task_id,
+            "context_id": context_id,
+            "status": {"state": "submitted", "timestamp": "2024-01-01T00:00:00Z"},
+        }
+        mock_storage.load_task.return_value = {
+            "id": task_id,
+            "context_id": context_id,
+            "status": {"state": "working", "timestamp": "2024-01-01T00:00:01Z"},
+            "artifacts": [],
+        }
+
+        handler = MessageHandlers(
+            scheduler=mock_scheduler,
+            storage=mock_storage,
+            context_id_parser=lambda x: context_id,
+            event_bus=event_bus,
+        )
+        request = {
+            "jsonrpc": "2.0",
+            "id": "req1",
+            "params": {"message": {"content": "test", "context_id": str(context_id)}},
+        }
+
+        response = await handler.stream_message(request)
+        events: list[dict] = []
+
+        async def consume():
+            async for chunk in response.body_iterator:
+                events.append(json.loads(chunk.removeprefix("data: ")))
+
+        with anyio.fail_after(2):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(consume)
+                while len(events) < 2:
+                    await anyio.sleep(0.01)
+
+                artifact_id = uuid4()
+                await event_bus.publish(
+                    {
+                        "kind": "artifact-update",
+                        "task_id": str(task_id),
+                        "context_id": str(context_id),
+                        "artifact": {"artifact_id": artifact_id, "parts": []},
+                        "append": False,
+                        "last_chunk": True,
+                    }
+                )
+                await event_bus.publish(
+                    {
+                        "kind": "status-update",
+                        "task_id": str(task_id),
+                        "context_id": str(context_id),
+                        "status": {
+                            "state": "completed",
+                            "timestamp": "2024-01-01T00:00:02Z",
+                        },
+                        "final": True,
+                    }
+                )
+
+        assert [e["kind"] for e in events] == [
+            "status-update",
+            "status-update",
+            "artifact-update",
+            "status-update",
+        ]
+        assert [e["status"]["state"] for e in events if "status" in e] == [
+            "submitted",
+            "working",
+            "completed",
+        ]
+        assert events[-1]["final"] is True
+        mock_storage.load_task.assert_awaited_once_with(task_id)
+        assert event_bus.subscriber_count(task_id) == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_message_forwards_appended_chunks(self):
+        """Appended chunks of one artifact are all forwarded to the client."""
+        mock_storage = AsyncMock()
+        event_bus = InMemoryTaskEventBus()
+        task_id = uuid4()
+        context_id = uuid4()
+        task = {
+            "id": task_id,
+            "context_id": context_id,
+            "status": {"state": "working", "timestamp": "2024-01-01T00:00:00Z"},
+            "artifacts": [],
+        }
+        mock_storage.submit_task.return_value = task
+        mock_storage.load_task.return_value = task
+
+        handler = MessageHandlers(
+            scheduler=AsyncMock(),
+            storage=mock_storage,
+            context_id_parser=lambda x: context_id,
+            event_bus=event_bus,
+        )
+        response = await handler.stream_message(
+            {
+                "jsonrpc": "2.0",
+                "id": "req1",
+                "params": {"message": {"context_id": str(context_id)}},
+            }
+        )
+        events: list[dict] = []
+
+        async def consume():
+            async for chunk in response.body_iterator:
+                events.append(json.loads(chunk.removeprefix("data: ")))
+
+        artifact_id = uuid4()
+        with anyio.fail_after(2):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(consume)
+                while event_bus.subscriber_count(task_id) == 0:
+                    await anyio.sleep(0.01)
+                for index, text in enumerate(("Hel", "lo")):
+                    await event_bus.publish(
+                        {
+                            "kind": "artifact-update",
+                            "task_id": str(task_id),
+                            "context_id": str(context_id),
+                            "artifact": {
+                                "artifact_id": artifact_id,
+                                "parts": [{"kind": "text", "text": text}],
+                            },
+                            "append": index > 0,
+                            "last_chunk": False,
+                        }
+                    )
+                await event_bus.publish(
+                    {
+                        "kind": "status-update",
+                        "task_id": str(task_id),
+                        "context_id": str(context_id),
+                        "status": {"state": "completed", "timestamp": "t"},
+                        "final": True,
+                    }
+                )
+
+        chunks = [e for e in events if e["kind"] == "artifact-update"]
+        assert [c["artifact"]["parts"][0]["text"] for c in chunks] == ["Hel", "lo"]
+        assert events[-1]["final"] is True
@@ -57,6 +57,26 @@ class TestTaskHandlers:
         response = await handler.list_tasks(request)
 
         assert len(response["result"]) == 2
+        mock_storage.list_tasks.assert_called_once_with(10, cursor=None)
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_summary_page(self):
+        """Test listing a page of task summaries."""
+        mock_storage = AsyncMock()
+        mock_storage.list_task_summaries.return_value = [{"id": "task2"}]
+
+        handler = TaskHandlers(scheduler=Mock(), storage=mock_storage)
+        request = {
+            "jsonrpc": "2.0",
+            "id": "3",
+            "params": {"length": 1, "cursor": "task1", "summary": True},
+        }
+
+        response = await handler.list_tasks(request)
+
+        assert response["result"] == [{"id": "task2"}]
+        mock_storage.list_task_summaries.assert_called_once_with(1, cursor="task1")
+        mock_storage.list_tasks.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_task_feedback_success(self):
@@ -0,0 +1,220 @@
+"""Tests for the DID public key cache used by HydraMiddleware."""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import base58
+import pytest
+from nacl.signing import SigningKey
+
+from bindu.auth.hydra.client import HydraClient
+from bindu.server.middleware.auth import HydraMiddleware
+from bindu.server.middleware.auth.did_key_cache import DIDKeyCache
+from bindu.utils.did import sign_request
+
+DID = "did:bindu:test:client"
+
+
+def _public_key(signing_key: SigningKey) -> str:
+    return base58.b58encode(bytes(signing_key.verify_key)).decode()
+
+
+def _fetcher(keys: dict[str, str | None], delay: float = 0.0) -> AsyncMock:
+    async def fetch(did):
+        await asyncio.sleep(delay)
+        return keys.get(did)
+
+    return AsyncMock(side_effect=fetch)
+
+
+@pytest.fixture
+def metrics():
+    """Capture cache hit/miss metrics."""
+    with patch("bindu.server.middleware.auth.did_key_cache.get_metrics") as get:
+        yield get.return_value
+
+
+class TestDIDKeyCache:
+    """Test caching, expiry and single-flight of key lookups."""
+
+    @pytest.mark.asyncio
+    async def test_hit_after_miss(self, metrics):
+        """Test a key is fetched once and then served from the cache."""
+        signing_key = SigningKey.generate()
+        fetch = _fetcher({DID: _public_key(signing_key)})
+        cache = DIDKeyCache(fetch, ttl=60, max_size=10)
+
+        first = await cache.get(DID)
+        second = await cache.get(DID)
+
+        assert first == second == signing_key.verify_key
+        fetch.assert_awaited_once_with(DID)
+        assert [
+            c.kwargs["hit"] for c in metrics.record_auth_cache_lookup.mock_calls
+        ] == [
+            False,
+            True,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_expired_key_is_refetched(self, metrics):
+        """Test a key is fetched again after the TTL."""
+        fetch = _fetcher({DID: _public_key(SigningKey.generate())})
+        cache = DIDKeyCache(fetch, ttl=0.05, max_size=10)
+
+        await cache.get(DID)
+        await asyncio.sleep(0.06)
+        await cache.get(DID)
+
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_is_evicted(self, metrics):
+        """Test the cache keeps at most max_size keys."""
+        keys = {f"did:bindu:{i}": _public_key(SigningKey.generate()) for i in range(3)}
+        cache = DIDKeyCache(_fetcher(keys), ttl=60, max_size=2)
+
+        await cache.get("did:bindu:0")
+        await cache.get("did:bindu:1")
+        await cache.get("did:bindu:0")
+        await cache.get("did:bindu:2")
+
+        assert "did:bindu:0" in cache
+        assert "did:bindu:1" not in cache
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self, metrics):
+        """Test concurrent lookups of one DID make a single Hydra request."""
+        fetch = _fetcher({DID: _public_key(SigningKey.generate())}, delay=0.05)
+        cache = DIDKeyCache(fetch, ttl=60, max_size=10)
+
+        keys = await asyncio.gather(*(cache.get(DID) for _ in range(20)))
+
+        assert len(set(keys)) == 1
+        fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_fetch(self, metrics):
+        """Test a key fetched before invalidation is not cached."""
+        fetch = _fetcher({DID: _public_key(SigningKey.generate())}, delay=0.05)
+        cache = DIDKeyCache(fetch, ttl=60, max_size=10)
+
+        pending = asyncio.create_task(cache.get(DID))
+        await asyncio.sleep(0.01)
+        cache.invalidate(DID)
+        await pending
+
+        assert DID not in cache
+
+    @pytest.mark.asyncio
+    async def test_missing_key_is_not_cached(self, metrics):
+        """Test clients without a key are looked up again."""
+        fetch = _fetcher({DID: None})
+        cache = DIDKeyCache(fetch, ttl=60, max_size=10)
+
+        assert await cache.get(DID) is None
+        assert await cache.get(DID) is None
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_key_raises(self, metrics):
+        """Test a key that is not Ed25519 raises ValueError."""
+        cache = DIDKeyCache(_fetcher({DID: "not-base58-0OIl"}), ttl=60, max_size=10)
+
+        with pytest.raises(ValueError, match="Invalid Ed25519 public key"):
+            await cache.get(DID)
+
+
+class _Signer:
+    """Signs like DIDExtension.sign_text."""
+
+    def __init__(self, signing_key: SigningKey):
+        self.signing_key = signing_key
+
+    def sign_text(self, message: str) -> str:
+        signature = self.signing_key.sign(message.encode()).signature
+        return base58.b58encode(signature).decode()
+
+
+class TestHydraSignatureVerification:
+    """Test HydraMiddleware's use of the key cache."""
+
+    def _middleware(self, keys: dict[str, str | None]) -> tuple[HydraMiddleware, Mock]:
+        fetch = _fetcher(keys)
+        config = SimpleNamespace(
+            admin_url="http://hydra-admin",
+            public_endpoints=[],
+            public_key_cache_ttl=300,
+            public_key_cache_size=100,
+        )
+        with patch.object(HydraClient, "get_public_key_from_client", fetch):
+            middleware = HydraMiddleware(Mock(), config)
+        return middleware, fetch
+
+    async def _verify(self, middleware, signing_key):
+        body = json.dumps({"jsonrpc": "2.0", "method": "message/send"}).encode()
+        headers = sign_request(body, DID, _Signer(signing_key), int(time.time()))
+        headers["content-length"] = str(len(body))
+
+        async def receive():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        is_valid, info, _ = await middleware._verify_did_signature_asgi(
+            receive, DID, headers
+        )
+        return is_valid, info
+
+    @pytest.mark.asyncio
+    async def test_key_fetched_once_for_many_requests(self, metrics):
+        """Test repeated signed requests reuse the cached key."""
+        signing_key = SigningKey.generate()
+        middleware, fetch = self._middleware({DID: _public_key(signing_key)})
+
+        for _ in range(3):
+            assert (await self._verify(middleware, signing_key))[0] is True
+
+        fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rotated_key_is_refetched(self, metrics):
+        """Test a signature with a new key passes once Hydra has the new key."""
+        old_key, new_key = SigningKey.generate(), SigningKey.generate()
+        keys = {DID: _public_key(old_key)}
+        middleware, fetch = self._middleware(keys)
+        await self._verify(middleware, old_key)
+
+        keys[DID] = _public_key(new_key)
+        is_valid, info = await self._verify(middleware, new_key)
+
+        assert is_valid is True
+        assert info["did_verified"] is True
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_bad_signature_still_rejected(self, metrics):
+        """Test a wrong signature is rejected after one refetch."""
+        signing_key = SigningKey.generate()
+        middleware, fetch = self._middleware({DID: _public_key(signing_key)})
+        await self._verify(middleware, signing_key)
+
+        is_valid, info = await self._verify(middleware, SigningKey.generate())
+
+        assert is_valid is False
+        assert info["reason"] == "invalid_signature"
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_did_key(self, metrics):
+        """Test explicit invalidation forces the next request to refetch."""
+        signing_key = SigningKey.generate()
+        middleware, fetch = self._middleware({DID: _public_key(signing_key)})
+        await self._verify(middleware, signing_key)
+
+        middleware.invalidate_did_key(DID)
+        await self._verify(middleware, signing_key)
+
+        assert fetch.await_count == 2
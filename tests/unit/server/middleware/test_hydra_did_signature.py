@@ -0,0 +1,153 @@
+"""Tests for HydraMiddleware DID signature verification of streamed bodies."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import base58
+import pytest
+from nacl.signing import SigningKey
+
+from bindu.auth.hydra.client import HydraClient
+from bindu.server.middleware.auth import HydraMiddleware
+from bindu.utils.did import (
+    SIGNATURE_VERSION_DIGEST,
+    SIGNATURE_VERSION_HEADER,
+    SIGNATURE_VERSION_LEGACY,
+    sign_request,
+)
+
+DID = "did:bindu:test:client"
+BODY = json.dumps(
+    {"jsonrpc": "2.0", "method": "message/send", "params": {"text": "x" * 5000}}
+).encode()
+
+
+class _Signer:
+    """Signs like DIDExtension.sign_text."""
+
+    def __init__(self, signing_key: SigningKey):
+        self.signing_key = signing_key
+
+    def sign_text(self, message: str) -> str:
+        signature = self.signing_key.sign(message.encode()).signature
+        return base58.b58encode(signature).decode()
+
+
+def _chunks(body: bytes, size: int) -> list[dict]:
+    parts = [body[i : i + size] for i in range(0, len(body), size)] or [b""]
+    return [
+        {"type": "http.request", "body": part, "more_body": i < len(parts) - 1}
+        for i, part in enumerate(parts)
+    ]
+
+
+def _receiver(messages: list[dict]):
+    pending = list(messages)
+
+    async def receive():
+        return pending.pop(0)
+
+    return receive
+
+
+async def _drain(receive) -> list[dict]:
+    messages = []
+    while True:
+        message = await receive()
+        messages.append(message)
+        if not message.get("more_body", False):
+            return messages
+
+
+@pytest.fixture
+def signing_key():
+    """Client signing key."""
+    return SigningKey.generate()
+
+
+@pytest.fixture
+def middleware(signing_key):
+    """HydraMiddleware whose Hydra client returns the client's public key."""
+    public_key = base58.b58encode(bytes(signing_key.verify_key)).decode()
+    fetch = AsyncMock(return_value=public_key)
+    config = SimpleNamespace(admin_url="http://hydra-admin", public_endpoints=[])
+    with patch.object(HydraClient, "get_public_key_from_client", fetch):
+        yield HydraMiddleware(Mock(), config)
+
+
+class TestStreamedSignatureVerification:
+    """Test bodies arriving in several ASGI messages."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "version", [SIGNATURE_VERSION_LEGACY, SIGNATURE_VERSION_DIGEST]
+    )
+    @pytest.mark.parametrize("content_length", [True, False])
+    async def test_chunked_body_verified_and_replayed(
+        self, middleware, signing_key, version, content_length
+    ):
+        """Test both schemes verify a chunked body and replay it unchanged."""
+        headers = sign_request(BODY, DID, _Signer(signing_key), version=version)
+        if content_length:
+            headers["content-length"] = str(len(BODY))
+        messages = _chunks(BODY, 1024)
+
+        is_valid, info, receive = await middleware._verify_did_signature_asgi(
+            _receiver(messages), DID, headers
+        )
+
+        assert is_valid is True
+        assert info["signature_version"] == version
+        assert await _drain(receive) == messages
+
+    @pytest.mark.asyncio
+    async def test_tampered_chunk_rejected(self, middleware, signing_key):
+        """Test a digest signature fails when one chunk differs."""
+        headers = sign_request(
+            BODY, DID, _Signer(signing_key), version=SIGNATURE_VERSION_DIGEST
+        )
+        messages = _chunks(BODY, 1024)
+        messages[2]["body"] = messages[2]["body"].upper()
+
+        is_valid, info, _ = await middleware._verify_did_signature_asgi(
+            _receiver(messages), DID, headers
+        )
+
+        assert is_valid is False
+        assert info["reason"] == "invalid_signature"
+
+    @pytest.mark.asyncio
+    async def test_stream_larger_than_limit_rejected(
+        self, middleware, signing_key, monkeypatch
+    ):
+        """Test a body without Content-Length is cut off at the size limit."""
+        monkeypatch.setattr(
+            "bindu.server.middleware.auth.hydra.MAX_BODY_SIZE_BYTES", 4096
+        )
+        headers = sign_request(
+            BODY, DID, _Signer(signing_key), version=SIGNATURE_VERSION_DIGEST
+        )
+
+        is_valid, info, _ = await middleware._verify_did_signature_asgi(
+            _receiver(_chunks(BODY, 1024)), DID, headers
+        )
+
+        assert is_valid is False
+        assert info["reason"] == "payload_too_large"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("version", ["9", "v2"])
+    async def test_unsupported_version_rejected(self, middleware, signing_key, version):
+        """Test an unknown signature scheme is refused before reading the body."""
+        headers = sign_request(BODY, DID, _Signer(signing_key))
+        headers[SIGNATURE_VERSION_HEADER] = version
+        receive = AsyncMock()
+
+        is_valid, info, _ = await middleware._verify_did_signature_asgi(
+            receive, DID, headers
+        )
+
+        assert is_valid is False
+        assert info["reason"] == "unsupported_signature_version"
+        receive.assert_not_awaited()
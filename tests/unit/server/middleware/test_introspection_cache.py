@@ -0,0 +1,147 @@
+"""Tests for the token introspection cache used by HydraMiddleware."""
+
+import asyncio
+import time
+
+import pytest
+
+from bindu.server.middleware.auth.introspection_cache import IntrospectionCache
+
+
+class _Introspection:
+    """Hydra's introspection endpoint, recording the tokens it was asked about.
+
+    Tokens starting with "revoked" are rejected; the others are active for
+    ``lifetimes[token]`` seconds, an hour by default.
+    """
+
+    def __init__(self, lifetimes: dict[str, float] | None = None, delay: float = 0):
+        self.lifetimes = lifetimes or {}
+        self.delay = delay
+        self.calls: list[str] = []
+
+    async def __call__(self, token: str) -> dict:
+        self.calls.append(token)
+        await asyncio.sleep(self.delay)
+        if token.startswith("revoked"):
+            raise ValueError("Token is not active")
+        lifetime = self.lifetimes.get(token, 3600)
+        return {"active": True, "sub": token, "exp": time.time() + lifetime}
+
+
+class TestIntrospectionCache:
+    """Test which results are reused from memory and for how long."""
+
+    @pytest.mark.asyncio
+    async def test_active_token_introspected_once(self):
+        """Test repeated requests with one token cause a single Hydra call."""
+        hydra = _Introspection(delay=0.01)
+        cache = IntrospectionCache(hydra, ttl=60, max_size=10)
+
+        concurrent = await asyncio.gather(*(cache.get("token-a") for _ in range(5)))
+        later = await cache.get("token-a")
+
+        assert all(result is later for result in concurrent)
+        assert hydra.calls == ["token-a"]
+
+    @pytest.mark.asyncio
+    async def test_revoked_token_asks_hydra_again(self):
+        """Test a rejected token is introspected again on its next use."""
+        hydra = _Introspection()
+        cache = IntrospectionCache(hydra, ttl=60, max_size=10)
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="not active"):
+                await cache.get("revoked-token")
+
+        assert hydra.calls == ["revoked-token", "revoked-token"]
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_token_expiry_caps_cache_ttl(self):
+        """Test a result is not reused past the token's own expiry."""
+        hydra = _Introspection({"token-a": 0.05})
+        cache = IntrospectionCache(hydra, ttl=60, max_size=10)
+
+        await cache.get("token-a")
+        await asyncio.sleep(0.1)
+        await cache.get("token-b")
+
+        assert len(cache) == 1
+        await cache.get("token-a")
+        assert hydra.calls == ["token-a", "token-b", "token-a"]
+
+    @pytest.mark.asyncio
+    async def test_full_cache_drops_soonest_expiry(self):
+        """Test a full cache keeps the results that stay valid longest."""
+        hydra = _Introspection({"short": 10, "long-1": 1000, "long-2": 1000})
+        cache = IntrospectionCache(hydra, ttl=3600, max_size=2)
+
+        for token in hydra.lifetimes:
+            await cache.get(token)
+
+        assert len(cache) == 2
+        assert {entry[1]["sub"] for entry in cache._entries.values()} == {
+            "long-1",
+            "long-2",
+        }
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_always_asks_hydra(self):
+        """Test ttl=0 introspects on every request."""
+        hydra = _Introspection()
+        cache = IntrospectionCache(hydra, ttl=0, max_size=10)
+
+        await cache.get("token-a")
+        await cache.get("token-a")
+
+        assert hydra.calls == ["token-a", "token-a"]
+
+
+class TestSharedIntrospectionCache:
+    """Test results shared between replicas through Redis."""
+
+    @pytest.fixture
+    def server(self):
+        """Fake Redis server shared by the replicas."""
+        return pytest.importorskip("fakeredis").FakeServer()
+
+    def _replica(self, server, hydra):
+        fakeredis = pytest.importorskip("fakeredis")
+        client = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+        return IntrospectionCache(hydra, ttl=60, max_size=10, redis_client=client)
+
+    @pytest.mark.asyncio
+    async def test_token_introspected_once_across_replicas(self, server):
+        """Test a token introspected on one replica is reused by another."""
+        hydra = _Introspection()
+        first, second = (self._replica(server, hydra) for _ in range(2))
+
+        result = await first.get("token-a")
+
+        assert await second.get("token-a") == result
+        assert hydra.calls == ["token-a"]
+
+    @pytest.mark.asyncio
+    async def test_tokens_stored_hashed(self, server):
+        """Test raw tokens never reach Redis."""
+        cache = self._replica(server, _Introspection())
+
+        await cache.get("secret-token")
+
+        keys = await cache._redis.keys("*")
+        assert len(keys) == 1
+        assert "secret-token" not in keys[0]
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_back_to_hydra(self, server):
+        """Test an unreachable Redis does not fail validation."""
+        server.connected = False
+        hydra = _Introspection()
+        cache = self._replica(server, hydra)
+
+        result = await cache.get("token-a")
+
+        assert result["sub"] == "token-a"
+        assert await cache.get("token-a") == result
+        assert hydra.calls == ["token-a"]
@@ -0,0 +1,173 @@
+"""Tests for local verification of Hydra JWT access tokens."""
+
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from bindu.auth.hydra.client import HydraClient
+from bindu.server.middleware.auth import HydraMiddleware
+from bindu.server.middleware.auth.jwks_verifier import JWKSVerifier
+
+
+class _Hydra:
+    """Signs tokens like Hydra and serves the matching JWKS."""
+
+    def __init__(self, kid: str = "hydra-key"):
+        self.kid = kid
+        self.private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048
+        )
+        self.fetch_jwks = AsyncMock(side_effect=self._jwks)
+
+    async def _jwks(self):
+        jwk = json.loads(
+            jwt.algorithms.RSAAlgorithm.to_jwk(self.private_key.public_key())
+        )
+        jwk.update({"kid": self.kid, "alg": "RS256", "use": "sig"})
+        return {"keys": [jwk]}
+
+    def token(self, kid: str | None = None, **claims) -> str:
+        now = int(time.time())
+        payload = {
+            "sub": "did:bindu:test:client",
+            "client_id": "did:bindu:test:client",
+            "scp": ["agent:read", "agent:write"],
+            "iat": now,
+            "exp": now + 3600,
+            **claims,
+        }
+        payload = {k: v for k, v in payload.items() if v is not None}
+        return jwt.encode(
+            payload,
+            self.private_key,
+            algorithm="RS256",
+            headers={"kid": kid or self.kid},
+        )
+
+
+@pytest.fixture
+def hydra():
+    """Fake Hydra signing authority."""
+    return _Hydra()
+
+
+class TestJWKSVerifier:
+    """Test which tokens are verified locally."""
+
+    @pytest.mark.asyncio
+    async def test_access_token_verified_locally(self, hydra):
+        """Test a Hydra JWT yields introspection-shaped claims."""
+        verifier = JWKSVerifier(hydra.fetch_jwks, ttl=3600)
+
+        for _ in range(3):
+            claims = await verifier.verify(hydra.token())
+
+        assert claims["active"] is True
+        assert claims["sub"] == "did:bindu:test:client"
+        assert claims["scope"] == "agent:read agent:write"
+        hydra.fetch_jwks.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_opaque_token_left_to_introspection(self, hydra):
+        """Test opaque tokens are not checked and the JWKS is not fetched."""
+        verifier = JWKSVerifier(hydra.fetch_jwks, ttl=3600)
+
+        assert await verifier.verify("ory_at_opaque.signature") is None
+        hydra.fetch_jwks.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_id_token_left_to_introspection(self, hydra):
+        """Test a signed token without client_id is not taken as access token."""
+        verifier = JWKSVerifier(hydra.fetch_jwks, ttl=3600)
+
+        assert await verifier.verify(hydra.token(client_id=None)) is None
+
+    @pytest.mark.asyncio
+    async def test_expired_token_rejected(self, hydra):
+        """Test an expired Hydra JWT is rejected without introspection."""
+        verifier = JWKSVerifier(hydra.fetch_jwks, ttl=3600)
+
+        with pytest.raises(ValueError, match="expired"):
+            await verifier.verify(hydra.token(exp=int(time.time()) - 10))
+
+    @pytest.mark.asyncio
+    async def test_forged_token_rejected(self, hydra):
+        """Test a token claiming a Hydra key but signed otherwise is rejected."""
+        verifier = JWKSVerifier(hydra.fetch_jwks, ttl=3600)
+        forger = _Hydra(kid=hydra.kid)
+
+        with pytest.raises(ValueError, match="signature"):
+            await verifier.verify(forger.token())
+
+    @pytest.mark.asyncio
+    async def test_unknown_key_refetch_is_rate_limited(self, hydra):
+        """Test unknown key IDs refetch the JWKS at most once per interval."""
+        verifier = JWKSVerifier(hydra.fetch_jwks, ttl=3600, refresh_interval=60)
+        await verifier.verify(hydra.token())
+
+        for _ in range(5):
+            assert await verifier.verify(hydra.token(kid="rotated")) is None
+
+        hydra.fetch_jwks.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_jwks_failure_left_to_introspection(self, hydra):
+        """Test tokens are introspected while the JWKS cannot be fetched."""
+        verifier = JWKSVerifier(AsyncMock(side_effect=ValueError("down")), ttl=3600)
+
+        assert await verifier.verify(hydra.token()) is None
+
+
+class TestHydraLocalValidation:
+    """Test HydraMiddleware's choice between local checks and introspection."""
+
+    def _middleware(self, hydra, introspect):
+        config = SimpleNamespace(
+            admin_url="http://hydra-admin", public_endpoints=[], verify_jwt_locally=True
+        )
+        with patch.object(HydraClient, "get_jwks", hydra.fetch_jwks):
+            middleware = HydraMiddleware(Mock(), config)
+        middleware.hydra_client.introspect_token = introspect
+        return middleware
+
+    @pytest.mark.asyncio
+    async def test_jwt_skips_introspection(self, hydra):
+        """Test a Hydra JWT is validated without calling introspection."""
+        introspect = AsyncMock()
+        middleware = self._middleware(hydra, introspect)
+
+        payload = await middleware._validate_token(hydra.token())
+
+        assert middleware._extract_user_info(payload)["client_id"] == (
+            "did:bindu:test:client"
+        )
+        introspect.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_jwt_grant_type_derived_from_subject(self, hydra):
+        """Test client credentials tokens are machine-to-machine, user tokens not."""
+        middleware = self._middleware(hydra, AsyncMock())
+
+        client_token = await middleware._validate_token(hydra.token())
+        user_token = await middleware._validate_token(hydra.token(sub="user-1"))
+
+        assert middleware._extract_user_info(client_token)["is_m2m"] is True
+        assert middleware._extract_user_info(user_token)["is_m2m"] is False
+
+    @pytest.mark.asyncio
+    async def test_opaque_token_introspected(self, hydra):
+        """Test an opaque token still goes to Hydra introspection."""
+        introspect = AsyncMock(
+            return_value={"active": True, "sub": "user", "exp": time.time() + 60}
+        )
+        middleware = self._middleware(hydra, introspect)
+
+        payload = await middleware._validate_token("ory_at_opaque")
+
+        assert payload["sub"] == "user"
+        introspect.assert_awaited_once_with("ory_at_opaque")
@@ -1,7 +1,13 @@
 """Minimal tests for metrics middleware."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
 import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
 
 from bindu.server.middleware.metrics import (
     MetricsMiddleware,
@@ -10,6 +16,37 @@ from bindu.server.middleware.metrics import (
 )
 
 
+async def _json(request):
+    return JSONResponse({"ok": True})
+
+
+async def _stream(request):
+    async def events():
+        for n in range(3):
+            await asyncio.sleep(0.01)
+            yield f"data: {n}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+def _app() -> MetricsMiddleware:
+    return MetricsMiddleware(
+        Starlette(
+            routes=[
+                Route("/", _json, methods=["POST"]),
+                Route("/metrics", _json),
+                Route("/stream", _stream),
+            ]
+        )
+    )
+
+
+async def _request(method: str, path: str, **kwargs) -> httpx.Response:
+    transport = httpx.ASGITransport(app=_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.request(method, path, **kwargs)
+
+
 class TestMetricsMiddleware:
     """Test metrics middleware functionality."""
 
@@ -28,71 +65,81 @@ class TestMetricsMiddleware:
         assert result == "/users/:id/profile"
 
     @pytest.mark.asyncio
-    async def test_dispatch_skips_metrics_endpoint(self):
+    async def test_skips_metrics_endpoint(self):
         """Test that metrics endpoint itself is skipped."""
-        mock_request = Mock()
-        mock_request.url.path = "/metrics"
-
-        mock_call_next = AsyncMock(return_value=Mock())
-
-        middleware = MetricsMiddleware(app=Mock())
+        mock_metrics = Mock()
 
-        with patch("bindu.server.middleware.metrics.get_metrics"):
-            await middleware.dispatch(mock_request, mock_call_next)
+        with patch(
+            "bindu.server.middleware.metrics.get_metrics", return_value=mock_metrics
+        ):
+            response = await _request("GET", "/metrics")
 
-        mock_call_next.assert_called_once()
+        assert response.status_code == 200
+        mock_metrics.record_http_request.assert_not_called()
+        mock_metrics.increment_requests_in_flight.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_dispatch_records_metrics(self):
+    async def test_records_metrics(self):
         """Test that metrics are recorded for normal requests."""
-        mock_request = Mock()
-        mock_request.url.path = "/api/test"
-        mock_request.method = "GET"
-        mock_request.headers = {"content-length": "100"}
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.headers = {"content-length": "500"}
-
-        mock_call_next = AsyncMock(return_value=mock_response)
-
         mock_metrics = Mock()
-        mock_metrics.increment_requests_in_flight = Mock()
-        mock_metrics.decrement_requests_in_flight = Mock()
-        mock_metrics.record_http_request = Mock()
-
-        middleware = MetricsMiddleware(app=Mock())
 
         with patch(
             "bindu.server.middleware.metrics.get_metrics", return_value=mock_metrics
         ):
-            result = await middleware.dispatch(mock_request, mock_call_next)
+            response = await _request("POST", "/", content=b"x" * 100)
 
-        assert result == mock_response
         mock_metrics.increment_requests_in_flight.assert_called_once()
         mock_metrics.decrement_requests_in_flight.assert_called_once()
-        mock_metrics.record_http_request.assert_called_once()
+        args = mock_metrics.record_http_request.call_args
+        assert args.args[:3] == ("POST", "/", "200")
+        assert args.kwargs["request_size"] == 100
+        assert args.kwargs["response_size"] == len(response.content)
+        assert args.kwargs["time_to_first_byte"] is not None
 
     @pytest.mark.asyncio
-    async def test_dispatch_decrements_on_error(self):
-        """Test that requests in flight is decremented even on error."""
-        mock_request = Mock()
-        mock_request.url.path = "/api/test"
-        mock_request.headers = {}
+    async def test_measures_streamed_response(self):
+        """Test streamed bodies are counted chunk by chunk with their TTFB."""
+        mock_metrics = Mock()
 
-        mock_call_next = AsyncMock(side_effect=Exception("Test error"))
+        with patch(
+            "bindu.server.middleware.metrics.get_metrics", return_value=mock_metrics
+        ):
+            response = await _request("GET", "/stream")
 
+        assert response.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
+        args = mock_metrics.record_http_request.call_args
+        duration = args.args[3]
+        ttfb = args.kwargs["time_to_first_byte"]
+        assert args.kwargs["response_size"] == len(response.content)
+        assert 0 < ttfb < duration
+        assert duration >= 0.03
+
+    @pytest.mark.asyncio
+    async def test_decrements_on_error(self):
+        """Test that requests in flight is decremented even on error."""
         mock_metrics = Mock()
-        mock_metrics.increment_requests_in_flight = Mock()
-        mock_metrics.decrement_requests_in_flight = Mock()
 
-        middleware = MetricsMiddleware(app=Mock())
+        async def failing_app(scope, receive, send):
+            raise RuntimeError("Test error")
 
         with patch(
             "bindu.server.middleware.metrics.get_metrics", return_value=mock_metrics
         ):
-            with pytest.raises(Exception, match="Test error"):
-                await middleware.dispatch(mock_request, mock_call_next)
+            with pytest.raises(RuntimeError, match="Test error"):
+                await MetricsMiddleware(failing_app)(
+                    {
+                        "type": "http",
+                        "method": "GET",
+                        "path": "/fail",
+                        "headers": [],
+                        "query_string": b"",
+                    },
+                    AsyncMock(),
+                    AsyncMock(),
+                )
 
         mock_metrics.increment_requests_in_flight.assert_called_once()
         mock_metrics.decrement_requests_in_flight.assert_called_once()
+        args = mock_metrics.record_http_request.call_args
+        assert args.args[2] == "500"
+        assert args.kwargs["time_to_first_byte"] is None
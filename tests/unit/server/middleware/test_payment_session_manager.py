@@ -0,0 +1,183 @@
+"""Tests for the in-memory payment session manager."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from x402.types import PaymentPayload
+
+from bindu.server.middleware.x402 import PaymentSession, PaymentSessionManager
+from bindu.server.middleware.x402.session_factory import (
+    create_payment_session_manager,
+)
+
+PAYLOAD = PaymentPayload.model_validate({"x402Version": 1, "scheme": "exact"})
+
+
+class TestWaitForCompletion:
+    """Test waiting for a session to be settled."""
+
+    @pytest.mark.asyncio
+    async def test_completion_wakes_waiter_immediately(self):
+        """Test a waiter returns as soon as the session is completed."""
+        manager = PaymentSessionManager()
+        session = await manager.create_session()
+
+        async def pay():
+            await asyncio.sleep(0.05)
+            await manager.complete_session(session.session_id, PAYLOAD)
+
+        started = time.perf_counter()
+        payer = asyncio.create_task(pay())
+        result = await manager.wait_for_completion(session.session_id, 10)
+        await payer
+
+        assert result is not None and result.is_completed()
+        assert time.perf_counter() - started < 0.5
+        assert manager._waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_failure_wakes_all_waiters(self):
+        """Test every waiter of a session sees its failure."""
+        manager = PaymentSessionManager()
+        session = await manager.create_session()
+
+        waiters = [
+            asyncio.create_task(manager.wait_for_completion(session.session_id, 10))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        await manager.fail_session(session.session_id, "declined")
+        results = await asyncio.wait_for(asyncio.gather(*waiters), 1)
+
+        assert [r.status for r in results] == ["failed"] * 3
+        assert results[0].error == "declined"
+
+    @pytest.mark.asyncio
+    async def test_already_settled_session_returns_at_once(self):
+        """Test waiting on a completed session does not block."""
+        manager = PaymentSessionManager()
+        session = await manager.create_session()
+        await manager.complete_session(session.session_id, PAYLOAD)
+
+        result = await asyncio.wait_for(
+            manager.wait_for_completion(session.session_id, 10), 0.5
+        )
+
+        assert result is session
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_none(self):
+        """Test an unpaid session returns None after the timeout."""
+        manager = PaymentSessionManager()
+        session = await manager.create_session()
+
+        assert await manager.wait_for_completion(session.session_id, 0.05) is None
+        assert manager._waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_unknown_session_returns_none(self):
+        """Test waiting on an unknown session returns None."""
+        assert await PaymentSessionManager().wait_for_completion("missing", 1) is None
+
+    @pytest.mark.asyncio
+    async def test_deleted_session_wakes_waiter(self):
+        """Test deleting a session ends the wait."""
+        manager = PaymentSessionManager()
+        session = await manager.create_session()
+
+        waiter = asyncio.create_task(
+            manager.wait_for_completion(session.session_id, 10)
+        )
+        await asyncio.sleep(0.01)
+        assert await manager.delete_session(session.session_id) is True
+
+        assert await asyncio.wait_for(waiter, 0.5) is None
+
+
+class TestExpiry:
+    """Test session expiry."""
+
+    @pytest.mark.asyncio
+    async def test_session_uses_configured_timeout(self):
+        """Test sessions expire after the manager's timeout."""
+        manager = PaymentSessionManager(session_timeout_minutes=2)
+        session = await manager.create_session()
+
+        assert session.expires_at - session.created_at == timedelta(minutes=2)
+
+    @pytest.mark.asyncio
+    async def test_cleanup_task_removes_sessions_when_due(self):
+        """Test the cleanup task drops sessions at their expiry time."""
+        manager = PaymentSessionManager()
+        soon = await manager.create_session()
+        later = await manager.create_session()
+        now = datetime.now(timezone.utc)
+        soon.expires_at = now + timedelta(milliseconds=50)
+        later.expires_at = now + timedelta(minutes=5)
+        manager._expiry_heap = [(soon.expires_at, soon.session_id)]
+
+        await manager.start()
+        try:
+            waiter = asyncio.create_task(manager.wait_for_completion(soon.session_id))
+            assert await asyncio.wait_for(waiter, 1) is None
+            await asyncio.sleep(0.05)
+        finally:
+            await manager.stop()
+
+        assert soon.session_id not in manager._sessions
+        assert later.session_id in manager._sessions
+
+    @pytest.mark.asyncio
+    async def test_new_earlier_session_wakes_cleanup_task(self):
+        """Test an earlier expiry than the next due one is picked up."""
+        manager = PaymentSessionManager(session_timeout_minutes=60)
+        await manager.create_session()
+        await manager.start()
+        try:
+            await asyncio.sleep(0.01)
+            manager._session_timeout = timedelta(milliseconds=20)
+            session = await manager.create_session()
+            await asyncio.sleep(0.2)
+        finally:
+            await manager.stop()
+
+        assert session.session_id not in manager._sessions
+
+
+class TestPaymentSession:
+    """Test session serialization."""
+
+    def test_json_round_trip(self):
+        """Test a session survives serialization for a shared store."""
+        session = PaymentSession(
+            session_id="abc", payment_payload=PAYLOAD, status="completed"
+        )
+
+        restored = PaymentSession.from_json(session.to_json())
+
+        assert restored.session_id == "abc"
+        assert restored.expires_at == session.expires_at
+        assert restored.is_completed()
+        assert restored.payment_payload.model_dump() == PAYLOAD.model_dump()
+
+
+class TestFactory:
+    """Test backend selection."""
+
+    def test_defaults_to_memory(self):
+        """Test the in-memory manager is used with the memory scheduler."""
+        manager = create_payment_session_manager()
+
+        assert type(manager) is PaymentSessionManager
+
+    def test_redis_backend_requires_url(self):
+        """Test the Redis backend without a Redis URL is rejected."""
+        with (
+            patch("bindu.settings.app_settings.x402.session_backend", "redis"),
+            patch("bindu.settings.app_settings.scheduler.redis_url", None),
+        ):
+            with pytest.raises(ValueError, match="require a Redis URL"):
+                create_payment_session_manager()
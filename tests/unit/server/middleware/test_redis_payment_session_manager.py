@@ -0,0 +1,109 @@
+"""Tests for Redis-backed payment sessions."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from x402.types import PaymentPayload
+
+from bindu.server.middleware.x402.redis_payment_session_manager import (
+    RedisPaymentSessionManager,
+)
+
+PAYLOAD = PaymentPayload.model_validate({"x402Version": 1, "scheme": "exact"})
+
+
+@pytest.fixture
+def fake_redis_server():
+    """Share one fake Redis server between managers, like replicas sharing Redis."""
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    with patch(
+        "bindu.server.middleware.x402.redis_payment_session_manager.redis.from_url",
+        side_effect=lambda *args, **kwargs: fakeredis.aioredis.FakeRedis(
+            server=server, decode_responses=True
+        ),
+    ):
+        yield server
+
+
+async def _started(**kwargs) -> RedisPaymentSessionManager:
+    manager = RedisPaymentSessionManager("redis://fake", **kwargs)
+    await manager.start()
+    return manager
+
+
+class TestRedisPaymentSessionManager:
+    """Test payment sessions shared across replicas."""
+
+    @pytest.mark.asyncio
+    async def test_completion_on_other_replica_wakes_waiter(self, fake_redis_server):
+        """Test a payment captured on one replica ends a wait on another."""
+        capture, status = await _started(), await _started()
+        try:
+            session = await capture.create_session()
+            waiter = asyncio.create_task(
+                status.wait_for_completion(session.session_id, 10)
+            )
+            await asyncio.sleep(0.05)
+            assert await capture.complete_session(session.session_id, PAYLOAD)
+
+            result = await asyncio.wait_for(waiter, 2)
+        finally:
+            await capture.stop()
+            await status.stop()
+
+        assert result is not None and result.is_completed()
+        assert result.payment_payload.model_dump() == PAYLOAD.model_dump()
+
+    @pytest.mark.asyncio
+    async def test_sessions_expire_in_redis(self, fake_redis_server):
+        """Test the session key carries the session timeout as its TTL."""
+        manager = await _started(session_timeout_minutes=1)
+        try:
+            session = await manager.create_session()
+            ttl = await manager._client().pttl(manager._key(session.session_id))
+            await manager.fail_session(session.session_id, "declined")
+            ttl_after = await manager._client().pttl(manager._key(session.session_id))
+            failed = await manager.get_session(session.session_id)
+        finally:
+            await manager.stop()
+
+        assert 59_000 < ttl <= 60_000
+        assert 0 < ttl_after <= ttl
+        assert failed.status == "failed"
+
+    @pytest.mark.asyncio
+    async def test_expired_session_is_not_recreated(self, fake_redis_server):
+        """Test completing a session that expired meanwhile fails."""
+        manager = await _started()
+        try:
+            session = await manager.create_session()
+            await manager._client().delete(manager._key(session.session_id))
+
+            completed = await manager.complete_session(session.session_id, PAYLOAD)
+            missing = await manager.get_session(session.session_id)
+        finally:
+            await manager.stop()
+
+        assert completed is False
+        assert missing is None
+
+    @pytest.mark.asyncio
+    async def test_missed_wakeup_is_recovered(self, fake_redis_server):
+        """Test a waiter re-reads its session if a wakeup is lost."""
+        manager = await _started()
+        manager.resync_interval = 0.05
+        try:
+            session = await manager.create_session()
+            with patch.object(manager, "_notify_settled"):
+                waiter = asyncio.create_task(
+                    manager.wait_for_completion(session.session_id, 10)
+                )
+                await asyncio.sleep(0.01)
+                await manager.complete_session(session.session_id, PAYLOAD)
+                result = await asyncio.wait_for(waiter, 1)
+        finally:
+            await manager.stop()
+
+        assert result is not None and result.is_completed()
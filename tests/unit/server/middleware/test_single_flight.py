@@ -0,0 +1,78 @@
+"""Tests for the single-flight helper of the authentication caches."""
+
+import asyncio
+
+import pytest
+
+from bindu.server.middleware.auth.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test that concurrent loads of one key are shared."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_load(self):
+        """Test callers arriving during a load get its result."""
+        flight: SingleFlight[str, int] = SingleFlight()
+        loads = 0
+
+        async def load():
+            nonlocal loads
+            loads += 1
+            await asyncio.sleep(0.01)
+            return loads
+
+        results = await asyncio.gather(*(flight.run("a", load) for _ in range(10)))
+
+        assert results == [1] * 10
+        assert len(flight) == 0
+        assert await flight.run("a", load) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_load(self):
+        """Test the others still get the result when one caller gives up."""
+        flight: SingleFlight[str, str] = SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.05)
+            return "loaded"
+
+        impatient = asyncio.create_task(flight.run("a", load))
+        patient = asyncio.create_task(flight.run("a", load))
+        await asyncio.sleep(0.01)
+        impatient.cancel()
+
+        assert await patient == "loaded"
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_caller_and_is_not_kept(self):
+        """Test a failed load is raised to all callers and retried after."""
+        flight: SingleFlight[str, str] = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("unavailable")
+
+        results = await asyncio.gather(
+            flight.run("a", fail), flight.run("a", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_forgotten_load_is_no_longer_current(self):
+        """Test a load can tell it was forgotten while it ran."""
+        flight: SingleFlight[str, bool] = SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.02)
+            return flight.is_current("a")
+
+        kept = await flight.run("a", load)
+        pending = asyncio.create_task(flight.run("a", load))
+        await asyncio.sleep(0.01)
+        flight.forget("a")
+
+        assert kept is True
+        assert await pending is False
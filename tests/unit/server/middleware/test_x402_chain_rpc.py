@@ -0,0 +1,300 @@
+"""Tests for async on-chain lookups used by the x402 middleware."""
+
+import asyncio
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import pytest_asyncio
+
+from bindu.server.middleware.x402 import X402Middleware
+from bindu.server.middleware.x402.chain_rpc import ChainRpcClient, ChainRpcError
+
+TOKEN = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+PAYER = "0x857b06519E91e3A54538791bDbb0E22373e36b66"
+NETWORK = "base-sepolia"
+
+
+class StubRpcServer:
+    """Local JSON-RPC node answering the calls made for a payment check."""
+
+    def __init__(self, balance=0, code="0x6080", delay=0.0, status=200):
+        self.balance = balance
+        self.code = code
+        self.delay = delay
+        self.status = status
+        self.methods: list[str] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                request = json.loads(
+                    self.rfile.read(int(self.headers["Content-Length"]))
+                )
+                stub.methods.append(request["method"])
+                time.sleep(stub.delay)
+                body = json.dumps(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": request["id"],
+                        "result": stub.result(request),
+                    }
+                ).encode()
+                self.send_response(stub.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def result(self, request):
+        method = request["method"]
+        if method == "eth_chainId":
+            return "0x14a34"
+        if method == "eth_getCode":
+            return self.code
+        if method == "eth_call":
+            return "0x" + self.balance.to_bytes(32, "big").hex()
+        raise AssertionError(f"unexpected RPC method {method}")
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def servers():
+    """Start stub RPC nodes on demand and stop them after the test."""
+    started = []
+
+    def start(**kwargs):
+        server = StubRpcServer(**kwargs)
+        started.append(server)
+        return server
+
+    yield start
+    for server in started:
+        server.close()
+
+
+_clients: list[ChainRpcClient] = []
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def close_clients():
+    """Close the RPC sessions opened by each test."""
+    yield
+    while _clients:
+        await _clients.pop().close()
+
+
+def _dead_url() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+
+def _client(*urls, **kwargs) -> ChainRpcClient:
+    options = {
+        "timeout": 2.0,
+        "hedge_delay": 1.0,
+        "failure_threshold": 2,
+        "reset_timeout": 60.0,
+        "balance_cache_ttl": 5.0,
+        "contract_cache_ttl": 60.0,
+    }
+    options.update(kwargs)
+    client = ChainRpcClient({NETWORK: list(urls)}, **options)
+    _clients.append(client)
+    return client
+
+
+class TestLookups:
+    """Test contract and balance lookups."""
+
+    @pytest.mark.asyncio
+    async def test_reads_balance_and_contract(self, servers):
+        """Test lookups decode the node's answers."""
+        node = servers(balance=25_000)
+        client = _client(node.url)
+
+        assert await client.has_contract(NETWORK, TOKEN) is True
+        assert await client.token_balance(NETWORK, TOKEN, PAYER) == 25_000
+
+    @pytest.mark.asyncio
+    async def test_missing_contract(self, servers):
+        """Test an address without code is reported as having no contract."""
+        client = _client(servers(code="0x").url)
+
+        assert await client.has_contract(NETWORK, TOKEN) is False
+
+    @pytest.mark.asyncio
+    async def test_lookups_are_cached(self, servers):
+        """Test repeated checks within the TTL do not reach the node."""
+        node = servers(balance=7)
+        client = _client(node.url)
+
+        for _ in range(3):
+            await client.has_contract(NETWORK, TOKEN)
+            await client.token_balance(NETWORK, TOKEN, PAYER)
+
+        assert node.methods.count("eth_getCode") == 1
+        assert node.methods.count("eth_call") == 1
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_balance_cache(self, servers):
+        """Test balance_cache_ttl=0 reads the balance on every check."""
+        node = servers(balance=7)
+        client = _client(node.url, balance_cache_ttl=0)
+
+        await client.token_balance(NETWORK, TOKEN, PAYER)
+        await client.token_balance(NETWORK, TOKEN, PAYER)
+
+        assert node.methods.count("eth_call") == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_network(self):
+        """Test a network without RPC URLs is an RPC error."""
+        with pytest.raises(ChainRpcError, match="No RPC URLs configured"):
+            await _client().has_contract("solana", TOKEN)
+
+
+class TestFailover:
+    """Test failover across a network's RPC URLs."""
+
+    @pytest.mark.asyncio
+    async def test_fails_over_to_next_url(self, servers):
+        """Test an unreachable or erroring node is replaced by the next one."""
+        broken = servers(status=500)
+        healthy = servers(balance=3)
+        client = _client(_dead_url(), broken.url, healthy.url)
+
+        assert await client.token_balance(NETWORK, TOKEN, PAYER) == 3
+
+    @pytest.mark.asyncio
+    async def test_slow_node_is_raced(self, servers):
+        """Test a node slower than the hedge delay is overtaken by the next."""
+        slow = servers(balance=1, delay=1.5)
+        fast = servers(balance=2)
+        client = _client(slow.url, fast.url, hedge_delay=0.05)
+
+        started = time.perf_counter()
+        balance = await client.token_balance(NETWORK, TOKEN, PAYER)
+
+        assert balance == 2
+        assert time.perf_counter() - started < 1.0
+
+    @pytest.mark.asyncio
+    async def test_all_urls_failing(self):
+        """Test an RPC error names the last failure when no node answers."""
+        client = _client(_dead_url(), _dead_url())
+
+        with pytest.raises(ChainRpcError, match="Failed to reach any base-sepolia"):
+            await client.has_contract(NETWORK, TOKEN)
+
+
+class TestCircuitBreaker:
+    """Test skipping of failing RPC URLs."""
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_url(self, servers):
+        """Test a URL is no longer called once its circuit opens."""
+        broken = servers(status=500)
+        healthy = servers(balance=5)
+        client = _client(broken.url, healthy.url, balance_cache_ttl=0)
+
+        for _ in range(4):
+            assert await client.token_balance(NETWORK, TOKEN, PAYER) == 5
+
+        assert len(broken.methods) == 2
+        assert healthy.methods.count("eth_call") == 4
+
+    @pytest.mark.asyncio
+    async def test_trial_call_after_reset_timeout(self, servers):
+        """Test a recovered node is used again after the reset timeout."""
+        node = servers(status=500, balance=9)
+        client = _client(node.url, reset_timeout=0.1, balance_cache_ttl=0)
+
+        for _ in range(2):
+            with pytest.raises(ChainRpcError):
+                await client.token_balance(NETWORK, TOKEN, PAYER)
+        with pytest.raises(ChainRpcError, match="circuit open"):
+            await client.token_balance(NETWORK, TOKEN, PAYER)
+
+        node.status = 200
+        await asyncio.sleep(0.15)
+
+        assert await client.token_balance(NETWORK, TOKEN, PAYER) == 9
+
+
+class TestPaymentValidation:
+    """Test the middleware's on-chain payment checks."""
+
+    def _validate(self, middleware, balance_required=1000):
+        authorization = SimpleNamespace(value=str(balance_required), from_=PAYER)
+        payload = SimpleNamespace(
+            x402_version=1,
+            scheme="exact",
+            network=NETWORK,
+            payload=SimpleNamespace(authorization=authorization),
+        )
+        requirements = SimpleNamespace(
+            max_amount_required=str(balance_required), network=NETWORK, asset=TOKEN
+        )
+        return middleware._validate_payment_manually(payload, requirements)
+
+    def _middleware(self, *urls) -> X402Middleware:
+        middleware = X402Middleware.__new__(X402Middleware)
+        middleware._chain = _client(*urls)
+        return middleware
+
+    @pytest.mark.asyncio
+    async def test_sufficient_balance(self, servers):
+        """Test a payer holding enough tokens passes validation."""
+        middleware = self._middleware(servers(balance=5000).url)
+
+        assert await self._validate(middleware) == (True, None)
+
+    @pytest.mark.asyncio
+    async def test_insufficient_balance(self, servers):
+        """Test a payer without enough tokens is rejected."""
+        middleware = self._middleware(servers(balance=10).url)
+
+        is_valid, reason = await self._validate(middleware)
+
+        assert is_valid is False
+        assert reason == "Insufficient balance: 10 < 1000 (required)"
+
+    @pytest.mark.asyncio
+    async def test_shutdown_closes_rpc_sessions(self):
+        """Test the lifespan shutdown message closes the RPC client."""
+        middleware = self._middleware()
+        middleware._chain = Mock(close=AsyncMock())
+        receive = middleware._close_on_shutdown(
+            AsyncMock(return_value={"type": "lifespan.shutdown"})
+        )
+
+        assert await receive() == {"type": "lifespan.shutdown"}
+        middleware._chain.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unreachable_network(self):
+        """Test payments are rejected when no RPC node answers."""
+        middleware = self._middleware(_dead_url())
+
+        assert await self._validate(middleware) == (
+            False,
+            "Cannot connect to base-sepolia network",
+        )
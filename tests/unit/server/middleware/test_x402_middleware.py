@@ -0,0 +1,107 @@
+"""Tests for the x402 payment middleware."""
+
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from bindu.server.middleware.x402 import X402Middleware, x402_middleware
+
+REQUIREMENTS = Mock(name="payment_requirements")
+PAYMENT = '{"x402Version": 1, "scheme": "exact", "network": "base-sepolia"}'
+
+
+@pytest.fixture(autouse=True)
+def payment_decoding(monkeypatch):
+    """Decode X-PAYMENT as plain JSON and match the single requirement."""
+    monkeypatch.setattr(x402_middleware, "safe_base64_decode", lambda header: header)
+    monkeypatch.setattr(
+        x402_middleware,
+        "find_matching_payment_requirements",
+        lambda requirements, payload: requirements[0],
+    )
+    monkeypatch.setattr(
+        X402Middleware,
+        "_create_402_response",
+        lambda self, error: JSONResponse({"error": error}, status_code=402),
+    )
+
+
+async def _echo(request):
+    """Return the body and payment state the application received."""
+    body = await request.json()
+    payment = getattr(request.state, "payment_payload", None)
+    return JSONResponse({"method": body["method"], "paid": payment is not None})
+
+
+def _middleware() -> X402Middleware:
+    manifest = Mock()
+    manifest.name = "test-agent"
+    manifest.description = "Test agent"
+    manifest.did_extension = None
+    return X402Middleware(
+        Starlette(routes=[Route("/", _echo, methods=["POST"])]),
+        manifest=manifest,
+        facilitator_config={"url": "https://facilitator.example"},
+        x402_ext=Mock(),
+        payment_requirements=[REQUIREMENTS],
+    )
+
+
+async def _post(middleware: X402Middleware, method: str, **kwargs) -> httpx.Response:
+    transport = httpx.ASGITransport(app=middleware)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.post(
+            "/", json={"jsonrpc": "2.0", "id": 1, "method": method}, **kwargs
+        )
+
+
+class TestX402Middleware:
+    """Test payment enforcement on the JSON-RPC endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_unprotected_method_passes_body_through(self):
+        """Test free methods reach the app with the body still readable."""
+        response = await _post(_middleware(), "tasks/get")
+
+        assert response.status_code == 200
+        assert response.json() == {"method": "tasks/get", "paid": False}
+
+    @pytest.mark.asyncio
+    async def test_missing_payment_returns_402(self):
+        """Test protected methods without X-PAYMENT are rejected."""
+        response = await _post(_middleware(), "message/send")
+
+        assert response.status_code == 402
+        assert response.json()["error"] == "X-PAYMENT header required"
+
+    @pytest.mark.asyncio
+    async def test_valid_payment_attaches_request_state(self):
+        """Test a verified payment is exposed to the app via request.state."""
+        middleware = _middleware()
+        middleware._validate_payment_manually = AsyncMock(return_value=(True, None))
+
+        response = await _post(
+            middleware, "message/send", headers={"X-PAYMENT": PAYMENT}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"method": "message/send", "paid": True}
+
+    @pytest.mark.asyncio
+    async def test_invalid_payment_returns_402(self):
+        """Test a payment failing validation is rejected with its reason."""
+        middleware = _middleware()
+        middleware._validate_payment_manually = AsyncMock(
+            return_value=(False, "Insufficient balance")
+        )
+
+        response = await _post(
+            middleware, "message/send", headers={"X-PAYMENT": PAYMENT}
+        )
+
+        assert response.status_code == 402
+        assert response.json()["error"] == "Invalid payment: Insufficient balance"
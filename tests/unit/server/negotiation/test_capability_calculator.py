@@ -1,11 +1,16 @@
 """Minimal tests for capability calculator."""
 
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
 import pytest
 
 from bindu.server.negotiation.capability_calculator import (
+    AssessmentResult,
+    CapabilityCalculator,
     ScoringWeights,
     SkillMatchResult,
-    AssessmentResult,
+    _SubstringMatcher,
 )
 
 
@@ -96,3 +101,131 @@ class TestAssessmentResult:
 
         assert result.accepted is False
         assert result.rejection_reason == "Insufficient skill match"
+
+
+def _skill(skill_id, tags=(), keywords=(), anti_patterns=(), specializations=()):
+    return {
+        "id": skill_id,
+        "name": skill_id,
+        "tags": list(tags),
+        "capabilities_detail": {},
+        "assessment": {
+            "keywords": list(keywords),
+            "anti_patterns": list(anti_patterns),
+            "specializations": list(specializations),
+        },
+    }
+
+
+def _calculator(skills):
+    calculator = CapabilityCalculator(skills)
+    calculator._use_embeddings = False
+    return calculator
+
+
+async def _match(calculator, summary, details=None):
+    keywords = calculator._extract_keywords(summary, details)
+    return await calculator._calculate_skill_match(keywords, summary, details)
+
+
+class TestSubstringMatcher:
+    """Test the compiled anti-pattern/specialization matcher."""
+
+    def test_finds_overlapping_patterns(self):
+        """Test patterns sharing a start or overlapping are all found."""
+        matcher = _SubstringMatcher(
+            [("sql", 0), ("sql query", 1), ("query plan", 2), ("pdf", 3)]
+        )
+
+        assert matcher.owners_in("explain the sql query plan") == {0, 1, 2}
+
+    def test_escapes_regex_characters(self):
+        """Test patterns are matched literally."""
+        matcher = _SubstringMatcher([("c++ (legacy)", 0), ("a.b", 1)])
+
+        assert matcher.owners_in("port c++ (legacy) code") == {0}
+        assert matcher.owners_in("axb") == set()
+
+    def test_empty_pattern_matches_everything(self):
+        """Test an empty pattern matches like ``"" in text`` does."""
+        assert _SubstringMatcher([("", 5)]).owners_in("anything") == {5}
+        assert _SubstringMatcher([]).owners_in("anything") == set()
+
+
+class TestSkillMatch:
+    """Test matching a task against all skills at once."""
+
+    @pytest.mark.asyncio
+    async def test_jaccard_scores_and_reasons(self):
+        """Test keyword overlap is scored and matched tags are reported."""
+        calculator = _calculator(
+            [
+                _skill("pdf", tags=["pdf", "documents"], keywords=["extract"]),
+                _skill("images", tags=["vision"]),
+            ]
+        )
+
+        best, matches, tags, _ = await _match(calculator, "extract pdf tables")
+
+        # Task {extract, pdf, tables} vs skill {pdf, documents, extract}
+        assert best == 0.5
+        assert [m.skill_id for m in matches] == ["pdf"]
+        assert matches[0].reasons == ["tags: pdf"]
+        assert tags == ["pdf"]
+
+    @pytest.mark.asyncio
+    async def test_anti_patterns_skip_skills(self):
+        """Test a skill is skipped when its anti-pattern is in the task."""
+        calculator = _calculator(
+            [
+                _skill("sql", tags=["sql"], anti_patterns=["Drop Table"]),
+                _skill("sql-ro", tags=["sql"]),
+            ]
+        )
+
+        _, matches, _, _ = await _match(calculator, "sql", details="then DROP TABLE")
+
+        assert [m.skill_id for m in matches] == ["sql-ro"]
+
+    @pytest.mark.asyncio
+    async def test_specialization_boost(self):
+        """Test a specialization domain in the summary boosts its skill."""
+        calculator = _calculator(
+            [
+                _skill(
+                    "finance",
+                    tags=["report"],
+                    specializations=[{"domain": "quarterly", "confidence_boost": 0.3}],
+                ),
+                _skill("generic", tags=["report"]),
+            ]
+        )
+
+        _, matches, _, _ = await _match(calculator, "quarterly report")
+
+        # Both overlap 1/3 with the task; the boost adds 0.3
+        assert [(m.skill_id, m.score) for m in matches] == [
+            ("finance", 0.6333),
+            ("generic", 0.3333),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_embedding_similarity_from_matrix(self):
+        """Test similarities come from the normalized skill embedding matrix."""
+        calculator = CapabilityCalculator([_skill("a"), _skill("b"), _skill("c")])
+        calculator._skill_embeddings = {
+            "a": {"embedding": np.array([2.0, 0.0], dtype=np.float32)},
+            "b": {"embedding": np.array([0.0, 3.0], dtype=np.float32)},
+        }
+        calculator._embedding_matrix = calculator._build_embedding_matrix()
+        calculator._embedder = Mock(
+            embed_task_cached=AsyncMock(
+                return_value=np.array([1.0, 1.0], dtype=np.float32)
+            )
+        )
+
+        _, matches, _, _ = await _match(calculator, "anything")
+
+        # Cosine 0.7071 for a and b; c has no embedding
+        assert [m.skill_id for m in matches] == ["a", "b"]
+        assert matches[0].reasons == ["semantic similarity: 0.71"]
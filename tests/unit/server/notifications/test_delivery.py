@@ -0,0 +1,425 @@
+"""Tests for background webhook delivery."""
+
+import asyncio
+from typing import Any, cast
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from bindu.common.protocol.types import PushNotificationConfig
+from bindu.server.notifications.delivery import WebhookDispatcher
+from bindu.server.storage.memory_storage import InMemoryStorage
+from bindu.utils.notifications import NotificationDeliveryError
+
+
+def _config(url: str = "https://example.com/webhook") -> PushNotificationConfig:
+    return cast(PushNotificationConfig, {"id": uuid4(), "url": url})
+
+
+def _event(n: int = 0) -> dict[str, Any]:
+    return {"event_id": str(uuid4()), "kind": "status-update", "n": n}
+
+
+def _dispatcher(deliver=None, **kwargs) -> WebhookDispatcher:
+    service = Mock()
+    service.deliver = AsyncMock(side_effect=deliver)
+    options = {
+        "queue_size": 100,
+        "max_batch_size": 1,
+        "max_attempts": 3,
+        "min_wait": 0,
+        "max_wait": 0,
+        "idle_timeout": 5.0,
+        "use_outbox": True,
+    }
+    options.update(kwargs)
+    return WebhookDispatcher(notification_service=service, **options)
+
+
+async def _settle(dispatcher: WebhookDispatcher) -> None:
+    """Give the endpoint workers time to drain their queues."""
+    for _ in range(100):
+        await asyncio.sleep(0.005)
+        if all(ep.queue.empty() for ep in dispatcher._endpoints.values()):
+            break
+    await asyncio.sleep(0.02)
+
+
+class TestWebhookDispatcher:
+    """Test per-endpoint queuing, batching and retries."""
+
+    @pytest.mark.asyncio
+    async def test_slow_endpoint_does_not_block_others(self):
+        """Test submit returns at once and other endpoints keep flowing."""
+        slow_release = asyncio.Event()
+        delivered: list[str] = []
+
+        async def deliver(config, event):
+            if "slow" in config["url"]:
+                await slow_release.wait()
+            delivered.append(config["url"])
+
+        dispatcher = _dispatcher(deliver)
+        await dispatcher.start()
+        try:
+            await asyncio.wait_for(
+                dispatcher.submit(_config("https://slow.example/h"), _event(), uuid4()),
+                timeout=0.5,
+            )
+            await dispatcher.submit(
+                _config("https://fast.example/h"), _event(), uuid4()
+            )
+            await _settle(dispatcher)
+
+            assert delivered == ["https://fast.example/h"]
+
+            slow_release.set()
+            await _settle(dispatcher)
+            assert delivered == ["https://fast.example/h", "https://slow.example/h"]
+        finally:
+            await dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_endpoint_events_delivered_in_order(self):
+        """Test events for one endpoint keep their submission order."""
+        received: list[int] = []
+
+        async def deliver(config, event):
+            await asyncio.sleep(0)
+            received.append(event["n"])
+
+        dispatcher = _dispatcher(deliver)
+        await dispatcher.start()
+        try:
+            for n in range(5):
+                await dispatcher.submit(_config(), _event(n), uuid4())
+            await _settle(dispatcher)
+        finally:
+            await dispatcher.stop()
+
+        assert received == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_queued_events_are_batched(self):
+        """Test waiting events are sent in one batch request."""
+        payloads: list[dict] = []
+
+        async def deliver(config, event):
+            payloads.append(event)
+
+        dispatcher = _dispatcher(deliver, max_batch_size=10)
+        await dispatcher.start()
+        try:
+            for n in range(3):
+                await dispatcher.submit(_config(), _event(n), uuid4())
+            await _settle(dispatcher)
+        finally:
+            await dispatcher.stop()
+
+        assert len(payloads) == 1
+        assert payloads[0]["kind"] == "batch"
+        assert [e["n"] for e in payloads[0]["events"]] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_retries_server_errors(self):
+        """Test 5xx responses are retried until delivery succeeds."""
+        outcomes = [NotificationDeliveryError(503, "busy"), None]
+
+        async def deliver(config, event):
+            outcome = outcomes.pop(0)
+            if outcome is not None:
+                raise outcome
+
+        dispatcher = _dispatcher(deliver)
+        await dispatcher.start()
+        try:
+            await dispatcher.submit(_config(), _event(), uuid4())
+            await _settle(dispatcher)
+        finally:
+            await dispatcher.stop()
+
+        assert dispatcher.notification_service.deliver.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        """Test persistent failures stop after max_attempts."""
+        dispatcher = _dispatcher(NotificationDeliveryError(None, "down"))
+        await dispatcher.start()
+        try:
+            await dispatcher.submit(_config(), _event(), uuid4())
+            await _settle(dispatcher)
+        finally:
+            await dispatcher.stop()
+
+        assert dispatcher.notification_service.deliver.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self):
+        """Test 4xx responses and invalid webhooks are dropped at once."""
+        for error in (NotificationDeliveryError(400, "bad"), ValueError("blocked")):
+            dispatcher = _dispatcher(error)
+            await dispatcher.start()
+            try:
+                await dispatcher.submit(_config(), _event(), uuid4())
+                await _settle(dispatcher)
+            finally:
+                await dispatcher.stop()
+
+            assert dispatcher.notification_service.deliver.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_events(self):
+        """Test events beyond queue_size are dropped and counted."""
+        release = asyncio.Event()
+
+        async def deliver(config, event):
+            await release.wait()
+
+        dispatcher = _dispatcher(deliver, queue_size=1)
+        await dispatcher.start()
+        try:
+            for n in range(4):
+                await dispatcher.submit(_config(), _event(n), uuid4())
+                await asyncio.sleep(0)
+
+            # One in flight, one queued, the rest dropped
+            assert dispatcher.get_metrics()["total_dropped"] == 2
+            release.set()
+            await _settle(dispatcher)
+        finally:
+            await dispatcher.stop()
+
+        assert dispatcher.notification_service.deliver.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_idle_endpoint_is_removed(self):
+        """Test an endpoint's worker exits after idle_timeout."""
+        dispatcher = _dispatcher(idle_timeout=0.01)
+        await dispatcher.start()
+        try:
+            await dispatcher.submit(_config(), _event(), uuid4())
+            await _settle(dispatcher)
+            await asyncio.sleep(0.05)
+
+            assert dispatcher.get_metrics()["endpoints"] == 0
+
+            # A new event starts a fresh worker
+            await dispatcher.submit(_config(), _event(), uuid4())
+            await _settle(dispatcher)
+        finally:
+            await dispatcher.stop()
+
+        assert dispatcher.notification_service.deliver.await_count == 2
+
+
+class TestWebhookOutbox:
+    """Test durable delivery through the storage outbox."""
+
+    @pytest.mark.asyncio
+    async def test_delivered_events_leave_outbox(self):
+        """Test events are recorded on submit and removed once delivered."""
+        storage = InMemoryStorage()
+        release = asyncio.Event()
+
+        async def deliver(config, event):
+            await release.wait()
+
+        dispatcher = _dispatcher(deliver, storage=storage)
+        await dispatcher.start()
+        try:
+            await dispatcher.submit(_config(), _event(), uuid4())
+            assert len(await storage.load_webhook_events()) == 1
+
+            release.set()
+            await _settle(dispatcher)
+        finally:
+            await dispatcher.stop()
+
+        assert await storage.load_webhook_events() == []
+
+    @pytest.mark.asyncio
+    async def test_abandoned_events_leave_outbox(self):
+        """Test events given up on are not redelivered forever."""
+        storage = InMemoryStorage()
+        dispatcher = _dispatcher(
+            NotificationDeliveryError(410, "gone"), storage=storage
+        )
+        await dispatcher.start()
+        try:
+            await dispatcher.submit(_config(), _event(), uuid4())
+            await _settle(dispatcher)
+        finally:
+            await dispatcher.stop()
+
+        assert await storage.load_webhook_events() == []
+
+    @pytest.mark.asyncio
+    async def test_start_redelivers_pending_events(self):
+        """Test events left over from a previous run are delivered on start."""
+        storage = InMemoryStorage()
+        config = _config()
+        events = [_event(0), _event(1)]
+        for event in events:
+            await storage.save_webhook_event(uuid4(), uuid4(), config, event)
+
+        dispatcher = _dispatcher(storage=storage)
+        await dispatcher.start()
+        try:
+            await _settle(dispatcher)
+        finally:
+            await dispatcher.stop()
+
+        delivered = [
+            call.args[1]
+            for call in dispatcher.notification_service.deliver.await_args_list
+        ]
+        assert delivered == events
+        assert await storage.load_webhook_events() == []
+
+    @pytest.mark.asyncio
+    async def test_start_claims_outbox_in_pages(self):
+        """Test start() claims every pending event, page_size at a time."""
+        storage = InMemoryStorage()
+        config = _config()
+        events = [_event(n) for n in range(5)]
+        for event in events:
+            await storage.save_webhook_event(uuid4(), uuid4(), config, event)
+
+        dispatcher = _dispatcher(storage=storage, page_size=2)
+        await dispatcher.start()
+        try:
+            await _settle(dispatcher)
+        finally:
+            await dispatcher.stop()
+
+        delivered = [
+            call.args[1]
+            for call in dispatcher.notification_service.deliver.await_args_list
+        ]
+        assert delivered == events
+
+    @pytest.mark.asyncio
+    async def test_replica_does_not_redeliver_leased_events(self):
+        """Test a starting replica leaves events another replica delivers."""
+        storage = InMemoryStorage()
+        release = asyncio.Event()
+
+        async def deliver(config, event):
+            await release.wait()
+
+        busy = _dispatcher(deliver, storage=storage, rescan_interval=0.01)
+        other = _dispatcher(storage=storage, rescan_interval=0.01)
+        await busy.start()
+        try:
+            await busy.submit(_config(), _event(), uuid4())
+            await other.start()
+            # Several rescans, each renewing the busy replica's lease
+            await asyncio.sleep(0.05)
+            release.set()
+            await _settle(busy)
+        finally:
+            await other.stop()
+            await busy.stop()
+
+        other.notification_service.deliver.assert_not_called()
+        busy.notification_service.deliver.assert_awaited_once()
+        assert await storage.load_webhook_events() == []
+
+    @pytest.mark.asyncio
+    async def test_stop_releases_leases(self):
+        """Test events queued at stop() are claimable by the next replica."""
+        storage = InMemoryStorage()
+        blocked = asyncio.Event()
+
+        async def deliver(config, event):
+            await blocked.wait()
+
+        stopped = _dispatcher(deliver, storage=storage)
+        await stopped.start()
+        await stopped.submit(_config(), _event(), uuid4())
+        await stopped.stop()
+
+        other = _dispatcher(storage=storage)
+        await other.start()
+        try:
+            await _settle(other)
+        finally:
+            await other.stop()
+
+        other.notification_service.deliver.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_dropped_event_redelivered_by_rescan(self):
+        """Test an event dropped on a full queue is claimed again later."""
+        storage = InMemoryStorage()
+        release = asyncio.Event()
+        delivered: list[int] = []
+
+        async def deliver(config, event):
+            await release.wait()
+            delivered.append(event["n"])
+
+        dispatcher = _dispatcher(
+            deliver,
+            storage=storage,
+            queue_size=1,
+            lease_seconds=0.02,
+            rescan_interval=0.01,
+        )
+        await dispatcher.start()
+        try:
+            for n in range(3):
+                await dispatcher.submit(_config(), _event(n), uuid4())
+            assert dispatcher.total_dropped >= 1
+
+            release.set()
+            for _ in range(50):
+                await asyncio.sleep(0.01)
+                if not await storage.load_webhook_events():
+                    break
+        finally:
+            await dispatcher.stop()
+
+        assert sorted(delivered) == [0, 1, 2]
+        assert await storage.load_webhook_events() == []
+
+    @pytest.mark.asyncio
+    async def test_unexpected_failure_releases_lease(self):
+        """Test an event whose delivery crashed is retried by the next rescan."""
+        storage = InMemoryStorage()
+        dispatcher = _dispatcher(
+            [RuntimeError("connection reset"), None],
+            storage=storage,
+            lease_seconds=60,
+            rescan_interval=0.01,
+        )
+        await dispatcher.start()
+        try:
+            await dispatcher.submit(_config(), _event(), uuid4())
+            for _ in range(50):
+                await asyncio.sleep(0.01)
+                if not await storage.load_webhook_events():
+                    break
+        finally:
+            await dispatcher.stop()
+
+        assert dispatcher.notification_service.deliver.await_count == 2
+        assert await storage.load_webhook_events() == []
+        assert dispatcher._held == set()
+
+    @pytest.mark.asyncio
+    async def test_outbox_disabled(self):
+        """Test use_outbox=False never touches storage."""
+        storage = AsyncMock()
+        dispatcher = _dispatcher(storage=storage, use_outbox=False)
+        await dispatcher.start()
+        try:
+            await dispatcher.submit(_config(), _event(), uuid4())
+            await _settle(dispatcher)
+        finally:
+            await dispatcher.stop()
+
+        storage.claim_webhook_events.assert_not_called()
+        storage.save_webhook_event.assert_not_called()
+        dispatcher.notification_service.deliver.assert_awaited_once()
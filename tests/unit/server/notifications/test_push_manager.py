@@ -418,3 +418,42 @@ class TestPushNotificationManager:
         error = Exception("Generic error")
 
         manager._log_notification_error("artifact", task_id, context_id, error)
+
+    @pytest.mark.asyncio
+    async def test_notify_lifecycle_queues_when_started(self):
+        """Test notifications go through the dispatcher once initialized."""
+        mock_manifest = Mock()
+        mock_manifest.capabilities = {"push_notifications": True}
+        dispatcher = Mock()
+        dispatcher.start = AsyncMock()
+        dispatcher.submit = AsyncMock()
+        dispatcher.running = True
+
+        manager = PushNotificationManager(manifest=mock_manifest, dispatcher=dispatcher)
+        task_id = uuid4()
+        config = cast(
+            PushNotificationConfig,
+            {"id": task_id, "url": "https://example.com/webhook"},
+        )
+        manager._push_notification_configs[task_id] = config
+
+        await manager.initialize()
+        await manager.notify_lifecycle(task_id, uuid4(), "completed", True)
+
+        dispatcher.start.assert_awaited_once()
+        submitted_config, event, submitted_task_id = dispatcher.submit.await_args.args
+        assert submitted_config == config
+        assert event["status"]["state"] == "completed"
+        assert submitted_task_id == task_id
+
+    @pytest.mark.asyncio
+    async def test_close_stops_dispatcher(self):
+        """Test close stops background delivery and the HTTP sessions."""
+        manager = PushNotificationManager()
+        manager.dispatcher = Mock(stop=AsyncMock())
+        manager.notification_service = Mock(close=AsyncMock())
+
+        await manager.close()
+
+        manager.dispatcher.stop.assert_awaited_once()
+        manager.notification_service.close.assert_awaited_once()
@@ -5,6 +5,7 @@ from unittest.mock import Mock, patch
 
 from bindu.server.scheduler.factory import create_scheduler, close_scheduler
 from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
+from bindu.server.scheduler.redis_stream_scheduler import RedisStreamScheduler
 from bindu.common.models import SchedulerConfig
 
 
@@ -54,6 +55,24 @@ class TestSchedulerFactory:
                 assert "redis_url" in call_kwargs
                 assert call_kwargs["redis_url"] == "redis://localhost:6379/0"
 
+    @pytest.mark.asyncio
+    async def test_create_redis_stream_scheduler(self):
+        """Test that queue_mode="stream" selects the Redis Streams scheduler."""
+        config = SchedulerConfig(
+            type="redis",
+            redis_url="redis://localhost:6379/0",
+            queue_mode="stream",
+            visibility_timeout=30.0,
+            max_deliveries=3,
+        )
+
+        scheduler = await create_scheduler(config)
+
+        assert isinstance(scheduler, RedisStreamScheduler)
+        assert scheduler.visibility_timeout == 30.0
+        assert scheduler.max_deliveries == 3
+        assert scheduler.dead_letter_queue == "bindu:tasks:dead"
+
     @pytest.mark.asyncio
     async def test_close_scheduler(self):
         """Test closing scheduler gracefully."""
@@ -1,5 +1,7 @@
 """Minimal tests for in-memory scheduler."""
 
+import asyncio
+
 import pytest
 from uuid import uuid4
 
@@ -52,6 +54,23 @@ class TestInMemoryScheduler:
             assert operation["operation"] == "cancel"
             assert operation["params"]["task_id"] == task_id
 
+    @pytest.mark.asyncio
+    async def test_cancellations_reach_every_receiver(self):
+        """Test each cancellation is broadcast besides the queued operation."""
+        async with InMemoryScheduler() as scheduler:
+            receivers = [scheduler.receive_cancellations() for _ in range(2)]
+            pending = [asyncio.ensure_future(anext(r)) for r in receivers]
+            await asyncio.sleep(0)
+            task_id = uuid4()
+
+            await scheduler.cancel_task({"task_id": task_id})
+
+            assert await asyncio.gather(*pending) == [task_id, task_id]
+            assert (await scheduler._read_stream.receive())["operation"] == "cancel"
+            for receiver in receivers:
+                await receiver.aclose()
+            assert scheduler._cancel_subscribers == set()
+
     @pytest.mark.asyncio
     async def test_pause_task(self):
         """Test pausing a task."""
@@ -0,0 +1,263 @@
+"""Tests for the Redis Streams scheduler."""
+
+import asyncio
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from bindu.server.scheduler.redis_stream_scheduler import (
+    RedisStreamScheduler,
+)
+
+
+@pytest.fixture
+def fake_redis_server():
+    """Share one fake Redis server between schedulers, like pods sharing Redis."""
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    with patch(
+        "bindu.server.scheduler.redis_scheduler.redis.from_url",
+        side_effect=lambda *args, **kwargs: fakeredis.aioredis.FakeRedis(
+            server=server, decode_responses=True
+        ),
+    ):
+        yield server
+
+
+def make_scheduler(**kwargs) -> RedisStreamScheduler:
+    kwargs.setdefault("visibility_timeout", 60.0)
+    return RedisStreamScheduler("redis://fake", poll_timeout=0, **kwargs)
+
+
+def run_params():
+    return {"task_id": uuid4(), "context_id": uuid4()}
+
+
+async def receive(scheduler: RedisStreamScheduler, count: int = 1, timeout=1.0):
+    """Collect ``count`` operations, or fewer if the timeout expires."""
+    received = []
+    operations = scheduler.receive_task_operations()
+    try:
+        async with asyncio.timeout(timeout):
+            async for operation in operations:
+                received.append(operation)
+                if len(received) == count:
+                    break
+    except TimeoutError:
+        pass
+    finally:
+        await operations.aclose()
+    return received
+
+
+class TestDelivery:
+    """Test producing, consuming and acknowledging operations."""
+
+    @pytest.mark.asyncio
+    async def test_operation_roundtrip_with_delivery_id(self, fake_redis_server):
+        """Operations keep their params and carry the stream entry id."""
+        params = run_params()
+        async with make_scheduler() as scheduler:
+            await scheduler.run_task(params)
+            [operation] = await receive(scheduler)
+
+        assert operation["operation"] == "run"
+        assert operation["params"]["task_id"] == params["task_id"]
+        assert operation["delivery_id"]
+        assert "redelivered" not in operation["params"]
+
+    @pytest.mark.asyncio
+    async def test_batch_read(self, fake_redis_server):
+        """Several queued operations are received without waiting for new ones."""
+        async with make_scheduler(batch_size=5) as scheduler:
+            for _ in range(5):
+                await scheduler.run_task(run_params())
+            operations = await receive(scheduler, count=5)
+
+        assert len(operations) == 5
+        assert len({op["delivery_id"] for op in operations}) == 5
+
+    @pytest.mark.asyncio
+    async def test_reads_no_more_than_free_slots(self, fake_redis_server):
+        """Operations the worker cannot start stay in the stream for others."""
+        async with make_scheduler(batch_size=5) as scheduler:
+            scheduler.set_capacity(lambda: 2)
+            for _ in range(5):
+                await scheduler.run_task(run_params())
+
+            await receive(scheduler)
+
+            assert await scheduler.get_pending_count() == 2
+            assert await scheduler.get_queue_length() == 3
+
+    @pytest.mark.asyncio
+    async def test_skips_read_without_free_slot(self, fake_redis_server):
+        """A worker with no free slot does not take operations."""
+        async with make_scheduler() as scheduler:
+            scheduler.set_capacity(lambda: 0)
+            await scheduler.run_task(run_params())
+
+            assert await receive(scheduler, timeout=0.2) == []
+            assert await scheduler.get_pending_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_ack_removes_operation(self, fake_redis_server):
+        """Acknowledged operations are deleted from the stream."""
+        async with make_scheduler() as scheduler:
+            await scheduler.run_task(run_params())
+            [operation] = await receive(scheduler)
+            assert await scheduler.get_pending_count() == 1
+
+            await scheduler.ack_task_operation(operation)
+
+            assert await scheduler.get_pending_count() == 0
+            assert await scheduler._redis_client.xlen(scheduler.queue_name) == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_length_excludes_delivered(self, fake_redis_server):
+        """The queue length counts only operations no worker has received."""
+        async with make_scheduler(batch_size=1) as scheduler:
+            await scheduler.run_task(run_params())
+            await scheduler.run_task(run_params())
+            assert await scheduler.get_queue_length() == 2
+
+            await receive(scheduler)
+
+            assert await scheduler.get_queue_length() == 1
+
+    @pytest.mark.asyncio
+    async def test_clear_queue(self, fake_redis_server):
+        """Clearing drops queued operations and keeps the group usable."""
+        async with make_scheduler() as scheduler:
+            await scheduler.run_task(run_params())
+            assert await scheduler.clear_queue() == 1
+
+            await scheduler.run_task(run_params())
+            assert len(await receive(scheduler)) == 1
+
+
+class TestCancellation:
+    """Test cancellations reaching the pod that runs the task."""
+
+    @pytest.mark.asyncio
+    async def test_cancellation_broadcast_to_all_pods(self, fake_redis_server):
+        """Every pod hears a cancellation; one pod takes the cancel operation."""
+        async with make_scheduler() as api, make_scheduler() as worker:
+            receivers = [s.receive_cancellations() for s in (api, worker)]
+            pending = [asyncio.ensure_future(anext(r)) for r in receivers]
+            await asyncio.sleep(0.05)
+            task_id = uuid4()
+
+            await api.cancel_task({"task_id": task_id})
+
+            try:
+                async with asyncio.timeout(1):
+                    assert await asyncio.gather(*pending) == [task_id, task_id]
+            finally:
+                for receiver in receivers:
+                    await receiver.aclose()
+            [operation] = await receive(worker)
+
+        assert operation["operation"] == "cancel"
+        assert operation["params"]["task_id"] == task_id
+
+
+class TestReclaim:
+    """Test recovery of operations whose worker crashed."""
+
+    @pytest.mark.asyncio
+    async def test_unacked_operation_is_reclaimed_by_another_consumer(
+        self, fake_redis_server
+    ):
+        """A worker that dies mid-task loses the operation to a live worker."""
+        params = run_params()
+        crashed = make_scheduler(visibility_timeout=0.05, consumer_name="crashed")
+        await crashed.__aenter__()
+        await crashed.run_task(params)
+        [first] = await receive(crashed)
+        # Simulate a crash: stop heartbeating without acknowledging
+        await crashed.__aexit__(None, None, None)
+
+        await asyncio.sleep(0.1)
+        async with make_scheduler(
+            visibility_timeout=0.05, consumer_name="survivor"
+        ) as survivor:
+            [second] = await receive(survivor)
+
+        assert second["delivery_id"] == first["delivery_id"]
+        assert second["params"]["task_id"] == params["task_id"]
+        assert second["params"]["redelivered"] is True
+
+    @pytest.mark.asyncio
+    async def test_reclaim_continues_from_cursor(self, fake_redis_server):
+        """Each reclaim resumes the PEL scan where the previous one stopped."""
+        crashed = make_scheduler(visibility_timeout=0.05, consumer_name="crashed")
+        await crashed.__aenter__()
+        for _ in range(2):
+            await crashed.run_task(run_params())
+        abandoned = await receive(crashed, count=2)
+        await crashed.__aexit__(None, None, None)
+        await asyncio.sleep(0.1)
+
+        async with make_scheduler(
+            visibility_timeout=0.05, consumer_name="survivor"
+        ) as survivor:
+            [first] = await survivor._reclaim_abandoned(1)
+            assert survivor._autoclaim_cursor == abandoned[1]["delivery_id"]
+            [second] = await survivor._reclaim_abandoned(1)
+            assert await survivor._reclaim_abandoned(1) == []
+
+        assert [first["delivery_id"], second["delivery_id"]] == [
+            op["delivery_id"] for op in abandoned
+        ]
+        assert survivor._autoclaim_cursor == "0-0"
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_prevents_reclaim_of_running_operation(
+        self, fake_redis_server
+    ):
+        """Long-running operations are not stolen while their worker is alive."""
+        async with (
+            make_scheduler(visibility_timeout=0.15, consumer_name="busy") as busy,
+            make_scheduler(visibility_timeout=0.15, consumer_name="idle") as idle,
+        ):
+            await busy.run_task(run_params())
+            [operation] = await receive(busy)
+
+            await asyncio.sleep(0.4)
+            stolen = await receive(idle, timeout=0.2)
+
+            assert stolen == []
+            await busy.ack_task_operation(operation)
+
+    @pytest.mark.asyncio
+    async def test_operation_is_dead_lettered_after_max_deliveries(
+        self, fake_redis_server
+    ):
+        """A poison operation stops being retried after max_deliveries."""
+        params = run_params()
+        deliveries = 0
+        for attempt in range(4):
+            scheduler = make_scheduler(
+                visibility_timeout=0.05,
+                max_deliveries=2,
+                consumer_name=f"worker-{attempt}",
+            )
+            await scheduler.__aenter__()
+            if attempt == 0:
+                await scheduler.run_task(params)
+            deliveries += len(await receive(scheduler, timeout=0.3))
+            await scheduler.__aexit__(None, None, None)
+            await asyncio.sleep(0.1)
+
+        assert deliveries == 2
+
+        async with make_scheduler() as scheduler:
+            dead = await scheduler._redis_client.xrange(scheduler.dead_letter_queue)
+            assert await scheduler._redis_client.xlen(scheduler.queue_name) == 0
+
+        assert len(dead) == 1
+        _, fields = dead[0]
+        assert str(params["task_id"]) in fields["payload"]
+        assert fields["times_delivered"] == "3"
@@ -1,5 +1,7 @@
 """Comprehensive tests for InMemoryStorage implementation."""
 
+import asyncio
+
 import pytest
 from uuid import uuid4
 
@@ -237,6 +239,39 @@ class TestTaskOperations:
         reloaded_task = await storage.load_task(task["id"])
         assert len(reloaded_task["history"]) == 1
 
+    @pytest.mark.asyncio
+    async def test_load_task_shares_messages_without_copying(
+        self, storage, sample_context_id, sample_message
+    ):
+        """Snapshots share stored messages instead of deep-copying them."""
+        task = await storage.submit_task(sample_context_id, sample_message)
+
+        first = await storage.load_task(task["id"])
+        second = await storage.load_task(task["id"])
+
+        assert first is not second
+        assert first["history"] is not second["history"]
+        assert first["history"][0] is second["history"][0]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_unaffected_by_later_updates(
+        self, storage, sample_context_id, sample_message
+    ):
+        """A loaded task keeps its state and history when the task moves on."""
+        task = await storage.submit_task(sample_context_id, sample_message)
+        snapshot = await storage.load_task(task["id"])
+
+        await storage.update_task(
+            task["id"],
+            "completed",
+            new_messages=[{"role": "agent", "parts": [], "kind": "message"}],
+            metadata={"key": "value"},
+        )
+
+        assert snapshot["status"]["state"] == "submitted"
+        assert len(snapshot["history"]) == 1
+        assert "metadata" not in snapshot
+
     @pytest.mark.asyncio
     async def test_load_task_with_history_limit(
         self, storage, sample_context_id, sample_message
@@ -355,12 +390,48 @@ class TestTaskOperations:
         assert updated_task["metadata"]["key1"] == "value1"
         assert updated_task["metadata"]["key2"] == "value2"
 
+    @pytest.mark.asyncio
+    async def test_update_task_without_full_return(
+        self, storage, sample_context_id, sample_message
+    ):
+        """Test that return_full=False returns only the task status."""
+        task = await storage.submit_task(sample_context_id, sample_message)
+
+        updated_task = await storage.update_task(
+            task["id"], "working", metadata={"key": "value"}, return_full=False
+        )
+
+        assert updated_task["id"] == task["id"]
+        assert updated_task["context_id"] == sample_context_id
+        assert updated_task["status"]["state"] == "working"
+        assert "history" not in updated_task
+        assert "metadata" not in updated_task
+        stored = await storage.load_task(task["id"])
+        assert stored["metadata"] == {"key": "value"}
+
     @pytest.mark.asyncio
     async def test_update_nonexistent_task_raises_error(self, storage):
         """Test updating a nonexistent task raises KeyError."""
         with pytest.raises(KeyError):
             await storage.update_task(uuid4(), "working")
 
+    @pytest.mark.asyncio
+    async def test_update_task_if_active_skips_terminal_task(
+        self, storage, sample_context_id, sample_message
+    ):
+        """Test the conditional update leaves a finished task as it is."""
+        task = await storage.submit_task(sample_context_id, sample_message)
+
+        working = await storage.update_task_if_active(task["id"], "working")
+        await storage.update_task(task["id"], "canceled")
+        completed = await storage.update_task_if_active(task["id"], "completed")
+
+        assert working["status"]["state"] == "working"
+        assert completed is None
+        stored = await storage.load_task(task["id"])
+        assert stored["status"]["state"] == "canceled"
+        assert await storage.update_task_if_active(uuid4(), "working") is None
+
     @pytest.mark.asyncio
     async def test_update_task_with_invalid_message_type_raises_error(
         self, storage, sample_context_id, sample_message
@@ -472,6 +543,70 @@ class TestTaskOperations:
         assert completed_count == 2
         assert submitted_count == 3
 
+    @pytest.mark.asyncio
+    async def test_count_tasks_by_state_follows_transitions(
+        self, storage, sample_context_id
+    ):
+        """Test the per-state counters track submit, update and clear."""
+        from bindu.common.protocol.types import TextPart
+
+        def msg(task_id):
+            return Message(
+                message_id=uuid4(),
+                task_id=task_id,
+                context_id=sample_context_id,
+                kind="message",
+                role="user",
+                parts=[TextPart(kind="text", text="Test")],
+            )
+
+        task_ids = [uuid4() for _ in range(4)]
+        for task_id in task_ids:
+            await storage.submit_task(sample_context_id, msg(task_id))
+        await storage.update_task(task_ids[0], "working")
+        await storage.update_task(task_ids[0], "working")
+        await storage.update_task(task_ids[1], "input-required")
+        await storage.update_task(task_ids[2], "completed")
+
+        assert await storage.count_tasks_by_state() == {
+            "submitted": 1,
+            "working": 1,
+            "input-required": 1,
+            "completed": 1,
+        }
+
+        # Continuing a task moves it back to submitted
+        await storage.submit_task(sample_context_id, msg(task_ids[1]))
+        counts = await storage.count_tasks_by_state()
+        assert counts["submitted"] == 2
+        assert "input-required" not in counts
+        assert await storage.count_tasks(status="submitted") == 2
+
+        await storage.clear_context(sample_context_id)
+        assert await storage.count_tasks_by_state() == {}
+
+    @pytest.mark.asyncio
+    async def test_count_tasks_by_state_reset_by_clear_all(
+        self, storage, sample_context_id
+    ):
+        """Test clear_all resets the per-state counters."""
+        from bindu.common.protocol.types import TextPart
+
+        await storage.submit_task(
+            sample_context_id,
+            Message(
+                message_id=uuid4(),
+                task_id=uuid4(),
+                context_id=sample_context_id,
+                kind="message",
+                role="user",
+                parts=[TextPart(kind="text", text="Test")],
+            ),
+        )
+        await storage.clear_all()
+
+        assert await storage.count_tasks_by_state() == {}
+
     @pytest.mark.asyncio
     async def test_list_tasks_by_context(self, storage):
         """Test listing tasks by context."""
@@ -507,6 +642,126 @@ class TestTaskOperations:
         assert len(context1_tasks) == 3
         assert len(context2_tasks) == 2
 
+    @pytest.mark.asyncio
+    async def test_list_task_summaries_by_context(self, storage, sample_message):
+        """Test context task summaries come oldest first without history."""
+        context_id = uuid4()
+        task_ids = []
+        for _ in range(3):
+            msg = dict(sample_message, task_id=uuid4(), context_id=context_id)
+            task = await storage.submit_task(context_id, msg)
+            task_ids.append(task["id"])
+        await storage.update_task(task_ids[0], state="completed")
+
+        summaries = await storage.list_task_summaries_by_context(context_id)
+
+        assert [s["id"] for s in summaries] == task_ids
+        assert summaries[0]["status"]["state"] == "completed"
+        assert "history" not in summaries[0]
+        assert await storage.list_task_summaries_by_context(uuid4()) == []
+
+    @pytest.mark.asyncio
+    async def test_load_tasks(self, storage, sample_context_id, sample_message):
+        """Test batch loading keeps the requested order and skips unknown ids."""
+        first = await storage.submit_task(sample_context_id, sample_message)
+        second = await storage.submit_task(
+            sample_context_id, dict(sample_message, task_id=uuid4())
+        )
+
+        tasks = await storage.load_tasks([second["id"], uuid4(), first["id"]])
+
+        assert [t["id"] for t in tasks] == [second["id"], first["id"]]
+        assert len(tasks[0]["history"]) == 1
+        assert await storage.load_tasks([]) == []
+
+
+class TestPagination:
+    """Test newest-first listings with cursor pagination."""
+
+    @staticmethod
+    async def submit(storage, context_id=None):
+        from bindu.common.protocol.types import TextPart
+
+        task_id, context_id = uuid4(), context_id or uuid4()
+        msg = Message(
+            message_id=uuid4(),
+            task_id=task_id,
+            context_id=context_id,
+            kind="message",
+            role="user",
+            parts=[TextPart(kind="text", text="Test")],
+        )
+        await storage.submit_task(context_id, msg)
+        return task_id
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_cover_all_tasks_newest_first(self, storage):
+        """Following cursors visits every task exactly once, newest first."""
+        task_ids = [await self.submit(storage) for _ in range(7)]
+
+        seen, cursor = [], None
+        while page := await storage.list_tasks(length=3, cursor=cursor):
+            seen.extend(task["id"] for task in page)
+            cursor = page[-1]["id"]
+
+        assert seen == task_ids[::-1]
+
+    @pytest.mark.asyncio
+    async def test_cursor_survives_deletion_of_other_tasks(self, storage):
+        """Clearing a context does not shift later pages."""
+        doomed = uuid4()
+        first = await self.submit(storage)
+        await self.submit(storage, doomed)
+        cursor = await self.submit(storage)
+
+        await storage.clear_context(doomed)
+        page = await storage.list_tasks(cursor=cursor)
+
+        assert [task["id"] for task in page] == [first]
+
+    @pytest.mark.asyncio
+    async def test_unknown_cursor_returns_empty_page(self, storage):
+        """A cursor that no longer exists yields no tasks."""
+        await self.submit(storage)
+
+        assert await storage.list_tasks(cursor=uuid4()) == []
+
+    @pytest.mark.asyncio
+    async def test_task_summaries_have_no_content(self, storage):
+        """Summaries carry ids, status and timestamps only."""
+        task_id = await self.submit(storage)
+        await storage.update_task(task_id, "working")
+
+        [summary] = await storage.list_task_summaries()
+
+        assert set(summary) == {
+            "id",
+            "context_id",
+            "kind",
+            "status",
+            "created_at",
+            "updated_at",
+        }
+        assert summary["status"]["state"] == "working"
+        assert summary["updated_at"] >= summary["created_at"]
+
+    @pytest.mark.asyncio
+    async def test_context_summaries_page_newest_first(self, storage):
+        """Context summaries count tasks and page like tasks do."""
+        older, newer = uuid4(), uuid4()
+        await self.submit(storage, older)
+        await self.submit(storage, older)
+        await self.submit(storage, newer)
+
+        first = await storage.list_context_summaries(length=1)
+        second = await storage.list_context_summaries(
+            length=1, cursor=first[0]["context_id"]
+        )
+
+        assert [s["context_id"] for s in first + second] == [newer, older]
+        assert second[0]["task_count"] == 2
+        assert "task_ids" not in second[0]
+
 
 class TestContextOperations:
     """Test context operations."""
@@ -716,6 +971,83 @@ class TestWebhookOperations:
         assert len(all_configs) == 2
 
 
+class TestWebhookOutboxOperations:
+    """Test webhook outbox operations."""
+
+    @pytest.mark.asyncio
+    async def test_save_and_load_webhook_events(self, storage, sample_task_id):
+        """Test outbox events load oldest first."""
+        config = PushNotificationConfig(id=uuid4(), url="https://example.com/webhook")
+        event_ids = [uuid4(), uuid4()]
+        for n, event_id in enumerate(event_ids):
+            await storage.save_webhook_event(
+                event_id, sample_task_id, config, {"event_id": str(event_id), "n": n}
+            )
+
+        events = await storage.load_webhook_events()
+
+        assert [e["event_id"] for e in events] == event_ids
+        assert events[0]["task_id"] == sample_task_id
+        assert events[0]["config"] == config
+        assert events[1]["event"]["n"] == 1
+        assert len(await storage.load_webhook_events(limit=1)) == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_webhook_events(self, storage, sample_task_id):
+        """Test deleting delivered events ignores unknown ids."""
+        config = PushNotificationConfig(id=uuid4(), url="https://example.com/webhook")
+        event_id = uuid4()
+        await storage.save_webhook_event(event_id, sample_task_id, config, {})
+
+        await storage.delete_webhook_events([event_id, uuid4()])
+
+        assert await storage.load_webhook_events() == []
+
+    @pytest.mark.asyncio
+    async def test_claim_webhook_events_skips_leased(self, storage, sample_task_id):
+        """Test events are claimed in pages and not by two owners at once."""
+        config = PushNotificationConfig(id=uuid4(), url="https://example.com/webhook")
+        event_ids = [uuid4(), uuid4(), uuid4()]
+        for event_id in event_ids:
+            await storage.save_webhook_event(event_id, sample_task_id, config, {})
+        await storage.save_webhook_event(
+            uuid4(), sample_task_id, config, {}, owner="a", lease_seconds=60
+        )
+
+        first = await storage.claim_webhook_events("a", limit=2, lease_seconds=60)
+        second = await storage.claim_webhook_events("b", limit=2, lease_seconds=60)
+
+        assert [e["event_id"] for e in first] == event_ids[:2]
+        assert [e["event_id"] for e in second] == event_ids[2:]
+        assert await storage.claim_webhook_events("b", 10, 60) == []
+
+    @pytest.mark.asyncio
+    async def test_renew_webhook_events_only_for_owner(self, storage, sample_task_id):
+        """Test the owner can renew or release its lease and others cannot."""
+        config = PushNotificationConfig(id=uuid4(), url="https://example.com/webhook")
+        event_id = uuid4()
+        await storage.save_webhook_event(event_id, sample_task_id, config, {})
+        await storage.claim_webhook_events("a", limit=10, lease_seconds=0.01)
+
+        await storage.renew_webhook_events("b", [event_id], lease_seconds=0)
+        assert await storage.claim_webhook_events("b", 10, 60) == []
+
+        await asyncio.sleep(0.02)
+        await storage.renew_webhook_events("a", [event_id], lease_seconds=60)
+        assert await storage.claim_webhook_events("b", 10, 60) == []
+
+        await storage.renew_webhook_events("a", [event_id], lease_seconds=0)
+        claimed = await storage.claim_webhook_events("b", 10, 60)
+        assert [e["event_id"] for e in claimed] == [event_id]
+
+    @pytest.mark.asyncio
+    async def test_save_webhook_event_invalid_id(self, storage, sample_task_id):
+        """Test a non-UUID event id raises TypeError."""
+        config = PushNotificationConfig(id=uuid4(), url="https://example.com/webhook")
+        with pytest.raises(TypeError):
+            await storage.save_webhook_event("event-1", sample_task_id, config, {})
+
+
 class TestUtilityOperations:
     """Test utility operations."""
 
@@ -727,6 +1059,12 @@ class TestUtilityOperations:
         await storage.save_webhook_config(
             task["id"], PushNotificationConfig(id=uuid4(), url="https://example.com")
         )
+        await storage.save_webhook_event(
+            uuid4(),
+            task["id"],
+            PushNotificationConfig(id=uuid4(), url="https://example.com"),
+            {},
+        )
 
         await storage.clear_all()
 
@@ -734,6 +1072,7 @@ class TestUtilityOperations:
         assert len(storage.contexts) == 0
         assert len(storage.task_feedback) == 0
         assert len(storage._webhook_configs) == 0
+        assert len(storage._webhook_outbox) == 0
 
     @pytest.mark.asyncio
     async def test_close(self, storage, sample_context_id, sample_message):
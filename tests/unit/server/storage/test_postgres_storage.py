@@ -0,0 +1,294 @@
+"""Tests for the SQL statements built by PostgresStorage.
+
+No database is needed: statements are compiled with the PostgreSQL dialect.
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from bindu.server.storage.postgres_storage import PostgresStorage
+
+
+@pytest.fixture
+def storage():
+    """Create an unconnected PostgresStorage."""
+    return PostgresStorage(database_url="postgresql://user@localhost/bindu")
+
+
+def compile_sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def make_message(task_id, context_id):
+    return {
+        "kind": "message",
+        "role": "agent",
+        "message_id": uuid4(),
+        "task_id": task_id,
+        "context_id": context_id,
+        "parts": [{"kind": "text", "text": "hi"}],
+    }
+
+
+class TestSubmitTaskStatement:
+    """Test the single-statement task upsert."""
+
+    def test_upsert_creates_context_and_guards_terminal_states(self, storage):
+        """Context creation, insert and continuation run as one statement."""
+        task_id, context_id = uuid4(), uuid4()
+
+        sql = compile_sql(
+            storage._submit_task_statement(
+                task_id, context_id, make_message(task_id, context_id)
+            )
+        )
+
+        assert sql.startswith("WITH ensure_context AS")
+        assert "INSERT INTO contexts" in sql
+        assert "ON CONFLICT (id) DO NOTHING" in sql
+        assert "INSERT INTO tasks" in sql
+        assert "ON CONFLICT (id) DO UPDATE" in sql
+        assert "WHERE (tasks.state NOT IN" in sql
+        assert "AS inserted" in sql
+
+    def test_message_is_appended_as_a_row(self, storage):
+        """The submitted message goes to task_messages, not tasks.history."""
+        task_id, context_id = uuid4(), uuid4()
+
+        sql = compile_sql(
+            storage._submit_task_statement(
+                task_id, context_id, make_message(task_id, context_id)
+            )
+        )
+
+        assert "appended AS" in sql
+        assert "INSERT INTO task_messages (task_id, message)" in sql
+        assert "history" not in sql
+
+
+class TestUpdateTaskStatement:
+    """Test the single-statement task update."""
+
+    def test_full_return_includes_jsonb_columns(self, storage):
+        """By default the whole task row is returned."""
+        sql = compile_sql(storage._update_task_statement(uuid4(), "working"))
+
+        assert sql.startswith("WITH updated AS")
+        returning = sql.split("RETURNING")[1]
+        assert "tasks.artifacts" in returning
+        assert "history" not in returning
+
+    def test_only_if_active_excludes_terminal_states(self, storage):
+        """The conditional update matches only tasks not yet finished."""
+        plain = compile_sql(storage._update_task_statement(uuid4(), "canceled"))
+        guarded = compile_sql(
+            storage._update_task_statement(uuid4(), "canceled", only_if_active=True)
+        )
+
+        assert "tasks.state NOT IN" not in plain
+        assert "tasks.state NOT IN" in guarded.split("RETURNING")[0]
+
+    def test_light_return_skips_jsonb_columns(self, storage):
+        """return_full=False returns only the status columns."""
+        task_id = uuid4()
+        sql = compile_sql(
+            storage._update_task_statement(
+                task_id,
+                "completed",
+                new_artifacts=[{"artifact_id": uuid4(), "parts": []}],
+                new_messages=[make_message(task_id, None)],
+                metadata={"key": "value"},
+                return_full=False,
+            )
+        )
+
+        returning = sql.split("RETURNING")[1]
+        assert "tasks.state_timestamp" in returning
+        for column in ("history", "artifacts", "metadata"):
+            assert f"tasks.{column}" not in returning
+
+    def test_messages_are_appended_in_order_with_stored_context_id(self, storage):
+        """New messages become task_messages rows tagged with the task's context."""
+        task_id = uuid4()
+        sql = compile_sql(
+            storage._update_task_statement(
+                task_id, "working", new_messages=[make_message(task_id, None)]
+            )
+        )
+
+        assert "INSERT INTO task_messages (task_id, message)" in sql
+        assert "WITH ORDINALITY AS new_messages(value, ord)" in sql
+        assert "ORDER BY new_messages.ord" in sql
+        assert (
+            "jsonb_build_object('context_id', CAST(updated.context_id AS VARCHAR))"
+            in sql
+        )
+        assert "UPDATE tasks SET history" not in sql
+
+    def test_light_row_to_task_has_no_content(self, storage):
+        """Light rows become tasks with only id, context_id, kind and status."""
+        row = SimpleNamespace(
+            id=uuid4(),
+            context_id=uuid4(),
+            kind="task",
+            state="working",
+            state_timestamp=datetime.now(timezone.utc),
+        )
+
+        task = storage._row_to_task_status(row)
+
+        assert task["status"]["state"] == "working"
+        assert set(task) == {"id", "context_id", "kind", "status"}
+
+
+class TestHistoryStatements:
+    """Test reads of the task_messages table."""
+
+    def test_task_columns_exclude_legacy_history(self, storage):
+        """Task rows are read without the legacy history column."""
+        names = {column.name for column in storage._task_columns()}
+
+        assert "history" not in names
+        assert {"id", "context_id", "state", "artifacts"} <= names
+
+    def test_recent_history_uses_seq_index(self, storage):
+        """history_length reads the newest messages by sequence number."""
+        sql = compile_sql(storage._recent_history_statement(uuid4(), 5))
+
+        assert "FROM task_messages" in sql
+        assert "ORDER BY task_messages.seq DESC" in sql
+        assert "LIMIT" in sql
+
+    def test_full_history_has_no_limit(self, storage):
+        """Without history_length the whole history is read."""
+        sql = compile_sql(storage._recent_history_statement(uuid4(), None))
+
+        assert "LIMIT" not in sql
+
+
+class TestListStatements:
+    """Test keyset pagination and summary projections."""
+
+    def test_tasks_page_newest_first(self, storage):
+        """Without a cursor, tasks are ordered on (created_at, id) descending."""
+        sql = compile_sql(storage._list_tasks_statement(length=10))
+
+        assert "ORDER BY tasks.created_at DESC, tasks.id DESC" in sql
+        assert "LIMIT" in sql
+        assert "OFFSET" not in sql
+        assert "anchor" not in sql
+
+    def test_cursor_seeks_past_anchor_row(self, storage):
+        """The cursor row's key bounds the page instead of an OFFSET."""
+        sql = compile_sql(storage._list_tasks_statement(length=10, cursor=uuid4()))
+
+        assert "WHERE tasks.id = " in sql
+        assert "(tasks.created_at, tasks.id) < (anchor.created_at, anchor.id)" in sql
+        assert "OFFSET" not in sql
+
+    def test_task_summaries_skip_jsonb_columns(self, storage):
+        """Summaries read no history, artifacts or metadata."""
+        sql = compile_sql(storage._list_task_summaries_statement(10, uuid4()))
+
+        for column in ("history", "artifacts", "metadata"):
+            assert f"tasks.{column}" not in sql
+        assert "task_messages" not in sql
+
+    def test_contexts_aggregate_only_the_page(self, storage):
+        """Task ids are aggregated after the page of contexts is chosen."""
+        sql = compile_sql(storage._list_contexts_statement(10, cursor=uuid4()))
+
+        assert "AS page LEFT OUTER JOIN tasks" in sql
+        page = sql.split("AS page")[0]
+        assert "LIMIT" in page
+
+    def test_context_summaries_count_without_aggregating_ids(self, storage):
+        """Context summaries count tasks per row and skip json_agg."""
+        sql = compile_sql(storage._list_context_summaries_statement(10))
+
+        assert "json_agg" not in sql
+        assert "(SELECT count(*)" in sql
+        assert "ORDER BY contexts.created_at DESC, contexts.id DESC" in sql
+
+    def test_context_task_summaries_oldest_first(self, storage):
+        """A context's task list is read in creation order without content."""
+        sql = compile_sql(storage._context_task_summaries_statement(uuid4()))
+
+        assert "WHERE tasks.context_id = " in sql
+        assert "ORDER BY tasks.created_at ASC, tasks.id ASC" in sql
+        for column in ("history", "artifacts", "metadata"):
+            assert f"tasks.{column}" not in sql
+
+
+class TestStateCounts:
+    """Test the trigger-maintained per-state task counters."""
+
+    def test_counts_read_only_the_counter_table(self, storage):
+        """A scrape sums counter shards and never touches the tasks table."""
+        sql = compile_sql(storage._state_counts_statement())
+
+        assert "FROM task_state_counts GROUP BY task_state_counts.state" in sql
+        assert "FROM tasks" not in sql
+
+    def test_reconcile_adds_drift_without_locking(self, storage):
+        """Reconciliation upserts the difference read in one snapshot."""
+        sql = compile_sql(storage._reconcile_state_counts_statement())
+
+        assert sql.startswith(
+            "INSERT INTO task_state_counts (state, shard, task_count)"
+        )
+        assert "FROM tasks GROUP BY tasks.state" in sql
+        assert "UNION ALL" in sql
+        assert "ON CONFLICT (state, shard) DO UPDATE" in sql
+        assert "LOCK TABLE" not in sql
+
+    def test_reconcile_lock_is_per_schema(self, storage):
+        """One replica per schema is elected with a session advisory lock."""
+        sql = compile_sql(storage._reconcile_lock_statement())
+
+        assert "pg_try_advisory_lock(hashtext(concat(" in sql
+        assert "current_schema()" in sql
+
+    def test_trigger_function_updates_local_counters_in_order(self):
+        """The trigger function keeps its schema and locks counters in order."""
+        from bindu.server.storage.schema import COUNT_TASK_STATES_FUNCTION
+
+        assert "SET search_path FROM CURRENT" in COUNT_TASK_STATES_FUNCTION
+        assert COUNT_TASK_STATES_FUNCTION.count("ORDER BY state") == 3
+        assert "HAVING sum(change) <> 0" in COUNT_TASK_STATES_FUNCTION
+
+    @pytest.mark.asyncio
+    async def test_scrape_does_not_reconcile(self, storage, monkeypatch):
+        """Counting only reads the counters; recounts run in the background."""
+        from unittest.mock import AsyncMock
+
+        monkeypatch.setattr(storage, "_ensure_connected", lambda: None)
+        monkeypatch.setattr(
+            storage,
+            "_retry_on_connection_error",
+            AsyncMock(return_value={"working": 2}),
+        )
+        reconcile_mock = AsyncMock()
+        monkeypatch.setattr(storage, "reconcile_task_state_counts", reconcile_mock)
+
+        assert await storage.count_tasks_by_state() == {"working": 2}
+        reconcile_mock.assert_not_awaited()
+
+
+class TestWebhookOutboxStatements:
+    """Test how replicas claim outbox events."""
+
+    def test_claim_skips_rows_locked_by_other_replicas(self, storage):
+        """Claimable rows are locked with SKIP LOCKED and leased in one update."""
+        sql = compile_sql(storage._claim_webhook_events_statement("owner-a", 50, 30))
+
+        claimable = sql.split(" UPDATE webhook_outbox")[0]
+        assert "webhook_outbox.visible_at <= now()" in claimable
+        assert "ORDER BY webhook_outbox.created_at" in claimable
+        assert "FOR UPDATE SKIP LOCKED" in claimable
+        assert "SET owner=" in sql
+        assert "RETURNING webhook_outbox.event_id" in sql
@@ -0,0 +1,207 @@
+"""Tests for the Prometheus metrics collector."""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+from bindu.server.metrics import PrometheusMetrics
+
+
+def _metrics(**kwargs) -> PrometheusMetrics:
+    options = {"cache_ttl": 60.0, "multiprocess_dir": None}
+    options.update(kwargs)
+    return PrometheusMetrics(**options)
+
+
+class TestRecording:
+    """Test lock-free recording and rendering."""
+
+    def test_concurrent_threads_lose_no_samples(self):
+        """Test every thread's samples are merged into the totals."""
+        metrics = _metrics()
+
+        def record():
+            for _ in range(2000):
+                metrics.record_http_request("GET", "/", "200", 0.05)
+                metrics.increment_requests_in_flight()
+                metrics.decrement_requests_in_flight()
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        text = metrics.generate_prometheus_text()
+        assert 'http_requests_total{method="GET",endpoint="/",status="200"} 16000' in (
+            text
+        )
+        assert 'http_request_duration_seconds_bucket{le="0.1"} 16000' in text
+        assert "http_requests_in_flight 0" in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test a value on a bucket bound counts in that bucket."""
+        metrics = _metrics()
+        for duration in (0.5, 3.0, 100.0):
+            metrics.record_task_duration("agent", "success", duration)
+
+        text = metrics.generate_prometheus_text()
+        prefix = 'task_duration_seconds_bucket{agent_id="agent",status="success"'
+        assert f'{prefix},le="1.0"}} 1' in text
+        assert f'{prefix},le="5.0"}} 2' in text
+        assert f'{prefix},le="60.0"}} 2' in text
+        assert f'{prefix},le="+Inf"}} 3' in text
+        assert (
+            'task_duration_seconds_count{agent_id="agent",status="success"} 3' in text
+        )
+
+    def test_unused_metrics_are_omitted(self):
+        """Test metrics without samples are not rendered, except the defaults."""
+        text = _metrics().generate_prometheus_text()
+
+        assert "# TYPE http_requests_total counter" in text
+        assert 'http_request_duration_seconds_bucket{le="+Inf"} 0' in text
+        assert "http_requests_in_flight 0" in text
+        assert "agent_errors_total" not in text
+        assert "worker_slots_busy" not in text
+
+    def test_label_values_are_escaped(self):
+        """Test quotes in label values cannot break the exposition format."""
+        metrics = _metrics()
+        metrics.increment_agent_error('did:"x"', "timeout")
+
+        text = metrics.generate_prometheus_text()
+        assert 'agent_id="did:\\"x\\""' in text
+
+
+class TestExpositionCache:
+    """Test reuse of a rendering across scrapes."""
+
+    def test_rendering_reused_within_ttl(self):
+        """Test cached text is returned until a new rendering."""
+        metrics = _metrics()
+        assert metrics.cached_prometheus_text() is None
+
+        text = metrics.generate_prometheus_text()
+        metrics.set_worker_queue_depth(5)
+
+        assert metrics.cached_prometheus_text() == text
+        assert "worker_queue_depth 5" in metrics.generate_prometheus_text()
+
+    def test_zero_ttl_disables_cache(self):
+        """Test cache_ttl=0 renders on every scrape."""
+        metrics = _metrics(cache_ttl=0)
+        metrics.generate_prometheus_text()
+
+        assert metrics.cached_prometheus_text() is None
+
+
+class TestMultiprocess:
+    """Test aggregation across worker processes."""
+
+    def _write(self, directory: Path, pid: int, **samples) -> None:
+        data = {"counters": [], "histograms": [], "gauges": []}
+        data.update(samples)
+        (directory / f"metrics_{pid}.json").write_text(json.dumps(data))
+
+    def test_flush_writes_own_samples(self, tmp_path):
+        """Test flush() writes this process's samples to the shared directory."""
+        metrics = _metrics(multiprocess_dir=str(tmp_path), flush_interval=3600)
+        metrics.increment_agent_error("agent", "timeout")
+        metrics.flush()
+
+        data = json.loads((tmp_path / f"metrics_{os.getpid()}.json").read_text())
+        assert data["counters"] == [
+            ["agent_errors_total", ["agent", "timeout"], 1],
+        ]
+
+    def test_aggregates_other_processes(self, tmp_path):
+        """Test counters of all processes are summed, gauges only of live ones."""
+        live, dead = os.getppid(), 2**22 + 12345
+        counter = ["http_requests_total", ["GET", "/", "200"], 2]
+        self._write(
+            tmp_path,
+            live,
+            counters=[counter],
+            gauges=[["worker_slots_busy", [], 3], ["worker_queue_depth", [], 9]],
+        )
+        self._write(
+            tmp_path,
+            dead,
+            counters=[counter],
+            histograms=[["http_request_duration_seconds", [], [1, 0, 0, 0, 0.05]]],
+            gauges=[["worker_slots_busy", [], 7]],
+        )
+
+        metrics = _metrics(multiprocess_dir=str(tmp_path), flush_interval=3600)
+        metrics.record_http_request("GET", "/", "200", 0.2)
+        metrics.set_worker_slots(1, 4)
+        metrics.set_worker_queue_depth(2)
+        text = metrics.generate_prometheus_text()
+
+        assert 'http_requests_total{method="GET",endpoint="/",status="200"} 5' in text
+        assert 'http_request_duration_seconds_bucket{le="0.1"} 1' in text
+        assert "http_request_duration_seconds_count 2" in text
+        # Live processes' slot gauges add up; the dead one's are dropped
+        assert "worker_slots_busy 4" in text
+        # Queue depth is shared state: the serving process's value is used
+        assert "worker_queue_depth 2" in text
+
+    def test_exited_worker_counts_remain(self, tmp_path):
+        """Test an exited worker's counters still count, without its file."""
+        metrics = _metrics(multiprocess_dir=str(tmp_path), flush_interval=3600)
+        metrics.flush()
+        script = (
+            "from bindu.server.metrics import PrometheusMetrics\n"
+            f"m = PrometheusMetrics(multiprocess_dir={str(tmp_path)!r})\n"
+            "m.increment_agent_tasks_completed('agent', 'success')\n"
+        )
+        subprocess.run(
+            [sys.executable, "-c", script],
+            check=True,
+            cwd=Path(__file__).resolve().parents[3],
+            timeout=60,
+        )
+        metrics.increment_agent_tasks_completed("agent", "success")
+
+        for _ in range(2):
+            text = metrics.generate_prometheus_text()
+            assert (
+                'agent_tasks_completed_total{agent_id="agent",status="success"} 2'
+                in text
+            )
+            metrics._cache = None
+        assert {path.name for path in tmp_path.glob("metrics_*.json")} == {
+            f"metrics_{os.getpid()}.json"
+        }
+
+    def test_first_process_deletes_earlier_runs(self, tmp_path):
+        """Test samples left by a previous run are not counted."""
+        counter = ["http_requests_total", ["GET", "/", "200"], 7]
+        self._write(tmp_path, 2**22 + 12345, counters=[counter])
+        (tmp_path / "exited.json").write_text(
+            json.dumps({"counters": [counter], "histograms": [], "gauges": []})
+        )
+
+        metrics = _metrics(multiprocess_dir=str(tmp_path), flush_interval=3600)
+        metrics.record_http_request("GET", "/", "200", 0.2)
+
+        text = metrics.generate_prometheus_text()
+        assert 'http_requests_total{method="GET",endpoint="/",status="200"} 1' in text
+        assert list(tmp_path.iterdir()) == []
+
+    def test_reused_pid_file_is_archived(self, tmp_path):
+        """Test a file left under this process's PID is kept, not overwritten."""
+        counter = ["agent_errors_total", ["agent", "timeout"], 3]
+        self._write(tmp_path, os.getppid())
+        self._write(tmp_path, os.getpid(), counters=[counter])
+
+        metrics = _metrics(multiprocess_dir=str(tmp_path), flush_interval=3600)
+        metrics.increment_agent_error("agent", "timeout")
+        metrics.flush()
+
+        text = metrics.generate_prometheus_text()
+        assert 'agent_errors_total{agent_id="agent",error_type="timeout"} 4' in text
@@ -0,0 +1,103 @@
+"""Tests for ArtifactChunkStreamer (incremental artifact-update events)."""
+
+import asyncio
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from bindu.server.workers.helpers.chunk_streamer import ArtifactChunkStreamer
+
+
+def _streamer(events, **kwargs):
+    async def publish(event):
+        events.append(event)
+
+    return ArtifactChunkStreamer(
+        task_id=uuid4(), context_id=uuid4(), publish=publish, **kwargs
+    )
+
+
+def _texts(events):
+    return [
+        "".join(part["text"] for part in event["artifact"]["parts"]) for event in events
+    ]
+
+
+class TestArtifactChunkStreamer:
+    """Test chunk forwarding and coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_forwards_each_chunk_as_appended_artifact(self):
+        """Without coalescing every text chunk is its own event."""
+        events = []
+        streamer = _streamer(events)
+
+        for chunk in ("Hel", "lo", " world"):
+            await streamer.push(chunk)
+        await streamer.close()
+
+        assert _texts(events) == ["Hel", "lo", " world", ""]
+        assert [e["append"] for e in events] == [False, True, True, True]
+        assert [e["last_chunk"] for e in events] == [False, False, False, True]
+        assert len({str(e["artifact"]["artifact_id"]) for e in events}) == 1
+
+    @pytest.mark.asyncio
+    async def test_coalesces_by_size_after_first_chunk(self):
+        """The first chunk is immediate; later ones wait for coalesce_chars."""
+        events = []
+        streamer = _streamer(events, coalesce_chars=4)
+
+        for chunk in ("a", "b", "c", "d", "e", "f"):
+            await streamer.push(chunk)
+        await streamer.close()
+
+        assert _texts(events) == ["a", "bcde", "f"]
+        assert events[-1]["last_chunk"] is True
+
+    @pytest.mark.asyncio
+    async def test_coalesces_by_time(self):
+        """Chunks within coalesce_seconds of the last flush are buffered."""
+        events = []
+        streamer = _streamer(events, coalesce_seconds=1.0)
+
+        with patch(
+            "bindu.server.workers.helpers.chunk_streamer.time.monotonic"
+        ) as clock:
+            clock.return_value = 0.0
+            await streamer.push("a")
+            clock.return_value = 0.5
+            await streamer.push("b")
+            clock.return_value = 1.2
+            await streamer.push("c")
+
+        assert _texts(events) == ["a", "bc"]
+
+    @pytest.mark.asyncio
+    async def test_time_window_flushes_without_new_chunk(self):
+        """Buffered text is sent when its window ends, not at the next chunk."""
+        events = []
+        streamer = _streamer(events, coalesce_seconds=0.05)
+
+        await streamer.push("a")
+        await streamer.push("b")
+        await streamer.push("c")
+        assert _texts(events) == ["a"]
+
+        await asyncio.sleep(0.1)
+        assert _texts(events) == ["a", "bc"]
+
+        await streamer.close()
+        assert _texts(events) == ["a", "bc", ""]
+        assert [e["last_chunk"] for e in events] == [False, False, True]
+
+    @pytest.mark.asyncio
+    async def test_ignores_structured_chunks(self):
+        """State-transition dicts are not streamed and nothing is closed."""
+        events = []
+        streamer = _streamer(events)
+
+        await streamer.push({"state": "input-required", "prompt": "Which?"})
+        await streamer.close()
+
+        assert events == []
@@ -0,0 +1,244 @@
+"""Tests for HandlerExecutor (sync handler offloading)."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from bindu.penguin.manifest import _create_run_method
+from bindu.server.workers.helpers.handler_executor import (
+    HandlerCancelledError,
+    HandlerExecutor,
+    HandlerTimeoutError,
+)
+from bindu.server.workers.helpers.result_processor import ResultProcessor
+from bindu.server.workers.manifest_worker import ManifestWorker
+
+
+def _thread_name_handler(messages):
+    return threading.current_thread().name
+
+
+def _chunk_generator(messages):
+    for i in range(5):
+        yield f"chunk-{i}"
+
+
+def _context_handler(messages, context):
+    return f"{len(messages)} messages, context {context!r}"
+
+
+def _thread_name_generator(messages):
+    yield threading.current_thread().name
+
+
+def _failing_generator(messages):
+    yield "first"
+    raise RuntimeError("boom")
+
+
+class TestHandlerExecutor:
+    """Test HandlerExecutor execution modes."""
+
+    @pytest.mark.asyncio
+    async def test_sync_handler_runs_on_thread_pool(self):
+        """Sync handlers do not run on the event loop thread."""
+        executor = HandlerExecutor(mode="thread", max_workers=2)
+        try:
+            result = await executor.invoke(_thread_name_handler, [])
+        finally:
+            executor.shutdown()
+
+        assert result.startswith("bindu-handler")
+
+    @pytest.mark.asyncio
+    async def test_inline_mode_runs_on_loop_thread(self):
+        """Inline mode keeps the legacy behaviour."""
+        executor = HandlerExecutor(mode="inline")
+        result = await executor.invoke(_thread_name_handler, [])
+
+        assert result == threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_async_handler_is_not_offloaded(self):
+        """Coroutine handlers are awaited by the caller as usual."""
+
+        async def handler(messages):
+            return "async result"
+
+        executor = HandlerExecutor(mode="thread")
+        result = await executor.invoke(handler, [])
+
+        assert await result == "async result"
+        assert executor._pool is None
+
+    @pytest.mark.asyncio
+    async def test_sync_generator_is_bridged_to_async_iterator(self):
+        """Sync generator chunks are delivered through an async iterator."""
+        executor = HandlerExecutor(mode="thread", queue_size=2)
+        try:
+            result = await executor.invoke(_chunk_generator, [])
+            chunks = [chunk async for chunk in result]
+        finally:
+            executor.shutdown()
+
+        assert chunks == [f"chunk-{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_generator_errors_propagate(self):
+        """Exceptions raised inside a bridged generator reach the consumer."""
+        executor = HandlerExecutor(mode="thread")
+        try:
+            result = await executor.invoke(_failing_generator, [])
+            with pytest.raises(RuntimeError, match="boom"):
+                await ResultProcessor.collect_results(result)
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_process_mode_materializes_generators(self):
+        """Process mode runs picklable handlers in a child process."""
+        executor = HandlerExecutor(mode="process", max_workers=1)
+        try:
+            result = await executor.invoke(_chunk_generator, [])
+            collected = await ResultProcessor.collect_results(result)
+        finally:
+            executor.shutdown()
+
+        assert collected == "".join(f"chunk-{i}" for i in range(5))
+
+    @pytest.mark.asyncio
+    async def test_process_mode_resolves_manifest_params(self):
+        """Process mode passes the same parameters as the manifest wrapper."""
+        run = _create_run_method(_context_handler, True, "context-agent")
+        executor = HandlerExecutor(mode="process", max_workers=1)
+        try:
+            result = await executor.invoke(run, ["hi"])
+        finally:
+            executor.shutdown()
+
+        assert result == "1 messages, context {}"
+
+    @pytest.mark.asyncio
+    async def test_inline_mode_iterates_generators_on_loop_thread(self):
+        """Inline mode does not hand sync generators to the pool."""
+        executor = HandlerExecutor(mode="inline")
+        result = await executor.invoke(_thread_name_generator, [])
+        chunks = [chunk async for chunk in result]
+
+        assert chunks == [threading.current_thread().name]
+        assert executor._pool is None
+
+    def test_from_config_uses_manifest_values(self):
+        """Manifest execution config overrides settings defaults."""
+        executor = HandlerExecutor.from_config(
+            {"mode": "inline", "max_workers": 3, "timeout_seconds": 5}
+        )
+
+        assert executor.mode == "inline"
+        assert executor.max_workers == 3
+        assert executor.timeout_seconds == 5
+
+    def test_from_config_rejects_unknown_mode(self):
+        """Unknown execution modes are rejected."""
+        with pytest.raises(ValueError, match="Invalid execution mode"):
+            HandlerExecutor.from_config({"mode": "gpu"})
+
+
+class TestManifestWorkerExecution:
+    """Test ManifestWorker integration with HandlerExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_handler_timeout_error(self):
+        """A handler exceeding timeout_seconds fails with HandlerTimeoutError."""
+
+        def slow_generator(messages):
+            for _ in range(50):
+                time.sleep(0.02)
+                yield "tick"
+
+        manifest = Mock()
+        manifest.execution = {"mode": "thread", "timeout_seconds": 0.1}
+        manifest.run = slow_generator
+        worker = ManifestWorker(
+            manifest=manifest, scheduler=Mock(), storage=AsyncMock()
+        )
+
+        try:
+            with pytest.raises(HandlerTimeoutError):
+                await worker._execute_handler([])
+        finally:
+            worker.executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancel_task_stops_running_handler(self):
+        """cancel_task cancels the in-flight handler of the task."""
+        cancelled = asyncio.Event()
+
+        async def slow_handler(messages):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            yield "done"
+
+        task_id = uuid4()
+        manifest = Mock()
+        manifest.execution = {"mode": "thread", "timeout_seconds": 30}
+        manifest.run = slow_handler
+        storage = AsyncMock()
+        storage.load_task.return_value = {
+            "id": task_id,
+            "context_id": uuid4(),
+            "status": {"state": "working", "timestamp": "2024-01-01T00:00:00Z"},
+        }
+        worker = ManifestWorker(manifest=manifest, scheduler=Mock(), storage=storage)
+
+        running = asyncio.create_task(worker._execute_handler([], task_id=task_id))
+        await asyncio.sleep(0.05)
+        await worker.cancel_task({"task_id": task_id})
+
+        with pytest.raises(HandlerCancelledError):
+            await running
+        assert cancelled.is_set()
+        assert worker._handler_scopes == {}
+        storage.update_task_if_active.assert_called_once_with(
+            task_id, state="canceled", return_full=False
+        )
+
+    @pytest.mark.asyncio
+    async def test_stop_task_closes_sync_generator(self):
+        """stop_task stops a sync generator on the pool at its next chunk."""
+        closed = threading.Event()
+
+        def slow_generator(messages):
+            try:
+                for _ in range(500):
+                    time.sleep(0.01)
+                    yield "tick"
+            finally:
+                closed.set()
+
+        task_id = uuid4()
+        manifest = Mock()
+        manifest.execution = {"mode": "thread", "timeout_seconds": 30}
+        manifest.run = slow_generator
+        worker = ManifestWorker(
+            manifest=manifest, scheduler=Mock(), storage=AsyncMock()
+        )
+
+        try:
+            running = asyncio.create_task(worker._execute_handler([], task_id=task_id))
+            await asyncio.sleep(0.05)
+            assert worker.stop_task(task_id) is True
+
+            with pytest.raises(HandlerCancelledError):
+                await running
+            assert await asyncio.to_thread(closed.wait, 1)
+            assert worker.stop_task(task_id) is False
+        finally:
+            worker.executor.shutdown()
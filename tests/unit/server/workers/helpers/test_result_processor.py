@@ -1,5 +1,7 @@
 """Minimal tests for result processor."""
 
+import asyncio
+
 import pytest
 
 from bindu.server.workers.helpers.result_processor import ResultProcessor
@@ -26,6 +28,27 @@ class TestResultProcessor:
 
         assert collected == {"message": "Hello", "data": 123}
 
+    @pytest.mark.asyncio
+    async def test_async_generator_closed_when_cancelled(self):
+        """Test a generator's cleanup runs as soon as collection is cancelled."""
+        closed = asyncio.Event()
+
+        async def async_gen():
+            try:
+                yield "chunk1"
+                await asyncio.sleep(10)
+                yield "chunk2"
+            finally:
+                closed.set()
+
+        collecting = asyncio.create_task(ResultProcessor.collect_results(async_gen()))
+        await asyncio.sleep(0.01)
+        collecting.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await collecting
+        assert closed.is_set()
+
     @pytest.mark.asyncio
     async def test_collect_results_with_async_generator(self):
         """Test collecting from async generator."""
@@ -37,7 +60,7 @@ class TestResultProcessor:
 
         collected = await ResultProcessor.collect_results(async_gen())
 
-        assert collected == "chunk3"
+        assert collected == "chunk1chunk2chunk3"
 
     @pytest.mark.asyncio
     async def test_collect_results_with_sync_generator(self):
@@ -50,7 +73,39 @@ class TestResultProcessor:
 
         collected = await ResultProcessor.collect_results(sync_gen())
 
-        assert collected == "item3"
+        assert collected == "item1item2item3"
+
+    @pytest.mark.asyncio
+    async def test_collect_results_forwards_chunks(self):
+        """Each chunk reaches on_chunk as it is yielded."""
+        received = []
+
+        async def on_chunk(chunk):
+            received.append(chunk)
+
+        async def async_gen():
+            yield "Hello"
+            yield " world"
+
+        collected = await ResultProcessor.collect_results(
+            async_gen(), on_chunk=on_chunk
+        )
+
+        assert received == ["Hello", " world"]
+        assert collected == "Hello world"
+
+    @pytest.mark.asyncio
+    async def test_collect_results_keeps_final_structured_chunk(self):
+        """A final non-text chunk is the result, not the text before it."""
+
+        async def async_gen():
+            yield "Let me check"
+            yield "..."
+            yield {"state": "input-required", "prompt": "Which city?"}
+
+        collected = await ResultProcessor.collect_results(async_gen())
+
+        assert collected == {"state": "input-required", "prompt": "Which city?"}
 
     @pytest.mark.asyncio
     async def test_collect_results_with_empty_async_generator(self):
@@ -0,0 +1,290 @@
+"""Tests for the base Worker pool (bounded parallelism and per-context ordering)."""
+
+from dataclasses import dataclass, field
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import anyio
+import pytest
+
+from bindu.server.metrics import get_metrics
+from bindu.server.scheduler import InMemoryScheduler
+from bindu.server.workers.base import Worker
+
+
+@dataclass
+class RecordingWorker(Worker):
+    """Worker that records run_task concurrency instead of executing agents."""
+
+    delay: float = 0.05
+    running: int = 0
+    max_running: int = 0
+    started: list[Any] = field(default_factory=list)
+    finished: list[Any] = field(default_factory=list)
+    stopped: list[Any] = field(default_factory=list)
+
+    async def run_task(self, params):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        self.started.append(params["task_id"])
+        try:
+            await anyio.sleep(self.delay)
+        finally:
+            self.running -= 1
+            self.finished.append(params["task_id"])
+
+    async def cancel_task(self, params):
+        self.finished.append(("cancel", params["task_id"]))
+
+    def stop_task(self, task_id):
+        self.stopped.append(task_id)
+        return task_id in self.started and task_id not in self.finished
+
+    def build_message_history(self, history):
+        return []
+
+    def build_artifacts(self, result):
+        return []
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    with anyio.fail_after(timeout):
+        while not predicate():
+            await anyio.sleep(0.005)
+
+
+class TestWorkerPool:
+    """Test worker pool behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_runs_operations_concurrently_up_to_limit(self):
+        """Operations on distinct contexts run in parallel, bounded by the pool."""
+        async with InMemoryScheduler() as scheduler:
+            worker = RecordingWorker(
+                scheduler=scheduler, storage=AsyncMock(), max_concurrent_tasks=3
+            )
+            async with worker.run():
+                for _ in range(6):
+                    await scheduler.run_task(
+                        {"task_id": uuid4(), "context_id": uuid4(), "message": {}}
+                    )
+                await _wait_for(lambda: len(worker.finished) == 6)
+
+        assert worker.max_running == 3
+
+    @pytest.mark.asyncio
+    async def test_same_context_operations_are_serialized(self):
+        """Two run operations on the same context never overlap and keep order."""
+        context_id = uuid4()
+        task_ids = [uuid4() for _ in range(3)]
+        async with InMemoryScheduler() as scheduler:
+            worker = RecordingWorker(
+                scheduler=scheduler, storage=AsyncMock(), max_concurrent_tasks=5
+            )
+            async with worker.run():
+                for task_id in task_ids:
+                    await scheduler.run_task(
+                        {"task_id": task_id, "context_id": context_id, "message": {}}
+                    )
+                await _wait_for(lambda: len(worker.finished) == 3)
+
+        assert worker.max_running == 1
+        assert worker.started == task_ids
+        assert worker._context_queues == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_operation_does_not_block_its_context(self):
+        """An operation that raises does not keep its context's queue busy."""
+        context_id = uuid4()
+        failing, following = uuid4(), uuid4()
+        storage = AsyncMock()
+        # Marking the task as failed fails too, so the error leaves the handler
+        storage.update_task.side_effect = ConnectionError("storage down")
+
+        async with InMemoryScheduler() as scheduler:
+            scheduler.ack_task_operation = AsyncMock()
+            worker = RecordingWorker(scheduler=scheduler, storage=storage)
+            run_task = worker.run_task
+
+            async def run_or_fail(params):
+                if params["task_id"] == failing:
+                    raise RuntimeError("handler crashed")
+                await run_task(params)
+
+            worker.run_task = run_or_fail
+            async with worker.run():
+                for task_id in (failing, following):
+                    await scheduler.run_task(
+                        {"task_id": task_id, "context_id": context_id, "message": {}}
+                    )
+                await _wait_for(lambda: following in worker.finished)
+                await _wait_for(lambda: worker._context_queues == {})
+
+        [call] = scheduler.ack_task_operation.await_args_list
+        assert call.args[0]["params"]["task_id"] == following
+        assert worker.waiting_operations == 0
+
+    @pytest.mark.asyncio
+    async def test_busy_context_does_not_starve_others(self):
+        """Operations queued on one context hold no slot while they wait."""
+        busy_context = uuid4()
+        other_task = uuid4()
+        async with InMemoryScheduler() as scheduler:
+            worker = RecordingWorker(
+                scheduler=scheduler,
+                storage=AsyncMock(),
+                max_concurrent_tasks=2,
+                delay=0.1,
+            )
+            async with worker.run():
+                for _ in range(4):
+                    await scheduler.run_task(
+                        {"task_id": uuid4(), "context_id": busy_context, "message": {}}
+                    )
+                await scheduler.run_task(
+                    {"task_id": other_task, "context_id": uuid4(), "message": {}}
+                )
+                await _wait_for(lambda: other_task in worker.started)
+                assert worker.waiting_operations == 3
+                await _wait_for(lambda: len(worker.finished) == 5)
+
+        assert worker.started.index(other_task) == 1
+        assert worker.waiting_operations == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_bypasses_context_ordering(self):
+        """Cancel operations are not queued behind the run they target."""
+        context_id = uuid4()
+        task_id = uuid4()
+        async with InMemoryScheduler() as scheduler:
+            worker = RecordingWorker(
+                scheduler=scheduler,
+                storage=AsyncMock(),
+                max_concurrent_tasks=2,
+                delay=0.5,
+            )
+            async with worker.run():
+                await scheduler.run_task(
+                    {"task_id": task_id, "context_id": context_id, "message": {}}
+                )
+                await _wait_for(lambda: worker.running == 1)
+                await scheduler.cancel_task({"task_id": task_id})
+                await _wait_for(lambda: ("cancel", task_id) in worker.finished)
+                assert task_id not in worker.finished
+
+    @pytest.mark.asyncio
+    async def test_cancellation_reaches_saturated_worker(self):
+        """A running task is stopped even when no slot is free for the cancel."""
+        task_id = uuid4()
+        async with InMemoryScheduler() as scheduler:
+            worker = RecordingWorker(
+                scheduler=scheduler,
+                storage=AsyncMock(),
+                max_concurrent_tasks=1,
+                delay=0.5,
+            )
+            async with worker.run():
+                await scheduler.run_task(
+                    {"task_id": task_id, "context_id": uuid4(), "message": {}}
+                )
+                await _wait_for(lambda: worker.running == 1)
+                await scheduler.cancel_task({"task_id": task_id})
+                await _wait_for(lambda: worker.stopped == [task_id])
+                assert ("cancel", task_id) not in worker.finished
+
+    @pytest.mark.asyncio
+    async def test_back_pressure_leaves_operations_in_scheduler(self):
+        """A saturated worker stops pulling operations from the scheduler."""
+        async with InMemoryScheduler() as scheduler:
+            worker = RecordingWorker(
+                scheduler=scheduler,
+                storage=AsyncMock(),
+                max_concurrent_tasks=1,
+                delay=0.2,
+            )
+            async with worker.run():
+                for _ in range(3):
+                    await scheduler.run_task(
+                        {"task_id": uuid4(), "context_id": uuid4(), "message": {}}
+                    )
+                await _wait_for(lambda: worker.running == 1)
+                assert await scheduler.get_queue_length() == 2
+                await _wait_for(lambda: len(worker.finished) == 3)
+
+    @pytest.mark.asyncio
+    async def test_reports_free_slots_to_scheduler(self):
+        """Batching schedulers learn how many operations the worker can start."""
+        async with InMemoryScheduler() as scheduler:
+            scheduler.set_capacity = Mock()
+            worker = RecordingWorker(
+                scheduler=scheduler,
+                storage=AsyncMock(),
+                max_concurrent_tasks=3,
+                delay=0.5,
+            )
+            async with worker.run():
+                await _wait_for(lambda: scheduler.set_capacity.called)
+                [free_slots] = scheduler.set_capacity.call_args.args
+                assert free_slots() == 3
+
+                await scheduler.run_task(
+                    {"task_id": uuid4(), "context_id": uuid4(), "message": {}}
+                )
+                await _wait_for(lambda: worker.running == 1)
+                assert free_slots() == 2
+
+    @pytest.mark.asyncio
+    async def test_reports_slot_usage_to_metrics(self):
+        """Slot utilisation is published to PrometheusMetrics."""
+        async with InMemoryScheduler() as scheduler:
+            worker = RecordingWorker(
+                scheduler=scheduler,
+                storage=AsyncMock(),
+                max_concurrent_tasks=4,
+                delay=0.2,
+            )
+            async with worker.run():
+                await scheduler.run_task(
+                    {"task_id": uuid4(), "context_id": uuid4(), "message": {}}
+                )
+                await _wait_for(lambda: worker.running == 1)
+                text = get_metrics().generate_prometheus_text()
+                assert "worker_slots_busy 1" in text
+                assert "worker_slots_total 4" in text
+
+
+class TestAcknowledgement:
+    """Test that handled operations are acknowledged to the scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_completed_operations_are_acknowledged(self):
+        """Each operation is acked once its handler returns."""
+        async with InMemoryScheduler() as scheduler:
+            scheduler.ack_task_operation = AsyncMock()
+            worker = RecordingWorker(
+                scheduler=scheduler, storage=AsyncMock(), delay=0.01
+            )
+            async with worker.run():
+                await scheduler.run_task(
+                    {"task_id": uuid4(), "context_id": uuid4(), "message": {}}
+                )
+                await _wait_for(lambda: scheduler.ack_task_operation.await_count == 1)
+
+        [call] = scheduler.ack_task_operation.await_args_list
+        assert call.args[0]["operation"] == "run"
+
+    @pytest.mark.asyncio
+    async def test_interrupted_operation_is_not_acknowledged(self):
+        """Shutting down mid-task leaves the operation for redelivery."""
+        async with InMemoryScheduler() as scheduler:
+            scheduler.ack_task_operation = AsyncMock()
+            worker = RecordingWorker(scheduler=scheduler, storage=AsyncMock(), delay=5)
+            async with worker.run():
+                await scheduler.run_task(
+                    {"task_id": uuid4(), "context_id": uuid4(), "message": {}}
+                )
+                await _wait_for(lambda: worker.running == 1)
+
+        scheduler.ack_task_operation.assert_not_awaited()
+        assert worker._context_queues == {}
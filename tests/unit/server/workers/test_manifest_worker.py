@@ -1,11 +1,12 @@
 """Minimal tests for ManifestWorker."""
 
 from typing import cast
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 import pytest
 
 from bindu.common.protocol.types import Task, TaskSendParams
+from bindu.server.workers.helpers import HandlerCancelledError
 from bindu.server.workers.manifest_worker import ManifestWorker
 
 
@@ -74,8 +75,8 @@ class TestManifestWorker:
 
         await worker._handle_task_failure(task, "Test error")
 
-        mock_storage.update_task.assert_called_once()
-        call_args = mock_storage.update_task.call_args
+        mock_storage.update_task_if_active.assert_called_once()
+        call_args = mock_storage.update_task_if_active.call_args
         assert call_args[0][0] == task["id"]
         assert call_args[1]["state"] == "failed"
 
@@ -189,7 +190,31 @@ class TestManifestWorker:
 
         await worker.cancel_task({"task_id": task_id})
 
-        mock_storage.update_task.assert_called_once_with(task_id, state="canceled")
+        mock_storage.update_task_if_active.assert_called_once_with(
+            task_id, state="canceled", return_full=False
+        )
+
+    @pytest.mark.asyncio
+    async def test_cancel_task_keeps_finished_task(self):
+        """Test a cancel arriving after completion does not rewrite the task."""
+        mock_storage = AsyncMock()
+        task_id = uuid4()
+        mock_storage.load_task.return_value = {
+            "id": task_id,
+            "context_id": uuid4(),
+            "status": {"state": "completed", "timestamp": "2024-01-01T00:00:00Z"},
+        }
+
+        # The conditional update finds the task already terminal
+        mock_storage.update_task_if_active.return_value = None
+
+        worker = ManifestWorker(manifest=Mock(), scheduler=Mock(), storage=mock_storage)
+        worker._notify_lifecycle = AsyncMock()
+
+        await worker.cancel_task({"task_id": task_id})
+
+        mock_storage.update_task.assert_not_called()
+        worker._notify_lifecycle.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_cancel_task_not_found(self):
@@ -206,7 +231,7 @@ class TestManifestWorker:
         task_id = uuid4()
         await worker.cancel_task({"task_id": task_id})
 
-        mock_storage.update_task.assert_not_called()
+        mock_storage.update_task_if_active.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_build_complete_message_history_with_references(self):
@@ -241,7 +266,7 @@ class TestManifestWorker:
             "history": [{"role": "user", "content": "previous"}],
         }
 
-        mock_storage.load_task.return_value = ref_task
+        mock_storage.load_tasks.return_value = [ref_task]
 
         worker = ManifestWorker(
             manifest=mock_manifest, scheduler=mock_scheduler, storage=mock_storage
@@ -250,7 +275,8 @@ class TestManifestWorker:
         history = await worker._build_complete_message_history(task)
 
         assert isinstance(history, list)
-        mock_storage.load_task.assert_called()
+        mock_storage.load_tasks.assert_awaited_once_with([ref_task_id])
+        mock_storage.load_task.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_build_complete_message_history_without_references(self):
@@ -328,7 +354,7 @@ class TestManifestWorker:
             task, "input-required", "Please provide input"
         )
 
-        mock_storage.update_task.assert_called()
+        mock_storage.update_task_if_active.assert_called()
 
     @pytest.mark.asyncio
     async def test_handle_terminal_state(self):
@@ -356,7 +382,45 @@ class TestManifestWorker:
 
         await worker._handle_terminal_state(task, "Task completed", "completed")
 
-        mock_storage.update_task.assert_called()
+        mock_storage.update_task_if_active.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_handle_terminal_state_publishes_events(self):
+        """Completed tasks publish message, artifact and final status events."""
+        mock_manifest = Mock()
+        mock_manifest.did_extension = Mock()
+        mock_manifest.did_extension.did = "did:example:123"
+        mock_event_bus = AsyncMock()
+
+        task_id = uuid4()
+        context_id = uuid4()
+        task = cast(
+            Task,
+            {
+                "id": task_id,
+                "context_id": context_id,
+                "status": {"state": "working", "timestamp": "2024-01-01T00:00:00Z"},
+            },
+        )
+
+        worker = ManifestWorker(
+            manifest=mock_manifest,
+            scheduler=Mock(),
+            storage=AsyncMock(),
+            event_bus=mock_event_bus,
+        )
+
+        await worker._handle_terminal_state(task, "Task completed", "completed")
+
+        events = [call.args[0] for call in mock_event_bus.publish.await_args_list]
+        assert [event["kind"] for event in events] == [
+            "message",
+            "artifact-update",
+            "status-update",
+        ]
+        assert events[-1]["status"]["state"] == "completed"
+        assert events[-1]["final"] is True
+        assert all(event["task_id"] == str(task_id) for event in events)
 
     @pytest.mark.asyncio
     async def test_handle_terminal_state_with_payment(self):
@@ -385,11 +449,53 @@ class TestManifestWorker:
             manifest=mock_manifest, scheduler=mock_scheduler, storage=mock_storage
         )
 
+        worker._settle_payment = AsyncMock(return_value={"x402.status": "settled"})
+
         await worker._handle_terminal_state(
             task, "Task completed", "completed", payment_context=payment_context
         )
 
-        mock_storage.update_task.assert_called()
+        mock_storage.update_task_if_active.assert_called()
+        worker._settle_payment.assert_awaited_once_with(payment_context)
+        mock_storage.update_task.assert_awaited_once_with(
+            task_id,
+            state="completed",
+            metadata={"x402.status": "settled"},
+            return_full=False,
+        )
+
+    @pytest.mark.asyncio
+    async def test_handle_terminal_state_does_not_settle_canceled_task(self):
+        """Test a task canceled before its completion is stored is not charged."""
+        mock_manifest = Mock()
+        mock_manifest.did_extension = Mock()
+        mock_manifest.did_extension.did = "did:example:123"
+        mock_storage = AsyncMock()
+        mock_storage.update_task_if_active.return_value = None
+
+        task = cast(
+            Task,
+            {
+                "id": uuid4(),
+                "context_id": uuid4(),
+                "status": {"state": "working", "timestamp": "2024-01-01T00:00:00Z"},
+            },
+        )
+        worker = ManifestWorker(
+            manifest=mock_manifest, scheduler=Mock(), storage=mock_storage
+        )
+        worker._settle_payment = AsyncMock()
+
+        with pytest.raises(HandlerCancelledError):
+            await worker._handle_terminal_state(
+                task,
+                "Task completed",
+                "completed",
+                payment_context={"session_id": "sess123"},
+            )
+
+        worker._settle_payment.assert_not_awaited()
+        mock_storage.update_task.assert_not_called()
 
     def test_add_state_change_event_with_error(self):
         """Test adding state change event with error."""
@@ -449,9 +555,135 @@ class TestManifestWorker:
 
         await worker.run_task(params)
 
-        mock_storage.update_task.assert_called()
+        mock_storage.update_task_if_active.assert_called()
         mock_manifest.run.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_run_task_keeps_cancel_from_other_replica(self):
+        """Test a result is dropped if the task was canceled meanwhile."""
+        task_id = uuid4()
+        task = {
+            "id": task_id,
+            "context_id": uuid4(),
+            "status": {"state": "submitted", "timestamp": "2024-01-01T00:00:00Z"},
+            "history": [{"role": "user", "content": "test"}],
+        }
+
+        def handler(messages):
+            return "Task completed"
+
+        async def update_task_if_active(task_id, state, **kwargs):
+            # Another replica canceled the task while the agent ran
+            return {"id": task_id} if state == "working" else None
+
+        mock_manifest = Mock()
+        mock_manifest.run = handler
+        mock_manifest.name = "test-agent"
+        mock_manifest.did_extension = Mock()
+        mock_manifest.did_extension.did = "did:example:123"
+        mock_manifest.enable_system_message = False
+        mock_manifest.enable_context_based_history = False
+        mock_storage = AsyncMock()
+        mock_storage.load_task.return_value = task
+        mock_storage.update_task_if_active.side_effect = update_task_if_active
+
+        worker = ManifestWorker(
+            manifest=mock_manifest, scheduler=Mock(), storage=mock_storage
+        )
+        worker._notify_artifact = AsyncMock()
+
+        await worker.run_task(
+            cast(TaskSendParams, {"task_id": task_id, "context_id": task["context_id"]})
+        )
+
+        states = [
+            c.kwargs.get("state") for c in mock_storage.update_task_if_active.mock_calls
+        ]
+        assert states == ["working", "completed"]
+        mock_storage.update_task.assert_not_called()
+        worker._notify_artifact.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_task_skips_task_canceled_before_start(self):
+        """Test a task canceled before it started is not run."""
+        task_id = uuid4()
+        mock_manifest = Mock()
+        mock_storage = AsyncMock()
+        mock_storage.load_task.return_value = {
+            "id": task_id,
+            "context_id": uuid4(),
+            "status": {"state": "submitted", "timestamp": "2024-01-01T00:00:00Z"},
+            "history": [],
+        }
+        mock_storage.update_task_if_active.return_value = None
+
+        worker = ManifestWorker(
+            manifest=mock_manifest, scheduler=Mock(), storage=mock_storage
+        )
+
+        await worker.run_task(cast(TaskSendParams, {"task_id": task_id}))
+
+        mock_manifest.run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_task_streams_chunks_before_completion(self):
+        """Generator chunks are published as appended artifact updates."""
+
+        async def handler(messages):
+            for chunk in ("Hello", ", ", "world"):
+                yield chunk
+
+        mock_manifest = Mock()
+        mock_manifest.run = handler
+        mock_manifest.name = "test-agent"
+        mock_manifest.did_extension = Mock()
+        mock_manifest.did_extension.did = "did:example:123"
+        mock_manifest.enable_system_message = False
+        mock_manifest.enable_context_based_history = False
+
+        mock_storage = AsyncMock()
+        mock_event_bus = AsyncMock()
+        task_id = uuid4()
+        context_id = uuid4()
+        mock_storage.load_task.return_value = {
+            "id": task_id,
+            "context_id": context_id,
+            "status": {"state": "submitted", "timestamp": "2024-01-01T00:00:00Z"},
+            "history": [{"role": "user", "content": "test"}],
+        }
+
+        worker = ManifestWorker(
+            manifest=mock_manifest,
+            scheduler=Mock(),
+            storage=mock_storage,
+            event_bus=mock_event_bus,
+        )
+
+        await worker.run_task(
+            cast(TaskSendParams, {"task_id": task_id, "context_id": context_id})
+        )
+
+        events = [call.args[0] for call in mock_event_bus.publish.await_args_list]
+        streamed = [
+            event
+            for event in events
+            if event["kind"] == "artifact-update"
+            and event["artifact"]["name"] == "streaming-response"
+        ]
+        assert [
+            "".join(part["text"] for part in event["artifact"]["parts"])
+            for event in streamed
+        ] == ["Hello", ", ", "world", ""]
+        assert streamed[-1]["last_chunk"] is True
+        assert events.index(streamed[0]) < len(events) - 1
+        assert events[-1]["status"]["state"] == "completed"
+        # The streamed text is not sent again as the final result artifact
+        assert [e for e in events if e["kind"] == "artifact-update"] == streamed
+        # The stored result holds the whole text, for tasks/get and webhooks
+        stored = mock_storage.update_task_if_active.await_args_list[-1].kwargs
+        [part] = stored["new_artifacts"][0]["parts"]
+        assert part["text"] == "Hello, world"
+
     @pytest.mark.asyncio
     async def test_run_task_with_input_required_response(self):
         """Test task execution with input-required response."""
@@ -488,7 +720,7 @@ class TestManifestWorker:
 
         await worker.run_task(params)
 
-        mock_storage.update_task.assert_called()
+        mock_storage.update_task_if_active.assert_called()
 
     @pytest.mark.asyncio
     async def test_run_task_with_auth_required_response(self):
@@ -526,7 +758,7 @@ class TestManifestWorker:
 
         await worker.run_task(params)
 
-        mock_storage.update_task.assert_called()
+        mock_storage.update_task_if_active.assert_called()
 
     @pytest.mark.asyncio
     async def test_run_task_with_payment_context(self):
@@ -570,7 +802,7 @@ class TestManifestWorker:
 
         await worker.run_task(params)
 
-        mock_storage.update_task.assert_called()
+        mock_storage.update_task_if_active.assert_called()
 
     @pytest.mark.asyncio
     async def test_run_task_not_found(self):
@@ -589,6 +821,49 @@ class TestManifestWorker:
         with pytest.raises(ValueError, match="not found"):
             await worker.run_task(params)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("state", "reruns"),
+        [
+            ("submitted", True),
+            ("working", True),
+            ("completed", False),
+            ("input-required", False),
+        ],
+    )
+    async def test_run_task_redelivered(self, state, reruns):
+        """Redelivered operations re-run interrupted tasks and skip finished ones."""
+        mock_manifest = Mock()
+        mock_manifest.run = Mock(return_value="Task completed")
+        mock_manifest.name = "test-agent"
+        mock_manifest.did_extension = Mock()
+        mock_manifest.did_extension.did = "did:example:123"
+        mock_manifest.enable_system_message = False
+        mock_manifest.enable_context_based_history = False
+
+        mock_storage = AsyncMock()
+        task_id = uuid4()
+        context_id = uuid4()
+        mock_storage.load_task.return_value = {
+            "id": task_id,
+            "context_id": context_id,
+            "status": {"state": state, "timestamp": "2024-01-01T00:00:00Z"},
+            "history": [{"role": "user", "content": "test"}],
+        }
+
+        worker = ManifestWorker(
+            manifest=mock_manifest, scheduler=Mock(), storage=mock_storage
+        )
+        params = cast(
+            TaskSendParams,
+            {"task_id": task_id, "context_id": context_id, "redelivered": True},
+        )
+
+        await worker.run_task(params)
+
+        assert mock_manifest.run.called is reruns
+        assert mock_storage.update_task_if_active.called is reruns
+
     @pytest.mark.asyncio
     async def test_run_task_with_agent_error(self):
         """Test task execution when agent raises error."""
@@ -627,7 +902,7 @@ class TestManifestWorker:
         # Should have updated task to failed state
         assert any(
             call[1].get("state") == "failed"
-            for call in mock_storage.update_task.call_args_list
+            for call in mock_storage.update_task_if_active.call_args_list
         )
 
     @pytest.mark.asyncio
@@ -705,11 +980,16 @@ class TestManifestWorker:
         prev_task = {
             "id": prev_task_id,
             "context_id": context_id,
+            "status": {"state": "completed", "timestamp": "2024-01-01T00:00:00Z"},
             "history": [{"role": "user", "content": "previous"}],
         }
 
         mock_storage.load_task.return_value = mock_task
-        mock_storage.list_tasks_by_context.return_value = [prev_task, mock_task]
+        mock_storage.list_task_summaries_by_context.return_value = [
+            {"id": prev_task_id},
+            {"id": task_id},
+        ]
+        mock_storage.load_tasks.return_value = [prev_task]
 
         worker = ManifestWorker(
             manifest=mock_manifest, scheduler=mock_scheduler, storage=mock_storage
@@ -719,7 +999,8 @@ class TestManifestWorker:
 
         await worker.run_task(params)
 
-        mock_storage.list_tasks_by_context.assert_called_once_with(context_id)
+        mock_storage.list_task_summaries_by_context.assert_called_once_with(context_id)
+        mock_storage.load_tasks.assert_awaited_once_with([prev_task_id])
 
     @pytest.mark.asyncio
     async def test_settle_payment_with_facilitator(self):
@@ -779,4 +1060,152 @@ class TestManifestWorker:
 
         assert isinstance(history, list)
         # Should not call list_tasks_by_context when disabled
-        mock_storage.list_tasks_by_context.assert_not_called()
+        mock_storage.list_task_summaries_by_context.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_build_complete_message_history_parses_files_off_loop(self):
+        """Histories carrying file parts are converted in a worker thread."""
+        import threading
+
+        mock_manifest = Mock()
+        mock_manifest.enable_context_based_history = False
+        task = cast(
+            Task,
+            {
+                "id": uuid4(),
+                "context_id": uuid4(),
+                "status": {"state": "working", "timestamp": "2024-01-01T00:00:00Z"},
+                "history": [
+                    {
+                        "role": "user",
+                        "parts": [{"kind": "file", "mimeType": "text/plain"}],
+                    }
+                ],
+            },
+        )
+        worker = ManifestWorker(
+            manifest=mock_manifest, scheduler=Mock(), storage=AsyncMock()
+        )
+        threads = []
+
+        def build(history):
+            threads.append(threading.current_thread())
+            return []
+
+        with patch.object(worker, "build_message_history", side_effect=build):
+            await worker._build_complete_message_history(task)
+
+        assert threads and threads[0] is not threading.main_thread()
+
+
+def _text_message(role: str, text: str, context_id, task_id=None) -> dict:
+    return {
+        "role": role,
+        "parts": [{"kind": "text", "text": text}],
+        "kind": "message",
+        "message_id": uuid4(),
+        "context_id": context_id,
+        "task_id": task_id or uuid4(),
+    }
+
+
+class TestContextHistoryCache:
+    """Test per-context chat history reuse across turns."""
+
+    async def _finished_task(self, storage, context_id, question, answer):
+        task = await storage.submit_task(
+            context_id, _text_message("user", question, context_id)
+        )
+        await storage.update_task(
+            task["id"],
+            state="completed",
+            new_messages=[_text_message("agent", answer, context_id, task["id"])],
+        )
+        return task
+
+    def _worker(self, storage, **kwargs):
+        manifest = Mock()
+        manifest.enable_context_based_history = True
+        return ManifestWorker(
+            manifest=manifest, scheduler=Mock(), storage=storage, **kwargs
+        )
+
+    @pytest.mark.asyncio
+    async def test_finished_tasks_are_loaded_once(self):
+        """Later turns reuse the converted history of finished tasks."""
+        from bindu.server.storage.memory_storage import InMemoryStorage
+
+        storage = InMemoryStorage()
+        context_id = uuid4()
+        await self._finished_task(storage, context_id, "q1", "a1")
+        current = await storage.submit_task(
+            context_id, _text_message("user", "q2", context_id)
+        )
+        worker = self._worker(storage)
+
+        with patch.object(storage, "load_tasks", wraps=storage.load_tasks) as load:
+            first = await worker._build_complete_message_history(current)
+            second = await worker._build_complete_message_history(current)
+
+        assert [m["content"] for m in first] == ["q1", "a1", "q2"]
+        assert second == first
+        load.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_completed_task_is_cached_on_completion(self):
+        """A task's history is cached when it reaches a terminal state."""
+        from bindu.server.storage.memory_storage import InMemoryStorage
+
+        storage = InMemoryStorage()
+        context_id = uuid4()
+        task = await storage.submit_task(
+            context_id, _text_message("user", "hello", context_id)
+        )
+        worker = self._worker(storage)
+        worker.manifest.did_extension = None
+
+        await worker._handle_terminal_state(task, "hi there", "completed")
+
+        cached = worker.history_cache.get(context_id)
+        assert [m["content"] for m in cached[task["id"]]] == ["hello", "hi there"]
+
+    @pytest.mark.asyncio
+    async def test_cleared_tasks_are_dropped(self):
+        """Tasks no longer in storage are removed from the cache."""
+        from bindu.server.storage.memory_storage import InMemoryStorage
+
+        storage = InMemoryStorage()
+        context_id = uuid4()
+        await self._finished_task(storage, context_id, "old", "answer")
+        worker = self._worker(storage)
+        current = await storage.submit_task(
+            context_id, _text_message("user", "q", context_id)
+        )
+        await worker._build_complete_message_history(current)
+
+        await storage.clear_context(context_id)
+        current = await storage.submit_task(
+            context_id, _text_message("user", "fresh", context_id)
+        )
+        history = await worker._build_complete_message_history(current)
+
+        assert [m["content"] for m in history] == ["fresh"]
+        assert list(worker.history_cache.get(context_id)) == []
+
+    @pytest.mark.asyncio
+    async def test_history_window(self):
+        """Only the most recent messages within the window are handed over."""
+        from bindu.server.storage.memory_storage import InMemoryStorage
+
+        storage = InMemoryStorage()
+        context_id = uuid4()
+        for n in range(3):
+            await self._finished_task(storage, context_id, f"q{n}", f"a{n}")
+        current = await storage.submit_task(
+            context_id, _text_message("user", "now", context_id)
+        )
+        worker = self._worker(storage, history_max_messages=3)
+
+        history = await worker._build_complete_message_history(current)
+
+        assert [m["content"] for m in history] == ["q2", "a2", "now"]
@@ -141,6 +141,23 @@ class TestSchedulerConfigFromEnv:
         assert result.type == "redis"
         assert result.redis_url == "redis://localhost:6379"
 
+    def test_scheduler_queue_mode_from_user_config(self):
+        """Test that Redis Streams options in user config are passed through."""
+        user_config = {
+            "scheduler": {
+                "type": "redis",
+                "redis_url": "redis://localhost:6379",
+                "queue_mode": "stream",
+                "max_deliveries": 3,
+            }
+        }
+
+        result = create_scheduler_config_from_env(user_config)
+
+        assert result.queue_mode == "stream"
+        assert result.max_deliveries == 3
+        assert result.visibility_timeout == 60.0
+
     def test_scheduler_from_env_invalid_type(self):
         """Test invalid scheduler type from environment."""
         user_config = {}
@@ -0,0 +1,128 @@
+"""Tests for DID request signatures (legacy and body-digest schemes)."""
+
+import hashlib
+import json
+import time
+
+import base58
+import pytest
+from nacl.signing import SigningKey
+
+from bindu.utils.did import (
+    SIGNATURE_VERSION_DIGEST,
+    SIGNATURE_VERSION_HEADER,
+    extract_signature_headers,
+    sign_request,
+    verify_digest_signature,
+    verify_signature,
+)
+
+DID = "did:bindu:test:client"
+BODY = json.dumps({"jsonrpc": "2.0", "method": "message/send", "id": 1}).encode()
+
+
+class _Signer:
+    """Signs like DIDExtension.sign_text."""
+
+    def __init__(self):
+        self.signing_key = SigningKey.generate()
+        self.public_key = base58.b58encode(bytes(self.signing_key.verify_key)).decode()
+
+    def sign_text(self, text: str) -> str:
+        signature = self.signing_key.sign(text.encode()).signature
+        return base58.b58encode(signature).decode()
+
+
+def _verify_headers(headers, body, public_key):
+    data = extract_signature_headers(headers)
+    common = {
+        "signature": data["signature"],
+        "did": data["did"],
+        "timestamp": data["timestamp"],
+        "public_key": public_key,
+    }
+    if data["version"] == SIGNATURE_VERSION_DIGEST:
+        return verify_digest_signature(hashlib.sha256(body).digest(), **common)
+    return verify_signature(body, **common)
+
+
+class TestLegacySignature:
+    """Test the version 1 scheme kept for older clients."""
+
+    def test_round_trip(self):
+        """Test a legacy signature verifies and sends no version header."""
+        signer = _Signer()
+        headers = sign_request(BODY, DID, signer)
+
+        assert SIGNATURE_VERSION_HEADER not in headers
+        assert extract_signature_headers(headers)["version"] == 1
+        assert _verify_headers(headers, BODY, signer.public_key) is True
+
+    def test_bytearray_body(self):
+        """Test a buffered bytearray body verifies like bytes."""
+        signer = _Signer()
+        headers = sign_request(BODY, DID, signer)
+        data = extract_signature_headers(headers)
+
+        assert verify_signature(
+            bytearray(BODY),
+            data["signature"],
+            DID,
+            data["timestamp"],
+            signer.public_key,
+        )
+
+
+class TestDigestSignature:
+    """Test the version 2 scheme over a SHA-256 body digest."""
+
+    def test_round_trip(self):
+        """Test a digest signature verifies and is announced in a header."""
+        signer = _Signer()
+        headers = sign_request(BODY, DID, signer, version=SIGNATURE_VERSION_DIGEST)
+
+        assert headers[SIGNATURE_VERSION_HEADER] == "2"
+        assert _verify_headers(headers, BODY, signer.public_key) is True
+
+    def test_covers_exact_bytes(self):
+        """Test a body with the same JSON but other bytes is rejected."""
+        signer = _Signer()
+        headers = sign_request(BODY, DID, signer, version=SIGNATURE_VERSION_DIGEST)
+        reformatted = json.dumps(json.loads(BODY), indent=2).encode()
+
+        assert _verify_headers(headers, reformatted, signer.public_key) is False
+
+    def test_bytearray_body(self):
+        """Test a bytearray body is signed as the bytes it holds."""
+        signer = _Signer()
+        headers = sign_request(
+            bytearray(BODY), DID, signer, version=SIGNATURE_VERSION_DIGEST
+        )
+
+        assert _verify_headers(headers, BODY, signer.public_key) is True
+
+    def test_binary_body(self):
+        """Test bodies that are not UTF-8 can be signed."""
+        signer = _Signer()
+        body = bytes(range(256)) * 4
+        headers = sign_request(body, DID, signer, version=SIGNATURE_VERSION_DIGEST)
+
+        assert _verify_headers(headers, body, signer.public_key) is True
+
+    def test_stale_timestamp(self):
+        """Test an old signature is rejected as a replay."""
+        signer = _Signer()
+        headers = sign_request(
+            BODY,
+            DID,
+            signer,
+            timestamp=int(time.time()) - 3600,
+            version=SIGNATURE_VERSION_DIGEST,
+        )
+
+        assert _verify_headers(headers, BODY, signer.public_key) is False
+
+    def test_unknown_version(self):
+        """Test signing with an unknown scheme fails loudly."""
+        with pytest.raises(ValueError, match="Unsupported DID signature version"):
+            sign_request(BODY, DID, _Signer(), version=3)
@@ -5,6 +5,9 @@ from typing import cast
 from unittest.mock import patch
 from uuid import uuid4
 import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 from bindu.common.protocol.types import PushNotificationConfig
 from bindu.utils.notifications import NotificationService, NotificationDeliveryError
@@ -176,7 +179,7 @@ class TestNotificationService:
         with patch(
             "socket.getaddrinfo", return_value=[("", "", "", "", ("93.184.216.34", 0))]
         ):
-            with patch.object(service, "_post_once", return_value=200):
+            with patch.object(service, "_post", return_value=200):
                 await service.send_event(config, event)
 
         assert service.total_sent > 0
@@ -195,7 +198,7 @@ class TestNotificationService:
         ):
             with patch.object(
                 service,
-                "_post_once",
+                "_post",
                 side_effect=NotificationDeliveryError(400, "Bad request"),
             ):
                 with pytest.raises(NotificationDeliveryError):
@@ -214,3 +217,193 @@ class TestNotificationService:
 
         assert error.status is None
         assert str(error) == "Network error"
+
+    def test_delivery_error_retryable(self):
+        """Test only network errors, 5xx and 429 are retryable."""
+        assert NotificationDeliveryError(None, "Network error").retryable
+        assert NotificationDeliveryError(503, "Unavailable").retryable
+        assert NotificationDeliveryError(429, "Slow down").retryable
+        assert not NotificationDeliveryError(400, "Bad request").retryable
+        assert not NotificationDeliveryError(302, "Redirect").retryable
+
+
+PUBLIC_ADDRESS = [("", "", "", "", ("93.184.216.34", 0))]
+
+
+class TestHostVerdictCache:
+    """Test the cached SSRF verdict per webhook hostname."""
+
+    def _config(self, url: str = "https://example.com/webhook"):
+        return cast(PushNotificationConfig, {"id": uuid4(), "url": url})
+
+    def test_resolves_once_within_ttl(self):
+        """Test repeated validation reuses the first resolution."""
+        service = NotificationService()
+
+        with patch("socket.getaddrinfo", return_value=PUBLIC_ADDRESS) as resolve:
+            service.validate_config(self._config())
+            service.validate_config(self._config("https://example.com/other"))
+
+        resolve.assert_called_once()
+
+    def test_blocked_verdict_is_cached(self):
+        """Test a rejected hostname stays rejected without resolving again."""
+        service = NotificationService()
+        loopback = [("", "", "", "", ("127.0.0.1", 0))]
+
+        with patch("socket.getaddrinfo", return_value=loopback) as resolve:
+            for _ in range(2):
+                with pytest.raises(ValueError, match="blocked address range"):
+                    service.validate_config(self._config())
+
+        resolve.assert_called_once()
+
+    def test_zero_ttl_disables_cache(self):
+        """Test dns_cache_ttl=0 resolves on every validation."""
+        service = NotificationService(dns_cache_ttl=0)
+
+        with patch("socket.getaddrinfo", return_value=PUBLIC_ADDRESS) as resolve:
+            service.validate_config(self._config())
+            service.validate_config(self._config())
+
+        assert resolve.call_count == 2
+
+    def test_expired_verdict_resolves_again(self):
+        """Test the hostname is resolved again after the TTL."""
+        service = NotificationService(dns_cache_ttl=10)
+
+        with patch("socket.getaddrinfo", return_value=PUBLIC_ADDRESS) as resolve:
+            with patch("bindu.utils.notifications.time.monotonic", return_value=0.0):
+                service.validate_config(self._config())
+            with patch("bindu.utils.notifications.time.monotonic", return_value=11.0):
+                service.validate_config(self._config())
+
+        assert resolve.call_count == 2
+
+    def test_any_blocked_address_rejects_host(self):
+        """Test a host is rejected if any of its addresses is internal."""
+        service = NotificationService()
+        mixed = PUBLIC_ADDRESS + [("", "", "", "", ("10.0.0.5", 0))]
+
+        with patch("socket.getaddrinfo", return_value=mixed):
+            with pytest.raises(ValueError, match="blocked address range"):
+                service.validate_config(self._config())
+
+    def test_resolution_failure_is_not_cached(self):
+        """Test a failed lookup is retried on the next validation."""
+        service = NotificationService()
+
+        with patch("socket.getaddrinfo", side_effect=socket.gaierror("down")):
+            with pytest.raises(ValueError, match="could not be resolved"):
+                service.validate_config(self._config())
+        with patch("socket.getaddrinfo", return_value=PUBLIC_ADDRESS):
+            service.validate_config(self._config())
+
+    @pytest.mark.asyncio
+    async def test_validate_config_async_shares_cache(self):
+        """Test async validation uses the same verdict cache."""
+        service = NotificationService()
+
+        with patch("socket.getaddrinfo", return_value=PUBLIC_ADDRESS) as resolve:
+            await service.validate_config_async(self._config())
+            service.validate_config(self._config())
+
+        resolve.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_validate_config_async_blocks_private_network(self):
+        """Test async validation applies the SSRF check."""
+        service = NotificationService()
+        private = [("", "", "", "", ("192.168.1.1", 0))]
+
+        with patch("socket.getaddrinfo", return_value=private):
+            with pytest.raises(ValueError, match="blocked address range"):
+                await service.validate_config_async(self._config())
+
+
+class TestPooledPost:
+    """Test webhook POSTs through the per-origin HTTP client."""
+
+    @pytest_asyncio.fixture
+    async def webhook(self):
+        """Run a local webhook server recording received requests."""
+        received: list[tuple[str, dict]] = []
+
+        async def ok(request: web.Request) -> web.Response:
+            received.append((request.path_qs, await request.json()))
+            return web.Response(status=204)
+
+        async def fail(request: web.Request) -> web.Response:
+            return web.Response(status=503, text="try later")
+
+        async def redirect(request: web.Request) -> web.Response:
+            raise web.HTTPFound("/ok")
+
+        app = web.Application()
+        app.router.add_post("/ok", ok)
+        app.router.add_post("/fail", fail)
+        app.router.add_post("/redirect", redirect)
+
+        server = TestServer(app)
+        await server.start_server()
+        yield str(server.make_url("")), received
+        await server.close()
+
+    @pytest.mark.asyncio
+    async def test_post_reuses_client_per_origin(self, webhook):
+        """Test requests to one origin share a client and keep the query."""
+        base_url, received = webhook
+        service = NotificationService()
+
+        try:
+            assert await service._post(f"{base_url}/ok?a=1", {}, b'{"n": 1}') == 204
+            assert await service._post(f"{base_url}/ok", {}, b'{"n": 2}') == 204
+            assert len(service._clients) == 1
+        finally:
+            await service.close()
+
+        assert received == [("/ok?a=1", {"n": 1}), ("/ok", {"n": 2})]
+        assert service._clients == {}
+
+    @pytest.mark.asyncio
+    async def test_post_server_error(self, webhook):
+        """Test 5xx responses raise a retryable delivery error."""
+        base_url, _ = webhook
+        service = NotificationService()
+
+        try:
+            with pytest.raises(NotificationDeliveryError) as exc_info:
+                await service._post(f"{base_url}/fail", {}, b"{}")
+        finally:
+            await service.close()
+
+        assert exc_info.value.status == 503
+        assert exc_info.value.retryable
+
+    @pytest.mark.asyncio
+    async def test_post_does_not_follow_redirects(self, webhook):
+        """Test redirects are reported instead of followed."""
+        base_url, received = webhook
+        service = NotificationService()
+
+        try:
+            with pytest.raises(NotificationDeliveryError) as exc_info:
+                await service._post(f"{base_url}/redirect", {}, b"{}")
+        finally:
+            await service.close()
+
+        assert exc_info.value.status == 302
+        assert received == []
+
+    @pytest.mark.asyncio
+    async def test_post_connection_error(self):
+        """Test connection failures raise a delivery error without status."""
+        service = NotificationService(timeout=1.0)
+
+        try:
+            with pytest.raises(NotificationDeliveryError) as exc_info:
+                await service._post("http://127.0.0.1:9/hook", {}, b"{}")
+        finally:
+            await service.close()
+
+        assert exc_info.value.status is None
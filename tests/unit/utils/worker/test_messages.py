@@ -1,9 +1,19 @@
 """Tests for worker message utilities."""
 
+import base64
 from typing import cast
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
 
 from bindu.common.protocol.types import Message
-from bindu.utils.worker.messages import MessageConverter
+from bindu.utils.worker.messages import (
+    ChatHistoryCache,
+    FileInterceptor,
+    MessageConverter,
+    ParsedTextCache,
+)
 
 
 class TestMessageConverter:
@@ -95,3 +105,166 @@ class TestMessageConverter:
         result = MessageConverter.to_chat_format(messages)
 
         assert result == []
+
+
+def file_message(data: bytes, mime_type: str = "application/pdf") -> Message:
+    return cast(
+        Message,
+        {
+            "role": "user",
+            "parts": [
+                {
+                    "kind": "file",
+                    "mimeType": mime_type,
+                    "data": base64.b64encode(data).decode(),
+                }
+            ],
+        },
+    )
+
+
+class TestFileInterceptor:
+    """Test file part extraction and its parsed-text cache."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        FileInterceptor.parsed_text_cache.clear()
+        yield
+        FileInterceptor.parsed_text_cache.clear()
+
+    def test_plain_text_file_is_inlined(self):
+        """Text files are decoded and wrapped as an uploaded document."""
+        result = MessageConverter.to_chat_format(
+            [file_message(b"notes", mime_type="text/plain")]
+        )
+
+        assert "--- Document Uploaded ---\nnotes\n" in result[0]["content"]
+
+    def test_document_is_parsed_once_across_turns(self):
+        """Re-converting a history reuses the extracted text."""
+        history = [file_message(b"%PDF-fake")]
+
+        with patch.object(
+            FileInterceptor, "_extract_pdf", return_value="pdf text"
+        ) as extract:
+            first = MessageConverter.to_chat_format(history)
+            second = MessageConverter.to_chat_format(history + history)
+
+        assert extract.call_count == 1
+        assert first[0]["content"] == second[1]["content"]
+        assert "pdf text" in first[0]["content"]
+
+    def test_different_content_is_parsed_separately(self):
+        """The cache is keyed by content, not by position in the history."""
+        with patch.object(
+            FileInterceptor, "_extract_pdf", side_effect=["one", "two"]
+        ) as extract:
+            result = MessageConverter.to_chat_format(
+                [file_message(b"first"), file_message(b"second")]
+            )
+
+        assert extract.call_count == 2
+        assert "one" in result[0]["content"]
+        assert "two" in result[1]["content"]
+
+    def test_contains_files(self):
+        """Only histories with file parts need off-loop conversion."""
+        text = cast(
+            Message, {"role": "user", "parts": [{"kind": "text", "text": "hi"}]}
+        )
+
+        assert FileInterceptor.contains_files([text, file_message(b"x")])
+        assert not FileInterceptor.contains_files([text])
+
+
+class TestParsedTextCache:
+    """Test the size-bounded LRU."""
+
+    def test_evicts_least_recently_used_beyond_size(self):
+        """Entries are evicted oldest-use first once the size bound is hit."""
+        cache = ParsedTextCache(max_chars=10)
+        cache.put("a", "xxxx")
+        cache.put("b", "xxxx")
+        cache.get("a")
+        cache.put("c", "xxxx")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "xxxx"
+        assert cache.get("c") == "xxxx"
+
+    def test_oversized_text_is_not_cached(self):
+        """A document larger than the whole cache is not stored."""
+        cache = ParsedTextCache(max_chars=3)
+        cache.put("a", "xxxx")
+
+        assert len(cache) == 0
+
+
+class TestChatHistoryCache:
+    """Test the per-context chat history cache."""
+
+    def test_evicts_least_recently_used_context(self):
+        """Contexts beyond max_contexts are evicted oldest-use first."""
+        cache = ChatHistoryCache(max_contexts=2)
+        a, b, c = uuid4(), uuid4(), uuid4()
+        cache.put(a, uuid4(), [])
+        cache.put(b, uuid4(), [])
+        cache.get(a)
+        cache.put(c, uuid4(), [])
+
+        assert cache.get(b) == {}
+        assert len(cache.get(a)) == 1
+        assert len(cache.get(c)) == 1
+
+    def test_retain_and_invalidate(self):
+        """Tasks can be pruned individually or a context dropped as a whole."""
+        cache = ChatHistoryCache()
+        context_id, kept, gone = uuid4(), uuid4(), uuid4()
+        cache.put(context_id, kept, [{"role": "user", "content": "a"}])
+        cache.put(context_id, gone, [{"role": "user", "content": "b"}])
+
+        cache.retain(context_id, {kept})
+        assert list(cache.get(context_id)) == [kept]
+
+        cache.invalidate(context_id)
+        assert cache.get(context_id) == {}
+
+    def test_disabled(self):
+        """max_contexts=0 caches nothing."""
+        cache = ChatHistoryCache(max_contexts=0)
+        cache.put(uuid4(), uuid4(), [])
+
+        assert len(cache) == 0
+
+
+class TestApplyWindow:
+    """Test trimming chat history to a message/token window."""
+
+    HISTORY = [
+        {"role": "user", "content": "a" * 40},
+        {"role": "assistant", "content": "b" * 40},
+        {"role": "user", "content": "c" * 40},
+    ]
+
+    def test_no_limits_keeps_everything(self):
+        """Without limits the history is returned unchanged."""
+        assert MessageConverter.apply_window(self.HISTORY) == self.HISTORY
+
+    def test_max_messages_keeps_most_recent(self):
+        """The newest messages are kept."""
+        window = MessageConverter.apply_window(self.HISTORY, max_messages=2)
+
+        assert window == self.HISTORY[1:]
+
+    def test_max_tokens_keeps_most_recent(self):
+        """Messages are dropped oldest first until the estimate fits."""
+        # Each message is estimated at 11 tokens
+        window = MessageConverter.apply_window(self.HISTORY, max_tokens=25)
+
+        assert window == self.HISTORY[1:]
+
+    def test_newest_message_always_kept(self):
+        """The newest message survives even if it exceeds the budget."""
+        window = MessageConverter.apply_window(self.HISTORY, max_tokens=1)
+
+        assert window == self.HISTORY[-1:]